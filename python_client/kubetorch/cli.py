@@ -2200,6 +2200,9 @@ def kt_put(
         "-c",
         help="Copy directory contents (adds trailing slashes for rsync 'copy contents' behavior)",
     ),
+    stripes: int = typer.Option(
+        None, "--stripes", help="Concurrent rsync processes for a large directory (default: KT_RSYNC_STRIPES, or 1)"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed progress"),
     namespace: str = typer.Option(globals.config.namespace, "-n", "--namespace", help="Kubernetes namespace"),
 ):
@@ -2228,6 +2231,7 @@ def kt_put(
             force=force,
             verbose=verbose,
             namespace=namespace,
+            stripes=stripes,
         )
 
         if not verbose:
@@ -2258,6 +2262,9 @@ def kt_get(
         "-c",
         help="Copy directory contents (adds trailing slashes for rsync 'copy contents' behavior)",
     ),
+    stripes: int = typer.Option(
+        None, "--stripes", help="Concurrent rsync processes for a large directory (default: KT_RSYNC_STRIPES, or 1)"
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed progress"),
     namespace: str = typer.Option(globals.config.namespace, "-n", "--namespace", help="Kubernetes namespace"),
 ):
@@ -2289,6 +2296,7 @@ def kt_get(
             force=force,
             verbose=verbose,
             namespace=namespace,
+            stripes=stripes,
         )
 
         if not verbose:
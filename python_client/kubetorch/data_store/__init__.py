@@ -6,9 +6,11 @@ An intuitive, scalable distributed data system for Kubernetes, solving two criti
 1. **Out-of-cluster direct transfers**: Sync code and data to your cluster instantly and scalably - no container rebuilds
 2. **In-cluster data transfer and caching**: Peer-to-peer data transfer between pods with automatic caching and discovery, for filesystem and GPU data
 
-The unified put()/get() API handles two data types (auto-detected from parameters):
+The unified put()/get() API handles four data types (auto-detected from parameters):
 - **Filesystem data**: Files/directories via distributed rsync (zero-copy P2P with locale="local" or central store)
 - **GPU data**: CUDA tensors/state dicts via NCCL broadcast
+- **CPU tensor data**: CPU tensors/NumPy arrays/state dicts via the pod data server's TCP channel
+- **Python objects**: Picklable objects via the pod data server (kt.put(key, obj=...), kt.get(key, obj=True))
 
 Key capabilities:
 - External sync: Push/pull files to/from cluster
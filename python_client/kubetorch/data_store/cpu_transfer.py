@@ -0,0 +1,299 @@
+"""
+CPU tensor transfer support for kubetorch data store.
+
+Enables peer-to-peer transfers of CPU tensors and NumPy arrays for services without GPUs, over the pod data
+server's TCP channel instead of NCCL.
+
+Architecture:
+- The publishing process writes the arrays into a shared-memory file owned by its pod's Pod Data Server (the same
+  object store behind kt.put(key, obj=...)), with each array as an out-of-band pickle buffer
+- Getters' pod data servers stream the file from the source's server over TCP; getters on the source pod map it
+- Data is copied into the receiver's pre-allocated destination, like GPU transfers
+
+Supports:
+- Single tensors or arrays (torch.Tensor on CPU, numpy.ndarray)
+- State dicts (Dict[str, Tensor/ndarray]), including nested dicts
+
+BroadcastWindow support:
+- Like filesystem broadcasts, only getters coordinate: each joins a tree through the metadata server and fetches from
+  its parent's pod data server, which waits until the parent has the data itself
+- `pack=True` on the putter stores all arrays in a single contiguous buffer
+"""
+
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
+
+from kubetorch.logger import get_logger
+from kubetorch.serving.utils import is_running_in_kubernetes
+
+from .gpu_transfer import _flatten_state_dict
+
+if TYPE_CHECKING:
+    from .types import BroadcastWindow
+
+logger = get_logger(__name__)
+
+# Matches the object store's buffer alignment, so packed arrays can be viewed with their own dtype
+PACKED_ALIGNMENT = 64
+
+
+def _is_cpu_tensor(obj) -> bool:
+    """Check if object is a NumPy array or a CPU torch tensor."""
+    # Only check types whose modules are already imported: an object can't be an instance of a class never loaded
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(obj, numpy.ndarray):
+        return True
+    torch = sys.modules.get("torch")
+    return torch is not None and isinstance(obj, torch.Tensor) and obj.device.type == "cpu"
+
+
+def _is_cpu_data(obj) -> bool:
+    """Check if object is CPU tensor data (array or tensor, or a non-empty dict containing only those)."""
+    if _is_cpu_tensor(obj):
+        return True
+
+    if isinstance(obj, dict):
+        flat = _flatten_state_dict(obj)
+        return bool(flat) and all(_is_cpu_tensor(v) for v in flat.values())
+
+    return False
+
+
+def _flatten_tensors(data: Union[Any, Dict]) -> List[Tuple[str, Any]]:
+    """Flatten a tensor or state dict to (key, tensor) pairs, sorted for consistent ordering."""
+    if _is_cpu_tensor(data):
+        return [("", data)]
+    return sorted(_flatten_state_dict(data).items())
+
+
+def _dtype_name(tensor) -> str:
+    """Dtype name shared by NumPy and torch (e.g. 'float32'), so either can receive the other's data."""
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(tensor, numpy.ndarray):
+        return tensor.dtype.name
+    return str(tensor.dtype).replace("torch.", "")
+
+
+def _as_bytes(tensor):
+    """Contiguous uint8 NumPy view of a tensor's data (a copy only if it isn't contiguous)."""
+    import numpy as np
+
+    if isinstance(tensor, np.ndarray):
+        return np.ascontiguousarray(tensor).reshape(-1).view(np.uint8)
+    # Through torch's uint8 view, since NumPy has no equivalent of some torch dtypes (e.g. bfloat16)
+    torch = sys.modules["torch"]
+    return tensor.detach().contiguous().reshape(-1).view(torch.uint8).numpy()
+
+
+def _copy_into(dest, data) -> None:
+    """Copy raw bytes (a uint8 array) into a destination array or tensor of the same size."""
+    import numpy as np
+
+    if isinstance(dest, np.ndarray):
+        np.copyto(dest, data.view(dest.dtype).reshape(dest.shape))
+    else:
+        torch = sys.modules["torch"]
+        dest.copy_(torch.from_numpy(data).view(dest.dtype).reshape(dest.shape))
+
+
+def _serialize_tensors(tensors: List[Tuple[str, Any]], pack: bool = False) -> dict:
+    """
+    Build the object stored for CPU tensors: per-tensor metadata plus the raw bytes, either one uint8 array per
+    tensor (each stored as its own out-of-band buffer) or, with ``pack``, one buffer holding all of them.
+    """
+    import numpy as np
+
+    layout = []
+    arrays = []
+    offset = 0
+    for tensor_key, tensor in tensors:
+        data = _as_bytes(tensor)
+        offset = -(-offset // PACKED_ALIGNMENT) * PACKED_ALIGNMENT
+        layout.append(
+            {
+                "key": tensor_key,
+                "dtype": _dtype_name(tensor),
+                "shape": list(tensor.shape),
+                "offset": offset,
+                "nbytes": data.nbytes,
+            }
+        )
+        arrays.append(data)
+        offset += data.nbytes
+
+    if not pack:
+        return {"layout": layout, "buffers": arrays}
+
+    packed = np.zeros(offset, dtype=np.uint8)
+    for entry, data in zip(layout, arrays):
+        packed[entry["offset"] : entry["offset"] + entry["nbytes"]] = data
+    return {"layout": layout, "packed": packed}
+
+
+def _deserialize_into(payload: dict, tensors: List[Tuple[str, Any]], key: str) -> None:
+    """Copy a stored payload into destination tensors, validating that keys, dtypes and shapes match."""
+    entries = {entry["key"]: (i, entry) for i, entry in enumerate(payload["layout"])}
+    missing = [tensor_key or "<tensor>" for tensor_key, _ in tensors if tensor_key not in entries]
+    if missing:
+        raise ValueError(f"'{key}' has no data for: {', '.join(missing)}")
+
+    for tensor_key, dest in tensors:
+        i, entry = entries[tensor_key]
+        name = tensor_key or key
+        if entry["dtype"] != _dtype_name(dest) or entry["shape"] != list(dest.shape):
+            raise ValueError(
+                f"'{name}' is {entry['dtype']}{tuple(entry['shape'])}, "
+                f"but the destination is {_dtype_name(dest)}{tuple(dest.shape)}"
+            )
+        if "packed" in payload:
+            data = payload["packed"][entry["offset"] : entry["offset"] + entry["nbytes"]]
+        else:
+            data = payload["buffers"][i]
+        _copy_into(dest, data)
+
+
+class CPUTransferManager:
+    """
+    Manages CPU tensor and NumPy array transfers through the pod data server.
+
+    This class is used internally by kt.put/kt.get for CPU tensor data.
+    """
+
+    def __init__(self, namespace: Optional[str] = None):
+        """Initialize the CPU transfer manager."""
+        from kubetorch import globals
+
+        self.namespace = namespace or globals.config.namespace
+
+        from kubetorch.provisioning.constants import DATA_STORE_METADATA_PORT
+
+        from .metadata_client import MetadataClient
+
+        self.metadata_client = MetadataClient(namespace=self.namespace, metadata_port=DATA_STORE_METADATA_PORT)
+
+        # Pod data server client (lazy initialization)
+        self._server_client = None
+
+    def _get_server_client(self):
+        """Get or create the pod data server client, starting the server if needed."""
+        if self._server_client is None:
+            from .pod_data_server import PodDataServerClient, start_server_if_needed
+
+            server_pid = start_server_if_needed()
+            logger.debug(f"Pod Data Server PID: {server_pid}")
+
+            self._server_client = PodDataServerClient()
+
+        return self._server_client
+
+    def publish(
+        self,
+        key: str,
+        data: Union[Any, Dict],
+        broadcast: Optional["BroadcastWindow"] = None,
+        verbose: bool = False,
+    ) -> None:
+        """
+        Publish CPU tensor data (tensor, array or state dict) from this pod.
+
+        The data is copied once, into the pod data server's shared memory, so the caller may modify or free it
+        afterwards. Putting the key again replaces it.
+
+        Args:
+            key: Storage key
+            data: CPU tensor or NumPy array, or a dict of them
+            broadcast: Optional BroadcastWindow. Getters coordinate the broadcast tree among themselves, so the
+                putter only uses ``broadcast.pack`` to store all tensors in a single buffer.
+            verbose: Show detailed progress
+        """
+        if not is_running_in_kubernetes():
+            raise RuntimeError("CPU tensor publish can only be called from inside a Kubernetes pod")
+
+        tensors = _flatten_tensors(data)
+        pack = broadcast is not None and broadcast.pack and len(tensors) > 1
+        payload = _serialize_tensors(tensors, pack=pack)
+
+        response = self._get_server_client().put_object(key, payload)
+        if response.get("status") != "ok":
+            raise RuntimeError(f"Failed to publish '{key}': {response.get('error')}")
+
+        if verbose:
+            total_bytes = sum(entry["nbytes"] for entry in payload["layout"])
+            logger.info(f"Published CPU data '{key}': {len(tensors)} tensor(s), {total_bytes} bytes")
+
+    def retrieve(
+        self,
+        key: str,
+        dest: Union[Any, Dict],
+        broadcast: Optional["BroadcastWindow"] = None,
+        verbose: bool = False,
+    ) -> Optional[Dict]:
+        """
+        Retrieve CPU tensor data into a pre-allocated destination.
+
+        Args:
+            key: Storage key
+            dest: Destination CPU tensor or NumPy array, or a dict of them matching the published structure
+            broadcast: Optional BroadcastWindow. This getter joins a tree with the group's other getters (fanout
+                ``broadcast.fanout``, default 50) and fetches from its parent, which in turn serves its children.
+            verbose: Show detailed progress
+
+        Returns:
+            When broadcast is provided: Dict with the rank and parent this getter was assigned
+            When broadcast is None: None
+        """
+        if not is_running_in_kubernetes():
+            raise RuntimeError("CPU tensor retrieve can only be called from inside a Kubernetes pod")
+
+        tensors = _flatten_tensors(dest)
+        server_client = self._get_server_client()
+
+        if broadcast is None:
+            response = server_client.get_object(key)
+            if response.get("status") != "ok":
+                raise RuntimeError(f"Failed to receive '{key}': {response.get('error')}")
+            _deserialize_into(response["object"], tensors, key)
+            if verbose:
+                logger.info(f"Received CPU data '{key}' from {response.get('source')}: {len(tensors)} tensor(s)")
+            return None
+
+        group_id = broadcast.group_id or key
+        timeout = broadcast.timeout or 600.0
+        result = self.metadata_client.join_fs_broadcast(
+            group_id=group_id,
+            key=key,
+            pod_ip=os.getenv("POD_IP"),
+            pod_name=os.getenv("POD_NAME"),
+            fanout=broadcast.fanout,
+        )
+        if result.get("status") == "error":
+            logger.warning(f"Broadcast join failed for '{key}': {result.get('error')}. Fetching from the source.")
+            parent_ip = None
+        else:
+            # Rank 0 is the source itself, which is found through MDS like a regular get
+            parent_ip = result.get("parent_ip") if result.get("parent_rank") else None
+
+        if verbose:
+            logger.info(f"Joined broadcast '{group_id}': rank={result.get('rank')}, parent_ip={parent_ip or 'source'}")
+
+        response = server_client.get_object(key, timeout=timeout, group_id=group_id, parent_ip=parent_ip)
+        if response.get("status") != "ok":
+            raise RuntimeError(f"Failed to receive '{key}' via broadcast: {response.get('error')}")
+        _deserialize_into(response["object"], tensors, key)
+
+        if verbose:
+            logger.info(f"Broadcast receive complete for '{key}' from {response.get('source')}")
+        return {"rank": result.get("rank"), "parent_rank": result.get("parent_rank"), "source": response.get("source")}
+
+
+# Singleton instance
+_cpu_manager: Optional[CPUTransferManager] = None
+
+
+def _get_cpu_manager() -> CPUTransferManager:
+    """Get or create the global CPU transfer manager."""
+    global _cpu_manager
+    if _cpu_manager is None:
+        _cpu_manager = CPUTransferManager()
+    return _cpu_manager
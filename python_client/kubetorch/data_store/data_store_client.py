@@ -8,10 +8,12 @@ data transfer via a metadata server.
 
 import os
 import subprocess
+import threading
 import time
+from concurrent.futures import as_completed, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import kubetorch.provisioning.constants as provisioning_constants
 from kubetorch import globals
@@ -21,11 +23,17 @@ from kubetorch.serving.utils import is_running_in_kubernetes
 
 from .key_utils import parse_key, ParsedKey
 from .metadata_client import MetadataClient
+from .pod_cache import get_pod_cache
 from .rsync_client import RsyncClient
 from .types import BroadcastWindow, Lifespan, Locale
 
 logger = get_logger(__name__)
 
+# Max keys transferred at once by a multi-key get or put
+DEFAULT_MAX_TRANSFER_WORKERS = 8
+# Max concurrent downloads from any one peer pod, so a multi-key get doesn't pile onto a single source
+MAX_TRANSFERS_PER_SOURCE = 4
+
 
 class DataStoreError(Exception):
     """Exception raised for data store operations (key-value store) errors."""
@@ -47,6 +55,40 @@ class SourceInfo:
     peer_ip: Optional[str] = None
 
 
+class _SourceResolver:
+    """Resolves the sources of a multi-key get in bulk lookups, one batch of keys at a time.
+
+    A source lookup counts as a transfer in flight on the peer it returns until ``complete_request``, so sources are
+    resolved just ahead of the downloads rather than for every key up front, and lookups left unused (e.g. keys
+    served from the pod cache) are released by :meth:`release_unused`.
+    """
+
+    def __init__(self, client: "DataStoreClient", keys: List[str], batch_size: int, verbose: bool):
+        self._client = client
+        self._pending = list(dict.fromkeys(keys))
+        self._batch_size = max(batch_size, 1)
+        self._verbose = verbose
+        self._in_cluster = is_running_in_kubernetes()
+        self._resolved: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, key: str) -> tuple:
+        with self._lock:
+            if key not in self._resolved:
+                batch = [key] + [k for k in self._pending if k != key][: self._batch_size - 1]
+                self._pending = [k for k in self._pending if k not in batch]
+                self._resolved.update(self._client._resolve_sources(batch, self._in_cluster, self._verbose))
+            return self._resolved.pop(key)
+
+    def release_unused(self):
+        with self._lock:
+            resolved, self._resolved = self._resolved, {}
+        for key, (source_info, _) in resolved.items():
+            peer_ip = source_info and (source_info.ip or source_info.peer_ip)
+            if peer_ip:
+                self._client.metadata_client.complete_request(key, peer_ip)
+
+
 class DataStoreClient:
     """High-level client for key-value store interface."""
 
@@ -62,6 +104,36 @@ class DataStoreClient:
         self.metadata_client = MetadataClient(
             namespace=self.namespace, metadata_port=provisioning_constants.DATA_STORE_METADATA_PORT
         )
+        self._source_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._source_slots_lock = threading.Lock()
+
+    def _for_each_key(self, keys: List[str], transfer: Callable[[str], None], max_workers: int, action: str) -> None:
+        """Run ``transfer(key)`` for each key, up to ``max_workers`` at once, and report all failures together."""
+        if len(keys) <= 1 or max_workers <= 1:
+            for key in keys:
+                transfer(key)
+            return
+
+        failures = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+            futures = {executor.submit(transfer, key): key for key in keys}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failures[futures[future]] = e
+
+        if failures:
+            details = "; ".join(f"'{key}': {error}" for key, error in failures.items())
+            first_error = next(iter(failures.values()))
+            raise DataStoreError(f"Failed to {action} {len(failures)} of {len(keys)} keys: {details}") from first_error
+
+    def _source_slot(self, source: str) -> threading.BoundedSemaphore:
+        """Semaphore limiting concurrent downloads from one source pod to MAX_TRANSFERS_PER_SOURCE."""
+        with self._source_slots_lock:
+            if source not in self._source_slots:
+                self._source_slots[source] = threading.BoundedSemaphore(MAX_TRANSFERS_PER_SOURCE)
+            return self._source_slots[source]
 
     def put(
         self,
@@ -76,6 +148,9 @@ class DataStoreClient:
         verbose: bool = False,
         start_rsyncd: bool = True,
         base_path: str = "/",
+        max_workers: int = DEFAULT_MAX_TRANSFER_WORKERS,
+        files_from: Optional[str] = None,
+        stripes: Optional[int] = None,
     ) -> None:
         """
         Upload files or directories to the cluster using a key-value store interface.
@@ -92,6 +167,11 @@ class DataStoreClient:
             verbose (bool, optional): Show detailed progress. (Default: False)
             start_rsyncd (bool, optional): For locale="local": Start rsync daemon. (Default: True)
             base_path (str, optional): For locale="local": Root path for rsync daemon. (Default: "/")
+            max_workers (int, optional): Max keys uploaded concurrently when ``key`` is a list. (Default: 8)
+            files_from (str, optional): For locale="store": Path to a file listing the paths (relative to ``src``,
+                a directory) to upload, instead of all of ``src``. (Default: None)
+            stripes (int, optional): For locale="store": Number of concurrent rsync processes to upload a directory
+                with, each sending a size-balanced share of its files. (Default: ``KT_RSYNC_STRIPES`` env var, or 1)
         """
         # Normalize keys to list
         keys = [key] if isinstance(key, str) else key
@@ -105,6 +185,9 @@ class DataStoreClient:
                 filter_options=filter_options,
                 force=force,
                 verbose=verbose,
+                max_workers=max_workers,
+                files_from=files_from,
+                stripes=stripes,
             )
         elif locale == "local":
             self._put_local(
@@ -131,6 +214,9 @@ class DataStoreClient:
         filter_options: Optional[str],
         force: bool,
         verbose: bool,
+        max_workers: int = DEFAULT_MAX_TRANSFER_WORKERS,
+        files_from: Optional[str] = None,
+        stripes: Optional[int] = None,
     ) -> None:
         """Upload data to the central store pod."""
         # Convert Path objects to strings
@@ -139,7 +225,7 @@ class DataStoreClient:
         elif isinstance(src, list):
             src = [str(s) if isinstance(s, Path) else s for s in src]
 
-        for key in keys:
+        def upload(key: str) -> None:
             parsed = parse_key(key)
 
             # Create rsync client with appropriate service name
@@ -162,7 +248,13 @@ class DataStoreClient:
                 )
 
                 rsync_client.upload(
-                    source=src, dest=dest_path, contents=contents, filter_options=filter_options, force=force
+                    source=src,
+                    dest=dest_path,
+                    contents=contents,
+                    filter_options=filter_options,
+                    force=force,
+                    files_from=files_from,
+                    stripes=stripes,
                 )
 
                 # After successful upload, register with metadata server
@@ -175,6 +267,8 @@ class DataStoreClient:
                 logger.error(f"Failed to store at key '{key}': {e}")
                 raise
 
+        self._for_each_key(keys, upload, max_workers, action="upload")
+
     def _put_local(
         self,
         keys: List[str],
@@ -346,6 +440,8 @@ class DataStoreClient:
         filter_options: Optional[str] = None,
         force: bool = False,
         verbose: bool = False,
+        max_workers: int = DEFAULT_MAX_TRANSFER_WORKERS,
+        stripes: Optional[int] = None,
     ) -> None:
         """
         Download files or directories from the cluster using a key-value store interface.
@@ -358,6 +454,9 @@ class DataStoreClient:
             filter_options: Additional rsync filter options.
             force: Force overwrite of existing files.
             verbose: Show detailed progress.
+            max_workers: Max keys downloaded concurrently when ``key`` is a list (without broadcast).
+            stripes: Number of concurrent rsync processes to download a directory with, each fetching a
+                size-balanced share of its files (without broadcast). Defaults to ``KT_RSYNC_STRIPES``, or 1.
         """
         # Normalize keys to list
         keys = [key] if isinstance(key, str) else key
@@ -377,16 +476,29 @@ class DataStoreClient:
                 verbose=verbose,
             )
         else:
-            # Regular get without broadcast
-            for k in keys:
-                self._get_single(
-                    key=k,
-                    dest=dest,
-                    contents=contents,
-                    filter_options=filter_options,
-                    force=force,
-                    verbose=verbose,
+            # Regular get without broadcast. With several keys, sources are looked up in bulk, a batch ahead.
+            resolver = None
+            if len(keys) > 1:
+                resolver = _SourceResolver(self, [parse_key(k).full_key for k in keys], max_workers, verbose)
+            try:
+                self._for_each_key(
+                    keys,
+                    lambda k: self._get_single(
+                        key=k,
+                        dest=dest,
+                        contents=contents,
+                        filter_options=filter_options,
+                        force=force,
+                        verbose=verbose,
+                        stripes=stripes,
+                        resolver=resolver,
+                    ),
+                    max_workers,
+                    action="download",
                 )
+            finally:
+                if resolver is not None:
+                    resolver.release_unused()
 
     def _get_with_broadcast(
         self,
@@ -580,23 +692,58 @@ class DataStoreClient:
         filter_options: Optional[str],
         force: bool,
         verbose: bool,
+        stripes: Optional[int] = None,
+        resolver: Optional[_SourceResolver] = None,
     ) -> None:
         """Get a single key without broadcast coordination."""
         dest_str = self._normalize_dest(dest, contents, key)
         parsed = parse_key(key)
+
+        # In-cluster, go through the pod's data cache if it has one (only for directory destinations, since the
+        # cached tree is linked into dest)
+        cache = get_pod_cache() if is_running_in_kubernetes() and dest_str.endswith("/") else None
+        if cache is not None:
+            cache.get(
+                cache_key=f"{parsed.full_key}|{contents}|{filter_options or ''}",
+                dest=dest_str,
+                fetch=lambda cache_dest: self._download_key(
+                    key, parsed, cache_dest, contents, filter_options, force, verbose, stripes, resolver
+                ),
+                refresh=force,
+            )
+            return
+
+        self._download_key(key, parsed, dest_str, contents, filter_options, force, verbose, stripes, resolver)
+
+    def _download_key(
+        self,
+        key: str,
+        parsed: ParsedKey,
+        dest_str: str,
+        contents: bool,
+        filter_options: Optional[str],
+        force: bool,
+        verbose: bool,
+        stripes: Optional[int] = None,
+        resolver: Optional[_SourceResolver] = None,
+    ) -> None:
+        """Download a key into ``dest_str`` from a peer or the store pod."""
         in_cluster = is_running_in_kubernetes()
 
         if verbose:
             logger.info(f"Downloading from key '{key}' to {dest_str}")
 
         # Get source information from metadata server
-        source_info, has_store_backup = self._resolve_source(parsed.full_key, in_cluster, verbose)
+        if resolver is not None:
+            source_info, has_store_backup = resolver.resolve(parsed.full_key)
+        else:
+            source_info, has_store_backup = self._resolve_source(parsed.full_key, in_cluster, verbose)
 
         # Try to retrieve the data
         if in_cluster and source_info and source_info.ip:
             # In-cluster peer-to-peer transfer
             success = self._get_from_peer_in_cluster(
-                key, parsed, source_info, dest_str, contents, filter_options, force, has_store_backup, verbose
+                key, parsed, source_info, dest_str, contents, filter_options, force, has_store_backup, verbose, stripes
             )
             if success:
                 return
@@ -611,7 +758,7 @@ class DataStoreClient:
 
         # Fall back to store pod
         if has_store_backup:
-            self._get_from_store_pod(key, parsed, dest_str, contents, filter_options, force, verbose)
+            self._get_from_store_pod(key, parsed, dest_str, contents, filter_options, force, verbose, stripes)
         else:
             raise DataStoreError(
                 f"Key '{parsed.full_key}' not found - no peer sources and no store pod backup available"
@@ -637,27 +784,36 @@ class DataStoreClient:
 
     def _resolve_source(self, key: str, in_cluster: bool, verbose: bool) -> tuple[Optional[SourceInfo], bool]:
         """Resolve the best source for retrieving a key."""
-        source_info = None
-        has_store_backup = False
+        return self._resolve_sources([key], in_cluster, verbose)[key]
 
-        if in_cluster:
-            raw_info = self.metadata_client.get_source_ip(key, external=False)
-            if isinstance(raw_info, dict):
-                source_info = SourceInfo(ip=raw_info.get("ip"), src_path=raw_info.get("src_path"))
-            elif raw_info:
-                source_info = SourceInfo(ip=raw_info)
+    def _resolve_sources(
+        self, keys: List[str], in_cluster: bool, verbose: bool
+    ) -> Dict[str, tuple[Optional[SourceInfo], bool]]:
+        """Resolve the best source for each of several keys, with bulk metadata lookups."""
+        sources = {}
 
-            if verbose and source_info and source_info.ip:
-                logger.info(f"Metadata server returned peer IP '{source_info.ip}' for key '{key}'")
-
-            has_store_backup = self.metadata_client.has_store_pod(key)
+        if in_cluster:
+            raw_infos = self.metadata_client.get_source_ips(keys, external=False)
+            has_store_backups = self.metadata_client.has_store_pods(keys)
+            for key in keys:
+                raw_info, source_info = raw_infos[key], None
+                if isinstance(raw_info, dict):
+                    source_info = SourceInfo(ip=raw_info.get("ip"), src_path=raw_info.get("src_path"))
+                elif raw_info:
+                    source_info = SourceInfo(ip=raw_info)
+
+                if verbose and source_info and source_info.ip:
+                    logger.info(f"Metadata server returned peer IP '{source_info.ip}' for key '{key}'")
+                sources[key] = (source_info, has_store_backups[key])
         else:
             # External client - check store pod first
-            has_store_backup = self.metadata_client.has_store_pod(key)
+            has_store_backups = self.metadata_client.has_store_pods(keys)
 
-            if not has_store_backup:
-                # Only check peer pods if store doesn't have it
-                raw_info = self.metadata_client.get_source_ip(key, external=True)
+            # Only check peer pods for keys the store doesn't have
+            missing = [key for key in keys if not has_store_backups[key]]
+            raw_infos = self.metadata_client.get_source_ips(missing, external=True) if missing else {}
+            for key in keys:
+                raw_info, source_info = raw_infos.get(key), None
                 if raw_info and isinstance(raw_info, dict):
                     source_info = SourceInfo(
                         pod_name=raw_info.get("pod_name"),
@@ -668,8 +824,9 @@ class DataStoreClient:
                     )
                     if verbose:
                         logger.info(f"External client: checking peer pods for key '{key}': {raw_info}")
+                sources[key] = (source_info, has_store_backups[key])
 
-        return source_info, has_store_backup
+        return sources
 
     def _get_from_peer_in_cluster(
         self,
@@ -682,6 +839,7 @@ class DataStoreClient:
         force: bool,
         has_store_backup: bool,
         verbose: bool,
+        stripes: Optional[int] = None,
     ) -> bool:
         """
         Attempt peer-to-peer transfer within the cluster.
@@ -708,9 +866,15 @@ class DataStoreClient:
             if verbose:
                 logger.info(f"Attempting peer-to-peer rsync from {source_info.ip}")
 
-            rsync_client.download(
-                source=remote_source, dest=dest, contents=contents, filter_options=filter_options, force=force
-            )
+            with self._source_slot(source_info.ip):
+                rsync_client.download(
+                    source=remote_source,
+                    dest=dest,
+                    contents=contents,
+                    filter_options=filter_options,
+                    force=force,
+                    stripes=stripes,
+                )
 
             if verbose:
                 logger.info(f"Successfully retrieved key '{key}' from peer {source_info.ip}")
@@ -784,9 +948,10 @@ class DataStoreClient:
                 raise RuntimeError(f"Port-forward failed: {stderr}")
 
             try:
-                return self._download_via_port_forward(
-                    key, source_info, local_port, dest, contents, filter_options, force, rsync_client, verbose
-                )
+                with self._source_slot(pod_name):
+                    return self._download_via_port_forward(
+                        key, source_info, local_port, dest, contents, filter_options, force, rsync_client, verbose
+                    )
             finally:
                 try:
                     pf_process.terminate()
@@ -870,6 +1035,7 @@ class DataStoreClient:
         filter_options: Optional[str],
         force: bool,
         verbose: bool,
+        stripes: Optional[int] = None,
     ) -> None:
         """Download from the store pod."""
         rsync_client = RsyncClient(namespace=self.namespace, service_name=parsed.service_name or "store")
@@ -887,7 +1053,12 @@ class DataStoreClient:
 
         try:
             rsync_client.download(
-                source=remote_source, dest=dest, contents=contents, filter_options=filter_options, force=force
+                source=remote_source,
+                dest=dest,
+                contents=contents,
+                filter_options=filter_options,
+                force=force,
+                stripes=stripes,
             )
 
             if verbose:
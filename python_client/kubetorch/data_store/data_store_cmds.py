@@ -8,12 +8,13 @@ import concurrent.futures
 import os
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Union
 
 from kubetorch.logger import get_logger
 from kubetorch.resources.compute.utils import RsyncError
+from kubetorch.serving.utils import is_running_in_kubernetes
 
-from .data_store_client import DataStoreClient, DataStoreError
+from .data_store_client import DataStoreClient, DataStoreError, DEFAULT_MAX_TRANSFER_WORKERS
 from .types import BroadcastWindow, Lifespan, Locale
 
 logger = get_logger(__name__)
@@ -38,13 +39,18 @@ def put(
     start_rsyncd: bool = True,
     base_path: str = "/",
     nccl_port: int = 29500,
+    max_workers: int = DEFAULT_MAX_TRANSFER_WORKERS,
+    stripes: Optional[int] = None,
+    obj: Any = None,
 ) -> None:
     """
     Upload data to the cluster using a key-value store interface.
 
-    Supports two data types (auto-detected from `src`):
+    Supports four data types (auto-detected from `src`, or `obj` for objects):
     - **Filesystem data**: Files/directories uploaded via rsync
     - **GPU data**: GPU tensors or state dicts broadcast via NCCL
+    - **CPU tensor data**: CPU tensors, NumPy arrays or state dicts of them, served by the pod data server over TCP
+    - **Python objects**: Any picklable object, held in shared memory by the pod's data server
 
     Args:
         key: Storage key(s). Keys should be explicit paths like "my-service/models/v1".
@@ -53,6 +59,7 @@ def put(
             - Path(s) to local file(s) or directory(s) for filesystem transfer
             - GPU tensor for single tensor broadcast via NCCL
             - Dict of GPU tensors (state dict) for multi-tensor broadcast via NCCL
+            - CPU tensor, NumPy array, or dict of them, served from this pod's data server
         locale: Where data is stored:
             - "store" (default): Copy to central store pod. Data is persisted and
               accessible from any pod. (Filesystem only - GPU data always uses "local")
@@ -74,6 +81,12 @@ def put(
         start_rsyncd: For locale="local": Start rsync daemon to serve data (default: True). (Filesystem only)
         base_path: For locale="local": Root path for rsync daemon (default: "/"). (Filesystem only)
         nccl_port: Port for NCCL communication (default: 29500). (GPU only)
+        max_workers: Max keys uploaded concurrently when `key` is a list (default: 8). (Filesystem only)
+        stripes: Number of concurrent rsync processes for uploading a large directory to the store, each sending a
+            size-balanced share of its files (default: `KT_RSYNC_STRIPES` env var, or 1). (Filesystem only)
+        obj: A picklable Python object to store instead of `src`. It is kept in memory by the pod data server
+            (like locale="local", it never leaves the pod until fetched) until the key is put again or the server
+            exits. Other pods retrieve it with `kt.get(key, obj=True)`.
 
     Examples:
         # Upload filesystem data to central store
@@ -102,7 +115,20 @@ def put(
         # GPU state dict - all tensors broadcast over single NCCL process group
         >>> state_dict = model.state_dict()  # Contains CUDA tensors
         >>> kt.put(key="model/weights", src=state_dict, broadcast=kt.BroadcastWindow(world_size=4))
+
+        # CPU state dict (torch CPU tensors or NumPy arrays) - served over TCP, no GPU needed
+        >>> kt.put(key="eval/weights", src=cpu_model.state_dict())
+
+        # Python object - NumPy arrays inside are transferred without being copied into the pickle
+        >>> kt.put(key="my-service/features", obj={"ids": ids, "embeddings": np_embeddings})
     """
+    if obj is not None:
+        if src is not None:
+            raise ValueError("Provide either src or obj, not both.")
+        if isinstance(key, list):
+            raise ValueError("Object transfer only supports a single key, not a list of keys.")
+        return _put_object(key, obj)
+
     if src is None:
         raise ValueError("src is required. Provide a path for filesystem data or a GPU tensor/dict for GPU data.")
 
@@ -120,6 +146,16 @@ def put(
         manager = _get_gpu_manager()
         return manager.publish(key=key, data=src, nccl_port=nccl_port, broadcast=broadcast, verbose=verbose)
 
+    from .cpu_transfer import _is_cpu_data
+
+    if _is_cpu_data(src):
+        from .cpu_transfer import _get_cpu_manager
+
+        if isinstance(key, list):
+            raise ValueError("CPU tensor transfer only supports a single key, not a list of keys.")
+
+        return _get_cpu_manager().publish(key=key, data=src, broadcast=broadcast, verbose=verbose)
+
     # Filesystem data transfer
     global _default_client
 
@@ -138,6 +174,8 @@ def put(
         verbose=verbose,
         start_rsyncd=start_rsyncd,
         base_path=base_path,
+        max_workers=max_workers,
+        stripes=stripes,
     )
 
 
@@ -151,17 +189,23 @@ def get(
     verbose: bool = False,
     namespace: Optional[str] = None,
     kubeconfig_path: Optional[str] = None,
-) -> None:
+    max_workers: int = DEFAULT_MAX_TRANSFER_WORKERS,
+    stripes: Optional[int] = None,
+    obj: bool = False,
+) -> Any:
     """
     Download data from the cluster using a key-value store interface.
 
-    Supports two data types:
+    Supports four data types:
     - **Filesystem data**: Files/directories downloaded via rsync
     - **GPU data**: GPU tensors or state dicts received via NCCL broadcast
+    - **CPU tensor data**: CPU tensors, NumPy arrays or state dicts of them, received over TCP
+    - **Python objects**: Objects stored with `kt.put(key, obj=...)`, returned when `obj=True`
 
     The data type is auto-detected from the `dest` parameter:
     - If dest is a path (str/Path) or None: filesystem data
     - If dest is a GPU tensor or dict of GPU tensors: GPU data
+    - If dest is a CPU tensor, NumPy array, or dict of them: CPU tensor data
 
     Args:
         key: Storage key(s) to retrieve. Keys should be explicit paths like
@@ -169,6 +213,7 @@ def get(
         dest: Destination for the data:
             - For filesystem: Local path (defaults to current working directory)
             - For GPU: Pre-allocated tensor or state_dict (dict of tensors) to receive into
+            - For CPU tensors: Pre-allocated tensor/array or dict of them, with the published keys, dtypes and shapes
         broadcast: Optional BroadcastWindow for coordinated multi-party transfers.
             When specified, this get() joins as a "getter" and waits for putters
             before receiving data. Use broadcast.timeout to control wait time.
@@ -178,6 +223,14 @@ def get(
         verbose: Show detailed progress.
         namespace: Kubernetes namespace.
         kubeconfig_path: Path to kubeconfig file (for compatibility).
+        max_workers: Max keys downloaded concurrently when `key` is a list (default: 8). (Filesystem only)
+        stripes: Number of concurrent rsync processes for downloading a large directory, each fetching a
+            size-balanced share of its files (default: `KT_RSYNC_STRIPES` env var, or 1). (Filesystem only)
+        obj: If True, return the Python object stored under `key` with `kt.put(key, obj=...)`. On the putter's pod
+            it is mapped from shared memory; other pods stream it from the putter's pod data server.
+
+    Returns:
+        The object if `obj=True`, otherwise None.
 
     Examples:
         # Download from store
@@ -207,7 +260,18 @@ def get(
         ...     broadcast=kt.BroadcastWindow(world_size=4)
         ... )
         >>> model.load_state_dict(model.state_dict())  # Already updated in-place
+        >>>
+        >>> # CPU state dict, fetched through a broadcast tree of getters
+        >>> kt.get(key="eval/weights", dest=cpu_model.state_dict(), broadcast=kt.BroadcastWindow(timeout=30.0))
+        >>>
+        >>> # Python object
+        >>> features = kt.get(key="my-service/features", obj=True)
     """
+    if obj:
+        if isinstance(key, list):
+            raise ValueError("Object transfer only supports a single key, not a list of keys.")
+        return _get_object(key)
+
     from .gpu_transfer import _is_gpu_data
 
     # Check if dest is GPU data (tensor or dict of tensors)
@@ -217,6 +281,13 @@ def get(
         manager = _get_gpu_manager()
         return manager.retrieve(key=key, dest=dest, broadcast=broadcast, verbose=verbose)
 
+    from .cpu_transfer import _is_cpu_data
+
+    if dest is not None and _is_cpu_data(dest):
+        from .cpu_transfer import _get_cpu_manager
+
+        return _get_cpu_manager().retrieve(key=key, dest=dest, broadcast=broadcast, verbose=verbose)
+
     # Filesystem data retrieval
     global _default_client
 
@@ -231,6 +302,8 @@ def get(
         filter_options=filter_options,
         force=force,
         verbose=verbose,
+        max_workers=max_workers,
+        stripes=stripes,
     )
 
 
@@ -291,6 +364,34 @@ def rm(
     _default_client.rm(key=key, recursive=recursive, verbose=verbose)
 
 
+def _pod_data_server_client():
+    from .pod_data_server import PodDataServerClient, start_server_if_needed
+
+    start_server_if_needed()
+    return PodDataServerClient()
+
+
+def _put_object(key: str, obj: Any) -> None:
+    """Store a Python object with this pod's data server, which serves it to getters on any pod."""
+    if not is_running_in_kubernetes():
+        raise RuntimeError("Object put can only be called from inside a Kubernetes pod")
+
+    response = _pod_data_server_client().put_object(key, obj)
+    if response.get("status") != "ok":
+        raise DataStoreError(f"Failed to put object '{key}': {response.get('error')}")
+
+
+def _get_object(key: str) -> Any:
+    """Retrieve a Python object stored with kt.put(key, obj=...)."""
+    if not is_running_in_kubernetes():
+        raise RuntimeError("Object get can only be called from inside a Kubernetes pod")
+
+    response = _pod_data_server_client().get_object(key)
+    if response.get("status") != "ok":
+        raise DataStoreError(f"Failed to get object '{key}': {response.get('error')}")
+    return response["object"]
+
+
 def _sync_workdir_from_store(namespace: str, service_name: str):
     """
     Sync files from the rsync pod into the current working directory inside the server pod.
@@ -302,6 +403,8 @@ def _sync_workdir_from_store(namespace: str, service_name: str):
     - Regular files (excluding __absolute__*) into the working directory
     - Absolute path files (under __absolute__/...) into their absolute destinations
 
+    Set ``KT_RSYNC_STRIPES`` on the service to download large working directories with several concurrent rsyncs.
+
     Uses the DataStoreClient KV interface, which allows future scalability with peer-to-peer
     transfer via a central metadata store.
     """
@@ -649,7 +649,7 @@ class GPUTransferManager:
         url = f"{self.metadata_client.base_url}/api/v1/keys/{encoded_key}/gpu/quorum/{broadcast_id}/complete"
 
         try:
-            response = requests.post(url, params={"pod_ip": pod_ip}, timeout=5)
+            response = self.metadata_client.session.post(url, params={"pod_ip": pod_ip}, timeout=5)
             response.raise_for_status()
         except requests.RequestException as e:
             logger.warning(f"Failed to notify broadcast completion: {e}")
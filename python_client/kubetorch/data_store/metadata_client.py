@@ -5,10 +5,16 @@ The metadata server tracks which pods have published data for each key,
 enabling peer-to-peer data transfer and load balancing.
 """
 
-from typing import List, Optional, Union
+import asyncio
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 from urllib.parse import quote
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
 from kubetorch.logger import get_logger
 from kubetorch.serving.utils import is_running_in_kubernetes
@@ -17,6 +23,9 @@ from .types import BroadcastWindow, Lifespan
 
 logger = get_logger(__name__)
 
+# Max pooled connections to the metadata server, and max concurrent lookups in the bulk methods
+METADATA_POOL_SIZE = 32
+
 
 class MetadataClient:
     """Client for the metadata server API."""
@@ -32,6 +41,51 @@ class MetadataClient:
         self.namespace = namespace  # Namespace where the data-store service is deployed
         self.metadata_port = metadata_port
         self._base_url = None
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._async_session = None
+        self._async_session_loop = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session, so repeated calls to the metadata server reuse connections."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=METADATA_POOL_SIZE)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    @property
+    def async_session(self) -> httpx.AsyncClient:
+        """Pooled async HTTP client, reused by async calls made from the same event loop.
+
+        An ``httpx.AsyncClient``'s connections belong to the loop they were opened on, so a call from another loop
+        gets a new client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session_loop is not loop:
+            limits = httpx.Limits(max_connections=METADATA_POOL_SIZE, max_keepalive_connections=METADATA_POOL_SIZE)
+            self._async_session = httpx.AsyncClient(timeout=5, limits=limits)
+            self._async_session_loop = loop
+        return self._async_session
+
+    def close(self):
+        """Close pooled connections to the metadata server."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def aclose(self):
+        """Close pooled connections, including the async client's. Call from the loop the async calls ran on."""
+        self.close()
+        if self._async_session is not None:
+            await self._async_session.aclose()
+            self._async_session = None
+            self._async_session_loop = None
 
     @property
     def base_url(self) -> str:
@@ -76,52 +130,121 @@ class MetadataClient:
             If external=True: Dict with "pod_name", "namespace", and optionally "proxy_through_store" and "peer_ip", or None.
         """
         try:
-            # URL-encode the key to handle special characters
-            encoded_key = quote(key, safe="")
-            url = f"{self.base_url}/api/v1/keys/{encoded_key}/source"
-            if external:
-                url += "?external=true"
-
-            response = requests.get(url, timeout=5)
-
-            # Handle 503 (all sources at max concurrent) - retry with random peer
-            if response.status_code == 503 and retry_with_peers:
-                data = response.json()
-                available_ips = data.get("ips", [])
-                if available_ips:
-                    import random
-
-                    selected_ip = random.choice(available_ips)
-                    logger.info(f"All sources at max concurrent for key '{key}', randomly selected peer: {selected_ip}")
-                    if external:
-                        # For external clients, we can't use random IP selection because we need pod_name for port-forward
-                        # Fall back to store pod instead
-                        logger.debug("External client: falling back to store pod instead of random peer selection")
-                        return None
-                    return selected_ip
+            response = self.session.get(self._source_url(key, external), timeout=5)
+            if response.status_code != 503:
+                response.raise_for_status()
+            return self._parse_source_response(key, response.status_code, response.json(), retry_with_peers, external)
+        except requests.RequestException as e:
+            logger.warning(f"Failed to get source IP for key '{key}': {e}")
+            return None
+
+    def _source_url(self, key: str, external: bool) -> str:
+        # URL-encode the key to handle special characters
+        url = f"{self.base_url}/api/v1/keys/{quote(key, safe='')}/source"
+        if external:
+            url += "?external=true"
+        return url
+
+    @staticmethod
+    def _parse_source_response(key: str, status_code: int, data: dict, retry_with_peers: bool, external: bool):
+        # Handle 503 (all sources at max concurrent) - retry with random peer
+        if status_code == 503:
+            if not retry_with_peers:
                 return None
+            available_ips = data.get("ips", [])
+            if available_ips:
+                selected_ip = random.choice(available_ips)
+                logger.info(f"All sources at max concurrent for key '{key}', randomly selected peer: {selected_ip}")
+                if external:
+                    # For external clients, we can't use random IP selection because we need pod_name for port-forward
+                    # Fall back to store pod instead
+                    logger.debug("External client: falling back to store pod instead of random peer selection")
+                    return None
+                return selected_ip
+            return None
 
-            response.raise_for_status()
-            data = response.json()
+        # Check if key was found (new response format - 200 with {"found": False})
+        if data.get("found") is False:
+            # Key doesn't exist in metadata or filesystem
+            return None
+
+        if external:
+            # Return dict with pod info
+            return data
+        # Return IP address and src_path if available
+        ip = data.get("ip")
+        src_path = data.get("src_path")
+        if src_path:
+            return {"ip": ip, "src_path": src_path}
+        return ip
+
+    def get_source_ips(
+        self, keys: List[str], retry_with_peers: bool = True, external: bool = False
+    ) -> Dict[str, Optional[Union[str, dict]]]:
+        """
+        Bulk version of :meth:`get_source_ip`: look up sources for many keys concurrently over the pooled session.
+
+        Args:
+            keys (List[str]): Storage keys.
+            retry_with_peers (bool, optional): See :meth:`get_source_ip`. (Default: True)
+            external (bool, optional): See :meth:`get_source_ip`. (Default: False)
+
+        Returns:
+            Dict mapping each key to its :meth:`get_source_ip` result.
+        """
+        return self._bulk(
+            lambda key: self.get_source_ip(key, retry_with_peers=retry_with_peers, external=external), keys
+        )
+
+    def has_store_pods(self, keys: List[str]) -> Dict[str, bool]:
+        """
+        Bulk version of :meth:`has_store_pod`: check many keys concurrently over the pooled session.
+
+        Args:
+            keys (List[str]): Storage keys.
+
+        Returns:
+            Dict mapping each key to whether the store pod has it.
 
-            # Check if key was found (new response format - 200 with {"found": False})
-            if data.get("found") is False:
-                # Key doesn't exist in metadata or filesystem
+        Raises:
+            requests.exceptions.ConnectionError: If metadata server is unreachable
+        """
+        return self._bulk(self.has_store_pod, keys)
+
+    @staticmethod
+    def _bulk(fn, keys: List[str]) -> dict:
+        keys = list(dict.fromkeys(keys))
+        if len(keys) <= 1:
+            return {key: fn(key) for key in keys}
+        with ThreadPoolExecutor(max_workers=min(METADATA_POOL_SIZE, len(keys))) as executor:
+            return dict(zip(keys, executor.map(fn, keys)))
+
+    async def get_source_ips_async(
+        self, keys: List[str], retry_with_peers: bool = True, external: bool = False
+    ) -> Dict[str, Optional[Union[str, dict]]]:
+        """
+        Async version of :meth:`get_source_ips`, for callers already running an event loop.
+
+        Lookups run over :attr:`async_session`, which is kept between calls, with up to ``METADATA_POOL_SIZE``
+        requests in flight.
+        """
+        keys = list(dict.fromkeys(keys))
+        client = self.async_session
+
+        async def lookup(key):
+            try:
+                response = await client.get(self._source_url(key, external))
+                if response.status_code != 503:
+                    response.raise_for_status()
+                return self._parse_source_response(
+                    key, response.status_code, response.json(), retry_with_peers, external
+                )
+            except httpx.HTTPError as e:
+                logger.warning(f"Failed to get source IP for key '{key}': {e}")
                 return None
 
-            if external:
-                # Return dict with pod info
-                return data
-            else:
-                # Return IP address and src_path if available
-                ip = data.get("ip")
-                src_path = data.get("src_path")
-                if src_path:
-                    return {"ip": ip, "src_path": src_path}
-                return ip
-        except requests.RequestException as e:
-            logger.warning(f"Failed to get source IP for key '{key}': {e}")
-            return None
+        results = await asyncio.gather(*[lookup(key) for key in keys])
+        return dict(zip(keys, results))
 
     def publish_key(
         self,
@@ -161,7 +284,7 @@ class MetadataClient:
             if service_name:
                 payload["service_name"] = service_name
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/v1/keys/{encoded_key}/publish",
                 json=payload,
                 timeout=5,
@@ -187,7 +310,7 @@ class MetadataClient:
         try:
             # URL-encode the key to handle special characters
             encoded_key = quote(key, safe="")
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/v1/keys/{encoded_key}/source/complete",
                 json={"ip": ip},
                 timeout=5,
@@ -217,7 +340,7 @@ class MetadataClient:
         """
         # URL-encode the key to handle special characters
         encoded_key = quote(key, safe="")
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/api/v1/keys/{encoded_key}",
             timeout=5,
         )
@@ -247,7 +370,7 @@ class MetadataClient:
         try:
             # URL-encode the key to handle special characters
             encoded_key = quote(key, safe="")
-            response = requests.delete(
+            response = self.session.delete(
                 f"{self.base_url}/api/v1/keys/{encoded_key}/sources/{pod_ip}",
                 timeout=5,
             )
@@ -275,7 +398,7 @@ class MetadataClient:
             url = f"{self.base_url}/api/v1/keys/{encoded_key}"
             if recursive:
                 url += "?recursive=true"
-            response = requests.delete(url, timeout=30)  # Longer timeout for filesystem operations
+            response = self.session.delete(url, timeout=30)  # Longer timeout for filesystem operations
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -295,7 +418,7 @@ class MetadataClient:
         try:
             encoded_key = quote(key, safe="")
             url = f"{self.base_url}/api/v1/keys/{encoded_key}/mkdir"
-            response = requests.post(url, timeout=30)
+            response = self.session.post(url, timeout=30)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -317,7 +440,7 @@ class MetadataClient:
         """
         try:
             encoded_prefix = quote(prefix, safe="")
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/v1/keys/list?prefix={encoded_prefix}",
                 timeout=5,
             )
@@ -354,7 +477,7 @@ class MetadataClient:
             if service_name:
                 payload["service_name"] = service_name
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/v1/keys/{encoded_key}/store",
                 json=payload,
                 timeout=5,
@@ -402,7 +525,7 @@ class MetadataClient:
                 payload["ips"] = broadcast.ips
                 payload["group_id"] = broadcast.group_id
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/v1/broadcast/join",
                 json=payload,
                 timeout=10,
@@ -425,7 +548,7 @@ class MetadataClient:
             dict with status, putters, getters, and other info
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/v1/broadcast/{broadcast_id}/status",
                 params={"pod_ip": pod_ip},
                 timeout=5,
@@ -448,7 +571,7 @@ class MetadataClient:
             True if successful, False otherwise
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/v1/broadcast/{broadcast_id}/complete",
                 params={"pod_ip": pod_ip},
                 timeout=5,
@@ -471,7 +594,7 @@ class MetadataClient:
             dict with deleted_count and success status
         """
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f"{self.base_url}/api/v1/services/{quote(service_name, safe='')}/cleanup",
                 params={"namespace": self.namespace},
                 timeout=30,
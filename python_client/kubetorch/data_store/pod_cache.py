@@ -0,0 +1,193 @@
+"""
+Pod-local read-through cache for filesystem keys.
+
+Without it, every ``kt.get`` on a pod resolves the key through the metadata server and rsyncs it into ``dest``, so
+several ProcessWorkers loading the same model each download it. With ``KT_DATA_CACHE_DIR`` set (typically an
+emptyDir or PVC mount shared by the pod's processes), in-cluster gets go through the cache instead:
+
+- The key is rsynced into the cache once, under an exclusive per-key file lock, and then cloned into ``dest``:
+  a reflink (copy-on-write) where the filesystem supports it, otherwise a plain copy. Files in ``dest`` never share
+  data with the cache, so writing to them in place can't corrupt it for the pod's other processes.
+- Cache hits only read the entry, so they clone under a shared lock and processes loading the same key copy it
+  concurrently. The exclusive lock is only taken to fill, refresh or evict the entry.
+- Gets within ``KT_DATA_CACHE_TTL`` seconds (default 60) of the last fetch are served from the cache without
+  contacting the metadata server or the source. After that, the entry is refreshed with rsync, which only
+  transfers what changed. ``force=True`` always refreshes.
+- When the cache grows past ``KT_DATA_CACHE_MAX_GB`` (default 20), the least recently used entries are evicted.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional
+
+from kubetorch.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Linux ioctl to clone a file's extents (copy-on-write), supported by btrfs, XFS and overlayfs on top of them
+FICLONE = 0x40049409
+
+
+def _clone_file(src: Path, dst: Path):
+    # Never a hardlink: writes to dst in place would change the cached copy for every process on the pod
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    try:
+        with open(src, "rb") as src_f, open(dst, "wb") as dst_f:
+            fcntl.ioctl(dst_f.fileno(), FICLONE, src_f.fileno())
+        shutil.copystat(src, dst)
+    except OSError:
+        # No reflink support, or the cache is on a different filesystem than dest
+        shutil.copy2(src, dst)
+
+
+def _clone_tree(src: Path, dst: Path):
+    """Merge ``src`` into ``dst`` (like an rsync without ``--delete``), reflinking files where possible."""
+    for dirpath, dirnames, filenames in os.walk(src):
+        target_dir = dst / Path(dirpath).relative_to(src)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        # os.walk lists symlinks to directories with the directories, without descending into them
+        for name in filenames + [d for d in dirnames if os.path.islink(os.path.join(dirpath, d))]:
+            source_file = Path(dirpath) / name
+            if source_file.is_symlink():
+                target = target_dir / name
+                if target.exists() or target.is_symlink():
+                    target.unlink()
+                target.symlink_to(os.readlink(source_file))
+            else:
+                _clone_file(source_file, target_dir / name)
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += (Path(dirpath) / name).lstat().st_size
+            except OSError:
+                pass
+    return total
+
+
+class PodDataCache:
+    """Size-bounded LRU cache of fetched keys in a directory shared by the processes on a pod."""
+
+    def __init__(self, root: str, max_bytes: int, ttl: float):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _entry(self, cache_key: str) -> Path:
+        return self.root / hashlib.sha256(cache_key.encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _meta_path(entry: Path) -> Path:
+        return entry.with_suffix(".json")
+
+    @contextmanager
+    def _locked(self, entry: Path, blocking: bool = True, shared: bool = False):
+        mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        with open(entry.with_suffix(".lock"), "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, mode | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_meta(self, entry: Path) -> Optional[dict]:
+        try:
+            return json.loads(self._meta_path(entry).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, entry: Path, meta: dict):
+        # Hits update last_used concurrently under a shared lock, so each writer needs its own temp file
+        tmp_path = entry.with_suffix(f".json.{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(meta))
+        tmp_path.replace(self._meta_path(entry))
+
+    def _is_stale(self, meta: Optional[dict], refresh: bool) -> bool:
+        return meta is None or refresh or time.time() - meta["fetched_at"] >= self.ttl
+
+    def get(self, cache_key: str, dest: str, fetch: Callable[[str], None], refresh: bool = False):
+        """Clone the cached data for ``cache_key`` into the ``dest`` directory, first calling ``fetch(cache_dir)`` to
+        download it into the cache if it's missing, older than the TTL, or ``refresh`` is set."""
+        entry = self._entry(cache_key)
+        filled = False
+        while True:
+            with self._locked(entry, shared=True):
+                meta = self._read_meta(entry)
+                # Right after filling, serve what was fetched even if the TTL has already passed
+                if meta is not None and (filled or not self._is_stale(meta, refresh)):
+                    if not filled:
+                        logger.debug(f"Serving {cache_key} from the pod data cache")
+                    meta["last_used"] = time.time()
+                    self._write_meta(entry, meta)
+                    _clone_tree(entry, Path(dest))
+                    break
+
+            with self._locked(entry):
+                meta = self._read_meta(entry)
+                # Another process may have filled the entry while this one waited for the lock
+                if self._is_stale(meta, refresh and not filled):
+                    entry.mkdir(parents=True, exist_ok=True)
+                    fetch(str(entry) + "/")
+                    now = time.time()
+                    meta = {"key": cache_key, "fetched_at": now, "last_used": now, "size": _tree_size(entry)}
+                    self._write_meta(entry, meta)
+                filled = True
+        self._evict(keep=entry)
+
+    def _evict(self, keep: Path):
+        """Remove least recently used entries until the cache fits in ``max_bytes``. Entries in use are skipped."""
+        entries = []
+        for meta_path in self.root.glob("*.json"):
+            meta = self._read_meta(meta_path.with_suffix(""))
+            if meta is not None:
+                entries.append((meta.get("last_used", 0), meta.get("size", 0), meta_path.with_suffix("")))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            with self._locked(entry, blocking=False) as acquired:
+                if not acquired:
+                    continue
+                shutil.rmtree(entry, ignore_errors=True)
+                self._meta_path(entry).unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted {entry.name} ({size} bytes) from the pod data cache")
+
+
+_pod_cache = None
+_pod_cache_lock = threading.Lock()
+
+
+def get_pod_cache() -> Optional[PodDataCache]:
+    """The pod's data cache, or None if ``KT_DATA_CACHE_DIR`` isn't set."""
+    global _pod_cache
+    cache_dir = os.getenv("KT_DATA_CACHE_DIR")
+    if not cache_dir:
+        return None
+    with _pod_cache_lock:
+        if _pod_cache is None or str(_pod_cache.root) != cache_dir:
+            _pod_cache = PodDataCache(
+                cache_dir,
+                max_bytes=int(float(os.getenv("KT_DATA_CACHE_MAX_GB", "20")) * 1024**3),
+                ttl=float(os.getenv("KT_DATA_CACHE_TTL", "60")),
+            )
+        return _pod_cache
@@ -4,6 +4,7 @@ Pod Data Server - Per-node server for data transfers (GPU tensors and filesystem
 This server runs as a separate process on each node to handle:
 - GPU tensor transfers via NCCL broadcasts
 - Filesystem broadcast coordination for tree-based p2p propagation
+- Python objects stored with kt.put(key, obj=...)
 
 Architecture:
 - GPU: Application processes call kt.put(src=tensor) which registers the tensor
@@ -11,6 +12,8 @@ Architecture:
 - Filesystem: Tracks completed filesystem broadcasts with local paths. Child getters
   request data from parent's pod data server, which blocks until parent completes
   and returns the local path for rsync.
+- Objects: Pickled (protocol 5) into files in shared memory that this server owns. Readers
+  on the pod map the file; readers on other pods get it streamed from this server over TCP.
 - Server-to-server communication for coordination (no metadata server bounce)
 
 Usage:
@@ -24,14 +27,22 @@ Usage:
 
 import base64
 import ctypes
+import errno
+import itertools
 import json
+import mmap
 import os
+import pickle
+import select
+import shutil
 import signal
 import socket
 import struct
 import sys
+import tempfile
 import threading
 import time
+import uuid
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -68,6 +79,11 @@ SERVER_PID_FILE = "/tmp/kt-gpu-data-server.pid"
 KT_NCCL_TIMEOUT_SECONDS = int(os.environ.get("KT_NCCL_TIMEOUT_SECONDS", "60"))
 KT_NCCL_MAX_FAILURES = int(os.environ.get("KT_NCCL_MAX_FAILURES", "3"))
 
+# Objects stored with kt.put(key, obj=...) are files in this directory, so readers on the pod can map them directly
+OBJECT_STORE_DIR = os.environ.get("KT_OBJECT_STORE_DIR", "/dev/shm" if os.path.isdir("/dev/shm") else "/tmp")
+OBJECT_BUFFER_ALIGNMENT = 64
+OBJECT_STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 def _get_nccl_cuda_versions() -> dict:
     """Get NCCL and CUDA version information for compatibility checking."""
@@ -157,6 +173,132 @@ def _deserialize_ipc_handle(serialized: List) -> Tuple:
     return tuple(deserialized)
 
 
+def _dump_object(obj: Any, directory: str = OBJECT_STORE_DIR) -> str:
+    """
+    Serialize an object into a new file in ``directory`` and return its path.
+
+    Uses pickle protocol 5, so large contiguous buffers (NumPy arrays, bytearrays, ...) are written out-of-band
+    after the pickle stream rather than copied into it. Objects that don't support out-of-band buffers are copied
+    into the stream in memory before it's written; torch tensors are among them, since their storages pickle
+    in-band. File layout: the pickle stream and each buffer, 64-byte aligned, then a JSON trailer with their
+    (offset, length), then the trailer's length as 8 big-endian bytes.
+
+    Raises ``OSError(ENOSPC)`` before writing anything if ``directory`` doesn't have room for the file.
+    """
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    views = [memoryview(payload)] + [buffer.raw() for buffer in buffers]
+
+    segments = []
+    offset = 0
+    for view in views:
+        offset = -(-offset // OBJECT_BUFFER_ALIGNMENT) * OBJECT_BUFFER_ALIGNMENT
+        segments.append([offset, view.nbytes])
+        offset += view.nbytes
+    trailer = json.dumps({"segments": segments}).encode("utf-8")
+
+    size = offset + len(trailer) + 8
+    free = shutil.disk_usage(directory).free
+    if size > free:
+        raise OSError(
+            errno.ENOSPC, f"Object needs {size / 1e6:.1f} MB but {directory} has {free / 1e6:.1f} MB free", directory
+        )
+
+    fd, path = tempfile.mkstemp(prefix="kt-object-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for (start, _), view in zip(segments, views):
+                f.seek(start)
+                f.write(view)
+            f.seek(offset)
+            f.write(trailer)
+            f.write(struct.pack(">Q", len(trailer)))
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def _load_object(path: str) -> Any:
+    """
+    Deserialize an object written by ``_dump_object``.
+
+    The file is mapped copy-on-write and out-of-band buffers are handed to pickle as views of the mapping, so
+    arrays in the object share pages with the file instead of being read into memory, and stay writable.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapped)
+    trailer_end = len(view) - 8
+    (trailer_length,) = struct.unpack_from(">Q", view, trailer_end)
+    segments = json.loads(bytes(view[trailer_end - trailer_length : trailer_end]))["segments"]
+    (start, length), *buffers = segments
+    return pickle.loads(view[start : start + length], buffers=[view[o : o + n] for o, n in buffers])
+
+
+def _recv_exactly(sock: socket.socket, view: memoryview) -> None:
+    """Fill ``view`` from ``sock``, raising if the connection closes first."""
+    received = 0
+    while received < len(view):
+        n = sock.recv_into(view[received : received + OBJECT_STREAM_CHUNK_SIZE])
+        if not n:
+            raise RuntimeError("Remote server closed connection")
+        received += n
+
+
+# Messages are framed as a 4-byte big-endian length followed by the encoded message. The length's top bit marks a
+# msgpack-encoded message (JSON otherwise); the server replies in the encoding of the request.
+MSGPACK_FRAME_FLAG = 0x80000000
+
+
+def _get_msgpack():
+    """Lazily import msgpack."""
+    try:
+        import msgpack
+
+        return msgpack
+    except ImportError:
+        raise ImportError("msgpack is required for encoding='msgpack'. Install it with: pip install msgpack")
+
+
+def _encode_frame(message: dict, use_msgpack: bool = False) -> bytes:
+    """Encode a message as a length-prefixed frame."""
+    if use_msgpack:
+        data = _get_msgpack().packb(message, use_bin_type=True)
+        return struct.pack(">I", len(data) | MSGPACK_FRAME_FLAG) + data
+    data = json.dumps(message).encode("utf-8")
+    return struct.pack(">I", len(data)) + data
+
+
+class _FrameReader:
+    """Reads length-prefixed frames from a socket into one preallocated buffer, grown only for larger frames."""
+
+    def __init__(self, sock: socket.socket, initial_size: int = 64 * 1024):
+        self.sock = sock
+        self._buffer = bytearray(initial_size)
+
+    def read(self) -> Optional[Tuple[dict, bool]]:
+        """Read the next frame, returning (message, use_msgpack), or None if the peer closed the connection."""
+        header = memoryview(self._buffer)[:4]
+        n = self.sock.recv_into(header)
+        if not n:
+            return None
+        if n < 4:
+            _recv_exactly(self.sock, header[n:])
+
+        (length,) = struct.unpack_from(">I", self._buffer)
+        use_msgpack = bool(length & MSGPACK_FRAME_FLAG)
+        length &= ~MSGPACK_FRAME_FLAG
+        if length > len(self._buffer):
+            self._buffer = bytearray(max(length, 2 * len(self._buffer)))
+
+        view = memoryview(self._buffer)[:length]
+        _recv_exactly(self.sock, view)
+        if use_msgpack:
+            return _get_msgpack().unpackb(view, raw=False), True
+        return json.loads(bytes(view).decode("utf-8")), False
+
+
 @dataclass
 class RegisteredTensor:
     """Metadata for a registered GPU tensor."""
@@ -350,6 +492,12 @@ class PodDataServer:
         # TTL for completed broadcasts (10 minutes)
         self._fs_broadcast_ttl = 600
 
+        # Objects and CPU tensors put on this pod: key -> file in OBJECT_STORE_DIR (owned by this server)
+        self._objects: Dict[str, str] = {}
+        # Copies received as part of a broadcast, served to child getters: (group_id, key) -> (file, received_at)
+        self._broadcast_objects: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._objects_changed = threading.Condition(self._lock)
+
     def _record_nccl_success(self):
         """Record a successful NCCL operation, resetting failure counter."""
         with self._nccl_failure_lock:
@@ -459,6 +607,10 @@ class PodDataServer:
         if os.path.exists(self.socket_path):
             os.unlink(self.socket_path)
 
+        for path in list(self._objects.values()) + [path for path, _ in self._broadcast_objects.values()]:
+            if os.path.exists(path):
+                os.unlink(path)
+
         if os.path.exists(SERVER_PID_FILE):
             os.unlink(SERVER_PID_FILE)
 
@@ -487,135 +639,138 @@ class PodDataServer:
                     logger.error(f"Error in TCP accept loop: {e}")
 
     def _handle_remote_client(self, client_socket: socket.socket, addr: tuple):
-        """Handle a connection from a remote GPU server."""
+        """
+        Handle a connection from a remote GPU server.
+
+        Like local connections, it may carry several requests, each answered in order.
+        """
+        reader = _FrameReader(client_socket)
         try:
-            # Read message length (4 bytes, big-endian)
-            length_data = client_socket.recv(4)
-            if not length_data:
-                return
-
-            msg_length = struct.unpack(">I", length_data)[0]
-
-            # Read message
-            data = b""
-            while len(data) < msg_length:
-                chunk = client_socket.recv(min(msg_length - len(data), 4096))
-                if not chunk:
-                    break
-                data += chunk
-
-            # Parse JSON message
-            message = json.loads(data.decode("utf-8"))
-            command = message.get("command")
-
-            # Dispatch remote commands
-            if command == "request_broadcast":
-                # Remote getter is requesting to receive data
-                response = self._handle_remote_broadcast_request(message)
-            elif command == "join_broadcast":
-                # Source server telling us to join as receiver
-                response = self._handle_join_broadcast(message)
-            elif command == "fs_broadcast_get_path":
-                # Child getter requesting local path for filesystem broadcast
-                response = self._handle_fs_broadcast_get_path(message)
-            elif command == "ping":
-                response = {"status": "ok", "pid": os.getpid(), "tcp_port": self.tcp_port}
-            else:
-                response = {"status": "error", "error": f"Unknown remote command: {command}"}
+            while True:
+                frame = reader.read()
+                if frame is None:
+                    return
+                message, use_msgpack = frame
+
+                if message.get("command") == "fetch_object":
+                    # Streams the object after its own header instead of sending a framed response, so it ends
+                    # the connection
+                    self._handle_fetch_object(client_socket, message)
+                    return
 
-            # Send response
-            response_data = json.dumps(response).encode("utf-8")
-            client_socket.sendall(struct.pack(">I", len(response_data)))
-            client_socket.sendall(response_data)
+                try:
+                    response = self._dispatch_remote(message)
+                except Exception as e:
+                    logger.error(f"Error handling remote request from {addr}: {e}")
+                    response = {"status": "error", "error": str(e)}
+                self._send_response(client_socket, message, response, use_msgpack)
 
         except Exception as e:
             logger.error(f"Error handling remote client {addr}: {e}")
-            try:
-                error_response = json.dumps({"status": "error", "error": str(e)}).encode("utf-8")
-                client_socket.sendall(struct.pack(">I", len(error_response)))
-                client_socket.sendall(error_response)
-            except Exception:
-                pass
 
         finally:
             client_socket.close()
 
+    def _dispatch_remote(self, message: dict) -> dict:
+        """Run a command from a remote server."""
+        command = message.get("command")
+
+        if command == "request_broadcast":
+            # Remote getter is requesting to receive data
+            return self._handle_remote_broadcast_request(message)
+        elif command == "join_broadcast":
+            # Source server telling us to join as receiver
+            return self._handle_join_broadcast(message)
+        elif command == "fs_broadcast_get_path":
+            # Child getter requesting local path for filesystem broadcast
+            return self._handle_fs_broadcast_get_path(message)
+        elif command == "ping":
+            return {"status": "ok", "pid": os.getpid(), "tcp_port": self.tcp_port}
+        else:
+            return {"status": "error", "error": f"Unknown remote command: {command}"}
+
     def _handle_local_client(self, client_socket: socket.socket):
-        """Handle a connection from a local process (via Unix socket)."""
+        """
+        Handle a connection from a local process (via Unix socket).
+
+        Clients keep their connection open across commands and may pipeline them: requests are answered in the
+        order they arrive, each response echoing the request's ``request_id``.
+        """
+        reader = _FrameReader(client_socket)
         try:
-            # Read message length (4 bytes, big-endian)
-            length_data = client_socket.recv(4)
-            if not length_data:
-                return
-
-            msg_length = struct.unpack(">I", length_data)[0]
-
-            # Read message
-            data = b""
-            while len(data) < msg_length:
-                chunk = client_socket.recv(min(msg_length - len(data), 4096))
-                if not chunk:
-                    break
-                data += chunk
-
-            # Parse JSON message
-            message = json.loads(data.decode("utf-8"))
-            command = message.get("command")
-
-            # Dispatch command
-            if command == "register":
-                response = self._handle_register(message)
-            elif command == "unregister":
-                response = self._handle_unregister(message)
-            elif command == "serve_broadcast":
-                response = self._handle_serve_broadcast(message)
-            elif command == "receive_broadcast":
-                # Local getter process requesting to receive data
-                response = self._handle_receive_broadcast(message)
-            elif command == "list_keys":
-                response = self._handle_list_keys(message)
-            elif command == "execute_broadcast_group":
-                response = self._handle_execute_broadcast_group(message)
-            elif command == "put_tensor":
-                # High-level: register + MDS publish
-                response = self._handle_put_tensor(message)
-            elif command == "get_tensor":
-                # High-level: MDS lookup + NCCL receive
-                response = self._handle_get_tensor(message)
-            elif command == "put_tensors_broadcast":
-                # Batch: register multiple tensors + join broadcast as putter
-                response = self._handle_put_tensors_broadcast(message)
-            elif command == "get_tensors_broadcast":
-                # Batch: join broadcast as getter for multiple tensors
-                response = self._handle_get_tensors_broadcast(message)
-            elif command == "ping":
-                response = {"status": "ok", "pid": os.getpid(), "tcp_port": self.tcp_port}
-            elif command == "fs_broadcast_complete":
-                # Local client notifying that a filesystem broadcast download is complete
-                response = self._handle_fs_broadcast_complete(message)
-            elif command == "fs_broadcast_get_path":
-                # Local client requesting path (for testing; normally via TCP from child)
-                response = self._handle_fs_broadcast_get_path(message)
-            else:
-                response = {"status": "error", "error": f"Unknown command: {command}"}
+            while True:
+                frame = reader.read()
+                if frame is None:
+                    return
+                message, use_msgpack = frame
 
-            # Send response
-            response_data = json.dumps(response).encode("utf-8")
-            client_socket.sendall(struct.pack(">I", len(response_data)))
-            client_socket.sendall(response_data)
+                try:
+                    response = self._dispatch_local(message)
+                except Exception as e:
+                    logger.error(f"Error handling {message.get('command')} request: {e}")
+                    response = {"status": "error", "error": str(e)}
+                self._send_response(client_socket, message, response, use_msgpack)
 
         except Exception as e:
             logger.error(f"Error handling client: {e}")
-            try:
-                error_response = json.dumps({"status": "error", "error": str(e)}).encode("utf-8")
-                client_socket.sendall(struct.pack(">I", len(error_response)))
-                client_socket.sendall(error_response)
-            except Exception:
-                pass
 
         finally:
             client_socket.close()
 
+    def _dispatch_local(self, message: dict) -> dict:
+        """Run a command from a local process."""
+        command = message.get("command")
+
+        if command == "register":
+            return self._handle_register(message)
+        elif command == "unregister":
+            return self._handle_unregister(message)
+        elif command == "serve_broadcast":
+            return self._handle_serve_broadcast(message)
+        elif command == "receive_broadcast":
+            # Local getter process requesting to receive data
+            return self._handle_receive_broadcast(message)
+        elif command == "list_keys":
+            return self._handle_list_keys(message)
+        elif command == "execute_broadcast_group":
+            return self._handle_execute_broadcast_group(message)
+        elif command == "put_tensor":
+            # High-level: register + MDS publish
+            return self._handle_put_tensor(message)
+        elif command == "get_tensor":
+            # High-level: MDS lookup + NCCL receive
+            return self._handle_get_tensor(message)
+        elif command == "put_tensors_broadcast":
+            # Batch: register multiple tensors + join broadcast as putter
+            return self._handle_put_tensors_broadcast(message)
+        elif command == "get_tensors_broadcast":
+            # Batch: join broadcast as getter for multiple tensors
+            return self._handle_get_tensors_broadcast(message)
+        elif command == "ping":
+            return {"status": "ok", "pid": os.getpid(), "tcp_port": self.tcp_port}
+        elif command == "fs_broadcast_complete":
+            # Local client notifying that a filesystem broadcast download is complete
+            return self._handle_fs_broadcast_complete(message)
+        elif command == "fs_broadcast_get_path":
+            # Local client requesting path (for testing; normally via TCP from child)
+            return self._handle_fs_broadcast_get_path(message)
+        elif command == "put_object":
+            # Take ownership of a serialized object + MDS publish
+            return self._handle_put_object(message)
+        elif command == "get_object":
+            # Local lookup, or MDS lookup + TCP fetch from the source pod
+            return self._handle_get_object(message)
+        else:
+            return {"status": "error", "error": f"Unknown command: {command}"}
+
+    @staticmethod
+    def _send_response(client_socket: socket.socket, message: dict, response: dict, use_msgpack: bool):
+        """Send a response in the request's encoding, tagged with its request_id if it had one."""
+        if "request_id" in message:
+            # Copy, since some handlers return results shared between participants
+            response = {**response, "request_id": message["request_id"]}
+        client_socket.sendall(_encode_frame(response, use_msgpack))
+
     def _handle_register(self, message: dict) -> dict:
         """Handle tensor registration from a local process."""
         key = message["key"]
@@ -1328,28 +1483,12 @@ class PodDataServer:
 
         try:
             sock.connect((host, port))
+            sock.sendall(_encode_frame(message))
 
-            # Send message
-            data = json.dumps(message).encode("utf-8")
-            sock.sendall(struct.pack(">I", len(data)))
-            sock.sendall(data)
-
-            # Receive response length
-            length_data = sock.recv(4)
-            if not length_data:
+            frame = _FrameReader(sock).read()
+            if frame is None:
                 raise RuntimeError("Remote server closed connection")
-
-            msg_length = struct.unpack(">I", length_data)[0]
-
-            # Receive response
-            data = b""
-            while len(data) < msg_length:
-                chunk = sock.recv(min(msg_length - len(data), 4096))
-                if not chunk:
-                    break
-                data += chunk
-
-            return json.loads(data.decode("utf-8"))
+            return frame[0]
 
         finally:
             sock.close()
@@ -2099,45 +2238,278 @@ class PodDataServer:
 
         return {"status": "error", "error": "Broadcast completed but path not found"}
 
+    # ==================== Object Store ====================
 
-class PodDataServerClient:
-    """Client for communicating with the Pod Data Server."""
+    def _handle_put_object(self, message: dict) -> dict:
+        """
+        Handle put_object command - take ownership of an object file written by the client + publish to MDS.
 
-    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
-        self.socket_path = socket_path
+        The object stays available until the key is put again or the server exits, even if the putter exits.
+        """
+        key = message["key"]
+        path = message["path"]
+        if not os.path.isfile(path):
+            return {"status": "error", "error": f"Object file not found: {path}"}
+
+        with self._objects_changed:
+            previous = self._objects.get(key)
+            self._objects[key] = path
+            self._objects_changed.notify_all()
+        if previous and previous != path and os.path.exists(previous):
+            # Readers get their own hard link, so this doesn't affect gets in flight
+            os.unlink(previous)
+
+        if not self._mds_publish_gpu(key):
+            return {"status": "error", "error": "Failed to publish to MDS"}
+
+        logger.info(f"put_object: stored and published '{key}' ({os.path.getsize(path)} bytes)")
+        return {"status": "ok", "key": key}
 
-    def _send_message(self, message: dict, timeout: float = 30.0) -> dict:
-        """Send a message to the server and return the response."""
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
+    def _handle_get_object(self, message: dict) -> dict:
+        """
+        Handle get_object command - return the path of a file holding the object, which the caller owns.
+
+        Objects on this pod are hard-linked for the caller (no copy). Otherwise the source pod is looked up in MDS
+        and its server streams the object over TCP into a new file in OBJECT_STORE_DIR.
 
+        For broadcasts (``group_id`` set), the object is fetched from ``parent_ip`` when given (the parent's server
+        waits until it has received the object itself), and this server keeps a copy to serve its own children.
+        """
+        key = message["key"]
+        timeout = message.get("timeout", 300.0)
+        group_id = message.get("group_id")
+        parent_ip = message.get("parent_ip")
+        reader_path = os.path.join(OBJECT_STORE_DIR, f"kt-object-read-{uuid.uuid4().hex}")
+
+        if parent_ip:
+            port = message.get("parent_port") or DEFAULT_TCP_PORT
+            request = {"command": "fetch_object", "key": key, "group_id": group_id, "timeout": timeout}
+            # The parent waits up to `timeout` for its own copy before it starts sending
+            self._fetch_remote_object(parent_ip, port, request, reader_path, timeout + 10)
+            source_ip = parent_ip
+        else:
+            with self._lock:
+                path = self._objects.get(key)
+                if path:
+                    os.link(path, reader_path)
+            if path:
+                source_ip = "local"
+            else:
+                source = self._mds_get_gpu_source(key).get(key)
+                if source is None:
+                    return {"status": "error", "error": f"Object '{key}' not found"}
+                if source.get("ip") == self._pod_ip:
+                    return {
+                        "status": "error",
+                        "error": f"Object '{key}' is registered to this pod but no longer held here",
+                    }
+
+                port = source.get("gpu_server_port") or DEFAULT_TCP_PORT
+                request = {"command": "fetch_object", "key": key}
+                self._fetch_remote_object(source["ip"], port, request, reader_path, timeout)
+                source_ip = source["ip"]
+                logger.info(f"get_object: fetched '{key}' from {source_ip}:{port}")
+
+        if group_id:
+            self._add_broadcast_object(group_id, key, reader_path)
+        return {"status": "ok", "path": reader_path, "source": source_ip}
+
+    def _add_broadcast_object(self, group_id: str, key: str, path: str):
+        """Keep a link to an object received in a broadcast so child getters can fetch it from this pod."""
+        copy_path = os.path.join(OBJECT_STORE_DIR, f"kt-object-broadcast-{uuid.uuid4().hex}")
+        os.link(path, copy_path)
+
+        now = time.time()
+        with self._objects_changed:
+            stale_paths = []
+            for k, (old_path, received_at) in list(self._broadcast_objects.items()):
+                if now - received_at > self._fs_broadcast_ttl:
+                    del self._broadcast_objects[k]
+                    stale_paths.append(old_path)
+            previous = self._broadcast_objects.get((group_id, key))
+            if previous:
+                stale_paths.append(previous[0])
+            self._broadcast_objects[(group_id, key)] = (copy_path, now)
+            self._objects_changed.notify_all()
+
+        for stale_path in stale_paths:
+            if os.path.exists(stale_path):
+                os.unlink(stale_path)
+
+    def _fetch_remote_object(self, host: str, port: int, request: dict, dest_path: str, timeout: float) -> None:
+        """Stream an object from a remote pod data server into ``dest_path``, receiving directly into a mapping."""
+        key = request["key"]
+        sock = socket.create_connection((host, port), timeout=timeout)
         try:
-            sock.connect(self.socket_path)
+            sock.sendall(_encode_frame(request))
 
-            # Send message
-            data = json.dumps(message).encode("utf-8")
-            sock.sendall(struct.pack(">I", len(data)))
-            sock.sendall(data)
+            # Frames are read exactly, so this doesn't consume any of the object's bytes
+            frame = _FrameReader(sock).read()
+            if frame is None:
+                raise RuntimeError("Remote server closed connection")
+            header = frame[0]
+            if header.get("status") != "ok":
+                raise RuntimeError(header.get("error", f"Failed to fetch object '{key}' from {host}"))
+
+            size = header["size"]
+            with open(dest_path, "w+b") as f:
+                f.truncate(size)
+                with mmap.mmap(f.fileno(), size) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        _recv_exactly(sock, view)
+                    finally:
+                        view.release()
+        except BaseException:
+            if os.path.exists(dest_path):
+                os.unlink(dest_path)
+            raise
+        finally:
+            sock.close()
 
-            # Receive response length
-            length_data = sock.recv(4)
-            if not length_data:
-                raise RuntimeError("Server closed connection")
+    def _handle_fetch_object(self, client_socket: socket.socket, message: dict) -> None:
+        """
+        Send an object to a remote pod data server: a length-prefixed JSON header with its size, then the file.
 
-            msg_length = struct.unpack(">I", length_data)[0]
+        With a ``group_id``, sends this pod's broadcast copy instead, waiting up to ``timeout`` for it to arrive.
+        """
+        key = message.get("key")
+        group_id = message.get("group_id")
+        with self._objects_changed:
+            if group_id:
+                self._objects_changed.wait_for(
+                    lambda: (group_id, key) in self._broadcast_objects, timeout=message.get("timeout", 300.0)
+                )
+                path = self._broadcast_objects.get((group_id, key), (None, None))[0]
+            else:
+                path = self._objects.get(key)
+            # Opened under the lock, so a concurrent put of the same key can't remove it first
+            f = open(path, "rb") if path else None
 
-            # Receive response
-            data = b""
-            while len(data) < msg_length:
-                chunk = sock.recv(min(msg_length - len(data), 4096))
-                if not chunk:
-                    break
-                data += chunk
+        if f is None:
+            header = {"status": "error", "error": f"Object '{key}' not found on {self._pod_name or 'this pod'}"}
+        else:
+            header = {"status": "ok", "size": os.fstat(f.fileno()).st_size}
+        client_socket.sendall(_encode_frame(header))
 
-            return json.loads(data.decode("utf-8"))
+        if f is not None:
+            with f:
+                client_socket.sendfile(f)
 
-        finally:
-            sock.close()
+
+class PodDataServerClient:
+    """
+    Client for communicating with the Pod Data Server.
+
+    Each thread keeps one persistent connection to the server, opened on its first command. Commands can be
+    pipelined with ``_send_messages``: responses are read as they arrive while the requests are still being written.
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, encoding: Optional[str] = None):
+        """
+        Args:
+            socket_path: Unix socket path of the server
+            encoding: "json" or "msgpack" (requires the msgpack package). Defaults to the KT_PDS_ENCODING
+                environment variable, or "json".
+        """
+        self.socket_path = socket_path
+        self.encoding = encoding or os.environ.get("KT_PDS_ENCODING", "json")
+        if self.encoding not in ("json", "msgpack"):
+            raise ValueError(f"Unknown encoding '{self.encoding}', expected 'json' or 'msgpack'")
+        if self.encoding == "msgpack":
+            _get_msgpack()
+
+        self._local = threading.local()
+        self._request_ids = itertools.count(1)
+
+    def _connection(self, timeout: float) -> Tuple[socket.socket, _FrameReader]:
+        """This thread's connection to the server, opened if needed (including after a fork)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn[2] != os.getpid():
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            try:
+                sock.connect(self.socket_path)
+            except BaseException:
+                sock.close()
+                raise
+            conn = (sock, _FrameReader(sock), os.getpid())
+            self._local.conn = conn
+        conn[0].settimeout(timeout)
+        return conn[0], conn[1]
+
+    def _close_connection(self):
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None and conn[2] == os.getpid():
+            conn[0].close()
+
+    def close(self):
+        """Close the calling thread's connection to the server."""
+        self._close_connection()
+
+    def _send_message(self, message: dict, timeout: float = 30.0) -> dict:
+        """Send a message to the server and return the response."""
+        return self._send_messages([message], timeout=timeout)[0]
+
+    def _send_messages(self, messages: List[dict], timeout: float = 30.0) -> List[dict]:
+        """
+        Send messages to the server pipelined over this thread's connection and return their responses in order.
+
+        ``timeout`` applies to each socket operation. If the server closed an idle connection (e.g. it restarted),
+        the requests are retried once on a new connection.
+        """
+        for attempt in range(2):
+            reused = getattr(self._local, "conn", None) is not None
+            sock, reader = self._connection(timeout)
+
+            request_ids = [next(self._request_ids) for _ in messages]
+            frames = b"".join(
+                _encode_frame({**message, "request_id": request_id}, self.encoding == "msgpack")
+                for message, request_id in zip(messages, request_ids)
+            )
+
+            responses = []
+            try:
+                if len(messages) == 1:
+                    sock.sendall(frames)
+                else:
+                    self._write_pipelined(sock, reader, frames, request_ids, responses, timeout)
+                while len(responses) < len(request_ids):
+                    responses.append(self._read_response(reader, request_ids[len(responses)]))
+                return responses
+            except BaseException as e:
+                # The connection can't be resynchronized after a partial exchange
+                self._close_connection()
+                stale = reused and not responses and isinstance(e, (BrokenPipeError, ConnectionResetError))
+                if not stale or attempt:
+                    raise
+
+    def _write_pipelined(self, sock, reader, frames: bytes, request_ids: List[int], responses: List[dict], timeout):
+        """Write ``frames``, reading responses into ``responses`` whenever they're ready.
+
+        The server stops reading requests while it's blocked writing a response, so writing everything before
+        reading anything would deadlock once both directions' socket buffers fill.
+        """
+        pending = memoryview(frames)
+        while pending:
+            readable, writable, _ = select.select([sock], [sock], [], timeout)
+            if not readable and not writable:
+                raise socket.timeout("Timed out writing pipelined requests")
+            if readable:
+                responses.append(self._read_response(reader, request_ids[len(responses)]))
+            else:
+                pending = pending[sock.send(pending[:OBJECT_STREAM_CHUNK_SIZE]) :]
+
+    @staticmethod
+    def _read_response(reader: _FrameReader, request_id: int) -> dict:
+        frame = reader.read()
+        if frame is None:
+            raise ConnectionResetError("Server closed connection")
+        response = frame[0]
+        if response.pop("request_id", None) != request_id:
+            raise RuntimeError(f"Response out of sequence (expected request {request_id})")
+        return response
 
     def ping(self) -> dict:
         """Ping the server to check if it's alive."""
@@ -2642,31 +3014,74 @@ class PodDataServerClient:
 
         try:
             sock.connect((parent_ip, parent_port))
+            sock.sendall(_encode_frame(message))
 
-            # Send message
-            data = json.dumps(message).encode("utf-8")
-            sock.sendall(struct.pack(">I", len(data)))
-            sock.sendall(data)
-
-            # Receive response length
-            length_data = sock.recv(4)
-            if not length_data:
+            frame = _FrameReader(sock).read()
+            if frame is None:
                 raise RuntimeError("Parent server closed connection")
+            return frame[0]
+
+        finally:
+            sock.close()
 
-            msg_length = struct.unpack(">I", length_data)[0]
+    # ==================== Object Store API ====================
 
-            # Receive response
-            data = b""
-            while len(data) < msg_length:
-                chunk = sock.recv(min(msg_length - len(data), 4096))
-                if not chunk:
-                    break
-                data += chunk
+    def put_object(self, key: str, obj: Any, pid: Optional[int] = None) -> dict:
+        """
+        Store a picklable object with the server + publish to MDS.
 
-            return json.loads(data.decode("utf-8"))
+        The object is serialized straight into a file in the server's object directory (shared memory by
+        default), which the server then owns, so the putting process can exit without losing it.
 
-        finally:
-            sock.close()
+        Args:
+            key: Storage key
+            obj: Object to store
+            pid: PID of the putting process (defaults to current)
+
+        Returns:
+            Server response dict
+        """
+        path = _dump_object(obj)
+        message = {"command": "put_object", "key": key, "path": path, "pid": pid or os.getpid()}
+        try:
+            return self._send_message(message)
+        except Exception:
+            # The server never took ownership of the file
+            os.unlink(path)
+            raise
+
+    def get_object(
+        self,
+        key: str,
+        timeout: float = 300.0,
+        group_id: Optional[str] = None,
+        parent_ip: Optional[str] = None,
+        parent_port: int = DEFAULT_TCP_PORT,
+    ) -> dict:
+        """
+        Get an object stored with put_object on this pod or any other.
+
+        Args:
+            key: Storage key
+            timeout: Max time to wait for the transfer (including the parent's own transfer in a broadcast)
+            group_id: Broadcast group; the server keeps a copy to serve child getters in the group
+            parent_ip: Broadcast parent to fetch from instead of the source registered in MDS
+            parent_port: TCP port of the parent's pod data server
+
+        Returns:
+            Server response dict, with the deserialized object under 'object' if the status is 'ok'
+        """
+        message = {"command": "get_object", "key": key, "timeout": timeout}
+        if group_id:
+            message.update({"group_id": group_id, "parent_ip": parent_ip, "parent_port": parent_port})
+        response = self._send_message(message, timeout=timeout + 10)
+        if response.get("status") == "ok":
+            try:
+                response["object"] = _load_object(response["path"])
+            finally:
+                # The mapping outlives the file, and the server's copy is separate
+                os.unlink(response["path"])
+        return response
 
 
 def is_server_running(socket_path: str = DEFAULT_SOCKET_PATH) -> bool:
@@ -2674,12 +3089,14 @@ def is_server_running(socket_path: str = DEFAULT_SOCKET_PATH) -> bool:
     if not os.path.exists(socket_path):
         return False
 
+    client = PodDataServerClient(socket_path)
     try:
-        client = PodDataServerClient(socket_path)
         response = client.ping()
         return response.get("status") == "ok"
     except Exception:
         return False
+    finally:
+        client.close()
 
 
 def _forward_subprocess_output_to_log_capture(pipe, stream_name: str, source: str) -> None:
@@ -6,14 +6,19 @@ This module provides the low-level RsyncClient class that handles direct rsync o
 
 import asyncio
 import fcntl
+import heapq
 import os
 import pty
 import re
 import select
+import shlex
 import subprocess
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import kubetorch.provisioning.constants as provisioning_constants
@@ -37,6 +42,9 @@ RETRYABLE_RSYNC_CODES = {12, 23, 30, 35}
 RSYNC_MAX_RETRIES = 3
 RSYNC_RETRY_DELAY = 2  # seconds
 
+# A line of `rsync --list-only` output: permissions, size, date, time, path
+LIST_ONLY_REGEX = re.compile(r"^([-dlcbps])\S*\s+([\d,.]+)\s+\S+\s+\S+\s+(.+)$")
+
 
 class RsyncClient:
     """Core rsync functionality for data transfer."""
@@ -101,6 +109,7 @@ class RsyncClient:
         force: bool = False,
         is_download: bool = False,
         in_cluster: bool = False,
+        files_from: Optional[str] = None,
     ) -> str:
         """
         Build the rsync command.
@@ -114,12 +123,15 @@ class RsyncClient:
             force: Force overwrite
             is_download: True if downloading from cluster
             in_cluster: True if running inside Kubernetes cluster
+            files_from: Path to a file listing the paths (relative to the source directory) to transfer
         """
         if in_cluster:
-            return self._build_in_cluster_rsync_cmd(source, dest, contents, filter_options, force, is_download)
+            return self._build_in_cluster_rsync_cmd(
+                source, dest, contents, filter_options, force, is_download, files_from
+            )
         else:
             return self._build_external_rsync_cmd(
-                source, dest, rsync_local_port, contents, filter_options, force, is_download
+                source, dest, rsync_local_port, contents, filter_options, force, is_download, files_from
             )
 
     def _build_external_rsync_cmd(
@@ -131,6 +143,7 @@ class RsyncClient:
         filter_options: Optional[str] = None,
         force: bool = False,
         is_download: bool = False,
+        files_from: Optional[str] = None,
     ) -> str:
         """Build rsync command for external (outside cluster) execution."""
         base_url = self.get_base_rsync_url(rsync_local_port)
@@ -228,6 +241,9 @@ class RsyncClient:
         if force:
             rsync_cmd += " --ignore-times"
 
+        if files_from:
+            rsync_cmd += f" --files-from='{files_from}'"
+
         if is_download:
             rsync_cmd += f" {source_str} {remote_dest}"
         else:
@@ -243,6 +259,7 @@ class RsyncClient:
         filter_options: Optional[str] = None,
         force: bool = False,
         is_download: bool = False,
+        files_from: Optional[str] = None,
     ) -> str:
         """Build rsync command for in-cluster execution."""
         base_remote = self.get_rsync_pod_url()
@@ -335,6 +352,9 @@ class RsyncClient:
         if force:
             rsync_cmd += " --ignore-times"
 
+        if files_from:
+            rsync_cmd += f" --files-from='{files_from}'"
+
         if is_download:
             rsync_cmd += f" {source_str} {remote_dest}"
         else:
@@ -531,7 +551,7 @@ class RsyncClient:
     async def run_rsync_command_async(self, rsync_cmd: str, create_target_dir: bool = True):
         """Execute rsync command asynchronously."""
         # For now, run synchronously in executor
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self.run_rsync_command, rsync_cmd, create_target_dir)
 
     def upload(
@@ -542,6 +562,8 @@ class RsyncClient:
         filter_options: Optional[str] = None,
         force: bool = False,
         local_port: Optional[int] = None,
+        files_from: Optional[str] = None,
+        stripes: Optional[int] = None,
     ):
         """
         Upload files to the cluster.
@@ -553,36 +575,46 @@ class RsyncClient:
             filter_options: Additional rsync filters
             force: Force overwrite
             local_port: Local port for websocket tunnel
+            files_from: Path to a file listing the paths (relative to ``source``) to upload, instead of all of them
+            stripes: Number of concurrent rsync processes for a directory upload (default: ``KT_RSYNC_STRIPES``, or 1)
         """
         in_cluster = is_running_in_kubernetes()
         logger.debug(f"RsyncClient.upload: in_cluster={in_cluster}, service={self.service_name}, dest={dest}")
 
-        if in_cluster:
-            # In-cluster upload
-            rsync_cmd = self.build_rsync_command(
-                source=source,
-                dest=dest,
-                contents=contents,
-                filter_options=filter_options,
-                force=force,
-                in_cluster=True,
-            )
-            self.run_rsync_command(rsync_cmd)
-        else:
+        rsync_local_port = None
+        if not in_cluster:
             # External upload via websocket tunnel (reused across calls)
             start_port, ws_url = self.get_websocket_info(local_port)
-            tunnel = TunnelManager.get_tunnel(ws_url, start_port)
+            rsync_local_port = TunnelManager.get_tunnel(ws_url, start_port).local_port
 
-            rsync_cmd = self.build_rsync_command(
-                source=source,
+        def build(src, stripe_files_from=None, stripe_contents=contents):
+            return self.build_rsync_command(
+                source=src,
                 dest=dest,
-                rsync_local_port=tunnel.local_port,
-                contents=contents,
+                rsync_local_port=rsync_local_port,
+                contents=stripe_contents,
                 filter_options=filter_options,
                 force=force,
-                in_cluster=False,
+                in_cluster=in_cluster,
+                files_from=stripe_files_from or files_from,
             )
-            self.run_rsync_command(rsync_cmd)
+
+        stripes = _stripe_count(stripes)
+        base = _upload_base(source, contents) if stripes > 1 and not files_from else None
+        if base:
+            # List through rsync with the same filters as the upload, so excluded paths (.git, etc.) aren't striped
+            listing = self._list_files(build(base, stripe_contents=True))
+            if listing and len(listing[0]) > 1:
+                files, other_paths = listing
+                # The listed paths are relative to base, so upload base's contents
+                return self._run_striped(
+                    lambda stripe_files_from: build(base, stripe_files_from, stripe_contents=True),
+                    files,
+                    stripes,
+                    other_paths=other_paths,
+                )
+
+        self.run_rsync_command(build(source))
 
     async def upload_async(
         self,
@@ -592,33 +624,24 @@ class RsyncClient:
         filter_options: Optional[str] = None,
         force: bool = False,
         local_port: Optional[int] = None,
+        files_from: Optional[str] = None,
+        stripes: Optional[int] = None,
     ):
         """Async version of upload."""
-        if is_running_in_kubernetes():
-            rsync_cmd = self.build_rsync_command(
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            lambda: self.upload(
                 source=source,
                 dest=dest,
                 contents=contents,
                 filter_options=filter_options,
                 force=force,
-                in_cluster=True,
-            )
-            await self.run_rsync_command_async(rsync_cmd)
-        else:
-            # External upload via websocket tunnel (reused across calls)
-            start_port, ws_url = self.get_websocket_info(local_port)
-            tunnel = TunnelManager.get_tunnel(ws_url, start_port)
-
-            rsync_cmd = self.build_rsync_command(
-                source=source,
-                dest=dest,
-                rsync_local_port=tunnel.local_port,
-                contents=contents,
-                filter_options=filter_options,
-                force=force,
-                in_cluster=False,
-            )
-            await self.run_rsync_command_async(rsync_cmd)
+                local_port=local_port,
+                files_from=files_from,
+                stripes=stripes,
+            ),
+        )
 
     def download(
         self,
@@ -628,6 +651,7 @@ class RsyncClient:
         filter_options: Optional[str] = None,
         force: bool = False,
         local_port: Optional[int] = None,
+        stripes: Optional[int] = None,
     ):
         """
         Download files from the cluster.
@@ -639,39 +663,175 @@ class RsyncClient:
             filter_options: Additional rsync filters
             force: Force overwrite
             local_port: Local port for websocket tunnel
+            stripes: Number of concurrent rsync processes for a directory download (default: ``KT_RSYNC_STRIPES``,
+                or 1)
         """
-        if is_running_in_kubernetes():
-            # In-cluster download
-            rsync_cmd = self.build_rsync_command(
-                source=source,
-                dest=dest,
-                contents=contents,
-                filter_options=filter_options,
-                force=force,
-                is_download=True,
-                in_cluster=True,
-            )
-            self.run_rsync_command(rsync_cmd, create_target_dir=False)
-        else:
+        in_cluster = is_running_in_kubernetes()
+
+        rsync_local_port = None
+        if not in_cluster:
             # External download via websocket tunnel (reused across calls)
             start_port, ws_url = self.get_websocket_info(local_port)
-            tunnel = TunnelManager.get_tunnel(ws_url, start_port)
+            rsync_local_port = TunnelManager.get_tunnel(ws_url, start_port).local_port
 
             # Replace the rsync pod URL with localhost URL for tunneling
-            base_url = self.get_base_rsync_url(tunnel.local_port)
+            base_url = self.get_base_rsync_url(rsync_local_port)
             rsync_pod_url = self.get_rsync_pod_url()
 
             if isinstance(source, str):
                 source = source.replace(rsync_pod_url, base_url + "/")
 
-            rsync_cmd = self.build_rsync_command(
-                source=source,
+        def build(src, stripe_files_from=None):
+            return self.build_rsync_command(
+                source=src,
                 dest=dest,
-                rsync_local_port=tunnel.local_port,
+                rsync_local_port=rsync_local_port,
                 contents=contents,
                 filter_options=filter_options,
                 force=force,
                 is_download=True,
-                in_cluster=False,
+                in_cluster=in_cluster,
+                files_from=stripe_files_from,
             )
-            self.run_rsync_command(rsync_cmd, create_target_dir=False)
+
+        stripes = _stripe_count(stripes)
+        if stripes > 1 and isinstance(source, str):
+            listing = self._list_files(build(source))
+            # A single file (which may be downloaded to an exact dest path) isn't worth striping
+            if listing and len(listing[0]) > 1:
+                files, other_paths = listing
+                # Listed paths are relative to the source directory, or to its parent if the source has no trailing
+                # slash (the directory itself is copied), same as a regular download
+                base = source if source.endswith("/") else source.rsplit("/", 1)[0] + "/"
+                return self._run_striped(
+                    lambda stripe_files_from: build(base, stripe_files_from),
+                    files,
+                    stripes,
+                    create_target_dir=False,
+                    other_paths=other_paths,
+                )
+
+        self.run_rsync_command(build(source), create_target_dir=False)
+
+    @staticmethod
+    def _list_files(rsync_cmd: str) -> Optional[Tuple[List[Tuple[str, int]], List[str]]]:
+        """What an rsync command would transfer, from ``rsync --list-only`` with the same source and filters.
+
+        Returns the (path, size) of each regular file, and the paths of everything else that isn't a parent
+        directory: symlinks, special files and empty directories. None if the source can't be listed.
+        """
+        parts = shlex.split(rsync_cmd)
+        # Same source and filters, without the destination
+        list_cmd = [parts[0], "--list-only"] + parts[1:-1]
+        result = subprocess.run(list_cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            logger.debug(f"Could not list {parts[-2]} for a striped transfer, using a single rsync: {result.stderr}")
+            return None
+
+        files, other_paths, dirs = [], [], []
+        for line in result.stdout.splitlines():
+            match = LIST_ONLY_REGEX.match(line)
+            if not match:
+                continue
+            kind, path = match.group(1), match.group(3)
+            if kind == "-":
+                files.append((path, int(re.sub(r"[,.]", "", match.group(2)))))
+            elif kind == "d":
+                if path != ".":
+                    dirs.append(path)
+            else:
+                # Symlinks are listed as "name -> target"
+                other_paths.append(path.split(" -> ", 1)[0] if kind == "l" else path)
+
+        # With --files-from, rsync doesn't recurse into listed directories, so only empty ones need listing
+        parents = {str(Path(path).parent) for path, _ in files} | {str(Path(path).parent) for path in other_paths}
+        parents |= {str(Path(path).parent) for path in dirs}
+        other_paths += [path for path in dirs if path not in parents]
+        return files, other_paths
+
+    def _run_striped(
+        self,
+        build_cmd: Callable[[str], str],
+        files: List[Tuple[str, int]],
+        stripes: int,
+        create_target_dir: bool = True,
+        other_paths: Optional[List[str]] = None,
+    ):
+        """Transfer ``files`` with up to ``stripes`` concurrent rsync processes, one per size-balanced bucket.
+
+        ``build_cmd`` takes a ``--files-from`` list path and returns the rsync command for that stripe. Each stripe is
+        retried on its own (see run_rsync_command); if any stripe still fails, the first error is raised after the
+        others finish. ``create_target_dir`` is passed to run_rsync_command, same as for an unstriped transfer.
+        ``other_paths`` (symlinks, special files, empty directories) aren't balanced by size, and are transferred in
+        one more rsync after the stripes.
+        """
+        buckets = partition_files(files, stripes)
+        total_bytes = sum(size for _, size in files)
+        logger.info(
+            f"Transferring {len(files)} files ({total_bytes / 1e9:.2f} GB) with {len(buckets)} concurrent rsync stripes"
+        )
+
+        done_bytes = 0
+        progress_lock = threading.Lock()
+
+        def run_paths(paths: List[str]):
+            with tempfile.NamedTemporaryFile("w", suffix=".files", delete=False) as f:
+                f.write("\n".join(paths) + "\n")
+            try:
+                self.run_rsync_command(build_cmd(f.name), create_target_dir=create_target_dir)
+            finally:
+                os.unlink(f.name)
+
+        def run_stripe(index: int, paths: List[str], stripe_bytes: int):
+            nonlocal done_bytes
+            run_paths(paths)
+            with progress_lock:
+                done_bytes += stripe_bytes
+                logger.info(
+                    f"Stripe {index + 1}/{len(buckets)} done "
+                    f"({done_bytes / 1e9:.2f} of {total_bytes / 1e9:.2f} GB transferred)"
+                )
+
+        with ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+            futures = [
+                executor.submit(run_stripe, index, paths, stripe_bytes)
+                for index, (stripe_bytes, paths) in enumerate(buckets)
+            ]
+            errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            raise errors[0]
+        if other_paths:
+            run_paths(other_paths)
+
+
+def _stripe_count(stripes: Optional[int]) -> int:
+    return stripes if stripes is not None else int(os.getenv("KT_RSYNC_STRIPES", "1"))
+
+
+def partition_files(files: List[Tuple[str, int]], stripes: int) -> List[Tuple[int, List[str]]]:
+    """Split (path, size) pairs into at most ``stripes`` buckets of similar total size, as (total size, paths).
+
+    Greedy: the largest remaining file goes to the currently smallest bucket.
+    """
+    heap = [(0, index, []) for index in range(min(stripes, len(files)))]
+    for path, size in sorted(files, key=lambda f: f[1], reverse=True):
+        total, index, paths = heapq.heappop(heap)
+        paths.append(path)
+        heapq.heappush(heap, (total + size, index, paths))
+    return [(total, paths) for total, _, paths in sorted(heap, key=lambda bucket: bucket[1])]
+
+
+def _upload_base(source: Union[str, List[str]], contents: bool) -> Optional[str]:
+    """Base directory for a striped upload of a single directory source, or None.
+
+    The base is the directory itself when copying its contents, otherwise its parent, so listed paths keep the
+    directory's name like a regular upload.
+    """
+    if isinstance(source, list):
+        if len(source) != 1:
+            return None
+        source = source[0]
+    path = Path(source).expanduser().absolute()
+    if not path.is_dir():
+        return None
+    return str(path if contents or str(source).endswith("/") else path.parent)
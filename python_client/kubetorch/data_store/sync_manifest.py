@@ -0,0 +1,264 @@
+"""
+Content-addressed manifests for skipping no-op code syncs.
+
+``Module.to()`` rsyncs the project directory to the data store on every deploy, and on a large repo rsync's file walk
+and checksum exchange take seconds even when nothing changed. :func:`sync_to_store` keeps a manifest of each sync: a
+sha256 digest per file plus a root digest over all of them.
+
+The manifest of the last sync from this machine is cached under ``~/.kt/sync_manifests/<namespace>/<service>.json``.
+If the tree's root digest still matches it, the sync is skipped with no rsync at all, only a metadata lookup that the
+key still exists in the store. A file's digest is reused from the cache while the file's size and mtime are unchanged
+(rsync's own quick check), so checking an unchanged tree costs one directory walk.
+
+A copy of the manifest is uploaded next to the data, under the store key ``/.kt_sync_manifests/<key>``. When the tree
+did change, or there's no local cache, the sync fetches that copy and uploads only the files added or changed relative
+to it, listing them for rsync with ``--files-from``, so changes synced from another machine in the meantime are
+accounted for. If the store has no manifest (or no data) for the key, it does a full sync.
+
+An unchanged tree is trusted to match the store: a sync to the same service from another machine isn't undone until
+this tree changes (or its cached manifest is deleted). Uploads that bypass :func:`sync_to_store` (e.g. a plain
+``kt put`` to the same key) don't update the manifests. Deleted files aren't removed from the store, same as a full
+sync (rsync runs without ``--delete``).
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from kubetorch.logger import get_logger
+from kubetorch.resources.callables.utils import locate_working_dir
+
+from .key_utils import parse_key
+
+logger = get_logger(__name__)
+
+SYNC_MANIFEST_DIR = Path("~/.kt/sync_manifests")
+# Store keys holding the manifest of the last sync to each key, outside the synced data itself
+STORE_MANIFEST_PREFIX = "/.kt_sync_manifests"
+STORE_MANIFEST_NAME = "manifest.json"
+# Mirrors the default excludes in _get_rsync_exclude_options
+DEFAULT_EXCLUDES = ["*.pyc", "__pycache__", ".venv", ".git"]
+
+
+def _ignore_patterns() -> List[str]:
+    """Name patterns pruned from the manifest walk: the rsync defaults plus plain names from .ktignore/.gitignore.
+
+    Patterns the walk can't mirror exactly (paths, negations, ``KT_RSYNC_FILTERS``) aren't pruned. That only makes
+    the manifest list more files than rsync sends; rsync still applies its own filters to the upload.
+    """
+    if os.environ.get("KT_RSYNC_FILTERS"):
+        return []
+
+    patterns = list(DEFAULT_EXCLUDES)
+    repo_root, _, _ = locate_working_dir(os.getcwd())
+    for name in (".ktignore", ".gitignore"):
+        path = Path(repo_root) / name
+        if not path.exists():
+            continue
+        for line in path.read_text().splitlines():
+            line = line.strip()
+            if line.startswith("!"):
+                # A negation can re-include files that a broader pattern excludes
+                return list(DEFAULT_EXCLUDES)
+            if line and not line.startswith("#") and "/" not in line.rstrip("/"):
+                patterns.append(line)
+    return patterns
+
+
+def _ignored(name: str, is_dir: bool, patterns: List[str]) -> bool:
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            if is_dir and fnmatch.fnmatchcase(name, pattern[:-1]):
+                return True
+        elif fnmatch.fnmatchcase(name, pattern):
+            return True
+    return False
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SyncManifest:
+    """Digests of a synced tree, keyed by each file's path under its source's name (its path in the store)."""
+
+    def __init__(self, files: Dict[str, list]):
+        # path -> [size, mtime_ns, sha256]
+        self.files = files
+
+    @property
+    def root(self) -> str:
+        digest = hashlib.sha256()
+        for path in sorted(self.files):
+            digest.update(f"{path}\0{self.files[path][2]}\n".encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def build(cls, sources: List[Union[str, Path]], previous: Optional["SyncManifest"] = None) -> "SyncManifest":
+        """Walk ``sources`` (files or directories), reusing digests from ``previous`` for unchanged files."""
+        previous_files = previous.files if previous else {}
+        patterns = _ignore_patterns()
+        files = {}
+        for source in sources:
+            source = Path(source).expanduser().absolute()
+            if source.is_file():
+                cls._add(files, source, source.name, previous_files)
+                continue
+            # rsync runs with -L, so follow symlinks like it does, except a link back to a directory being walked
+            ancestors = {str(source): frozenset()}
+            for dirpath, dirnames, filenames in os.walk(source, followlinks=True):
+                dirnames[:] = cls._descend(dirpath, dirnames, ancestors, patterns)
+                rel_dir = Path(dirpath).relative_to(source.parent)
+                for name in filenames:
+                    if not _ignored(name, False, patterns):
+                        cls._add(files, Path(dirpath) / name, (rel_dir / name).as_posix(), previous_files)
+        return cls(files)
+
+    @staticmethod
+    def _descend(dirpath: str, dirnames: List[str], ancestors: Dict[str, frozenset], patterns: List[str]) -> List[str]:
+        """Subdirectories of ``dirpath`` to walk: not ignored, and not a symlink loop.
+
+        ``ancestors`` maps each directory still to be walked to the (device, inode) pairs of the directories above it.
+        """
+        try:
+            stat = os.stat(dirpath)
+        except OSError:
+            return []
+        chain = ancestors.pop(dirpath, frozenset()) | {(stat.st_dev, stat.st_ino)}
+        kept = []
+        for name in dirnames:
+            if _ignored(name, True, patterns):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if (stat.st_dev, stat.st_ino) in chain:
+                logger.debug(f"Skipping symlink loop at {path}")
+                continue
+            ancestors[path] = chain
+            kept.append(name)
+        return kept
+
+    @staticmethod
+    def _add(files: Dict[str, list], path: Path, key: str, previous_files: Dict[str, list]):
+        try:
+            stat = path.stat()
+        except OSError:
+            # Broken symlink, or removed during the walk
+            return
+        cached = previous_files.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            files[key] = cached
+        else:
+            files[key] = [stat.st_size, stat.st_mtime_ns, _file_digest(path)]
+
+    def changed_since(self, previous: "SyncManifest") -> List[str]:
+        """Paths added or modified since ``previous``."""
+        return sorted(
+            path for path, entry in self.files.items() if previous.files.get(path, [None, None, None])[2] != entry[2]
+        )
+
+    @staticmethod
+    def path_for(namespace: str, service_name: str) -> Path:
+        return SYNC_MANIFEST_DIR.expanduser() / namespace / f"{service_name}.json"
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SyncManifest"]:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        return cls(data.get("files", {}))
+
+    def save(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"root": self.root, "files": self.files}))
+        tmp_path.replace(path)
+
+
+def _store_has_key(client, key: str) -> bool:
+    try:
+        return client.metadata_client.has_store_pod(parse_key(key).full_key)
+    except Exception as e:
+        logger.debug(f"Could not check the store for key '{key}', doing a full sync: {e}")
+        return False
+
+
+def _store_manifest_key(key: str) -> str:
+    return f"{STORE_MANIFEST_PREFIX}/{key.strip('/')}"
+
+
+def _fetch_store_manifest(client, key: str) -> Optional[SyncManifest]:
+    """The manifest uploaded with the last sync to ``key`` from any machine, or None if the store has none."""
+    if not _store_has_key(client, key):
+        return None
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            client.get(key=_store_manifest_key(key), dest=tmpdir, contents=True)
+        except Exception as e:
+            logger.debug(f"No sync manifest in the store for key '{key}', doing a full sync: {e}")
+            return None
+        return SyncManifest.load(Path(tmpdir) / STORE_MANIFEST_NAME)
+
+
+def _upload_store_manifest(client, key: str, manifest: SyncManifest):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manifest.save(Path(tmpdir) / STORE_MANIFEST_NAME)
+        client.put(key=_store_manifest_key(key), src=tmpdir, contents=True)
+
+
+def sync_to_store(client, key: str, sources: List[str], service_name: str) -> None:
+    """Upload ``sources`` to ``key`` like ``client.put(key=key, src=sources)``, skipping what the store already has.
+
+    Args:
+        client (DataStoreClient): Client for the service's namespace.
+        key (str): Store key to sync to.
+        sources (List[str]): Local files or directories. Each lands in the store under its own name.
+        service_name (str): Service the sync belongs to, which names the locally cached manifest.
+    """
+    manifest_path = SyncManifest.path_for(client.namespace, service_name)
+    local = SyncManifest.load(manifest_path)
+    current = SyncManifest.build(sources, local)
+    if local is not None and current.root == local.root and _store_has_key(client, key):
+        logger.info(f"No changes to sync for {service_name}, skipping rsync")
+        return
+
+    source_dirs = {Path(source).name: Path(source).expanduser().absolute().parent for source in sources}
+    # Something is being sent, so diff against what the store holds, which another machine may have synced since
+    stored = _fetch_store_manifest(client, key) if len(source_dirs) == len(sources) else None
+
+    if stored is None:
+        client.put(key=key, src=sources, contents=False)
+    elif current.root == stored.root:
+        logger.info(f"No changes to sync for {service_name}, skipping rsync")
+    else:
+        changed = current.changed_since(stored)
+        logger.info(f"Syncing {len(changed)} changed file{'' if len(changed) == 1 else 's'} for {service_name}")
+
+        by_source: Dict[str, List[str]] = {}
+        for path in changed:
+            by_source.setdefault(path.split("/", 1)[0], []).append(path)
+        for name, paths in by_source.items():
+            with tempfile.NamedTemporaryFile("w", suffix=".files", delete=False) as f:
+                f.write("\n".join(paths) + "\n")
+            try:
+                # Paths in the list are relative to the source's parent, so they keep the source's name in the store
+                client.put(key=key, src=str(source_dirs[name]), contents=True, files_from=f.name)
+            finally:
+                os.unlink(f.name)
+
+    # Uploaded after the data, so a failed sync never leaves a manifest claiming files the store doesn't have
+    if stored is None or current.root != stored.root:
+        _upload_store_manifest(client, key, current)
+    current.save(manifest_path)
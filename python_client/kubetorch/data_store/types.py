@@ -54,6 +54,10 @@ class BroadcastWindow:
     - Tree-based propagation with configurable fanout (~50 for filesystem)
     - Each getter rsyncs from its parent's rsync daemon
 
+    For CPU tensor transfers:
+    - Getters form a tree like filesystem broadcasts, fetching from their parent's pod data server
+    - `pack` on the putter stores all tensors in a single buffer
+
     Attributes:
         timeout (float, optional): Maximum time in seconds to wait for participants. The quorum
             closes after this timeout even if other conditions aren't met. (Default: None)
@@ -67,11 +71,12 @@ class BroadcastWindow:
         fanout (int, optional): Number of children each node can have in the broadcast tree.
             Defaults to 2 for GPU (binary tree), can be set higher for filesystem
             transfers where rsync can handle many concurrent clients (~50). (Default: None)
-        pack (bool, optional): For GPU state_dict transfers only. When True, concatenates all
+        pack (bool, optional): For GPU and CPU state_dict transfers. When True, concatenates all
             tensors into a single packed buffer before broadcasting for maximum
             efficiency (single NCCL call). Requires all participants to have
             identical dict structure (same keys). Default False uses async
-            overlapped broadcasts (one per tensor, pipelined). (Default: False)
+            overlapped broadcasts (one per tensor, pipelined). For CPU tensors, only the
+            putter's setting matters. (Default: False)
 
     Examples:
         # Wait up to 10 seconds for participants
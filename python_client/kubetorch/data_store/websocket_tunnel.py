@@ -1,15 +1,21 @@
+import asyncio
 import atexit
+import os
 import random
 import socket
 import threading
 import time
 
-import websocket
-
 from kubetorch.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Reads from rsync start at MIN_FRAME_SIZE and double while they fill the buffer, up to MAX_FRAME_SIZE per frame
+MIN_FRAME_SIZE = 64 * 1024
+MAX_FRAME_SIZE = 1024 * 1024
+# After the local side's EOF, how long to keep relaying the server's remaining data before closing the connection
+HALF_CLOSE_TIMEOUT = 30
+
 
 class TunnelManager:
     """Manages a pool of reusable WebSocket tunnels.
@@ -52,7 +58,9 @@ class TunnelManager:
 
             # Create new tunnel
             logger.debug(f"Creating new tunnel for {ws_url}")
-            tunnel = WebSocketRsyncTunnel(start_port, ws_url)
+            tunnel = WebSocketRsyncTunnel(
+                start_port, ws_url, compress=os.getenv("KT_RSYNC_TUNNEL_COMPRESSION", "false").lower() == "true"
+            )
             tunnel.__enter__()
             cls._tunnels[ws_url] = tunnel
             return tunnel
@@ -70,12 +78,29 @@ class TunnelManager:
 
 
 class WebSocketRsyncTunnel:
-    def __init__(self, local_port: int, ws_url: str):
+    """Local TCP port that forwards each rsync connection over its own websocket to the data store.
+
+    All connections are served by one asyncio event loop on a background thread, rather than two threads each.
+    Backpressure is end to end: a slow websocket stops reads from rsync, and a slow rsync stops reads from the
+    websocket (``max_queue`` frames are buffered).
+
+    Args:
+        local_port (int): Starting port for finding an available local port.
+        ws_url (str): The websocket URL to tunnel to.
+        compress (bool, optional): Negotiate permessage-deflate compression per connection, which helps on slow
+            links with compressible data. Set with ``KT_RSYNC_TUNNEL_COMPRESSION=true``. (Default: False)
+    """
+
+    def __init__(self, local_port: int, ws_url: str, compress: bool = False):
         self.requested_port = local_port
         self.local_port = None  # Will be set in __enter__
         self.ws_url = ws_url
+        self.compress = compress
         self.running = False
         self.server_socket = None
+        self._loop = None
+        self._server = None
+        self._writers = set()  # Open local connections, closed when the tunnel stops
 
     def __enter__(self):
         self.running = True
@@ -99,7 +124,7 @@ class WebSocketRsyncTunnel:
                 port = start_port + i
                 try:
                     server_socket.bind(("127.0.0.1", port))
-                    server_socket.listen(5)
+                    server_socket.listen(64)
                     # Success! Save the socket and port
                     self.server_socket = server_socket
                     self.local_port = port
@@ -124,75 +149,116 @@ class WebSocketRsyncTunnel:
                 f"Could not find available port after {max_attempts} attempts starting from {self.requested_port}"
             )
 
-        threading.Thread(target=self._accept_loop, daemon=True).start()
-
-        # Wait for ready
-        for _ in range(50):
-            try:
-                with socket.socket() as s:
-                    s.settimeout(0.1)
-                    if s.connect_ex(("127.0.0.1", self.local_port)) == 0:
-                        return self
-            except:
-                pass
-            time.sleep(0.1)
-        raise RuntimeError("Tunnel failed to start")
+        ready = threading.Event()
+        startup_error = []
+        threading.Thread(target=self._run_loop, args=(ready, startup_error), daemon=True).start()
+        if not ready.wait(timeout=5) or startup_error:
+            self.__exit__(None, None, None)
+            raise RuntimeError(f"Tunnel failed to start: {startup_error[0] if startup_error else 'timed out'}")
+        return self
 
     def __exit__(self, *args):
         self.running = False
-        if self.server_socket:
+        if self._loop and self._loop.is_running():
+            # The loop owns the listening socket now, and closes it on the way out
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        elif self.server_socket:
             try:
                 self.server_socket.close()
             except:
                 pass  # Already closed
 
-    def _accept_loop(self):
-        while self.running:
-            try:
-                client_sock, _ = self.server_socket.accept()
-                threading.Thread(target=self._handle_client, args=(client_sock,), daemon=True).start()
-            except:
-                break
+    def _run_loop(self, ready: threading.Event, startup_error: list):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle_client, sock=self.server_socket, limit=MAX_FRAME_SIZE)
+            )
+        except Exception as e:
+            startup_error.append(e)
+            ready.set()
+            return
+        ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            # Close open connections first, so their handlers wind down on a closed stream rather than mid-write
+            for writer in list(self._writers):
+                writer.close()
+            connections = asyncio.all_tasks(self._loop)
+            for task in connections:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*connections, return_exceptions=True))
+            self._loop.close()
+            self.running = False
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            from websockets.asyncio.client import connect as ws_connect
+        except ImportError:
+            from websockets import connect as ws_connect
+
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._writers.add(writer)
 
-    def _handle_client(self, client_sock):
-        ws = None
         try:
-            ws = websocket.create_connection(self.ws_url)
+            async with ws_connect(
+                self.ws_url,
+                compression="deflate" if self.compress else None,
+                max_size=None,
+                ping_interval=None,
+                open_timeout=30,
+            ) as ws:
 
-            def tcp_to_ws():
-                while self.running:
-                    try:
-                        data = client_sock.recv(65536)
+                async def tcp_to_ws():
+                    frame_size = MIN_FRAME_SIZE
+                    while True:
+                        data = await reader.read(frame_size)
                         if not data:
                             break
-                        ws.send_binary(data)
-                    except:
-                        break
-
-            def ws_to_tcp():
-                while self.running:
-                    try:
-                        data = ws.recv()
-                        if isinstance(data, bytes):
-                            client_sock.send(data)
-                    except:
-                        break
-
-            t1 = threading.Thread(target=tcp_to_ws, daemon=True)
-            t2 = threading.Thread(target=ws_to_tcp, daemon=True)
-            t1.start()
-            t2.start()
-            t1.join()
-            t2.join()
+                        # Waits while the websocket's write buffer is full
+                        await ws.send(data)
+                        if len(data) == frame_size:
+                            frame_size = min(frame_size * 2, MAX_FRAME_SIZE)
+
+                async def ws_to_tcp():
+                    async for message in ws:
+                        if isinstance(message, bytes):
+                            writer.write(message)
+                            await writer.drain()
+
+                sending, receiving = asyncio.create_task(tcp_to_ws()), asyncio.create_task(ws_to_tcp())
+                await asyncio.wait([sending, receiving], return_when=asyncio.FIRST_COMPLETED)
+                if not receiving.done() and not sending.exception():
+                    # EOF from the local side may only be a half-close, with a response still on its way. Websockets
+                    # can't half-close, so stop sending and relay the rest until the server closes, or time out in
+                    # case the local side closed completely.
+                    await asyncio.wait([receiving], timeout=HALF_CLOSE_TIMEOUT)
+                tasks = [sending, receiving]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                for task in tasks:
+                    if task.cancelled():
+                        continue
+                    if task.exception() and not isinstance(task.exception(), ConnectionError):
+                        logger.debug(f"Tunnel connection to {self.ws_url} ended with error: {task.exception()}")
+
+        except asyncio.CancelledError:
+            # The tunnel is stopping. Finish normally: asyncio logs an error for a cancelled connection handler.
+            pass
 
         except Exception as e:
-            print(f"WebSocket connection error: {e}")
+            logger.warning(f"WebSocket connection error: {e}")
 
         finally:
-            # close both connections
-            for conn in [client_sock, ws]:
-                if conn:
-                    try:
-                        conn.close()
-                    except:
-                        pass
+            self._writers.discard(writer)
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except (Exception, asyncio.CancelledError):
+                pass
@@ -4,6 +4,8 @@ Distributed utilities for kubetorch services.
 This module provides utilities for distributed operations within kubetorch services.
 """
 
+from kubetorch.serving.sharding import shard
+
 from .utils import pod_ips
 
-__all__ = ["pod_ips"]
+__all__ = ["pod_ips", "shard"]
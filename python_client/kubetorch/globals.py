@@ -7,7 +7,7 @@ import subprocess
 import threading
 import time
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cache
 from typing import Any, Dict, List, Literal, Optional
 
@@ -105,11 +105,28 @@ class DebugConfig:
         return {"mode": self.mode, "port": self.port}
 
 
+# How long a port forward from the broker is used before asking the broker for it again, so it is restarted if needed
+# and not stopped as idle
+BROKER_RECHECK_SECONDS = 60
+
+
 @dataclass(frozen=True)
 class PFHandle:
-    process: subprocess.Popen
+    process: Optional[subprocess.Popen]  # None if the port forward is owned by the port-forward broker
     port: int
     base_url: str  # "http://localhost:<port>"
+    created: float = field(default_factory=time.monotonic)
+    broker_socket_id: Optional[tuple] = None  # The broker's socket when the port was handed out, if brokered
+
+    def is_alive(self) -> bool:
+        if self.process is None:
+            from kubetorch.provisioning.port_forward_broker import broker_socket_id
+
+            # Ask the broker again after a while, or right away if it has restarted since (its ports may have moved)
+            if time.monotonic() - self.created >= BROKER_RECHECK_SECONDS:
+                return False
+            return broker_socket_id() == self.broker_socket_id
+        return self.process.poll() is None
 
 
 # cache a single pf per service (currently just a single NGINX proxy)
@@ -138,6 +155,43 @@ def _cleanup_port_forwards():
         _port_forwards.clear()
 
 
+def _brokered_pf(
+    service_name: str, namespace: str, remote_port: int, health_endpoint: str, previous: Optional[PFHandle]
+) -> Optional[PFHandle]:
+    """Get a port forward from the port-forward broker, shared with other processes. Returns None if the broker is
+    disabled or fails, so the caller starts its own."""
+    import httpx
+
+    from kubetorch import VersionMismatchError
+    from kubetorch.provisioning.port_forward_broker import broker_enabled, broker_socket_id, request_port_forward
+    from kubetorch.provisioning.utils import check_kubetorch_versions, extract_config_from_nginx_health_check
+
+    if not broker_enabled():
+        return None
+
+    try:
+        local_port = request_port_forward(service_name, namespace, remote_port, health_endpoint=health_endpoint)
+        socket_id = broker_socket_id()
+        # The broker has waited for the endpoint to be healthy, so check versions and load the config once
+        if health_endpoint and (previous is None or previous.port != local_port):
+            resp = httpx.get(f"http://localhost:{local_port}{health_endpoint}", timeout=5)
+            resp.raise_for_status()
+            check_kubetorch_versions(resp)
+            cluster_config = extract_config_from_nginx_health_check(resp)
+            if isinstance(cluster_config, dict):
+                config.cluster_config = cluster_config
+                config.write(values={"cluster_config": cluster_config})
+    except VersionMismatchError:
+        raise
+    except Exception as e:
+        logger.debug(f"Port-forward broker unavailable, starting port forward in this process: {e}")
+        return None
+
+    return PFHandle(
+        process=None, port=local_port, base_url=f"http://localhost:{local_port}", broker_socket_id=socket_id
+    )
+
+
 def _ensure_pf(service_name: str, namespace: str, remote_port: int, health_endpoint: str) -> PFHandle:
     from kubetorch.provisioning.utils import wait_for_port_forward
     from kubetorch.resources.compute.utils import find_available_port
@@ -147,16 +201,21 @@ def _ensure_pf(service_name: str, namespace: str, remote_port: int, health_endpo
 
     # Fast path: check without lock first
     h = _port_forwards.get(cache_key)
-    if h and h.process.poll() is None:
+    if h and h.is_alive():
         return h
 
     # Slow path: need to create port forward
     with _pf_lock:
         # Double-check pattern: check again inside the lock
         h = _port_forwards.get(cache_key)
-        if h and h.process.poll() is None:
+        if h and h.is_alive():
             return h
 
+        brokered = _brokered_pf(service_name, namespace, remote_port, health_endpoint, previous=h)
+        if brokered:
+            _port_forwards[cache_key] = brokered
+            return brokered
+
         # Now create the port forward while holding the lock
         # This ensures only one thread creates the port forward
         local_port = find_available_port(LOCAL_NGINX_PORT)
@@ -215,7 +274,7 @@ async def _ensure_pf_async(service_name: str, namespace: str, remote_port: int,
 
     # Fast path: check without lock first
     h = _port_forwards.get(cache_key)
-    if h and h.process.poll() is None:
+    if h and h.is_alive():
         return h
 
     # Ensure async lock is created (lazy initialization)
@@ -227,9 +286,17 @@ async def _ensure_pf_async(service_name: str, namespace: str, remote_port: int,
     async with _pf_async_lock:
         # Double-check pattern: check again inside the lock
         h = _port_forwards.get(cache_key)
-        if h and h.process.poll() is None:
+        if h and h.is_alive():
             return h
 
+        loop = asyncio.get_event_loop()
+        brokered = await loop.run_in_executor(
+            None, _brokered_pf, service_name, namespace, remote_port, health_endpoint, h
+        )
+        if brokered:
+            _port_forwards[cache_key] = brokered
+            return brokered
+
         # Create port forward in a thread to avoid blocking the event loop
         def create_port_forward():
             local_port = find_available_port(LOCAL_NGINX_PORT)
@@ -277,7 +344,6 @@ async def _ensure_pf_async(service_name: str, namespace: str, remote_port: int,
             return PFHandle(process=proc, port=local_port, base_url=f"http://localhost:{local_port}")
 
         # Run the blocking operation in a thread
-        loop = asyncio.get_event_loop()
         h = await loop.run_in_executor(None, create_port_forward)
 
         # Store in cache while still holding the lock
@@ -308,7 +374,7 @@ def service_url(
     h = _ensure_pf(service_name, namespace, remote_port, health_endpoint)
 
     # if the process died between creation and use, recreate once
-    if h.process.poll() is not None:
+    if not h.is_alive():
         cache_key = f"{service_name}:{remote_port}"
         with _pf_lock:
             _port_forwards.pop(cache_key, None)
@@ -336,7 +402,7 @@ async def service_url_async(
     h = await _ensure_pf_async(service_name, namespace, remote_port, health_endpoint)
 
     # if the process died between creation and use, recreate once
-    if h.process.poll() is not None:
+    if not h.is_alive():
         cache_key = f"{service_name}:{remote_port}"
         # Ensure async lock is created
         global _pf_async_lock
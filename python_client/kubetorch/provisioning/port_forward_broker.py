@@ -0,0 +1,470 @@
+"""
+Port-forward broker: a per-user background daemon that owns long-lived ``kubectl port-forward`` processes.
+
+Without it, every process (each ``kt`` CLI command, notebook kernel or pytest worker) starts its own port forward to
+the cluster, paying kubectl's startup and a health wait before its first request. The broker keeps port forwards
+alive across processes instead: clients ask it for a service's local port over a Unix socket under ``~/.kt`` and
+connect to that port directly.
+
+- Port forwards are keyed by kubeconfig, context, namespace, service and remote port, and by the client's kubectl
+  environment: the variables kubectl and its exec credential plugins read (cloud credentials and profiles, proxies,
+  PATH and HOME). kubectl runs with the requesting client's values rather than the broker's, so clients with
+  different credentials never share a port forward.
+- If a kubectl process exits (e.g. the pod behind the service restarted), it is restarted on the same local port
+  when possible, with backoff while it keeps failing.
+- Port forwards no client has asked for in ``KT_PORT_FORWARD_IDLE_TIMEOUT`` seconds (default 900) are stopped, and
+  the broker exits once it has none left. Clients ask again at least every minute while they use one, and right
+  away once the broker's socket changes (the broker restarted, so their port may have moved).
+
+Protocol: one JSON request per line on the socket, each answered by one JSON line, e.g.
+``{"action": "ensure", "service_name": "...", "namespace": "...", "remote_port": 32300}`` ->
+``{"status": "ok", "port": 32301}``. The other actions are "ping", "list" and "shutdown".
+
+Set ``KT_PORT_FORWARD_BROKER=false`` to start port forwards in each process instead.
+"""
+
+import fcntl
+import json
+import os
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from kubetorch.logger import get_logger
+from kubetorch.provisioning.constants import LOCAL_NGINX_PORT
+
+logger = get_logger(__name__)
+
+DEFAULT_SOCKET_PATH = Path("~/.kt/port-forward-broker.sock")
+DEFAULT_IDLE_TIMEOUT = 900
+# How often the broker checks its kubectl processes
+CHECK_INTERVAL = 2.0
+MAX_RESTART_BACKOFF = 60.0
+READY_TIMEOUT = 30
+
+# Environment variables kubectl and exec credential plugins (aws, gke-gcloud-auth-plugin, kubelogin, ...) read
+KUBECTL_ENV_PREFIXES = ("KUBE", "AWS_", "GOOGLE_", "CLOUDSDK_", "AZURE_", "AAD_", "USE_GKE_")
+KUBECTL_ENV_VARS = ("PATH", "HOME", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY", "http_proxy", "https_proxy", "no_proxy")
+
+
+def broker_enabled() -> bool:
+    return os.getenv("KT_PORT_FORWARD_BROKER", "true").lower() not in ("false", "0")
+
+
+def _socket_path(socket_path=None) -> Path:
+    return Path(socket_path or os.getenv("KT_PORT_FORWARD_BROKER_SOCKET") or DEFAULT_SOCKET_PATH).expanduser()
+
+
+def _is_kubectl_env(name: str) -> bool:
+    return name in KUBECTL_ENV_VARS or name.startswith(KUBECTL_ENV_PREFIXES)
+
+
+def _kubectl_env() -> Dict[str, str]:
+    """The environment variables from this process that decide how kubectl authenticates to the cluster."""
+    return {name: value for name, value in os.environ.items() if _is_kubectl_env(name)}
+
+
+def _kube_context() -> Tuple[str, Optional[str]]:
+    """The kubeconfig path and current context kubectl would use in this process."""
+    kubeconfig = os.getenv("KUBECONFIG") or str(Path("~/.kube/config").expanduser())
+    try:
+        import yaml
+
+        with open(kubeconfig.split(os.pathsep)[0]) as f:
+            return kubeconfig, (yaml.safe_load(f) or {}).get("current-context")
+    except Exception:
+        return kubeconfig, None
+
+
+class _PortForward:
+    """One kubectl port-forward process owned by the broker, restarted when it exits."""
+
+    def __init__(
+        self,
+        service_name: str,
+        namespace: str,
+        remote_port: int,
+        kubeconfig: str,
+        context: Optional[str],
+        env: Dict[str, str],
+    ):
+        self.service_name = service_name
+        self.namespace = namespace
+        self.remote_port = remote_port
+        self.kubeconfig = kubeconfig
+        self.context = context
+        self.env = env
+        self.health_endpoint = None
+
+        self.process: Optional[subprocess.Popen] = None
+        self.port: Optional[int] = None
+        self.last_used = time.monotonic()
+        self.restart_at = 0.0
+        self.restart_backoff = CHECK_INTERVAL
+        self.lock = threading.Lock()
+        self._stderr_tail = deque(maxlen=20)
+        self._stderr_thread = None
+
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """Start kubectl, on the previous local port if it's still free, and wait for the forward to be ready."""
+        from kubetorch.resources.compute.utils import find_available_port, is_port_available
+
+        self.stop()
+        if self.port is None or not is_port_available(self.port):
+            self.port = find_available_port(LOCAL_NGINX_PORT, max_tries=100)
+
+        cmd = [
+            "kubectl",
+            "port-forward",
+            f"svc/{self.service_name}",
+            f"{self.port}:{self.remote_port}",
+            "--namespace",
+            self.namespace,
+        ]
+        if self.context:
+            cmd += ["--context", self.context]
+        # The requesting client's kubectl environment replaces the broker's, which came from whichever process
+        # happened to start it
+        env = {name: value for name, value in os.environ.items() if not _is_kubectl_env(name)}
+        env.update(self.env, KUBECONFIG=self.kubeconfig)
+
+        # kubectl prints a line per connection, so its output is drained for the process's whole life
+        self._stderr_tail.clear()
+        self.process = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env, start_new_session=True
+        )
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, args=(self.process,), daemon=True)
+        self._stderr_thread.start()
+        self._wait_ready()
+        logger.info(f"Port forward for {self.namespace}/{self.service_name}:{self.remote_port} on port {self.port}")
+
+    def _drain_stderr(self, process: subprocess.Popen):
+        for line in process.stderr:
+            self._stderr_tail.append(line.decode(errors="ignore").rstrip())
+
+    def _wait_ready(self):
+        import httpx
+
+        deadline = time.time() + READY_TIMEOUT
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                self._stderr_thread.join(timeout=1)
+                err = " ".join(self._stderr_tail)
+                raise RuntimeError(f"kubectl port-forward exited (rc={self.process.returncode}): {err.strip()}")
+
+            try:
+                with socket.create_connection(("localhost", self.port), timeout=1):
+                    pass
+            except OSError:
+                time.sleep(0.1)
+                continue
+
+            if not self.health_endpoint:
+                return
+            try:
+                if httpx.get(f"http://localhost:{self.port}{self.health_endpoint}", timeout=2).status_code == 200:
+                    return
+            except Exception as e:
+                logger.debug(f"Waiting for HTTP endpoint to be ready: {e}")
+            time.sleep(0.2)
+
+        self.stop()
+        raise TimeoutError("Timeout waiting for port forward to be ready")
+
+    def stop(self):
+        if not self.alive():
+            return
+        try:
+            os.killpg(os.getpgid(self.process.pid), signal.SIGTERM)
+            self.process.wait(timeout=3)
+        except Exception:
+            pass
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class PortForwardBroker:
+    """Serves port forward requests on a Unix socket and keeps the port forwards alive."""
+
+    def __init__(self, socket_path=None, idle_timeout: float = None):
+        self.socket_path = _socket_path(socket_path)
+        self.idle_timeout = (
+            idle_timeout
+            if idle_timeout is not None
+            else float(os.getenv("KT_PORT_FORWARD_IDLE_TIMEOUT", DEFAULT_IDLE_TIMEOUT))
+        )
+        self.port_forwards: Dict[tuple, _PortForward] = {}
+
+        self._lock = threading.Lock()
+        self._last_request = time.monotonic()
+        self._stopped = threading.Event()
+        self._server: Optional[_Server] = None
+
+    def handle(self, request: dict) -> dict:
+        self._last_request = time.monotonic()
+        action = request.get("action")
+        try:
+            if action == "ensure":
+                return {"status": "ok", "port": self.ensure(request)}
+            if action == "ping":
+                return {"status": "ok", "pid": os.getpid()}
+            if action == "list":
+                with self._lock:
+                    port_forwards = list(self.port_forwards.values())
+                return {
+                    "status": "ok",
+                    "port_forwards": [
+                        {
+                            "service_name": pf.service_name,
+                            "namespace": pf.namespace,
+                            "remote_port": pf.remote_port,
+                            "context": pf.context,
+                            "port": pf.port,
+                            "alive": pf.alive(),
+                        }
+                        for pf in port_forwards
+                    ],
+                }
+            if action == "shutdown":
+                threading.Thread(target=self.shutdown, daemon=True).start()
+                return {"status": "ok"}
+            return {"status": "error", "error": f"Unknown action: {action}"}
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+
+    def ensure(self, request: dict) -> int:
+        """Return the local port of a running port forward for the request, starting kubectl if needed."""
+        service_name, namespace = request["service_name"], request["namespace"]
+        remote_port = int(request["remote_port"])
+        kubeconfig, context = request["kubeconfig"], request.get("context")
+        # Clients from before the env was sent get the broker's own, as they always did
+        env = request.get("env")
+        env = _kubectl_env() if env is None else env
+        key = (kubeconfig, context, namespace, service_name, remote_port, tuple(sorted(env.items())))
+        with self._lock:
+            pf = self.port_forwards.get(key)
+            if pf is None:
+                pf = _PortForward(service_name, namespace, remote_port, kubeconfig, context, env)
+                self.port_forwards[key] = pf
+            pf.last_used = time.monotonic()
+
+        with pf.lock:
+            pf.health_endpoint = pf.health_endpoint or request.get("health_endpoint")
+            if not pf.alive():
+                pf.start()
+                pf.restart_backoff = CHECK_INTERVAL
+            return pf.port
+
+    def _monitor(self):
+        """Restart port forwards whose kubectl exited, stop idle ones, and exit when there are none left."""
+        while not self._stopped.wait(CHECK_INTERVAL):
+            now = time.monotonic()
+            with self._lock:
+                for key, pf in list(self.port_forwards.items()):
+                    if now - pf.last_used > self.idle_timeout:
+                        logger.info(f"Stopping idle port forward for {pf.namespace}/{pf.service_name}")
+                        pf.stop()
+                        del self.port_forwards[key]
+                port_forwards = list(self.port_forwards.values())
+                idle = not port_forwards and now - self._last_request > self.idle_timeout
+
+            if idle:
+                logger.info("No port forwards in use, shutting down")
+                self.shutdown()
+                return
+
+            for pf in port_forwards:
+                # Skip port forwards being started for a request
+                if not pf.lock.acquire(blocking=False):
+                    continue
+                try:
+                    if pf.process is None or pf.alive() or now < pf.restart_at:
+                        continue
+                    logger.info(f"kubectl for {pf.namespace}/{pf.service_name} exited, restarting")
+                    try:
+                        pf.start()
+                        pf.restart_backoff = CHECK_INTERVAL
+                    except Exception as e:
+                        logger.warning(f"Failed to restart port forward for {pf.namespace}/{pf.service_name}: {e}")
+                        pf.restart_at = time.monotonic() + pf.restart_backoff
+                        pf.restart_backoff = min(pf.restart_backoff * 2, MAX_RESTART_BACKOFF)
+                finally:
+                    pf.lock.release()
+
+    def serve(self):
+        """Run the broker until shut down. Returns immediately if another broker already owns the socket."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(f"{self.socket_path}.lock", "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            logger.info("Port-forward broker already running")
+            lock_file.close()
+            return
+
+        broker = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        response = broker.handle(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        response = {"status": "error", "error": f"Invalid request: {e}"}
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+
+        try:
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            self._server = _Server(str(self.socket_path), Handler)
+            os.chmod(self.socket_path, 0o600)
+
+            logger.info(f"Port-forward broker listening on {self.socket_path} (PID: {os.getpid()})")
+            threading.Thread(target=self._monitor, daemon=True).start()
+            self._server.serve_forever()
+        finally:
+            self._stopped.set()
+            with self._lock:
+                for pf in self.port_forwards.values():
+                    pf.stop()
+                self.port_forwards.clear()
+            if self._server is not None:
+                self._server.server_close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            lock_file.close()
+
+    def shutdown(self):
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+
+
+# ----------------- Client ----------------- #
+
+
+def send_request(request: dict, socket_path=None, timeout: float = 5.0) -> dict:
+    """Send one request to the broker and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(_socket_path(socket_path)))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                raise ConnectionResetError("Port-forward broker closed the connection")
+            data += chunk
+    return json.loads(data)
+
+
+def is_broker_running(socket_path=None) -> bool:
+    try:
+        return send_request({"action": "ping"}, socket_path, timeout=1.0).get("status") == "ok"
+    except (OSError, ValueError):
+        return False
+
+
+def broker_socket_id(socket_path=None) -> Optional[Tuple[int, int, int]]:
+    """Identity of the broker's socket file, which changes whenever a broker (re)starts. None if there's no socket.
+
+    Clients compare it to the one seen when they got a port, to notice a restarted broker (whose port forwards may be
+    on other ports) with a stat rather than a request.
+    """
+    try:
+        stat = _socket_path(socket_path).stat()
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino, stat.st_ctime_ns
+
+
+def start_broker_if_needed(socket_path=None, timeout: float = 10.0):
+    """Start the broker as a detached process (so it outlives this one) unless it's already running."""
+    if is_broker_running(socket_path):
+        return
+
+    path = _socket_path(socket_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_suffix(".log"), "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "kubetorch.provisioning.port_forward_broker", "--socket-path", str(path)],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if is_broker_running(socket_path):
+            return
+        time.sleep(0.05)
+    raise RuntimeError("Failed to start port-forward broker")
+
+
+def request_port_forward(
+    service_name: str,
+    namespace: str,
+    remote_port: int,
+    health_endpoint: Optional[str] = None,
+    socket_path=None,
+    timeout: float = 60.0,
+) -> int:
+    """Return the local port of the broker's port forward to a service, starting the broker if needed."""
+    start_broker_if_needed(socket_path)
+    kubeconfig, context = _kube_context()
+    response = send_request(
+        {
+            "action": "ensure",
+            "service_name": service_name,
+            "namespace": namespace,
+            "remote_port": remote_port,
+            "health_endpoint": health_endpoint,
+            "kubeconfig": kubeconfig,
+            "context": context,
+            "env": _kubectl_env(),
+        },
+        socket_path,
+        timeout=timeout,
+    )
+    if response.get("status") != "ok":
+        raise RuntimeError(f"Port-forward broker failed for {service_name}: {response.get('error')}")
+    return response["port"]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Port-forward broker for kubetorch")
+    parser.add_argument(
+        "--socket-path",
+        default=None,
+        help=f"Unix socket path (default: {DEFAULT_SOCKET_PATH})",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help=f"Seconds before unused port forwards are stopped (default: {DEFAULT_IDLE_TIMEOUT})",
+    )
+    args = parser.parse_args()
+    broker = PortForwardBroker(socket_path=args.socket_path, idle_timeout=args.idle_timeout)
+    # Stop kubectl processes on SIGTERM; shutdown() can't run on the thread serving requests
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=broker.shutdown, daemon=True).start())
+    broker.serve()
+
+
+if __name__ == "__main__":
+    main()
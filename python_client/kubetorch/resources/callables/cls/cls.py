@@ -49,6 +49,11 @@ class Cls(Module):
                 else:
                     return self._call_sync(attr_name, *args, **kwargs)
 
+            def remote_method_map(*iterables, batch_size: int = None, concurrency: int = None, **kwargs):
+                # Batched calls to the method, see Fn.map
+                return self._map(attr_name, iterables, batch_size=batch_size, concurrency=concurrency, **kwargs)
+
+            remote_method_wrapper.map = remote_method_map
             return remote_method_wrapper
 
     @property
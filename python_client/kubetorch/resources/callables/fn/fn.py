@@ -36,6 +36,26 @@ class Fn(Module):
         else:
             return self._call_sync(*args, **kwargs)
 
+    def map(self, *iterables, batch_size: int = None, concurrency: int = None, **kwargs):
+        """Call the remote function once per element of the given iterables, like the builtin ``map``.
+
+        Calls are packed into batched requests of ``batch_size`` calls, which the service fans out across its
+        local processes, with up to ``concurrency`` batches in flight. Results are returned in input order.
+
+        Args:
+            *iterables: Iterables of positional arguments, zipped together as in ``map(fn, *iterables)``.
+            batch_size (int, optional): Number of calls per request. (Default: 64)
+            concurrency (int, optional): Max number of batch requests in flight. (Default: 4)
+            **kwargs: ``stream_logs`` and ``serialization`` overrides, as for a regular call.
+
+        Example:
+
+        .. code-block:: python
+
+            squares = remote_fn.map(range(1000), batch_size=100)
+        """
+        return self._map(None, iterables, batch_size=batch_size, concurrency=concurrency, **kwargs)
+
     def _call_sync(self, *args, **kwargs):
         client = self._client()
         stream_logs = kwargs.pop("stream_logs", None)
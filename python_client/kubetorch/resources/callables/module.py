@@ -4,6 +4,7 @@ import tempfile
 import threading
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Union
@@ -14,7 +15,7 @@ from kubetorch.globals import config, LoggingConfig, service_url, service_url_as
 from kubetorch.logger import get_logger
 from kubetorch.provisioning.constants import DEFAULT_K8S_SERVICE_PORT
 from kubetorch.provisioning.utils import has_k8s_credentials, KubernetesCredentialsError
-from kubetorch.resources.callables.utils import get_names_for_reload_fallbacks, locate_working_dir
+from kubetorch.resources.callables.utils import build_call_body, get_names_for_reload_fallbacks, locate_working_dir
 
 from kubetorch.resources.compute.utils import (
     delete_cached_service_data,
@@ -34,6 +35,9 @@ from kubetorch.utils import (
 
 logger = get_logger(__name__)
 
+DEFAULT_MAP_BATCH_SIZE = 64
+DEFAULT_MAP_CONCURRENCY = 4
+
 
 class Module:
     MODULE_TYPE = None
@@ -348,6 +352,52 @@ class Module:
         else:
             return f"{self.base_endpoint}/{self.module_name}/{method_name}"
 
+    def _map(
+        self,
+        method_name: Union[str, None],
+        iterables: tuple,
+        batch_size: int = None,
+        concurrency: int = None,
+        stream_logs: bool = None,
+        serialization: str = None,
+    ) -> list:
+        """Call the remote callable once per element of the zipped ``iterables``, packing many calls into each request.
+
+        Each batch is a single POST which the server fans out across its local processes. Results are returned in
+        input order; if any call fails, its exception is raised.
+        """
+        batch_size = batch_size or DEFAULT_MAP_BATCH_SIZE
+        concurrency = concurrency or DEFAULT_MAP_CONCURRENCY
+        if batch_size < 1 or concurrency < 1:
+            raise ValueError("`batch_size` and `concurrency` must be positive integers")
+
+        bodies = [build_call_body(*args) for args in zip(*iterables)]
+        batches = [bodies[i : i + batch_size] for i in range(0, len(bodies), batch_size)]
+        if not batches:
+            return []
+
+        client = self._client(method_name=method_name)
+        endpoint = self.endpoint(method_name) if method_name else self.endpoint()
+        stream_logs = stream_logs if stream_logs is not None else self.stream_logs
+        serialization = serialization or self.serialization
+
+        def call_batch(batch):
+            return client.call_method(
+                endpoint,
+                stream_logs,
+                self.logging_config,
+                stream_metrics=False,
+                headers=self.request_headers,
+                body={"batch": batch},
+                serialization=serialization,
+            )
+
+        results = []
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as executor:
+            for batch_results in executor.map(call_batch, batches):
+                results.extend(batch_results)
+        return results
+
     def deploy(self):
         """
         Helper method to deploy modules specified by the @compute decorator. Used by `kt deploy` CLI command.
@@ -810,12 +860,16 @@ class Module:
             # Using contents=False preserves directory structure - each directory becomes a subdirectory
             # This matches the old behavior where python_client/ and .kt/ were both preserved as subdirectories
             from kubetorch import data_store
+            from kubetorch.data_store.sync_manifest import sync_to_store
 
             dt_client = data_store.DataStoreClient(namespace=self.compute.namespace)
             # Use absolute key path (starting with /) to prevent auto-prepending of caller's service name
             # This is critical when a parent service creates a child service - we want files at
             # /data/{namespace}/{child_service_name}/, not /data/{namespace}/{parent_service_name}/{child_service_name}/
-            dt_client.put(key=f"/{self.compute.service_name}", src=all_dirs, contents=False)
+            # Only files changed since the last sync to this key are sent (see sync_manifest.py)
+            sync_to_store(
+                dt_client, key=f"/{self.compute.service_name}", sources=all_dirs, service_name=self.service_name
+            )
 
     async def _construct_and_rsync_files_async(self, rsync_dirs, service_dockerfile):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -832,12 +886,16 @@ class Module:
             # Using contents=False preserves directory structure - each directory becomes a subdirectory
             # This matches the old behavior where python_client/ and .kt/ were both preserved as subdirectories
             from kubetorch import data_store
+            from kubetorch.data_store.sync_manifest import sync_to_store
 
             dt_client = data_store.DataStoreClient(namespace=self.compute.namespace)
             # Use absolute key path (starting with /) to prevent auto-prepending of caller's service name
             # This is critical when a parent service creates a child service - we want files at
             # /data/{namespace}/{child_service_name}/, not /data/{namespace}/{parent_service_name}/{child_service_name}/
-            dt_client.put(key=f"/{self.compute.service_name}", src=all_dirs, contents=False)
+            # Only files changed since the last sync to this key are sent (see sync_manifest.py)
+            sync_to_store(
+                dt_client, key=f"/{self.compute.service_name}", sources=all_dirs, service_name=self.service_name
+            )
 
     def _startup_rsync_command(self, use_editable, install_url, dryrun):
         if dryrun:
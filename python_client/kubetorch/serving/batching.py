@@ -0,0 +1,195 @@
+"""Server-side dynamic micro-batching for methods that are faster on a batch of inputs than on one.
+
+A method decorated with :func:`batched` takes a list of inputs and returns a list of outputs. Callers still call it
+with a single input per request; inside each ProcessWorker subprocess, concurrent requests to the method are
+collected for up to ``max_batch_size`` inputs or ``max_wait_ms`` milliseconds, the method runs once on the list,
+and each request gets its own output back.
+
+Requests are handled on the subprocess's thread pool, so a batch can't be larger than the number of concurrent
+requests a subprocess accepts (``max_threads_per_proc``, default 10). A larger ``max_batch_size`` is clamped to it,
+so full batches run without waiting out ``max_wait_ms``. With ``num_processes > 1``, the pool's dispatch policy
+spreads concurrent requests over the subprocesses, and each batches its share separately; use ``num_processes=1``
+(with a higher ``max_threads_per_proc``) or the ``sticky`` policy with a shared dispatch key to batch them together.
+
+Batch sizes are reported back to the main process with each response and exported by ``MetricsPusher`` as the
+``kt_batch_size`` histogram.
+"""
+
+import asyncio
+import inspect
+import os
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+from kubetorch.logger import get_logger
+
+logger = get_logger(__name__)
+
+BATCH_CONFIG_ATTR = "__kt_batch__"
+
+
+def batched(max_batch_size: int = 32, max_wait_ms: float = 10.0):
+    """Decorator to serve a function or method with dynamic micro-batching.
+
+    The decorated callable must accept a list of inputs and return a list of outputs in the same order.
+    Remote callers pass a single input per call.
+
+    Args:
+        max_batch_size (int, optional): Maximum number of requests per batch, at most the service's
+            ``max_threads_per_proc`` (larger values are clamped to it). (Default: 32)
+        max_wait_ms (float, optional): Maximum time the first request in a batch waits for more to arrive,
+            in milliseconds. (Default: 10.0)
+
+    Example:
+
+    .. code-block:: python
+
+        class Model:
+            @kt.batched(max_batch_size=16, max_wait_ms=5)
+            def predict(self, inputs):
+                return self.model(inputs).tolist()
+
+        # On the client, each call sends one input
+        remote_model.predict(x)
+    """
+    if max_batch_size < 1:
+        raise ValueError("`max_batch_size` must be at least 1")
+    if max_wait_ms < 0:
+        raise ValueError("`max_wait_ms` must be non-negative")
+
+    def decorator(func):
+        setattr(func, BATCH_CONFIG_ATTR, {"max_batch_size": max_batch_size, "max_wait_ms": max_wait_ms})
+        return func
+
+    return decorator
+
+
+def get_batch_config(user_method) -> Dict:
+    """The batching config of a decorated function or method, or None."""
+    return getattr(user_method, BATCH_CONFIG_ATTR, None)
+
+
+class _PendingCall:
+    __slots__ = ("item", "result", "error")
+
+    def __init__(self, item):
+        self.item = item
+        self.result = None
+        self.error = None
+
+
+class _Batch:
+    def __init__(self):
+        self.calls: List[_PendingCall] = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+
+
+class MicroBatcher:
+    """Collects concurrent calls into batches. The first caller of each batch runs it (leader/follower)."""
+
+    def __init__(self, name: str, max_batch_size: int, max_wait_ms: float):
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        # The decorator's config, before clamping (see get_batcher)
+        self.requested_config = None
+        self._lock = threading.Lock()
+        self._current = None
+
+    def submit(self, user_method: Callable, item):
+        """Add an input to the open batch and block until its output is ready."""
+        call = _PendingCall(item)
+        with self._lock:
+            batch = self._current
+            leader = batch is None
+            if leader:
+                batch = self._current = _Batch()
+            batch.calls.append(call)
+            if len(batch.calls) >= self.max_batch_size:
+                # Close the batch; the next caller starts a new one
+                self._current = None
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(timeout=self.max_wait_ms / 1000)
+            with self._lock:
+                if self._current is batch:
+                    self._current = None
+            self._run(user_method, batch)
+        else:
+            batch.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _run(self, user_method: Callable, batch: _Batch):
+        try:
+            results = user_method([call.item for call in batch.calls])
+            if inspect.isawaitable(results):
+                results = asyncio.run(results)
+            results = list(results)
+            if len(results) != len(batch.calls):
+                raise ValueError(
+                    f"Batched method {self.name} returned {len(results)} results for a batch of {len(batch.calls)}"
+                )
+            for call, result in zip(batch.calls, results):
+                call.result = result
+        except Exception as e:
+            for call in batch.calls:
+                call.error = e
+        finally:
+            _record_batch_size(self.name, len(batch.calls))
+            batch.done.set()
+
+
+_batchers: Dict[str, MicroBatcher] = {}
+_batchers_lock = threading.Lock()
+
+_batch_sizes: Dict[str, List[int]] = defaultdict(list)
+_batch_sizes_lock = threading.Lock()
+
+
+def _clamp_to_threads(name: str, config: Dict) -> Dict:
+    """Cap the batch size at the number of requests this subprocess runs concurrently, which a batch can't exceed."""
+    max_threads = int(os.getenv("KT_MAX_THREADS_PER_PROC", "0"))
+    if max_threads and config["max_batch_size"] > max_threads:
+        logger.warning(
+            f"Batched method {name} has max_batch_size={config['max_batch_size']}, but each subprocess runs at most "
+            f"{max_threads} requests at once; using max_batch_size={max_threads}"
+        )
+        return {**config, "max_batch_size": max_threads}
+    return config
+
+
+def get_batcher(name: str, config: Dict) -> MicroBatcher:
+    """Get the process-wide batcher for a callable, creating it on first use."""
+    with _batchers_lock:
+        batcher = _batchers.get(name)
+        if batcher is None or batcher.requested_config != config:
+            # Built on first use, and rebuilt if the config changed on redeploy
+            batcher = _batchers[name] = MicroBatcher(name, **_clamp_to_threads(name, config))
+            batcher.requested_config = config
+        return batcher
+
+
+def submit_batched(name: str, user_method: Callable, args: list, kwargs: dict):
+    """Run a single-input call to a batched method through its batcher."""
+    if len(args) != 1 or kwargs:
+        raise TypeError(f"Batched method {name} takes exactly one positional argument per call")
+    return get_batcher(name, get_batch_config(user_method)).submit(user_method, args[0])
+
+
+def _record_batch_size(name: str, size: int):
+    with _batch_sizes_lock:
+        _batch_sizes[name].append(size)
+
+
+def drain_batch_sizes() -> Dict[str, List[int]]:
+    """Pop the batch sizes recorded since the last call, keyed by callable name."""
+    with _batch_sizes_lock:
+        sizes = dict(_batch_sizes)
+        _batch_sizes.clear()
+    return sizes
@@ -0,0 +1,117 @@
+"""Dispatch policies for routing calls across the local subprocesses of a ProcessPool.
+
+A pod running with ``num_processes > 1`` has several ProcessWorker subprocesses that can each
+serve a call. The policy decides which subprocess index a given call is routed to:
+
+- ``least_outstanding`` (default): the subprocess with the fewest in-flight requests
+- ``round_robin``: cycle through subprocesses in order
+- ``sticky``: route by a caller-provided key (``X-Dispatch-Key`` header), so calls with the same
+  key always land on the same subprocess (e.g. for per-session caches). Calls without a key fall
+  back to least-outstanding.
+
+The policy is set per pod with the ``KT_DISPATCH_POLICY`` env var (e.g. ``kt.Compute(env_vars=...)``), or with a
+supervisor's ``dispatch_policy`` argument, which takes precedence.
+"""
+
+import itertools
+import os
+import threading
+import zlib
+from typing import List, Optional
+
+DISPATCH_KEY_HEADER = "X-Dispatch-Key"
+DEFAULT_DISPATCH_POLICY = "least_outstanding"
+
+
+class DispatchPolicy:
+    """Base class for choosing a subprocess index given the pool's in-flight counters."""
+
+    name = None
+
+    def select(self, inflight: List[int], dispatch_key: Optional[str] = None) -> int:
+        """Return the index of the subprocess to route the call to.
+
+        Args:
+            inflight (List[int]): Snapshot of in-flight request counts, one per subprocess.
+            dispatch_key (str, optional): Caller-provided routing key, if any. (Default: None)
+        """
+        raise NotImplementedError
+
+
+class LeastOutstandingPolicy(DispatchPolicy):
+    name = "least_outstanding"
+
+    def __init__(self):
+        # Rotate the starting point so ties don't always resolve to subprocess 0
+        self._offset = itertools.count()
+
+    def select(self, inflight: List[int], dispatch_key: Optional[str] = None) -> int:
+        num_procs = len(inflight)
+        start = next(self._offset) % num_procs
+        candidates = [(start + i) % num_procs for i in range(num_procs)]
+        return min(candidates, key=lambda idx: inflight[idx])
+
+
+class RoundRobinPolicy(DispatchPolicy):
+    name = "round_robin"
+
+    def __init__(self):
+        self._counter = itertools.count()
+
+    def select(self, inflight: List[int], dispatch_key: Optional[str] = None) -> int:
+        return next(self._counter) % len(inflight)
+
+
+class StickyPolicy(DispatchPolicy):
+    name = "sticky"
+
+    def __init__(self):
+        self._fallback = LeastOutstandingPolicy()
+
+    def select(self, inflight: List[int], dispatch_key: Optional[str] = None) -> int:
+        if dispatch_key is None:
+            return self._fallback.select(inflight)
+        # Use a stable hash (not Python's salted hash()) so keys map consistently across server restarts
+        return zlib.crc32(str(dispatch_key).encode("utf-8")) % len(inflight)
+
+
+DISPATCH_POLICIES = {
+    LeastOutstandingPolicy.name: LeastOutstandingPolicy,
+    RoundRobinPolicy.name: RoundRobinPolicy,
+    StickyPolicy.name: StickyPolicy,
+}
+
+
+def get_dispatch_policy(name: Optional[str] = None) -> DispatchPolicy:
+    """Build a dispatch policy by name, defaulting to ``KT_DISPATCH_POLICY`` or else least-outstanding-requests."""
+    name = name or os.getenv("KT_DISPATCH_POLICY") or DEFAULT_DISPATCH_POLICY
+    if name not in DISPATCH_POLICIES:
+        raise ValueError(f"Unknown dispatch policy: {name}. Valid options are {list(DISPATCH_POLICIES.keys())}")
+    return DISPATCH_POLICIES[name]()
+
+
+class InflightCounter:
+    """Thread-safe per-subprocess in-flight request counters."""
+
+    def __init__(self, num_processes: int):
+        self._counts = [0] * num_processes
+        self._lock = threading.Lock()
+
+    def acquire(self, policy: DispatchPolicy, dispatch_key: Optional[str] = None) -> int:
+        """Select a subprocess with the given policy and increment its counter atomically."""
+        with self._lock:
+            idx = policy.select(self._counts, dispatch_key)
+            self._counts[idx] += 1
+            return idx
+
+    def increment(self, idx: int):
+        with self._lock:
+            self._counts[idx] += 1
+
+    def decrement(self, idx: int):
+        with self._lock:
+            self._counts[idx] = max(0, self._counts[idx] - 1)
+
+    def snapshot(self) -> List[int]:
+        with self._lock:
+            return list(self._counts)
@@ -253,6 +253,7 @@ class DistributedSupervisor(ExecutionSupervisor):
                             event.set()
 
                         self._current_workers = current_ips
+                        self._invalidate_worker_health(added | removed)
 
                 time.sleep(check_interval)
 
@@ -260,6 +261,11 @@ class DistributedSupervisor(ExecutionSupervisor):
                 logger.error(f"DNS monitor error: {e}")
                 time.sleep(3)
 
+    def _invalidate_worker_health(self, worker_ips: Set[str]):
+        """Make the RemoteWorkerPool re-check health for workers whose membership changed."""
+        if self.remote_worker_pool:
+            self.remote_worker_pool.invalidate_health(worker_ips)
+
     def subscribe_to_membership_changes(self) -> threading.Event:
         """Subscribe to worker membership changes.
 
@@ -299,6 +305,7 @@ class DistributedSupervisor(ExecutionSupervisor):
 
                     # Update current workers
                     self._current_workers = current_ips
+                    self._invalidate_worker_health(added | removed)
 
                     if removed:
                         logger.error(f"Workers REMOVED from cluster (forced check): {removed}")
@@ -10,14 +10,32 @@ For distributed execution with remote workers, see DistributedSupervisor.
 """
 
 import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, Optional
 
 from starlette.responses import JSONResponse
 
+from kubetorch.serving.dispatch_policy import DISPATCH_KEY_HEADER
 from kubetorch.serving.http_server import logger
-from kubetorch.serving.log_capture import get_subprocess_queue
-from kubetorch.serving.process_pool import ProcessPool
+from kubetorch.serving.log_capture import get_log_capture
+from kubetorch.serving.process_pool import ProcessPool, ProcessStream
 from kubetorch.serving.process_worker import ProcessWorker
+from kubetorch.serving.utils import split_batch_params
+
+# Files holding each local process's __kt_cached_state__, by local rank, saved before a redeploy tore down its pool
+# and restored by the process with the same rank in the next one. Module-level because a redeploy may also replace
+# the supervisor.
+_SAVED_CACHED_STATE: Dict[int, str] = {}
+
+
+def _discard_saved_cached_state(keep: int = 0):
+    """Remove saved state files for local ranks ``keep`` and up."""
+    for idx in [idx for idx in _SAVED_CACHED_STATE if idx >= keep]:
+        try:
+            os.unlink(_SAVED_CACHED_STATE.pop(idx))
+        except OSError:
+            pass
 
 
 class ExecutionSupervisor:
@@ -26,7 +44,7 @@ class ExecutionSupervisor:
     This class provides local execution via ProcessPool with one or more subprocesses.
     It handles:
     - Creating and managing a pool of worker subprocesses
-    - Routing calls to subprocesses
+    - Routing calls to subprocesses via a dispatch policy (least-outstanding, round-robin, or sticky)
     - Clean restart semantics for redeployment
 
     Subclass DistributedSupervisor for distributed execution with remote workers.
@@ -38,6 +56,7 @@ class ExecutionSupervisor:
         num_processes: int = 1,
         max_threads_per_proc: int = 10,
         restart_procs: bool = True,
+        dispatch_policy: Optional[str] = None,
         **process_kwargs,
     ):
         """Initialize execution supervisor.
@@ -49,15 +68,20 @@ class ExecutionSupervisor:
                 process_class.get_auto_num_processes(). (Default: 1)
             max_threads_per_proc (int, optional): Maximum threads per subprocess. (Default: 10)
             restart_procs (bool, optional): Whether to restart processes on setup. (Default: True)
+            dispatch_policy (str, optional): How calls are routed across local subprocesses. One of
+                "least_outstanding", "round_robin", or "sticky" (routes by the ``X-Dispatch-Key`` request
+                header). (Default: the ``KT_DISPATCH_POLICY`` env var, or "least_outstanding")
             **process_kwargs: Additional kwargs passed to process class constructor.
         """
         self.process_class = process_class or ProcessWorker
         self.num_processes = num_processes
         self.max_threads_per_proc = max_threads_per_proc
         self.restart_procs = restart_procs
+        self.dispatch_policy = dispatch_policy
         self.process_kwargs = process_kwargs
 
         self.process_pool: Optional[ProcessPool] = None
+        self._batch_executor: Optional[ThreadPoolExecutor] = None  # Fans out batched (map) calls, created lazily
         self.config_hash: Optional[int] = None  # Used by factory to detect config changes
 
     def setup(self, deployed_as_of: Optional[str] = None):
@@ -79,6 +103,7 @@ class ExecutionSupervisor:
         # Restart processes if requested
         if self.restart_procs and self.process_pool:
             logger.debug("restart_procs is True, restarting processes")
+            self.save_cached_state()
             self.cleanup()
 
         # Create new pool if needed or if size changed
@@ -88,16 +113,40 @@ class ExecutionSupervisor:
                 self.cleanup()
 
             logger.debug(f"Setting up process pool with {num_proc} processes")
+            # The new processes take ownership of the state saved for their rank and remove it once loaded
+            _discard_saved_cached_state(keep=num_proc)
             self.process_pool = ProcessPool(
                 process_class=self.process_class,
                 num_processes=num_proc,
                 max_threads_per_proc=self.max_threads_per_proc,
-                log_queue=get_subprocess_queue(),
+                log_capture=get_log_capture(),
+                dispatch_policy=self.dispatch_policy,
+                cached_state_paths=dict(_SAVED_CACHED_STATE),
                 **self.process_kwargs,
             )
+            _SAVED_CACHED_STATE.clear()
             self.process_pool.start()
             logger.debug("Process pool started successfully")
 
+    def save_cached_state(self):
+        """Save the ``__kt_cached_state__`` of the running processes' callables, for the pool that replaces them.
+
+        Call this before tearing the pool down for a redeploy. Processes whose callable doesn't define
+        ``__kt_cached_state__`` save nothing, and saving never fails the redeploy: processes that error or don't
+        finish within ``KT_CACHED_STATE_TIMEOUT`` seconds (default 300) just start from scratch.
+        """
+        if not self.process_pool:
+            return
+        _discard_saved_cached_state()
+        try:
+            _SAVED_CACHED_STATE.update(
+                self.process_pool.save_cached_state(timeout=float(os.getenv("KT_CACHED_STATE_TIMEOUT", "300")))
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save cached state before restarting processes: {e}")
+        if _SAVED_CACHED_STATE:
+            logger.info(f"Saved cached state of {len(_SAVED_CACHED_STATE)} process(es) for the restart")
+
     def cleanup(self):
         """Clean up process pool."""
         if self.process_pool:
@@ -105,6 +154,9 @@ class ExecutionSupervisor:
             self.process_pool.stop()
             self.process_pool = None
             logger.debug("Process pool stopped")
+        if self._batch_executor:
+            self._batch_executor.shutdown(wait=False)
+            self._batch_executor = None
 
     def call(
         self,
@@ -117,8 +169,8 @@ class ExecutionSupervisor:
     ):
         """Execute a call through the subprocess pool.
 
-        For local execution (non-distributed), this routes the call to the first
-        subprocess. For distributed execution, subclasses override this method
+        For local execution (non-distributed), this routes the call to one of the local
+        subprocesses according to the dispatch policy. For distributed execution, subclasses override this method
         to coordinate across multiple processes and remote workers.
 
         Args:
@@ -143,13 +195,9 @@ class ExecutionSupervisor:
 
         # Note: If deployed_as_of is None, we pass it as-is to subprocesses.
         # The subprocess's load_callable() will correctly skip reload when None.
-
-        # For local execution, route to the first (and typically only) subprocess
-        logger.debug(f"Routing call to subprocess: {cls_or_fn_name}.{method_name}")
-        result = self.process_pool.call(
-            idx=0,
+        call_kwargs = dict(
+            dispatch_key=request.headers.get(DISPATCH_KEY_HEADER),
             method_name=method_name,
-            params=params,
             deployed_as_of=deployed_as_of,
             request_id=request_id,
             distributed_env_vars={},  # No distributed env vars for local execution
@@ -158,6 +206,13 @@ class ExecutionSupervisor:
             serialization=serialization,
         )
 
+        if params and "batch" in params:
+            return self._call_batch(params, call_kwargs)
+
+        # For local execution, let the pool's dispatch policy pick the subprocess
+        logger.debug(f"Routing call to subprocess: {cls_or_fn_name}.{method_name}")
+        result = self.process_pool.dispatch(params=params, **call_kwargs)
+
         # Handle exceptions from subprocess
         if isinstance(result, JSONResponse):
             return result
@@ -165,3 +220,52 @@ class ExecutionSupervisor:
             raise result
 
         return result
+
+    def _call_batch(self, params: Dict, call_kwargs: Dict):
+        """Fan a batched (map) call out across the subprocesses and gather results in call order.
+
+        Each call in the batch is dispatched on its own, so the dispatch policy spreads them over the pool.
+        The first failed call fails the whole batch: calls that haven't started are cancelled, and the ones already
+        running are waited for (and any streams they return closed) before the error is returned.
+        """
+        calls = split_batch_params(params)
+        logger.debug(f"Fanning out batch of {len(calls)} calls across {len(self.process_pool)} subprocesses")
+        if self._batch_executor is None:
+            self._batch_executor = ThreadPoolExecutor(
+                max_workers=len(self.process_pool) * self.max_threads_per_proc,
+                thread_name_prefix="BatchDispatch",
+            )
+
+        futures = [
+            self._batch_executor.submit(self.process_pool.dispatch, params=call, **call_kwargs) for call in calls
+        ]
+        results = []
+        try:
+            for future in futures:
+                result = future.result()
+                if isinstance(result, ProcessStream):
+                    result = result.collect(call_kwargs["serialization"])
+                if isinstance(result, JSONResponse):
+                    return result
+                if isinstance(result, Exception):
+                    raise result
+                results.append(result)
+            return results
+        finally:
+            if len(results) < len(futures):
+                self._drain_batch(futures[len(results) + 1 :])
+
+    @staticmethod
+    def _drain_batch(futures):
+        """Cancel a failed batch's calls that haven't started and wait for the running ones to finish.
+
+        Calls that failed too are skipped, so their errors don't replace the one the batch is failing with.
+        """
+        for future in futures:
+            future.cancel()
+        wait(futures)
+        for future in futures:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            if isinstance(future.result(), ProcessStream):
+                future.result().close()
@@ -20,8 +20,11 @@ from kubetorch.provisioning.constants import DEFAULT_NGINX_PORT
 from kubetorch.serving.utils import (
     _deserialize_response,
     _serialize_body,
+    BINARY_CONTENT_TYPE,
     generate_unique_request_id,
+    is_stream_content_type,
     request_id_ctx_var,
+    StreamDecoder,
 )
 from kubetorch.utils import ColoredFormatter, extract_host_port, ServerLogsFormatter
 
@@ -37,6 +40,10 @@ LOG_LEVEL_PRIORITY = {
 }
 
 
+# Fields of an exception packaged by the server's package_exception
+REMOTE_ERROR_KEYS = ["error_type", "message", "traceback", "pod_name"]
+
+
 class LogDeduplicator:
     """Sliding window deduplication using hash sets.
 
@@ -83,108 +90,480 @@ class LogDeduplicator:
         return False
 
 
-class CustomResponse(httpx.Response):
-    def raise_for_status(self):
-        """Raises parsed server errors or HTTPError for other status codes"""
-        if not 400 <= self.status_code < 600:
-            return
+class StreamSubscription:
+    """A call's subscription to a stream shared across calls and read on a background thread.
 
-        if "application/json" in self.headers.get("Content-Type", ""):
-            try:
-                error_data = self.json()
-                if all(k in error_data for k in ["error_type", "message", "traceback", "pod_name"]):
-                    error_type = error_data["error_type"]
-                    message = error_data.get("message", "")
-                    traceback = error_data["traceback"]
-                    pod_name = error_data["pod_name"]
-                    error_state = error_data.get("state", {})  # Optional serialized state
-
-                    # Try to use the actual exception class if it exists
-                    exc = None
-                    error_class = None
-
-                    # Import the exception registry
-                    try:
-                        from kubetorch import EXCEPTION_REGISTRY
-                    except ImportError:
-                        EXCEPTION_REGISTRY = {}
+    Items are delivered to the event loop the subscription was created on, so it can be read from any loop
+    (a per-call thread's or the caller's) while the shared stream runs on its own thread.
+    """
 
-                    # First check if it's a Python builtin exception
-                    import builtins
+    def __init__(self, source, loop: asyncio.AbstractEventLoop):
+        self._source = source
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._closed = False
 
-                    if hasattr(builtins, error_type):
-                        error_class = getattr(builtins, error_type)
-                    # Otherwise try to use from the kubetorch registry
-                    elif error_type in EXCEPTION_REGISTRY:
-                        error_class = EXCEPTION_REGISTRY[error_type]
+    def _deliver(self, item):
+        """Queue an item for this subscriber. Called from the source's thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError:
+            # The subscriber's loop is already closed
+            pass
 
-                    if error_class:
-                        try:
-                            # First try to reconstruct from state if available
-                            if error_state and hasattr(error_class, "from_dict"):
-                                exc = error_class.from_dict(error_state)
-                            # Otherwise try simple construction with message
-                            else:
-                                exc = error_class(message)
-                        except Exception as e:
-                            logger.debug(f"Could not reconstruct {error_type}: {e}, will use dynamic type")
-                            # Fall back to dynamic creation
-                            pass
+    async def get(self, timeout: float):
+        """Return the next item, raising asyncio.TimeoutError if none arrives within timeout."""
+        return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+
+    def close(self):
+        """Stop receiving items and release this subscription's reference on its source."""
+        if not self._closed:
+            self._closed = True
+            self._source._unsubscribe(self)
 
-                    # If we couldn't create the actual exception, fall back to dynamic type creation
-                    if not exc:
 
-                        def create_str_method(remote_traceback):
-                            def __str__(self):
-                                cleaned_traceback = remote_traceback.encode().decode("unicode_escape")
-                                return f"{self.args[0]}\n\n{cleaned_traceback}"
+class LogSubscription(StreamSubscription):
+    """One call's share of a ServiceLogTail: (labels, values) Loki streams labeled with its request_id."""
 
-                            return __str__
+    def __init__(self, tail: "ServiceLogTail", request_id: str, loop: asyncio.AbstractEventLoop):
+        super().__init__(tail, loop)
+        self.request_id = request_id
 
-                        # Create the exception class with the custom __str__
-                        error_class = type(
-                            error_type,
-                            (Exception,),
-                            {"__str__": create_str_method(traceback)},
-                        )
 
-                        exc = error_class(message)
-
-                    # Always add remote_traceback and pod_name
-                    exc.remote_traceback = traceback
-                    exc.pod_name = pod_name
-
-                    # Wrap the exception to display remote traceback
-                    # Create a new class that inherits from the original exception
-                    # and overrides __str__ to include the remote traceback
-                    class RemoteException(exc.__class__):
-                        def __str__(self):
-                            # Get the original message
-                            original_msg = super().__str__()
-                            # Clean up the traceback
-                            cleaned_traceback = self.remote_traceback.encode().decode("unicode_escape")
-                            return f"{original_msg}\n\n{cleaned_traceback}"
-
-                    # Create wrapped instance without calling __init__
-                    wrapped_exc = RemoteException.__new__(RemoteException)
-                    # Copy all attributes from the original exception
-                    wrapped_exc.__dict__.update(exc.__dict__)
-                    # Set the exception args for proper display
-                    wrapped_exc.args = (str(exc),)
-                    raise wrapped_exc
+class ServiceLogTail:
+    """A single Loki websocket tail for all of a service's logs, shared by every call streaming them.
+
+    Opening a tail per call (filtered by request_id) puts one websocket on Loki for each in-flight call. Instead, calls
+    to the same service subscribe to this tail, which queries by service labels only and hands each stream to the
+    subscriptions for its request_id label (set on every line by LogCapture).
+
+    The tail runs on a daemon thread while it has subscriptions. Once the last one is closed it stays connected for
+    ``idle_timeout`` seconds, so back-to-back calls reuse it, then disconnects. Streams for a request without a
+    subscription yet (the call can log before its streaming task starts) are kept for ``RECENT_SECONDS`` and replayed
+    when it subscribes. If the websocket drops, it reconnects from the last timestamp seen.
+    """
+
+    RECENT_SECONDS = 30.0
+    RECENT_STREAMS = 1000
+    # How far back a newly opened tail starts, to pick up lines logged while it connects
+    START_LOOKBACK_NS = 5 * 10**9
+
+    def __init__(self, host: str, port: int, namespace: str, service_name: str, idle_timeout: float = 30.0):
+        self.host = host
+        self.port = port
+        self.namespace = namespace
+        self.service_name = service_name
+        self.idle_timeout = idle_timeout
+        self.connections = 0
+
+        self._lock = threading.Lock()
+        self._subscriptions: dict = defaultdict(set)
+        self._recent: deque = deque(maxlen=self.RECENT_STREAMS)  # (arrival time, request_id, labels, values)
+        self._thread = None
+        self._idle_since = None
+        self._start_ns = 0
 
+    @property
+    def uri(self) -> str:
+        # Query using labels set by LogCapture, without request_id so one tail covers all calls
+        query = f'{{service="{self.service_name}", namespace="{self.namespace}"}}'
+        encoded_query = urllib.parse.quote_plus(query)
+        return f"ws://{self.host}:{self.port}/loki/{self.namespace}/api/v1/tail?query={encoded_query}"
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def subscribe(self, request_id: str) -> LogSubscription:
+        """Subscribe to a request's logs, starting the tail if needed. Must be called from a running event loop."""
+        subscription = LogSubscription(self, request_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions[request_id].add(subscription)
+            self._idle_since = None
+            for _, recent_request_id, labels, values in self._recent:
+                if recent_request_id == request_id:
+                    subscription._deliver((labels, values))
+
+            if self._thread is None:
+                self._start_ns = time.time_ns() - self.START_LOOKBACK_NS
+                self._thread = threading.Thread(
+                    target=asyncio.run, args=(self._run(),), daemon=True, name=f"log-tail-{self.service_name}"
+                )
+                self._thread.start()
+        return subscription
+
+    def _unsubscribe(self, subscription: LogSubscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.request_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.request_id]
+            if not self._subscriptions:
+                self._idle_since = time.monotonic()
+
+    def _should_stop(self) -> bool:
+        """Whether the idle grace period has passed. If so, marks the tail stopped. Call with the lock held."""
+        if self._idle_since is not None and time.monotonic() - self._idle_since >= self.idle_timeout:
+            self._thread = None
+            return True
+        return False
+
+    def _dispatch(self, data: dict):
+        """Route the streams of one tail message to their request's subscriptions."""
+        now = time.monotonic()
+        with self._lock:
+            for stream in data.get("streams") or []:
+                labels = stream["stream"]
+                values = stream["values"]
+                if values:
+                    self._start_ns = max(self._start_ns, max(int(value[0]) for value in values))
+
+                request_id = labels.get("request_id")
+                subscriptions = self._subscriptions.get(request_id)
+                if subscriptions:
+                    for subscription in subscriptions:
+                        subscription._deliver((labels, values))
+                else:
+                    self._recent.append((now, request_id, labels, values))
+
+            while self._recent and now - self._recent[0][0] > self.RECENT_SECONDS:
+                self._recent.popleft()
+
+    async def _run(self):
+        backoff = 0.5
+        while True:
+            with self._lock:
+                if self._should_stop():
+                    return
+                # Reconnects resume from the last line seen; subscribers' deduplicators drop the overlap
+                uri = f"{self.uri}&start={self._start_ns}"
+
+            try:
+                logger.debug(f"Streaming logs with tail query {uri}")
+                async with websockets.connect(uri, close_timeout=1, ping_interval=20, ping_timeout=10) as websocket:
+                    self.connections += 1
+                    backoff = 0.5
+                    while True:
+                        with self._lock:
+                            if self._should_stop():
+                                return
+                        try:
+                            message = await asyncio.wait_for(websocket.recv(), timeout=1.0)
+                        except asyncio.TimeoutError:
+                            continue
+                        self._dispatch(json.loads(message))
             except Exception as e:
-                # Catchall for errors during exception handling above
-                if isinstance(e, RemoteException):
-                    # If we caught a RemoteException, it was packaged properly
-                    raise
-                import httpx
+                logger.debug(f"Log tail for service {self.service_name} disconnected: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 10)
+
+
+_service_log_tails = {}
+_service_log_tails_lock = threading.Lock()
+
+
+def get_service_log_tail(host: str, port: int, namespace: str, service_name: str) -> ServiceLogTail:
+    """Return the shared log tail for a service, creating it on first use."""
+    key = (host, port, namespace, service_name)
+    with _service_log_tails_lock:
+        if key not in _service_log_tails:
+            _service_log_tails[key] = ServiceLogTail(host, port, namespace, service_name)
+        return _service_log_tails[key]
+
+
+def get_stream_metrics_queries(
+    scope: Literal["pod", "resource"], service_name: str, interval: int, pod_names: list = None
+) -> dict:
+    """PromQL queries for the metrics printed during calls, by metric name."""
+    # lookback window for each Prometheus query
+    # For short intervals (1–60s polling): look back ≤ 2 min
+    # For slow polling (≥ 1 min): allow up to 5 min lookback
+    effective_window = min(max(30, interval * 3), 120 if interval < 60 else 300)
+    if scope == "pod":
+        pod_regex = "|".join(pod_names or [])
+        return {
+            # CPU: seconds of CPU used per second (i.e. cores used)
+            # Note: using irate ensures we always capture at least 2 samples in the window
+            # https://prometheus.io/docs/prometheus/latest/querying/functions/#irate
+            "CPU": f'sum by (pod) (irate(container_cpu_usage_seconds_total{{container!="",pod=~"{pod_regex}"}}[{effective_window}s]))',
+            # Memory: Working set in MiB
+            "Mem": f'last_over_time(container_memory_working_set_bytes{{container!="",pod=~"{pod_regex}"}}[{effective_window}s]) / 1024 / 1024',
+            # GPU metrics from DCGM
+            "GPU_SM": f'avg by (pod) (last_over_time(DCGM_FI_DEV_GPU_UTIL{{pod=~"{pod_regex}"}}[{effective_window}s]))',
+            "GPUMiB": f'avg by (pod) (last_over_time(DCGM_FI_DEV_FB_USED{{pod=~"{pod_regex}"}}[{effective_window}s]))',
+        }
+
+    service_name_regex = f"{service_name}.+"
+    return {
+        # CPU: Use rate of CPU seconds - cores utilized
+        "CPU": f'avg((irate(container_cpu_usage_seconds_total{{container!="",pod=~"{service_name_regex}"}}[{effective_window}s])))',
+        # Memory: Working set in MiB
+        "Mem": f'avg(last_over_time(container_memory_working_set_bytes{{container!="",pod=~"{service_name_regex}"}}[{effective_window}s]) / 1024 / 1024)',
+        # GPU metrics from DCGM
+        "GPU_SM": f'avg(last_over_time(DCGM_FI_DEV_GPU_UTIL{{pod=~"{service_name_regex}"}}[{effective_window}s]))',
+        "GPUMiB": f'avg(last_over_time(DCGM_FI_DEV_FB_USED{{pod=~"{service_name_regex}"}}[{effective_window}s]))',
+    }
+
+
+class MetricsSubscription(StreamSubscription):
+    """One call's share of a ServiceMetricsPoller: samples as {pod: {metric name: value}}, at most one per interval.
+
+    Like the per-call polling it replaces, the interval stretches over long calls, to at most a minute.
+    """
+
+    def __init__(self, poller: "ServiceMetricsPoller", interval: int, loop: asyncio.AbstractEventLoop):
+        super().__init__(poller, loop)
+        self.interval = interval
+        self.started = time.monotonic()
+        self.next_due = self.started + interval
+
+    def current_interval(self, now: float) -> float:
+        return max(self.interval, int(min(60, 1 + (now - self.started) / 30)))
+
+
+class ServiceMetricsPoller:
+    """Polls Prometheus for a service's metrics once per round and fans each sample out to every call streaming them.
+
+    Polling per call put a pod listing plus four PromQL queries per interval on the cluster for each in-flight call.
+    Instead, calls to the same service (and metrics scope) subscribe to this poller, which:
+
+    - Runs one poll for all subscriptions that are due, as a single query joining the four metrics with ``or``.
+    - Caches the service's pod names for ``POD_REFRESH_SECONDS`` (pod scope only).
+    - Spaces polls at least ``1 / POLLS_PER_CALL_SECOND`` seconds apart per subscription (up to
+      ``MAX_POLL_INTERVAL``), so fanning out hundreds of calls slows the metrics down rather than loading Prometheus.
+
+    The poller runs on a daemon thread while it has subscriptions.
+    """
+
+    POD_REFRESH_SECONDS = 60
+    POLLS_PER_CALL_SECOND = 16
+    MAX_POLL_INTERVAL = 60
+    # Subscriptions due this soon after a poll get its sample rather than waiting for the next one
+    DUE_SLACK = 1.0
+
+    def __init__(self, compute, prom_url: str, scope: Literal["pod", "resource"]):
+        self.compute = compute
+        self.prom_url = prom_url
+        self.scope = scope
+        self.polls = 0
+
+        self._lock = threading.Lock()
+        self._subscriptions: set = set()
+        self._thread = None
+        self._session = requests.Session()
+        self._pod_names = None
+        self._pods_listed_at = 0.0
 
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def subscribe(self, interval: int) -> MetricsSubscription:
+        """Subscribe to the service's metrics, starting the poller if needed. Must be called from a running loop."""
+        subscription = MetricsSubscription(self, interval, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions.add(subscription)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name=f"metrics-poller-{self.compute.service_name}"
+                )
+                self._thread.start()
+        return subscription
+
+    def _unsubscribe(self, subscription: MetricsSubscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def _min_poll_gap(self) -> float:
+        return min(self.MAX_POLL_INTERVAL, len(self._subscriptions) / self.POLLS_PER_CALL_SECOND)
+
+    def _run(self):
+        last_poll = float("-inf")
+        while True:
+            with self._lock:
+                if not self._subscriptions:
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                next_poll = max(min(s.next_due for s in self._subscriptions), last_poll + self._min_poll_gap())
+                interval = int(min(s.current_interval(now) for s in self._subscriptions))
+
+            if now < next_poll:
+                # Wake at least every second to notice when the last subscription is closed
+                time.sleep(min(1.0, next_poll - now))
+                continue
+
+            last_poll = now
+            samples = self._poll(interval)
+            now = time.monotonic()
+            with self._lock:
+                for subscription in self._subscriptions:
+                    if subscription.next_due <= now + self.DUE_SLACK:
+                        if samples:
+                            subscription._deliver(samples)
+                        subscription.next_due = now + subscription.current_interval(now)
+
+    def _poll(self, interval: int) -> dict:
+        """Query all metrics in one request, returning {pod: {metric name: value}}."""
+        pod_names = None
+        if self.scope == "pod":
+            if self._pod_names is None or time.monotonic() - self._pods_listed_at > self.POD_REFRESH_SECONDS:
+                try:
+                    self._pod_names = self.compute.pod_names()
+                except Exception as e:
+                    logger.debug(f"Failed to list pods for metrics: {e}")
+                    self._pod_names = []
+                self._pods_listed_at = time.monotonic()
+            if not self._pod_names:
+                logger.warning("No active pods found for service, skipping metrics collection")
+                return {}
+            pod_names = self._pod_names
+
+        queries = get_stream_metrics_queries(self.scope, self.compute.service_name, interval, pod_names)
+        # Tag each query's series with its metric name, so one request returns them all
+        query = " or ".join(f'label_replace({q}, "kt_metric", "{name}", "", "")' for name, q in queries.items())
+
+        self.polls += 1
+        try:
+            resp = self._session.get(self.prom_url, params={"query": query, "lookback_delta": interval}, timeout=5.0)
+            resp.raise_for_status()
+            data = resp.json()
+        except Exception as e:
+            logger.debug(f"Metrics request failed for {self.prom_url}: {e}")
+            return {}
+        if data.get("status") != "success":
+            return {}
+
+        samples = defaultdict(dict)
+        for result in data["data"]["result"]:
+            m = result["metric"]
+            _, val = result["value"]
+            try:
+                samples[m.get("pod", "unknown")][m["kt_metric"]] = float(val)
+            except (KeyError, ValueError):
+                continue
+        return dict(samples)
+
+
+_service_metrics_pollers = {}
+_service_metrics_pollers_lock = threading.Lock()
+
+
+def get_service_metrics_poller(compute, prom_url: str, scope: Literal["pod", "resource"]) -> ServiceMetricsPoller:
+    """Return the shared metrics poller for a service and scope, creating it on first use."""
+    key = (prom_url, compute.namespace, compute.service_name, scope)
+    with _service_metrics_pollers_lock:
+        if key not in _service_metrics_pollers:
+            _service_metrics_pollers[key] = ServiceMetricsPoller(compute, prom_url, scope)
+        return _service_metrics_pollers[key]
+
+
+def build_remote_exception(error_data: dict) -> Exception:
+    """Rebuild an exception packaged by the server (``error_type``, ``message``, ``traceback``, ``pod_name``)."""
+    error_type = error_data["error_type"]
+    message = error_data.get("message", "")
+    traceback = error_data["traceback"]
+    pod_name = error_data["pod_name"]
+    error_state = error_data.get("state", {})  # Optional serialized state
+
+    # Try to use the actual exception class if it exists
+    exc = None
+    error_class = None
+
+    # Import the exception registry
+    try:
+        from kubetorch import EXCEPTION_REGISTRY
+    except ImportError:
+        EXCEPTION_REGISTRY = {}
+
+    # First check if it's a Python builtin exception
+    import builtins
+
+    if hasattr(builtins, error_type):
+        error_class = getattr(builtins, error_type)
+    # Otherwise try to use from the kubetorch registry
+    elif error_type in EXCEPTION_REGISTRY:
+        error_class = EXCEPTION_REGISTRY[error_type]
+
+    if error_class:
+        try:
+            # First try to reconstruct from state if available
+            if error_state and hasattr(error_class, "from_dict"):
+                exc = error_class.from_dict(error_state)
+            # Otherwise try simple construction with message
+            else:
+                exc = error_class(message)
+        except Exception as e:
+            logger.debug(f"Could not reconstruct {error_type}: {e}, will use dynamic type")
+            # Fall back to dynamic creation
+            pass
+
+    # If we couldn't create the actual exception, fall back to dynamic type creation
+    if not exc:
+
+        def create_str_method(remote_traceback):
+            def __str__(self):
+                cleaned_traceback = remote_traceback.encode().decode("unicode_escape")
+                return f"{self.args[0]}\n\n{cleaned_traceback}"
+
+            return __str__
+
+        # Create the exception class with the custom __str__
+        error_class = type(
+            error_type,
+            (Exception,),
+            {"__str__": create_str_method(traceback)},
+        )
+
+        exc = error_class(message)
+
+    # Always add remote_traceback and pod_name
+    exc.remote_traceback = traceback
+    exc.pod_name = pod_name
+
+    # Wrap the exception to display remote traceback
+    # Create a new class that inherits from the original exception
+    # and overrides __str__ to include the remote traceback
+    class RemoteException(exc.__class__):
+        def __str__(self):
+            # Get the original message
+            original_msg = super().__str__()
+            # Clean up the traceback
+            cleaned_traceback = self.remote_traceback.encode().decode("unicode_escape")
+            return f"{original_msg}\n\n{cleaned_traceback}"
+
+    # Create wrapped instance without calling __init__
+    wrapped_exc = RemoteException.__new__(RemoteException)
+    # Copy all attributes from the original exception
+    wrapped_exc.__dict__.update(exc.__dict__)
+    # Set the exception args for proper display
+    wrapped_exc.args = (str(exc),)
+    return wrapped_exc
+
+
+class CustomResponse(httpx.Response):
+    def raise_for_status(self):
+        """Raises parsed server errors or HTTPError for other status codes"""
+        if not 400 <= self.status_code < 600:
+            return
+
+        if "application/json" in self.headers.get("Content-Type", ""):
+            try:
+                error_data = self.json()
+                remote_exc = None
+                if all(k in error_data for k in REMOTE_ERROR_KEYS):
+                    remote_exc = build_remote_exception(error_data)
+            except Exception:
+                # Catchall for errors while parsing or rebuilding the packaged exception
                 raise httpx.HTTPStatusError(
                     f"{self.status_code} {self.text}",
                     request=self.request,
                     response=self,
                 )
+            if remote_exc is not None:
+                # The exception was packaged properly by the server
+                raise remote_exc
         else:
             # Don't log 502 errors - they're expected during startup as nginx DNS updates
             if self.status_code != 502:
@@ -383,6 +762,14 @@ class HTTPClient:
 
         return endpoint, headers, stop_event, log_task, metrics_task, request_id
 
+    @staticmethod
+    def _call_request_kwargs(serialized_body, headers: dict) -> dict:
+        """Build post kwargs for a serialized call body: raw bytes for the binary transport, JSON otherwise."""
+        if isinstance(serialized_body, bytes):
+            headers["Content-Type"] = BINARY_CONTENT_TYPE
+            return {"content": serialized_body, "headers": headers}
+        return {"json": serialized_body, "headers": headers}
+
     def _make_request(self, method, endpoint, timeout=None, **kwargs):
         # Allow per-request timeout override
         if timeout is not None:
@@ -434,7 +821,7 @@ class HTTPClient:
         log_config: LoggingConfig,
         host: str = "localhost",
     ):
-        """Stream logs using Loki's websocket tail endpoint.
+        """Stream a call's logs from its service's shared Loki websocket tail.
 
         Args:
             request_id: The request ID to filter logs for
@@ -445,120 +832,88 @@ class HTTPClient:
         """
         formatter = ServerLogsFormatter()
         deduplicator = LogDeduplicator(window_intervals=5)  # ~2.5s dedup window
-        websocket = None
+        subscription = None
 
         try:
-            # Query using labels set by LogCapture (service, namespace, request_id)
-            namespace = self.compute.namespace
-            query = f'{{service="{self.service_name}", namespace="{namespace}", request_id="{request_id}"}}'
-            encoded_query = urllib.parse.quote_plus(query)
-            uri = f"ws://{host}:{port}/loki/{namespace}/api/v1/tail?query={encoded_query}"
+            tail = get_service_log_tail(host, port, self.compute.namespace, self.service_name)
+            subscription = tail.subscribe(request_id)
             # Track when we should stop
             stop_time = None
 
-            # Add timeout to prevent hanging connections
-            logger.debug(f"Streaming logs with tail query {uri}")
-            websocket = await websockets.connect(
-                uri,
-                close_timeout=10,  # Max time to wait for close handshake
-                ping_interval=20,  # Send ping every 20 seconds
-                ping_timeout=10,  # Wait 10 seconds for pong
-            )
-            try:
-                while True:
-                    # If stop event is set, start counting down
-                    # Handle both threading.Event and asyncio.Event
-                    is_stop_set = stop_event.is_set() if hasattr(stop_event, "is_set") else stop_event.is_set()
-                    if is_stop_set and stop_time is None:
-                        stop_time = time.time() + log_config.grace_period
-
-                    # If we're past the grace period, exit
-                    if stop_time is not None and time.time() > stop_time:
-                        break
+            while True:
+                # If stop event is set, start counting down
+                # Handle both threading.Event and asyncio.Event
+                is_stop_set = stop_event.is_set() if hasattr(stop_event, "is_set") else stop_event.is_set()
+                if is_stop_set and stop_time is None:
+                    stop_time = time.time() + log_config.grace_period
 
-                    try:
-                        # Use shorter timeout during grace period
-                        timeout = log_config.grace_poll_timeout if stop_time is not None else log_config.poll_timeout
-                        message = await asyncio.wait_for(websocket.recv(), timeout=timeout)
-                        data = json.loads(message)
+                # If we're past the grace period, exit
+                if stop_time is not None and time.time() > stop_time:
+                    break
 
-                        if data.get("streams"):
-                            for stream in data["streams"]:
-                                labels = stream["stream"]
-                                # Get pod name from Loki labels
-                                pod_name = labels.get("pod", "")
+                try:
+                    # Use shorter timeout during grace period
+                    timeout = log_config.grace_poll_timeout if stop_time is not None else log_config.poll_timeout
+                    labels, values = await subscription.get(timeout=timeout)
+                except asyncio.TimeoutError:
+                    # Timeout is expected - rotate deduplication window and continue
+                    deduplicator.rotate()
+                    continue
 
-                                for value in stream["values"]:
-                                    raw_log = value[1]
+                # Get pod name from Loki labels
+                pod_name = labels.get("pod", "")
 
-                                    # Deduplicate using hash-based sliding window
-                                    if deduplicator.is_duplicate(raw_log):
-                                        continue
+                for value in values:
+                    raw_log = value[1]
 
-                                    # Parse JSON message from LogCapture
-                                    try:
-                                        log_line = json.loads(raw_log)
-                                        log_name = log_line.get("name", "")
-                                        log_message = log_line.get("message", "")
-                                        log_level = log_line.get("levelname", "INFO")
-                                        log_asctime = log_line.get("asctime", "")
-                                    except json.JSONDecodeError:
-                                        # Fallback for plain text (shouldn't happen with LogCapture)
-                                        log_name = ""
-                                        log_message = raw_log
-                                        log_level = labels.get("level", "INFO")
-                                        log_asctime = ""
-
-                                    # Apply log level and system log filters
-                                    if not self._should_display_log(log_name, log_level, log_config):
-                                        continue
+                    # Deduplicate using hash-based sliding window
+                    if deduplicator.is_duplicate(raw_log):
+                        continue
 
-                                    # Format and print the log
-                                    if log_config.include_name and pod_name:
-                                        prefix = f"({pod_name}) "
-                                    else:
-                                        prefix = ""
+                    # Parse JSON message from LogCapture
+                    try:
+                        log_line = json.loads(raw_log)
+                        log_name = log_line.get("name", "")
+                        log_message = log_line.get("message", "")
+                        log_level = log_line.get("levelname", "INFO")
+                        log_asctime = log_line.get("asctime", "")
+                    except json.JSONDecodeError:
+                        # Fallback for plain text (shouldn't happen with LogCapture)
+                        log_name = ""
+                        log_message = raw_log
+                        log_level = labels.get("level", "INFO")
+                        log_asctime = ""
+
+                    # Apply log level and system log filters
+                    if not self._should_display_log(log_name, log_level, log_config):
+                        continue
 
-                                    # Strip trailing whitespace/control chars to prevent line overwrites
-                                    log_message = log_message.rstrip() if log_message else ""
+                    # Format and print the log
+                    if log_config.include_name and pod_name:
+                        prefix = f"({pod_name}) "
+                    else:
+                        prefix = ""
 
-                                    # Format differently for print statements vs logger output
-                                    if log_name == "print_redirect":
-                                        print(
-                                            f"{formatter.start_color}{prefix}{log_message}{formatter.reset_color}",
-                                            flush=True,
-                                        )
-                                    else:
-                                        formatted_log = f"{prefix}{log_asctime} | {log_level} | {log_message}"
-                                        print(
-                                            f"{formatter.start_color}{formatted_log}{formatter.reset_color}",
-                                            flush=True,
-                                        )
+                    # Strip trailing whitespace/control chars to prevent line overwrites
+                    log_message = log_message.rstrip() if log_message else ""
 
-                    except asyncio.TimeoutError:
-                        # Timeout is expected - rotate deduplication window and continue
-                        deduplicator.rotate()
-                        continue
-                    except websockets.exceptions.ConnectionClosed as e:
-                        logger.debug(f"WebSocket connection closed: {str(e)}")
-                        break
-            finally:
-                if websocket:
-                    try:
-                        # Use wait_for to prevent hanging on close
-                        await asyncio.wait_for(websocket.close(), timeout=1.0)
-                    except (asyncio.TimeoutError, Exception):
-                        pass
+                    # Format differently for print statements vs logger output
+                    if log_name == "print_redirect":
+                        print(
+                            f"{formatter.start_color}{prefix}{log_message}{formatter.reset_color}",
+                            flush=True,
+                        )
+                    else:
+                        formatted_log = f"{prefix}{log_asctime} | {log_level} | {log_message}"
+                        print(
+                            f"{formatter.start_color}{formatted_log}{formatter.reset_color}",
+                            flush=True,
+                        )
         except Exception as e:
-            logger.error(f"Error in websocket stream: {e}")
+            logger.error(f"Error in log stream: {e}")
         finally:
-            # Ensure websocket is closed even if we didn't enter the context
-            if websocket:
-                try:
-                    # Use wait_for to prevent hanging on close
-                    await asyncio.wait_for(websocket.close(), timeout=1.0)
-                except (asyncio.TimeoutError, Exception):
-                    pass
+            if subscription is not None:
+                subscription.close()
 
     async def _stream_events_websocket(
         self,
@@ -752,166 +1107,70 @@ class HTTPClient:
 
     # ----------------- Metrics Helpers ----------------- #
 
-    def _get_stream_metrics_queries(self, scope: Literal["pod", "resource"], interval: int):
-        # lookback window for each Prometheus query
-        # For short intervals (1–60s polling): look back ≤ 2 min
-        # For slow polling (≥ 1 min): allow up to 5 min lookback
-        effective_window = min(max(30, interval * 3), 120 if interval < 60 else 300)
-        metric_queries = {}
-        if scope == "pod":
-            active_pods = self.compute.pod_names()
-            if not active_pods:
-                logger.warning("No active pods found for service, skipping metrics collection")
-                return
-
-            pod_regex = "|".join(active_pods)
-            metric_queries = {
-                # CPU: seconds of CPU used per second (i.e. cores used)
-                # Note: using irate ensures we always capture at least 2 samples in the window
-                # https://prometheus.io/docs/prometheus/latest/querying/functions/#irate
-                "CPU": f'sum by (pod) (irate(container_cpu_usage_seconds_total{{container!="",pod=~"{pod_regex}"}}[{effective_window}s]))',
-                # Memory: Working set in MiB
-                "Mem": f'last_over_time(container_memory_working_set_bytes{{container!="",pod=~"{pod_regex}"}}[{effective_window}s]) / 1024 / 1024',
-                # GPU metrics from DCGM
-                "GPU_SM": f'avg by (pod) (last_over_time(DCGM_FI_DEV_GPU_UTIL{{pod=~"{pod_regex}"}}[{effective_window}s]))',
-                "GPUMiB": f'avg by (pod) (last_over_time(DCGM_FI_DEV_FB_USED{{pod=~"{pod_regex}"}}[{effective_window}s]))',
-            }
-
-        elif scope == "resource":
-            service_name_regex = f"{self.compute.service_name}.+"
-            metric_queries = {
-                # CPU: Use rate of CPU seconds - cores utilized
-                "CPU": f'avg((irate(container_cpu_usage_seconds_total{{container!="",pod=~"{service_name_regex}"}}[{effective_window}s])))',
-                # Memory: Working set in MiB
-                "Mem": f'avg(last_over_time(container_memory_working_set_bytes{{container!="",pod=~"{service_name_regex}"}}[{effective_window}s]) / 1024 / 1024)',
-                # GPU metrics from DCGM
-                "GPU_SM": f'avg(last_over_time(DCGM_FI_DEV_GPU_UTIL{{pod=~"{service_name_regex}"}}[{effective_window}s]))',
-                "GPUMiB": f'avg(last_over_time(DCGM_FI_DEV_FB_USED{{pod=~"{service_name_regex}"}}[{effective_window}s]))',
-            }
-
-        return metric_queries
-
-    def _collect_metrics_common(
-        self,
-        stop_event,
-        http_getter,
-        sleeper,
-        metrics_config: MetricsConfig,
-        is_async: bool = False,
-    ):
+    async def _collect_metrics_common(self, stop_event, metrics_config: MetricsConfig):
         """
-        Internal shared implementation for collecting and printing live resource metrics
-        (CPU, memory, and GPU) for all active pods in the service.
+        Internal shared implementation for printing live resource metrics (CPU, memory, and GPU) for the service's
+        pods during a call.
 
-        This function drives both the synchronous (`_collect_metrics`) and asynchronous
-        (`_collect_metrics_async`) metric collectors. It repeatedly queries Prometheus for
-        metrics related to the service’s pods until the given `stop_event` is set.
+        Samples come from the service's shared ServiceMetricsPoller, which polls Prometheus once for all calls in
+        flight, until the given `stop_event` is set.
 
         Args:
             stop_event (threading.event or asyncio.Event): A threading.Event or asyncio.Event used to stop collection.
-            http_getter (Callable): Callable that fetches Prometheus data — either sync (`requests.get`)
-                         or async (`httpx.AsyncClient.get`).
-            sleeper (Callable): Callable that sleeps between metric polls — either time.sleep or asyncio.sleep.
             metrics_config (MetricsConfig): User provided configuration controlling metrics collection behavior.
-            is_async (bool): If ``True``, runs in async mode (awaits HTTP + sleep calls).
-                             If ``False``, runs in blocking sync mode.
 
         Behavior:
-            - Polls Prometheus every 1–5 seconds for CPU, memory, and GPU metrics.
-            - Prints a formatted line per pod to stdout.
-            - Automatically adapts between synchronous and asynchronous execution modes.
+            - Prints a formatted line per pod to stdout for each sample.
 
         Note:
             - This function should not be called directly; use `_collect_metrics` or
               `_collect_metrics_async` instead.
             - Stops automatically when `stop_event.set()` is triggered.
         """
+        prom_url = f"{service_url()}/prometheus/api/v1/query"
+        poller = get_service_metrics_poller(self.compute, prom_url, metrics_config.scope)
+        subscription = poller.subscribe(int(metrics_config.interval))
+        show_gpu = True
 
-        async def maybe_await(obj):
-            if is_async and asyncio.iscoroutine(obj):
-                return await obj
-            return obj
-
-        async def run():
-            interval = int(metrics_config.interval)
-            metric_queries = self._get_stream_metrics_queries(scope=metrics_config.scope, interval=interval)
-            show_gpu = True
-            prom_url = f"{service_url()}/prometheus/api/v1/query"
-
-            start_time = time.time()
-
+        try:
             while not stop_event.is_set():
-                await maybe_await(sleeper(interval))
-                pod_data = defaultdict(dict)
-                gpu_values = []
-
-                for name, query in metric_queries.items():
-                    try:
-                        data = await maybe_await(
-                            http_getter(
-                                prom_url,
-                                params={
-                                    "query": query,
-                                    "lookback_delta": interval,
-                                },
-                            )
-                        )
-                        if data.get("status") != "success":
-                            continue
-                        for result in data["data"]["result"]:
-                            m = result["metric"]
-                            ts, val = result["value"]
-                            pod = m.get("pod", "unknown")
-                            val_f = float(val)
-                            pod_data[pod][name] = val_f
-                            if name in ("GPU%", "GPUMiB"):
-                                gpu_values.append(val_f)
-                    except Exception as e:
-                        logger.error(f"Error loading metrics: {e}")
-                        continue
+                try:
+                    pod_data = await subscription.get(timeout=1.0)
+                except asyncio.TimeoutError:
+                    continue
 
+                gpu_values = [vals[name] for vals in pod_data.values() for name in ("GPU_SM", "GPUMiB") if name in vals]
                 if not gpu_values:
                     show_gpu = False
 
-                if pod_data:
-                    for pod, vals in sorted(pod_data.items()):
-                        mem = vals.get("Mem", 0.0)
-                        cpu_cores = vals.get("CPU", 0.0)
-                        gpu = vals.get("GPU_SM", 0.0)
-                        gpumem = vals.get("GPUMiB", 0.0)
-                        now_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                        service_or_pod_info = (
-                            f"({pod} metrics) " if metrics_config.scope == "pod" else f"({self.service_name} metrics) "
-                        )
-                        line = f"{service_or_pod_info}{now_ts} | " f"CPU: {cpu_cores:.2f} | Memory: {mem:.3f}MiB"
-                        if show_gpu:
-                            line += f" | GPU SM: {gpu:.2f}% | GPU Memory: {gpumem:.3f}MiB"
-                        metrics_color = ColoredFormatter.get_color("blue")
-                        reset_color = ColoredFormatter.get_color("reset")
-                        print(f"{metrics_color}{line}{reset_color}", flush=True)
-
-                elapsed = time.time() - start_time
-                sleep_interval = max(interval, int(min(60, 1 + elapsed / 30)))
-                await maybe_await(sleeper(sleep_interval))
-
-        # run sync or async depending on mode
-        if is_async:
-            return run()
-        else:
-            asyncio.run(run())
+                for pod, vals in sorted(pod_data.items()):
+                    mem = vals.get("Mem", 0.0)
+                    cpu_cores = vals.get("CPU", 0.0)
+                    gpu = vals.get("GPU_SM", 0.0)
+                    gpumem = vals.get("GPUMiB", 0.0)
+                    now_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+                    service_or_pod_info = (
+                        f"({pod} metrics) " if metrics_config.scope == "pod" else f"({self.service_name} metrics) "
+                    )
+                    line = f"{service_or_pod_info}{now_ts} | " f"CPU: {cpu_cores:.2f} | Memory: {mem:.3f}MiB"
+                    if show_gpu:
+                        line += f" | GPU SM: {gpu:.2f}% | GPU Memory: {gpumem:.3f}MiB"
+                    metrics_color = ColoredFormatter.get_color("blue")
+                    reset_color = ColoredFormatter.get_color("reset")
+                    print(f"{metrics_color}{line}{reset_color}", flush=True)
+        finally:
+            subscription.close()
 
-    def _collect_metrics(self, stop_event, http_getter, sleeper, metrics_config):
+    def _collect_metrics(self, stop_event, metrics_config):
         """
         Synchronous metrics collector.
 
-        Invokes `_collect_metrics_common` in blocking mode to stream metrics. Designed for use in background threads
+        Runs `_collect_metrics_common` on a new event loop to stream metrics. Designed for use in background threads
         where the event loop is *not* running (e.g. standard Python threads).
 
         Args:
             stop_event: threading.Event to signal termination of metric collection.
-            http_getter: Synchronous callable that fetches Prometheus query results.
-            sleeper: Blocking sleep callable.
             metrics_config: User provided configuration controlling metrics collection behavior.
 
         Notes:
@@ -919,19 +1178,16 @@ class HTTPClient:
             - Safe to use in multi-threaded environments.
             - Should not be invoked from within an asyncio event loop.
         """
-        self._collect_metrics_common(stop_event, http_getter, sleeper, metrics_config=metrics_config, is_async=False)
+        asyncio.run(self._collect_metrics_common(stop_event, metrics_config=metrics_config))
 
-    async def _collect_metrics_async(self, stop_event, http_getter, sleeper, metrics_config):
+    async def _collect_metrics_async(self, stop_event, metrics_config):
         """
         Asynchronous metrics collector.
 
-        Invokes `_collect_metrics_common` in fully async mode. Designed for use when the caller is already
-        inside an active asyncio event loop.
+        Awaits `_collect_metrics_common` on the caller's event loop.
 
         Args:
             stop_event: asyncio.Event to signal termination of metric collection.
-            http_getter: Asynchronous callable that fetches Prometheus query results.
-            sleeper: Async sleep callable.
             metrics_config: User provided configuration controlling metrics collection behavior.
 
         Note:
@@ -939,9 +1195,7 @@ class HTTPClient:
             - Automatically terminates once `stop_event` is set.
             - Prints formatted metrics continuously until stopped.
         """
-        await self._collect_metrics_common(
-            stop_event, http_getter, sleeper, metrics_config=metrics_config, is_async=True
-        )
+        await self._collect_metrics_common(stop_event, metrics_config=metrics_config)
 
     # ----------------- Core APIs ----------------- #
     def stream_logs(self, request_id, stop_event, log_config: LoggingConfig):
@@ -978,50 +1232,16 @@ class HTTPClient:
         )
 
     async def stream_metrics_async(self, request_id, stop_event, metrics_config):
-        """Async GPU/CPU metrics streaming (uses httpx.AsyncClient)."""
+        """Async GPU/CPU metrics streaming, from the service's shared metrics poller."""
         logger.debug(f"Starting async metrics for {self.service_name} (request_id={request_id})")
-
-        async def async_http_get(url, params):
-            try:
-                resp = await self.async_session.get(url, params=params, timeout=5.0)
-                resp.raise_for_status()
-                try:
-                    return resp.json()
-                except json.JSONDecodeError:
-                    logger.debug(f"Non-JSON response from {url}: {resp.text[:100]}")
-                    return {}
-            except Exception as e:
-                logger.debug(f"Async metrics request failed for {url} ({params}): {e}")
-                return {}
-
-        async def async_sleep(seconds):
-            await asyncio.sleep(seconds)
-
-        await self._collect_metrics_async(stop_event, async_http_get, async_sleep, metrics_config)
+        await self._collect_metrics_async(stop_event, metrics_config)
         logger.debug(f"Stopped async metrics for {request_id}")
 
     def stream_metrics(self, stop_event, metrics_config: MetricsConfig = None):
-        """Synchronous GPU/CPU metrics streaming (uses requests)."""
+        """Synchronous GPU/CPU metrics streaming, from the service's shared metrics poller."""
         logger.debug(f"Streaming metrics for {self.service_name}")
         logger.debug(f"Using metrics config: {metrics_config}")
-
-        def sync_http_get(url, params):
-            try:
-                resp = requests.get(url, params=params, timeout=5.0)
-                resp.raise_for_status()
-                try:
-                    return resp.json()
-                except json.JSONDecodeError:
-                    logger.debug(f"Non-JSON response from {url}: {resp.text[:100]}")
-                    return {}
-            except Exception as e:
-                logger.debug(f"Sync metrics request failed for {url} ({params}): {e}")
-                return {}
-
-        def sync_sleep(seconds):
-            time.sleep(seconds)
-
-        self._collect_metrics(stop_event, sync_http_get, sync_sleep, metrics_config)
+        self._collect_metrics(stop_event, metrics_config)
 
     def call_method(
         self,
@@ -1041,16 +1261,52 @@ class HTTPClient:
             metrics_thread,
             _,
         ) = self._prepare_request(endpoint, stream_logs, stream_metrics, headers, serialization, logging_config)
+        streaming = False
         try:
-            json_data = _serialize_body(body, serialization)
-            response = self.post(endpoint=endpoint, json=json_data, headers=headers)
+            request_kwargs = self._call_request_kwargs(_serialize_body(body, serialization), headers)
+            response = self._send_call(endpoint, request_kwargs)
+            if response.status_code < 400 and is_stream_content_type(response.headers.get("Content-Type", "")):
+                # Generator callable: hand back an iterator, which now owns the log/metrics streams
+                streaming = True
+                return self._iter_stream_response(response, stop_event, log_thread, logging_config)
+            response.read()
             response.raise_for_status()
             return _deserialize_response(response, serialization)
         finally:
-            stop_event.set()
-            # Block main thread to allow log streaming to complete if shutdown_grace_period > 0
-            if log_thread and logging_config.shutdown_grace_period > 0:
-                log_thread.join(timeout=logging_config.shutdown_grace_period)
+            if not streaming:
+                self._stop_call_streams(stop_event, log_thread, logging_config)
+
+    def _send_call(self, endpoint, request_kwargs):
+        """POST a call without reading the body, so streamed responses can be consumed incrementally."""
+        request = self.session.build_request("POST", endpoint, **request_kwargs)
+        response = self.session.send(request, stream=True)
+        response.__class__ = CustomResponse
+        return response
+
+    @staticmethod
+    def _stop_call_streams(stop_event, log_thread, logging_config):
+        stop_event.set()
+        # Block main thread to allow log streaming to complete if shutdown_grace_period > 0
+        if log_thread and logging_config.shutdown_grace_period > 0:
+            log_thread.join(timeout=logging_config.shutdown_grace_period)
+
+    def _iter_stream_response(self, response, stop_event, log_thread, logging_config):
+        """Yield items from a streamed call response as they arrive.
+
+        Items are read from the socket only as the caller iterates, so a slow consumer applies backpressure all
+        the way to the remote generator. Closing the iterator early closes the connection and cancels it.
+        """
+        decoder = StreamDecoder(response.headers["Content-Type"])
+        try:
+            for data in response.iter_bytes():
+                for is_error, value in decoder.feed(data):
+                    if is_error:
+                        raise build_remote_exception(value)
+                    yield value
+            decoder.finish()
+        finally:
+            response.close()
+            self._stop_call_streams(stop_event, log_thread, logging_config)
 
     async def call_method_async(
         self,
@@ -1071,9 +1327,16 @@ class HTTPClient:
             monitoring_task,
             _,
         ) = self._prepare_request_async(endpoint, stream_logs, stream_metrics, headers, serialization, logging_config)
+        streaming = False
         try:
-            json_data = _serialize_body(body, serialization)
-            response = await self.post_async(endpoint=endpoint, json=json_data, headers=headers)
+            request_kwargs = self._call_request_kwargs(_serialize_body(body, serialization), headers)
+            request = self.async_session.build_request("POST", endpoint, **request_kwargs)
+            response = await self.async_session.send(request, stream=True)
+            response.__class__ = CustomResponse
+            if response.status_code < 400 and is_stream_content_type(response.headers.get("Content-Type", "")):
+                streaming = True
+                return self._aiter_stream_response(response, stop_event, log_task, monitoring_task, logging_config)
+            await response.aread()
             response.raise_for_status()
             result = _deserialize_response(response, serialization)
 
@@ -1082,32 +1345,51 @@ class HTTPClient:
 
             return result
         finally:
-            stop_event.set()
-            if log_task:
-                # Use shutdown_grace_period if set, otherwise use a short default timeout
-                timeout = logging_config.shutdown_grace_period if logging_config.shutdown_grace_period > 0 else 0.5
+            if not streaming:
+                await self._stop_call_tasks(stop_event, log_task, monitoring_task, logging_config)
+
+    async def _aiter_stream_response(self, response, stop_event, log_task, monitoring_task, logging_config):
+        """Async version of _iter_stream_response."""
+        decoder = StreamDecoder(response.headers["Content-Type"])
+        try:
+            async for data in response.aiter_bytes():
+                for is_error, value in decoder.feed(data):
+                    if is_error:
+                        raise build_remote_exception(value)
+                    yield value
+            decoder.finish()
+        finally:
+            await response.aclose()
+            await self._stop_call_tasks(stop_event, log_task, monitoring_task, logging_config)
+
+    @staticmethod
+    async def _stop_call_tasks(stop_event, log_task, monitoring_task, logging_config):
+        stop_event.set()
+        if log_task:
+            # Use shutdown_grace_period if set, otherwise use a short default timeout
+            timeout = logging_config.shutdown_grace_period if logging_config.shutdown_grace_period > 0 else 0.5
+            try:
+                await asyncio.wait_for(log_task, timeout=timeout)
+            except asyncio.TimeoutError:
+                # Always cancel on timeout to prevent "Task was destroyed but it is pending!" warnings
+                log_task.cancel()
                 try:
-                    await asyncio.wait_for(log_task, timeout=timeout)
-                except asyncio.TimeoutError:
-                    # Always cancel on timeout to prevent "Task was destroyed but it is pending!" warnings
-                    log_task.cancel()
-                    try:
-                        await log_task
-                    except asyncio.CancelledError:
-                        pass
-            # Clean up metrics task
-            if monitoring_task:
+                    await log_task
+                except asyncio.CancelledError:
+                    pass
+        # Clean up metrics task
+        if monitoring_task:
+            try:
+                await asyncio.wait_for(monitoring_task, timeout=0.5)
+            except asyncio.TimeoutError:
+                monitoring_task.cancel()
                 try:
-                    await asyncio.wait_for(monitoring_task, timeout=0.5)
-                except asyncio.TimeoutError:
-                    monitoring_task.cancel()
-                    try:
-                        await monitoring_task
-                    except asyncio.CancelledError:
-                        pass
+                    await monitoring_task
+                except asyncio.CancelledError:
+                    pass
 
-    def post(self, endpoint, json=None, headers=None):
-        return self._make_request("post", endpoint, json=json, headers=headers)
+    def post(self, endpoint, json=None, headers=None, content=None):
+        return self._make_request("post", endpoint, json=json, headers=headers, content=content)
 
     def put(self, endpoint, json=None, headers=None):
         return self._make_request("put", endpoint, json=json, headers=headers)
@@ -1118,8 +1400,8 @@ class HTTPClient:
     def get(self, endpoint, headers=None, timeout=None):
         return self._make_request("get", endpoint, headers=headers, timeout=timeout)
 
-    async def post_async(self, endpoint, json=None, headers=None):
-        return await self._make_request_async("post", endpoint, json=json, headers=headers)
+    async def post_async(self, endpoint, json=None, headers=None, content=None):
+        return await self._make_request_async("post", endpoint, json=json, headers=headers, content=content)
 
     async def put_async(self, endpoint, json=None, headers=None):
         return await self._make_request_async("put", endpoint, json=json, headers=headers)
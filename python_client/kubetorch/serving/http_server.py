@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import errno
 import importlib
 import importlib.util
 import inspect
@@ -7,6 +8,7 @@ import json
 import logging.config
 import os
 import pickle
+import shutil
 import subprocess
 import sys
 import threading
@@ -25,37 +27,59 @@ except:
 from fastapi import Body, FastAPI, Header, HTTPException, Query, Request, WebSocket
 
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from pydantic import BaseModel
 from starlette.middleware.base import BaseHTTPMiddleware
 
 try:
+    from batching import get_batch_config, submit_batched
     from log_capture import init_log_capture, stop_log_capture
     from metrics_push import init_metrics_pusher, stop_metrics_pusher
     from server_metrics import get_inactivity_ttl_annotation
+    from sharding import is_sharded, take_rank_shard
     from utils import (
+        BINARY_CONTENT_TYPE,
         clear_debugging_sessions,
         deep_breakpoint,
         DEFAULT_ALLOWED_SERIALIZATION,
+        encode_stream_error,
+        encode_stream_item,
         ensure_structured_logging,
+        is_binary_call,
         is_running_in_kubernetes,
         LOG_CONFIG,
+        pack_pickle_frame,
+        pack_result_list,
         request_id_ctx_var,
+        stream_content_type,
+        unpack_call_body,
+        unpack_pickle_frame,
         wait_for_app_start,
     )
 except ImportError:
+    from .batching import get_batch_config, submit_batched
     from .log_capture import init_log_capture, stop_log_capture
     from .metrics_push import init_metrics_pusher, stop_metrics_pusher
     from .server_metrics import get_inactivity_ttl_annotation
+    from .sharding import is_sharded, take_rank_shard
     from .utils import (
+        BINARY_CONTENT_TYPE,
         clear_debugging_sessions,
         deep_breakpoint,
         DEFAULT_ALLOWED_SERIALIZATION,
+        encode_stream_error,
+        encode_stream_item,
         ensure_structured_logging,
+        is_binary_call,
         is_running_in_kubernetes,
         LOG_CONFIG,
+        pack_pickle_frame,
+        pack_result_list,
         request_id_ctx_var,
+        stream_content_type,
+        unpack_call_body,
+        unpack_pickle_frame,
         wait_for_app_start,
     )
 
@@ -355,9 +379,10 @@ class ControllerWebSocket:
             # Clear caches
             _CACHED_CALLABLES.clear()
 
-            # Cleanup existing supervisor
+            # Cleanup existing supervisor, keeping its processes' __kt_cached_state__ for the new one
             if SUPERVISOR:
                 try:
+                    await asyncio.to_thread(SUPERVISOR.save_cached_state)
                     SUPERVISOR.cleanup()
                 except Exception as e:
                     logger.warning(f"Error during supervisor cleanup on reload: {e}")
@@ -764,6 +789,7 @@ def cached_image_setup():
 
                 # Don't clear the callable cache here - let load_callable_from_env handle it to preserve __kt_cached_state__
                 if SUPERVISOR:
+                    SUPERVISOR.save_cached_state()
                     SUPERVISOR.cleanup()
 
                 # Remove changed modules from sys.modules to override fresh imports
@@ -1001,6 +1027,7 @@ def load_supervisor(deployed_as_of: Optional[str] = None):
         distributed_config = json.loads(distributed_config)
         # If we already have some distributed processes, we need to clean them up before creating a new supervisor.
         if SUPERVISOR:
+            SUPERVISOR.save_cached_state()
             SUPERVISOR.cleanup()
         SUPERVISOR = supervisor_factory(**distributed_config)
         SUPERVISOR.config_hash = config_hash
@@ -1085,8 +1112,16 @@ def load_callable_from_env():
             init_kwargs = json.loads(os.environ["KT_INIT_ARGS"])
             logger.info(f"Setting init_args {init_kwargs}")
 
+        cached_state = _restore_cached_state(callable_obj)
+        if cached_state:
+            # Attributes listed in __kt_cached_state__ are set before __init__ runs, so it can skip reloading them
+            logger.info(f"Restoring cached state from the previous deployment: {', '.join(cached_state)}")
+            instance = callable_obj.__new__(callable_obj)
+            instance.__dict__.update(cached_state)
+            instance.__init__(**init_kwargs)
+            callable_obj = instance
         # Instantiate with arguments
-        if init_kwargs:
+        elif init_kwargs:
             callable_obj = callable_obj(**init_kwargs)
         else:
             callable_obj = callable_obj()
@@ -1094,6 +1129,100 @@ def load_callable_from_env():
     return callable_obj
 
 
+def _cached_state_owner(cls) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def save_cached_state() -> Optional[str]:
+    """Save the attributes the loaded class instance lists in ``__kt_cached_state__``.
+
+    Called in a ProcessWorker subprocess before a redeploy tears it down. The attributes are written to a file in
+    ``KT_OBJECT_STORE_DIR`` (``/dev/shm`` by default) with ``_dump_object``, which the subprocess replacing this one
+    restores in ``load_callable_from_env``. Returns the file's path, or None if the callable doesn't opt in.
+
+    NumPy arrays are written without an extra copy, but torch tensors are copied into the pickle stream, so saving
+    them briefly holds a second copy in this process on top of the one in the file. Raises ``OSError(ENOSPC)``
+    up front if the state is estimated not to fit in the directory's free space.
+    """
+    callable_obj = _CACHED_CALLABLES.get(os.environ.get("KT_CLS_OR_FN_NAME"))
+    names = getattr(type(callable_obj), "__kt_cached_state__", None)
+    if not names:
+        return None
+
+    from kubetorch.data_store.pod_data_server import _dump_object, OBJECT_STORE_DIR
+
+    state = {name: getattr(callable_obj, name) for name in names if hasattr(callable_obj, name)}
+    # Fail before paying for pickling when it can't fit (a container's /dev/shm is only 64MB unless resized)
+    needed, free = _estimated_nbytes(state), shutil.disk_usage(OBJECT_STORE_DIR).free
+    if needed > free:
+        raise OSError(
+            errno.ENOSPC,
+            f"__kt_cached_state__ needs about {needed / 1e6:.1f} MB but {OBJECT_STORE_DIR} has {free / 1e6:.1f} MB "
+            "free. Mount a larger memory-backed volume at /dev/shm or set KT_OBJECT_STORE_DIR.",
+            OBJECT_STORE_DIR,
+        )
+    return _dump_object(
+        {
+            "owner": _cached_state_owner(type(callable_obj)),
+            "init_args": os.environ.get("KT_INIT_ARGS"),
+            "state": state,
+        }
+    )
+
+
+def _estimated_nbytes(obj, seen=None) -> int:
+    """Rough size of the array data in ``obj``: arrays, tensors and torch modules' parameters and buffers, found
+    through dicts, lists, tuples and sets. Anything else counts as zero."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, (bytes, bytearray)):
+        return len(obj)
+    if isinstance(obj, dict):
+        return sum(_estimated_nbytes(value, seen) for value in obj.values())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sum(_estimated_nbytes(item, seen) for item in obj)
+    if callable(getattr(obj, "parameters", None)) and callable(getattr(obj, "buffers", None)):
+        # torch.nn.Module
+        return sum(_estimated_nbytes(t, seen) for t in [*obj.parameters(), *obj.buffers()])
+    nbytes = getattr(obj, "nbytes", None)
+    return nbytes if isinstance(nbytes, int) else 0
+
+
+def _restore_cached_state(cls) -> Optional[Dict]:
+    """Load the state saved by the subprocess this one replaced, if it was saved for the same class and init args.
+
+    The supervisor passes the saved file's path in ``KT_CACHED_STATE_PATH``. It's used at most once, and the file is
+    removed whether or not it's restored.
+    """
+    path = os.environ.pop("KT_CACHED_STATE_PATH", None)
+    if not path:
+        return None
+
+    names = getattr(cls, "__kt_cached_state__", None)
+    try:
+        if not names:
+            return None
+        from kubetorch.data_store.pod_data_server import _load_object
+
+        saved = _load_object(path)
+    except Exception as e:
+        logger.warning(f"Failed to load cached state, initializing from scratch: {e}")
+        return None
+    finally:
+        # Restored objects keep the mapped pages alive after the file is removed
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    if saved["owner"] != _cached_state_owner(cls) or saved["init_args"] != os.environ.get("KT_INIT_ARGS"):
+        logger.info("Class or init args changed since the cached state was saved, initializing from scratch")
+        return None
+    return {name: value for name, value in saved["state"].items() if name in names}
+
+
 def import_from_file(file_path: str, module_name: str):
     """Import a module from file path."""
     module_parts = module_name.split(".")
@@ -1649,7 +1778,7 @@ def run_callable(
     cls_or_fn_name: str,
     method_name: Optional[str] = None,
     distributed_subcall: bool = Query(False),
-    params: Optional[Union[Dict, str]] = Body(default=None),
+    params: Optional[Union[Dict, str, bytes]] = Body(default=None),
     deployed_as_of: Optional[str] = Header(None, alias="X-Deployed-As-Of"),
     serialization: str = Header("json", alias="X-Serialization"),
 ):
@@ -1677,6 +1806,26 @@ def run_callable(
     # Load supervisor (runs image setup if needed)
     load_callable(deployed_as_of)
 
+    # Binary pickle calls arrive as a raw octet body rather than JSON. Unpack the call metadata here and
+    # keep the pickled payload as bytes, so it reaches the subprocess without base64 encoding.
+    if isinstance(params, bytes):
+        params = unpack_call_body(params) if params else None
+
+    # Batches are split into single calls by the local ExecutionSupervisor, so reject them for distributed services
+    # before anything is fanned out to the workers
+    if isinstance(params, dict) and "batch" in params:
+        from kubetorch.serving.distributed_supervisor import DistributedSupervisor
+
+        if isinstance(SUPERVISOR, DistributedSupervisor):
+            raise ValueError("Batched (map) calls are only supported for non-distributed services")
+
+    # Only SPMD services reduce results, so don't silently return every rank's result elsewhere
+    if isinstance(params, dict) and params.get("reduce"):
+        from kubetorch.serving.spmd.spmd_supervisor import SPMDDistributedSupervisor
+
+        if not isinstance(SUPERVISOR, SPMDDistributedSupervisor):
+            raise ValueError("kt_reduce is only supported for SPMD distributed services")
+
     # Route call through supervisor to subprocess
     result = SUPERVISOR.call(
         request,
@@ -1687,6 +1836,20 @@ def run_callable(
         deployed_as_of,
     )
     clear_debugging_sessions()
+
+    from kubetorch.serving.process_pool import ProcessStream
+
+    if isinstance(result, ProcessStream):
+        # Generator callable: forward items as the subprocess yields them
+        return StreamingResponse(
+            encode_stream_response(result, serialization),
+            media_type=stream_content_type(serialization),
+        )
+    if isinstance(result, bytes):
+        return Response(content=result, media_type=BINARY_CONTENT_TYPE)
+    if isinstance(result, list) and result and all(isinstance(r, bytes) for r in result):
+        # SPMD calls return one pickled frame per rank
+        return Response(content=pack_result_list(result), media_type=BINARY_CONTENT_TYPE)
     return result
 
 
@@ -1698,6 +1861,8 @@ def execute_callable(
     serialization: str = "json",
 ):
     """Synchronous wrapper for run_callable_internal, used by distributed subprocesses."""
+    # Binary pickle calls carry the payload as raw bytes; respond in kind
+    binary_transport = serialization == "pickle" and is_binary_call(params)
 
     # Check if serialization is allowed
     allowed_serialization = os.getenv("KT_ALLOWED_SERIALIZATION", DEFAULT_ALLOWED_SERIALIZATION).split(",")
@@ -1707,15 +1872,24 @@ def execute_callable(
             detail=f"Serialization format '{serialization}' not allowed. Allowed formats: {allowed_serialization}",
         )
 
+    # Batches are split into single calls by the local ExecutionSupervisor before they reach the subprocess
+    if isinstance(params, dict) and "batch" in params:
+        raise ValueError("Batched (map) calls are only supported for non-distributed services")
+
     # Process the call
     args = []
     kwargs = {}
     debug_port, debug_mode = None, None
 
     if params:
-        if serialization == "pickle":
+        if is_sharded(params):
+            # Fill in this rank's slice of the args wrapped in kt.distributed.shard() (see sharding.py)
+            params.update(take_rank_shard(params, binary_transport))
+        elif serialization == "pickle":
             # Handle pickle serialization - extract data from dictionary wrapper
-            if isinstance(params, dict) and "data" in params:
+            if binary_transport:
+                params.update(unpack_pickle_frame(params.pop("data")))
+            elif isinstance(params, dict) and "data" in params:
                 encoded_data = params.pop("data")
                 pickled_data = base64.b64decode(encoded_data.encode("utf-8"))
                 param_args = pickle.loads(pickled_data)
@@ -1759,7 +1933,10 @@ def execute_callable(
             result = user_method(*args, **kwargs)
     else:
         logger.debug(f"Calling remote callable {callable_name}")
-        if is_async_method:
+        if get_batch_config(user_method):
+            # Concurrent calls are collected and run as one batch (see batching.py)
+            result = submit_batched(callable_name, user_method, args, kwargs)
+        elif is_async_method:
             # For async methods in sync context, we need to run them in a new event loop
             result = asyncio.run(user_method(*args, **kwargs))
         else:
@@ -1769,12 +1946,19 @@ def execute_callable(
     if isinstance(result, Awaitable):
         result = asyncio.run(result)
 
+    # Generators are returned as-is and streamed item by item (see iter_stream_chunks)
+    if is_stream_result(result):
+        return result
+
     # Serialize response based on format
     if serialization == "pickle":
         try:
-            pickled_result = pickle.dumps(result)
-            encoded_result = base64.b64encode(pickled_result).decode("utf-8")
-            result = {"data": encoded_result}
+            if binary_transport:
+                result = pack_pickle_frame(result)
+            else:
+                pickled_result = pickle.dumps(result)
+                encoded_result = base64.b64encode(pickled_result).decode("utf-8")
+                result = {"data": encoded_result}
         except Exception as e:
             logger.error(f"Failed to pickle result: {str(e)}")
             raise SerializationError(f"Result could not be serialized with pickle: {str(e)}")
@@ -1791,6 +1975,63 @@ def execute_callable(
     return result
 
 
+def is_stream_result(result) -> bool:
+    return inspect.isgenerator(result) or inspect.isasyncgen(result)
+
+
+def iter_stream_chunks(result, serialization: str = "json"):
+    """Iterate a generator or async generator result, serializing each item as it's produced.
+
+    Items are JSON strings for json serialization and pickle frames for pickle. Closing this iterator
+    closes the user's generator.
+    """
+    items = _iter_async_generator(result) if inspect.isasyncgen(result) else result
+    try:
+        for item in items:
+            if serialization == "pickle":
+                try:
+                    yield pack_pickle_frame(item)
+                except Exception as e:
+                    raise SerializationError(f"Stream item could not be serialized with pickle: {str(e)}")
+            else:
+                try:
+                    yield json.dumps(item)
+                except (TypeError, ValueError) as e:
+                    raise SerializationError(f"Stream item could not be serialized to JSON: {str(e)}")
+    finally:
+        items.close()
+
+
+def _iter_async_generator(agen):
+    """Drive an async generator from sync code on a dedicated event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                item = loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        loop.run_until_complete(agen.aclose())
+        loop.close()
+
+
+def encode_stream_response(chunks, serialization: str):
+    """Frame serialized stream chunks for a StreamingResponse, turning a mid-stream failure into an error record."""
+    from kubetorch.serving.process_pool import ProcessStreamError
+
+    try:
+        for chunk in chunks:
+            yield encode_stream_item(chunk, serialization)
+    except ProcessStreamError as e:
+        yield encode_stream_error(json.loads(e.response.body), serialization)
+    except Exception as e:
+        yield encode_stream_error(json.loads(package_exception(e).body), serialization)
+    finally:
+        chunks.close()
+
+
 @app.get("/health", include_in_schema=False)
 @app.get("/", include_in_schema=False)
 async def health():
@@ -5,12 +5,25 @@ Captures ALL stdout/stderr from the main process and subprocesses:
 1. Pushes structured logs to log store (async batched) for querying
 2. Forwards logs to original stdout/stderr (kubectl logs + user handlers)
 
+Log Shipping:
+- Lines wait in a bounded buffer (KT_LOG_BUFFER_LINES, default 10000). When it's full, the overflow policy
+  (KT_LOG_OVERFLOW_POLICY) decides: "drop_oldest" (default), "drop_newest", or "block", which makes the writing
+  thread wait up to a few seconds for the flush thread to make room before dropping the new line
+- The buffer is flushed every flush_interval seconds, or as soon as batch_size lines are waiting
+- Pushes are gzip-compressed and retried with exponential backoff on connection errors, 429s and 5xx responses
+- Queued, pushed and dropped line counts are exported through the MetricsPusher
+
 Subprocess Log Capture:
-- Subprocesses can send logs via the subprocess_queue (multiprocessing.Queue)
-- Use get_subprocess_queue() to get the queue and push log entries
+- Each subprocess gets its own pipe from new_subprocess_pipe() and sends log entries, or lists of entries, on it
 - Entry format: {"message": str, "level": str, "request_id": str, "extra_labels": dict}
+- A LogCapture in pipe mode (create_subprocess_log_capture) buffers lines in the subprocess and sends them on the
+  pipe in batches every 50ms, so a print costs an append rather than an IPC round trip
+- The collector drops a pipe once its subprocess exits, so a worker killed mid-write can't stall or corrupt log
+  collection for the others
 """
 
+import gzip
+import json
 import logging
 import multiprocessing as mp
 import os
@@ -18,13 +31,22 @@ import socket
 import sys
 import threading
 import time
-from queue import Empty
+from collections import deque
+from multiprocessing.connection import Connection, wait
 from typing import Callable, Dict, Optional
 
 import httpx
 
+from .metrics_push import get_metrics_pusher
+
 logger = logging.getLogger(__name__)
 
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+DEFAULT_MAX_BUFFERED_LINES = 10000
+
+# Subprocesses send their logs to the main process in batches this often
+SUBPROCESS_FLUSH_INTERVAL = 0.05
+
 # Silence httpx/httpcore INFO logs to prevent feedback loop:
 # httpx logs every request -> LogCapture captures it -> pushes to Loki -> httpx logs again
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -36,10 +58,10 @@ class LogCapture:
     Captures ALL stdout/stderr from the main process and:
     1. Pushes structured logs to log store (async batched)
     2. Forwards logs to original stdout/stderr (kubectl logs + user handlers)
-    3. Collects logs from subprocesses via a multiprocessing.Queue
+    3. Collects logs from subprocesses, each over its own pipe
 
-    Can also run in "queue mode" for subprocesses, where logs are pushed to a queue
-    instead of being buffered and sent to Loki.
+    Can also run in "pipe mode" for subprocesses, where buffered logs are sent to the main
+    process through a pipe in batches instead of being sent to Loki.
     """
 
     def __init__(
@@ -48,9 +70,14 @@ class LogCapture:
         labels: Dict[str, str] = None,
         batch_size: int = 100,
         flush_interval: float = 1.0,
-        # Queue mode: push to queue instead of Loki (for subprocesses)
-        output_queue: mp.Queue = None,
+        # Pipe mode: send to the main process instead of Loki (for subprocesses)
+        output_pipe: Connection = None,
         get_request_id_fn: Callable = None,
+        max_buffered_lines: Optional[int] = None,
+        overflow_policy: Optional[str] = None,
+        block_timeout: float = 5.0,
+        max_push_retries: int = 3,
+        retry_backoff: float = 0.5,
     ):
         """
         Initialize log capture.
@@ -58,40 +85,62 @@ class LogCapture:
         Args:
             log_store_url (str, optional): Base URL for log store (e.g., http://kubetorch-data-store.namespace:3100). (Default: None)
             labels (Dict[str, str], optional): Base labels for all logs (service, pod_name, namespace). (Default: None)
-            batch_size (int, optional): Number of log entries to batch before pushing. (Default: 100)
+            batch_size (int, optional): Number of buffered log entries that triggers a flush before the next
+                interval. (Default: 100)
             flush_interval (float, optional): Seconds between automatic flushes. (Default: 1.0)
-            output_queue (mp.Queue, optional): If provided, push logs to this queue instead of Loki (subprocess mode). (Default: None)
+            output_pipe (Connection, optional): If provided, send logs on this pipe instead of Loki (subprocess mode). (Default: None)
             get_request_id_fn (Callable, optional): Function to get current request_id (required for subprocess mode). (Default: None)
+            max_buffered_lines (int, optional): Max log entries waiting to be pushed. (Default: ``KT_LOG_BUFFER_LINES``
+                or 10000)
+            overflow_policy (str, optional): What to do with a new entry when the buffer is full: "drop_oldest",
+                "drop_newest", or "block". (Default: ``KT_LOG_OVERFLOW_POLICY`` or "drop_oldest")
+            block_timeout (float, optional): Max seconds a write waits for room under the "block" policy before
+                the entry is dropped. (Default: 5.0)
+            max_push_retries (int, optional): Retries of a failed push before its entries are dropped. (Default: 3)
+            retry_backoff (float, optional): Seconds before the first retry, doubled for each one after. (Default: 0.5)
         """
         self.log_store_url = log_store_url
         self.labels = labels or {}
         self.batch_size = batch_size
         self.flush_interval = flush_interval
+        self.max_buffered_lines = max_buffered_lines or int(
+            os.environ.get("KT_LOG_BUFFER_LINES", DEFAULT_MAX_BUFFERED_LINES)
+        )
+        self.overflow_policy = overflow_policy or os.environ.get("KT_LOG_OVERFLOW_POLICY", "drop_oldest")
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown log overflow policy '{self.overflow_policy}', expected one of {', '.join(OVERFLOW_POLICIES)}"
+            )
+        self.block_timeout = block_timeout
+        self.max_push_retries = max_push_retries
+        self.retry_backoff = retry_backoff
 
-        # Queue mode for subprocesses
-        self._output_queue = output_queue
+        # Pipe mode for subprocesses. The flush thread and stop() can both send, so sends are serialized.
+        self._output_pipe = output_pipe
+        self._send_lock = threading.Lock()
         self._get_request_id_fn = get_request_id_fn
-        self._queue_mode = output_queue is not None
+        self._pipe_mode = output_pipe is not None
 
-        # Buffer for log store push (not used in queue mode)
-        self._buffer = []
+        # Bounded buffer for log store push (not used in pipe mode)
+        self._buffer = deque()
         self._buffer_lock = threading.Lock()
+        self._buffer_not_full = threading.Condition(self._buffer_lock)
+        self._flush_requested = threading.Event()
+
+        # Shipping counters, and the values last exported to the MetricsPusher
+        self._counts = {"pushed": 0, "dropped_overflow": 0, "dropped_push_failed": 0}
+        self._exported_counts = dict(self._counts)
 
         # Original streams (for forwarding)
         self._original_stdout = sys.stdout
         self._original_stderr = sys.stderr
 
-        # Queue for subprocess log collection (multiprocessing-safe) - only in main process mode
-        # Use Manager queue to avoid context mismatch issues between fork/spawn
-        # (PyTorch CUDA changes start method to 'spawn' after LogCapture init)
-        if self._queue_mode:
-            self._subprocess_queue = None
-            self._manager = None
-        else:
-            self._manager = mp.Manager()
-            self._subprocess_queue = self._manager.Queue()
+        # Read ends of the subprocess log pipes (main process mode only), one per subprocess. A pipe has a single
+        # writer, so a subprocess killed mid-write only loses its own pipe, which the collector drops on EOF.
+        self._subprocess_pipes = []
+        self._subprocess_pipes_lock = threading.Lock()
 
-        # Background threads (not used in queue mode)
+        # Background threads (only the flush thread is used in pipe mode)
         self._stop_event = threading.Event()
         self._flush_thread: Optional[threading.Thread] = None
         self._subprocess_collector_thread: Optional[threading.Thread] = None
@@ -122,16 +171,16 @@ class LogCapture:
         # Redirect root logger to use our interceptor
         self._setup_logging_handler()
 
-        # In queue mode (subprocess), we don't need background threads or HTTP client
-        if not self._queue_mode:
+        # Start background flush thread (in pipe mode, it sends batches to the main process)
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+
+        # In pipe mode (subprocess), we don't need the HTTP client or subprocess collector
+        if not self._pipe_mode:
             # Create HTTP client for connection pooling (reuses TCP connections)
             self._session = httpx.Client(timeout=5.0)
 
-            # Start background flush thread
-            self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
-            self._flush_thread.start()
-
-            # Start subprocess queue collector
+            # Start subprocess log collector
             self._subprocess_collector_thread = threading.Thread(target=self._collect_subprocess_logs, daemon=True)
             self._subprocess_collector_thread.start()
 
@@ -145,8 +194,8 @@ class LogCapture:
             return
 
         self._stop_event.set()
-        if not self._queue_mode:
-            self._flush_now()
+        self._flush_requested.set()
+        self._flush_now()
         sys.stdout = self._original_stdout
         sys.stderr = self._original_stderr
 
@@ -158,14 +207,6 @@ class LogCapture:
                 pass
             self._session = None
 
-        # Shutdown manager if we created one
-        if self._manager is not None:
-            try:
-                self._manager.shutdown()
-            except Exception:
-                pass
-            self._manager = None
-
         self._started = False
 
     def flush(self):
@@ -180,14 +221,25 @@ class LogCapture:
         """
         self._ensure_logging_handler()
 
-    def get_subprocess_queue(self) -> mp.Queue:
+    def stats(self) -> Dict[str, int]:
+        """Log shipping counters: entries currently queued, and totals pushed and dropped (by reason)."""
+        with self._buffer_lock:
+            return {"queued": len(self._buffer), **self._counts}
+
+    def new_subprocess_pipe(self) -> Connection:
         """
-        Get the queue for subprocesses to push logs to.
+        Create a pipe for one subprocess to send logs on, and return its write end.
 
-        Subprocesses should push entries in the format:
+        The subprocess should send entries, or lists of entries, in the format:
         {"message": str, "level": str, "request_id": str, "extra_labels": dict}
+
+        Close the returned connection in this process once the subprocess has started, so the collector sees EOF
+        and drops the pipe when the subprocess exits.
         """
-        return self._subprocess_queue
+        reader, writer = mp.Pipe(duplex=False)
+        with self._subprocess_pipes_lock:
+            self._subprocess_pipes.append(reader)
+        return writer
 
     def add_log(
         self,
@@ -197,8 +249,9 @@ class LogCapture:
         extra_labels: Optional[Dict[str, str]] = None,
         name: str = "print_redirect",
         asctime: Optional[str] = None,
+        timestamp_ns: Optional[int] = None,
     ):
-        """Add a log entry to the buffer (or queue in subprocess mode).
+        """Add a log entry to the buffer (sent to the main process in batches in subprocess mode).
 
         Args:
             message: The log message text
@@ -207,24 +260,10 @@ class LogCapture:
             extra_labels: Additional Loki labels
             name: Logger name ("print_redirect" for stdout/stderr, logger name for logging)
             asctime: Formatted timestamp (auto-generated if not provided)
+            timestamp_ns: Time the line was logged, in nanoseconds (now if not provided)
         """
-        # In queue mode, push directly to queue for main process to handle
-        if self._queue_mode:
-            try:
-                self._output_queue.put_nowait(
-                    {
-                        "message": message,
-                        "level": level,
-                        "request_id": request_id,
-                        "extra_labels": extra_labels,
-                        "name": name,
-                    }
-                )
-            except Exception:
-                pass  # Don't block on queue errors
-            return
-
-        timestamp_ns = time.time_ns()
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
 
         # Generate asctime if not provided
         if asctime is None:
@@ -232,27 +271,53 @@ class LogCapture:
 
             asctime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # Build labels for this log line
-        labels = {**self.labels}
-        if extra_labels:
-            labels.update(extra_labels)
-        labels["level"] = level
-        labels["request_id"] = request_id
+        if self._pipe_mode:
+            # Labels are added by the main process, which collects the batches
+            entry = {
+                "message": message,
+                "level": level,
+                "request_id": request_id,
+                "extra_labels": extra_labels,
+                "name": name,
+                "asctime": asctime,
+                "timestamp": timestamp_ns,
+            }
+        else:
+            # Build labels for this log line
+            labels = {**self.labels}
+            if extra_labels:
+                labels.update(extra_labels)
+            labels["level"] = level
+            labels["request_id"] = request_id
+
+            entry = {
+                "labels": labels,
+                "timestamp": timestamp_ns,
+                "message": message,
+                "name": name,
+                "asctime": asctime,
+                "levelname": level,
+            }
 
         with self._buffer_lock:
-            self._buffer.append(
-                {
-                    "labels": labels,
-                    "timestamp": timestamp_ns,
-                    "message": message,
-                    "name": name,
-                    "asctime": asctime,
-                    "levelname": level,
-                }
-            )
+            if len(self._buffer) >= self.max_buffered_lines:
+                self._flush_requested.set()
+                # The flush thread itself must never wait for room (e.g. if pushing logs a warning)
+                if self.overflow_policy == "block" and threading.current_thread() is not self._flush_thread:
+                    self._buffer_not_full.wait_for(
+                        lambda: len(self._buffer) < self.max_buffered_lines, timeout=self.block_timeout
+                    )
+            if len(self._buffer) >= self.max_buffered_lines:
+                self._counts["dropped_overflow"] += 1
+                if self.overflow_policy != "drop_oldest":
+                    return
+                self._buffer.popleft()
+            self._buffer.append(entry)
             # Don't flush here - let the background thread handle it.
             # Calling _flush_now() here would block the calling thread,
             # which could be the async event loop.
+            if len(self._buffer) >= self.batch_size:
+                self._flush_requested.set()
 
     def _setup_logging_handler(self):
         """Add handler to root logger that feeds into our capture."""
@@ -275,20 +340,38 @@ class LogCapture:
         logging.root.addHandler(handler)
 
     def _flush_loop(self):
-        """Background thread: flush buffer periodically."""
+        """Background thread: flush the buffer periodically, or early once batch_size entries are waiting."""
         while not self._stop_event.is_set():
-            time.sleep(self.flush_interval)
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
             self._flush_now()
 
     def _flush_now(self):
         """Push buffered logs to log store."""
-        import json
-
         with self._buffer_lock:
-            if not self._buffer:
-                return
-            batch, self._buffer = self._buffer, []
+            batch = list(self._buffer)
+            self._buffer.clear()
+            self._buffer_not_full.notify_all()
+
+        if batch and self._pipe_mode:
+            self._send_to_main_process(batch)
+        elif batch:
+            self._push(batch)
+        self._export_stats()
+
+    def _send_to_main_process(self, batch):
+        """Pipe mode: send a batch of entries to the main process's LogCapture in a single message."""
+        try:
+            with self._send_lock:
+                self._output_pipe.send(batch)
+        except Exception:
+            with self._buffer_lock:
+                self._counts["dropped_push_failed"] += len(batch)
+            return
+        with self._buffer_lock:
+            self._counts["pushed"] += len(batch)
 
+    def _build_payload(self, batch) -> Dict:
         # Group by labels for efficient push (Loki format)
         streams: Dict[tuple, Dict] = {}
         for entry in batch:
@@ -307,23 +390,85 @@ class LogCapture:
             )
             streams[label_key]["values"].append([str(entry["timestamp"]), json_message])
 
-        payload = {"streams": list(streams.values())}
+        return {"streams": list(streams.values())}
 
-        try:
-            if self._session:
-                self._session.post(
-                    f"{self.log_store_url}/loki/api/v1/push",
-                    json=payload,
-                )
-        except Exception as e:
-            # Log to original stderr (don't recurse)
-            self._original_stderr.write(f"Failed to push logs to log store: {e}\n")
+    def _push(self, batch):
+        """Push a batch to the log store, retrying with backoff. The batch is dropped if every attempt fails."""
+        if not self._session:
+            return
+
+        # Log lines compress well, and the fastest level keeps the CPU cost on the pod low
+        body = gzip.compress(json.dumps(self._build_payload(batch)).encode("utf-8"), compresslevel=1)
+        headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        delay = self.retry_backoff
+        error = None
+        for attempt in range(self.max_push_retries + 1):
+            try:
+                response = self._session.post(f"{self.log_store_url}/loki/api/v1/push", content=body, headers=headers)
+                if response.status_code < 300:
+                    with self._buffer_lock:
+                        self._counts["pushed"] += len(batch)
+                    return
+                error = f"HTTP {response.status_code}: {response.text[:200]}"
+                # Other client errors mean the log store rejected the batch itself, so retrying won't help
+                if response.status_code < 500 and response.status_code != 429:
+                    break
+            except Exception as e:
+                error = e
+            # Don't wait out the backoff on shutdown
+            if attempt == self.max_push_retries or self._stop_event.wait(delay):
+                break
+            delay *= 2
+
+        with self._buffer_lock:
+            self._counts["dropped_push_failed"] += len(batch)
+        # Log to original stderr (don't recurse)
+        self._original_stderr.write(f"Failed to push {len(batch)} log lines to log store: {error}\n")
+
+    def _export_stats(self):
+        """Report shipping counters to the MetricsPusher, if metrics are enabled."""
+        metrics_pusher = get_metrics_pusher()
+        if metrics_pusher is None:
+            return
+        stats = self.stats()
+        deltas = {name: stats[name] - self._exported_counts[name] for name in self._counts}
+        self._exported_counts = {name: stats[name] for name in self._counts}
+        metrics_pusher.record_log_shipping(
+            queued=stats["queued"],
+            pushed=deltas["pushed"],
+            dropped={
+                "overflow": deltas["dropped_overflow"],
+                "push_failed": deltas["dropped_push_failed"],
+            },
+        )
 
     def _collect_subprocess_logs(self):
-        """Collect logs from subprocess queue and add to buffer."""
+        """Collect logs (single entries or batches) from the subprocess pipes and add to buffer."""
         while not self._stop_event.is_set():
+            with self._subprocess_pipes_lock:
+                pipes = list(self._subprocess_pipes)
+            if not pipes:
+                self._stop_event.wait(0.5)
+                continue
+            for pipe in wait(pipes, timeout=0.5):
+                try:
+                    message = pipe.recv()
+                except (EOFError, OSError):
+                    # The subprocess exited (or was killed mid-message), so nothing more will arrive on this pipe
+                    self._drop_subprocess_pipe(pipe)
+                    continue
+                except Exception:
+                    continue
+                self._add_subprocess_logs(message)
+
+    def _drop_subprocess_pipe(self, pipe: Connection):
+        with self._subprocess_pipes_lock:
+            self._subprocess_pipes.remove(pipe)
+        pipe.close()
+
+    def _add_subprocess_logs(self, message):
+        for entry in message if isinstance(message, list) else [message]:
             try:
-                entry = self._subprocess_queue.get(timeout=0.5)
                 # Entry should have: message, level, request_id, extra_labels, name
                 self.add_log(
                     message=entry.get("message", ""),
@@ -331,9 +476,9 @@ class LogCapture:
                     request_id=entry.get("request_id", "-"),
                     extra_labels=entry.get("extra_labels"),
                     name=entry.get("name", "print_redirect"),
+                    asctime=entry.get("asctime"),
+                    timestamp_ns=entry.get("timestamp"),
                 )
-            except Empty:
-                continue
             except Exception:
                 pass  # Don't crash on malformed entries
 
@@ -442,24 +587,22 @@ def get_log_capture() -> Optional[LogCapture]:
     return _log_capture
 
 
-def get_subprocess_queue() -> Optional[mp.Queue]:
+def new_subprocess_pipe() -> Optional[Connection]:
     """
-    Get the subprocess queue for sending logs from subprocesses.
+    Create a pipe for a subprocess to send logs on. See LogCapture.new_subprocess_pipe.
 
     Returns None if LogCapture is not initialized.
 
     Usage in subprocess:
-        queue = get_subprocess_queue()
-        if queue:
-            queue.put({
-                "message": "Log message",
-                "level": "INFO",
-                "request_id": "-",
-                "extra_labels": {"source": "pds"}
-            })
+        pipe.send({
+            "message": "Log message",
+            "level": "INFO",
+            "request_id": "-",
+            "extra_labels": {"source": "pds"}
+        })
     """
     if _log_capture is not None:
-        return _log_capture.get_subprocess_queue()
+        return _log_capture.new_subprocess_pipe()
     return None
 
 
@@ -512,25 +655,25 @@ def stop_log_capture():
         _log_capture = None
 
 
-def create_subprocess_log_capture(output_queue: mp.Queue) -> Optional[LogCapture]:
+def create_subprocess_log_capture(output_pipe: Connection) -> Optional[LogCapture]:
     """
     Create a LogCapture instance for use in a subprocess.
 
-    In subprocess mode, logs are pushed to the output_queue instead of Loki.
-    The main process's LogCapture will collect from this queue and push to Loki.
+    In subprocess mode, logs are sent on the output_pipe instead of Loki.
+    The main process's LogCapture will collect from this pipe and push to Loki.
 
     Args:
-        output_queue: Queue to push log entries to (from main process's LogCapture)
+        output_pipe: Pipe to send log entries on (from the main process's new_subprocess_pipe)
 
     Returns:
-        LogCapture instance in queue mode, or None if queue is None
+        LogCapture instance in pipe mode, or None if output_pipe is None
     """
     global _log_capture
 
-    if output_queue is None:
+    if output_pipe is None:
         return None
 
-    log_capture = LogCapture(output_queue=output_queue)
+    log_capture = LogCapture(output_pipe=output_pipe, flush_interval=SUBPROCESS_FLUSH_INTERVAL)
     log_capture.start()
 
     # Set as global so get_log_capture() works in a subprocess (needed for ensure_handler calls)
@@ -77,6 +77,33 @@ class MetricsPusher:
             registry=self.registry,
         )
 
+        # Micro-batch sizes for methods decorated with kt.batched
+        self.batch_size = Histogram(
+            "kt_batch_size",
+            "Number of requests per micro-batch",
+            ["callable"],
+            buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+            registry=self.registry,
+        )
+
+        # Log shipping (see log_capture.py)
+        self.log_lines_queued = Gauge(
+            "kt_log_lines_queued",
+            "Log lines waiting to be pushed to the log store",
+            registry=self.registry,
+        )
+        self.log_lines_pushed = Counter(
+            "kt_log_lines_pushed",
+            "Log lines pushed to the log store",
+            registry=self.registry,
+        )
+        self.log_lines_dropped = Counter(
+            "kt_log_lines_dropped",
+            "Log lines dropped before reaching the log store",
+            ["reason"],
+            registry=self.registry,
+        )
+
         # Heartbeat counter (for compatibility with existing TTL queries)
         self.heartbeat_counter = Counter(
             "kt_heartbeat_sent",
@@ -114,6 +141,22 @@ class MetricsPusher:
         self.request_latency.labels(method=method, endpoint=endpoint).observe(duration)
         self.last_activity.set(time.time())
 
+    def record_batch(self, callable_name: str, size: int):
+        """Record the size of a micro-batch run for a batched method."""
+        if not self._enabled:
+            return
+        self.batch_size.labels(callable=callable_name).observe(size)
+
+    def record_log_shipping(self, queued: int, pushed: int, dropped: dict):
+        """Record log shipping progress: lines currently queued, and lines pushed and dropped (by reason) since
+        the last call."""
+        if not self._enabled:
+            return
+        self.log_lines_queued.set(queued)
+        self.log_lines_pushed.inc(pushed)
+        for reason, count in dropped.items():
+            self.log_lines_dropped.labels(reason=reason).inc(count)
+
     def record_activity(self):
         """Record activity for TTL tracking."""
         if not self._enabled:
@@ -1,20 +1,124 @@
+import json
 import multiprocessing
+import queue
 import threading
+import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 
+from kubetorch.serving.dispatch_policy import get_dispatch_policy, InflightCounter
 from kubetorch.serving.http_server import logger
+from kubetorch.serving.metrics_push import get_metrics_pusher
+from kubetorch.serving.shm_transport import (
+    from_shared_memory,
+    maybe_to_shared_memory,
+    PARAMS_SEGMENT,
+    release_request_segments,
+    RESULT_SEGMENT,
+    SharedMemoryHandle,
+)
+from kubetorch.serving.utils import pack_pickle_frame, unpack_pickle_frame
+
+
+# Seconds stop() waits for processes to exit after SHUTDOWN (flushing their logs) before terminating them
+SHUTDOWN_GRACE_PERIOD = 2.0
+
+# Max stream items a worker sends ahead of the consumer; credits are returned in batches of half the window
+STREAM_WINDOW = 16
+
+
+class ProcessStreamError(Exception):
+    """Raised from a ProcessStream when the generator failed in the subprocess. Carries the packaged exception."""
+
+    def __init__(self, response):
+        super().__init__("Stream failed in subprocess")
+        self.response = response
+
+
+class _StreamStart:
+    """Router-side marker that a request's result is a stream, delivered through ``chunks``."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+
+class ProcessStream:
+    """Iterator over the serialized items a generator callable yields in a ProcessWorker subprocess.
+
+    The worker may run at most ``STREAM_WINDOW`` items ahead; consuming items sends credits back, so a slow
+    consumer (e.g. a slow HTTP client) pauses the generator instead of buffering its output in the pod.
+    """
+
+    def __init__(self, pool, idx, request_unique_id, chunks):
+        self._pool = pool
+        self._idx = idx
+        self._request_unique_id = request_unique_id
+        self._chunks = chunks
+        self._consumed = 0
+        self._done = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._done:
+            raise StopIteration
+        kind, payload = self._chunks.get()
+        if kind == "item":
+            self._consumed += 1
+            if self._consumed % (STREAM_WINDOW // 2) == 0:
+                self._pool._send_control(self._idx, {"stream_credit": self._request_unique_id, "n": STREAM_WINDOW // 2})
+            return payload
+        self._finish()
+        if kind == "error":
+            raise payload if isinstance(payload, Exception) else ProcessStreamError(payload)
+        raise StopIteration
+
+    def close(self):
+        """Stop consuming; cancels the generator in the subprocess if it hasn't finished."""
+        if not self._done:
+            self._pool._send_control(self._idx, {"stream_cancel": self._request_unique_id})
+            self._finish()
+
+    def collect(self, serialization):
+        """Drain the stream into the result a list-returning callable would have produced."""
+        try:
+            items = list(self)
+        except ProcessStreamError as e:
+            return e.response
+        if serialization == "pickle":
+            return pack_pickle_frame([unpack_pickle_frame(item) for item in items])
+        return [json.loads(item) for item in items]
+
+    def _finish(self):
+        self._done = True
+        self._pool._end_stream(self._idx, self._request_unique_id)
 
 
 class ProcessPool:
     """Unified pool managing distributed processes with single router thread."""
 
-    def __init__(self, process_class, num_processes, max_threads_per_proc=10, log_queue=None, **process_kwargs):
+    def __init__(
+        self,
+        process_class,
+        num_processes,
+        max_threads_per_proc=10,
+        log_capture=None,
+        dispatch_policy=None,
+        cached_state_paths=None,
+        **process_kwargs,
+    ):
         self.process_class = process_class
         self.num_processes = num_processes
         self.max_threads_per_proc = max_threads_per_proc
-        self.log_queue = log_queue  # Queue for subprocess log collection (from LogCapture)
+        self.log_capture = log_capture  # Main process LogCapture, which collects subprocess logs over pipes
         self.process_kwargs = process_kwargs  # Additional kwargs to pass to process constructor
+        # Saved __kt_cached_state__ files by local rank, restored by the new processes (see save_cached_state)
+        self.cached_state_paths = cached_state_paths or {}
+
+        # Dispatch policy and per-process in-flight counters for load-balanced routing
+        self.dispatch_policy = get_dispatch_policy(dispatch_policy)
+        self._inflight = InflightCounter(num_processes)
 
         # Processes and queues
         self.processes = []
@@ -24,6 +128,7 @@ class ProcessPool:
         # Response routing with single router thread
         self._router_thread = None
         self._response_events = {}  # Maps request_id to (threading.Event, response)
+        self._streams = {}  # Maps request_id to the queue.Queue of an in-progress stream
         self._response_lock = threading.Lock()
         self._running = False
 
@@ -39,9 +144,19 @@ class ProcessPool:
                 future = executor.submit(self._create_and_start_process, i)
                 futures.append(future)
 
-            # Wait for all processes to start
-            for future in futures:
-                future.result()
+        # Recorded in local rank order, so a process's index in the pool is its local rank. Processes that did
+        # start are recorded even if another failed, so stop() cleans them up.
+        errors = []
+        for future in futures:
+            try:
+                request_queue, process = future.result()
+            except Exception as e:
+                errors.append(e)
+                continue
+            self.request_queues.append(request_queue)
+            self.processes.append(process)
+        if errors:
+            raise errors[0]
 
         # Start single response router thread for entire pool
         self._running = True
@@ -50,20 +165,25 @@ class ProcessPool:
         logger.debug(f"Started {self.num_processes} processes with single router thread")
 
     def _create_and_start_process(self, local_rank):
-        """Helper to create and start a single process."""
+        """Helper to create and start a single process. Returns its request queue and the process."""
         request_queue = multiprocessing.Queue()
-        self.request_queues.append(request_queue)
+        # Each process gets its own log pipe, so one killed mid-write can't break log collection for the others
+        log_pipe = self.log_capture.new_subprocess_pipe() if self.log_capture else None
 
         process = self.process_class(
             local_rank=local_rank,
             request_queue=request_queue,
             response_queue=self.response_queue,  # Shared response queue
             max_threads=self.max_threads_per_proc,
-            log_queue=self.log_queue,  # For subprocess log capture
+            log_pipe=log_pipe,  # For subprocess log capture
+            cached_state_path=self.cached_state_paths.get(local_rank),
             **self.process_kwargs,  # Pass additional framework-specific settings
         )
         process.start()
-        self.processes.append(process)
+        if log_pipe is not None:
+            # The process holds the only write end now, so the collector sees EOF when it exits
+            log_pipe.close()
+        return request_queue, process
 
     def stop(self):
         """Stop all processes and the router thread."""
@@ -86,7 +206,11 @@ class ProcessPool:
         if self._router_thread:
             self._router_thread.join(timeout=0.5)
 
-        # Terminate all processes immediately without waiting
+        # Let processes exit on SHUTDOWN so they flush their buffered logs, then terminate any still running
+        deadline = time.time() + SHUTDOWN_GRACE_PERIOD
+        for process in self.processes:
+            process.join(timeout=max(0, deadline - time.time()))
+
         for process in self.processes:
             if process.is_alive():
                 process.terminate()
@@ -102,6 +226,12 @@ class ProcessPool:
                 process.kill()
                 process.join(timeout=0.1)  # Brief wait to confirm kill
 
+        # Unblock consumers of in-progress streams
+        with self._response_lock:
+            for chunks in self._streams.values():
+                chunks.put(("end", None))
+            self._streams.clear()
+
         # Clear all queues
         self._clear_queues()
 
@@ -122,8 +252,13 @@ class ProcessPool:
         debug_port,
         debug_mode,
         serialization,
+        dispatched=False,
     ):
-        """Call a specific process by index."""
+        """Call a specific process by index.
+
+        ``dispatched`` is set by :meth:`dispatch`, which has already counted this request as in flight and releases
+        the count itself (or hands it to the returned stream).
+        """
         if idx >= len(self.processes):
             raise ValueError(f"Process index {idx} out of range (have {len(self.processes)} processes)")
 
@@ -134,6 +269,19 @@ class ProcessPool:
         with self._response_lock:
             self._response_events[request_unique_id] = (event, None)
 
+        # Large binary payloads go through shared memory; only the handle is put on the queue.
+        # Copy the dict rather than mutating it, since SPMD calls share one params dict across processes.
+        params_in_shm = False
+        if isinstance(params, dict) and "data" in params:
+            data = maybe_to_shared_memory(params["data"], request_unique_id, PARAMS_SEGMENT)
+            if isinstance(data, SharedMemoryHandle):
+                params = {**params, "data": data}
+                params_in_shm = True
+
+        if not dispatched:
+            self._inflight.increment(idx)
+        completed = False
+        streaming = False
         try:
             # Send request to specific process
             self.request_queues[idx].put(
@@ -157,8 +305,13 @@ class ProcessPool:
             # Get and return the response
             with self._response_lock:
                 _, result = self._response_events.pop(request_unique_id)
+            completed = True
 
-            return result
+            if isinstance(result, _StreamStart):
+                # The stream owns the in-flight slot until it's exhausted or closed
+                streaming = True
+                return ProcessStream(self, idx, request_unique_id, result.chunks)
+            return from_shared_memory(result)
 
         except Exception:
             # Clean up on error
@@ -166,6 +319,123 @@ class ProcessPool:
                 self._response_events.pop(request_unique_id, None)
             raise
 
+        finally:
+            if not streaming and not dispatched:
+                self._inflight.decrement(idx)
+            # The receiving side unlinks segments as it reads them; this catches the ones never read
+            if params_in_shm:
+                release_request_segments(request_unique_id, kinds=(PARAMS_SEGMENT,))
+            if not completed:
+                release_request_segments(request_unique_id, kinds=(RESULT_SEGMENT,))
+
+    def dispatch(self, dispatch_key=None, **call_kwargs):
+        """Call the process selected by the pool's dispatch policy.
+
+        Selection and the in-flight counter increment happen atomically, so concurrent callers
+        see each other's outstanding requests.
+
+        Args:
+            dispatch_key (str, optional): Routing key for the sticky policy. (Default: None)
+            **call_kwargs: Arguments forwarded to :meth:`call` (everything except ``idx``).
+        """
+        idx = self._inflight.acquire(self.dispatch_policy, dispatch_key)
+        streaming = False
+        try:
+            result = self.call(idx=idx, dispatched=True, **call_kwargs)
+            # A stream releases the in-flight count when it's exhausted or closed
+            streaming = isinstance(result, ProcessStream)
+            return result
+        finally:
+            if not streaming:
+                self._inflight.decrement(idx)
+
+    def save_cached_state(self, timeout):
+        """Ask every process to save its callable's ``__kt_cached_state__`` before the pool is torn down.
+
+        Processes save in parallel. Returns the saved files' paths by local rank, for processes whose callable opts
+        in and that finished within ``timeout`` seconds.
+        """
+        pending = {}
+        for idx, process in enumerate(self.processes):
+            if not process.is_alive():
+                continue
+            request_unique_id = str(uuid.uuid4())
+            event = threading.Event()
+            with self._response_lock:
+                self._response_events[request_unique_id] = (event, None)
+            self._send_control(idx, {"save_cached_state": request_unique_id})
+            pending[idx] = (request_unique_id, event)
+
+        deadline = time.monotonic() + timeout
+        paths = {}
+        for idx, (request_unique_id, event) in pending.items():
+            # Don't wait out the timeout on a process that died
+            while not event.wait(0.1) and self.processes[idx].is_alive() and time.monotonic() < deadline:
+                pass
+            with self._response_lock:
+                _, path = self._response_events.pop(request_unique_id)
+            if path:
+                paths[self.processes[idx].local_rank] = path
+            elif not event.is_set():
+                logger.warning(f"Process {idx} did not save its cached state in time")
+        return paths
+
+    def reduce(self, reduce, local_results, child_partials, serialization, is_root):
+        """Reduce an SPMD call's results in the first process (see reduction.py).
+
+        Results stay serialized in the server process; the subprocess unpickles them, runs the reduction (which may
+        be user code), and returns the reduced result serialized the same way, or a packaged exception.
+        """
+        request_unique_id = str(uuid.uuid4())
+        event = threading.Event()
+        with self._response_lock:
+            self._response_events[request_unique_id] = (event, None)
+
+        completed = False
+        try:
+            self.request_queues[0].put(
+                {
+                    "request_unique_id": request_unique_id,
+                    "reduce": {
+                        "reduce": reduce,
+                        "local_results": local_results,
+                        "child_partials": child_partials,
+                        "serialization": serialization,
+                        "is_root": is_root,
+                    },
+                }
+            )
+            # Don't wait forever on a process that died mid-reduction
+            while not event.wait(0.1) and self.processes[0].is_alive():
+                pass
+            with self._response_lock:
+                _, result = self._response_events.pop(request_unique_id)
+            if not event.is_set():
+                raise RuntimeError("Process 0 exited while reducing results")
+            completed = True
+            return from_shared_memory(result)
+        finally:
+            with self._response_lock:
+                self._response_events.pop(request_unique_id, None)
+            if not completed:
+                release_request_segments(request_unique_id, kinds=(RESULT_SEGMENT,))
+
+    def _send_control(self, idx, message):
+        """Send a stream control message (credit or cancel) to a subprocess."""
+        try:
+            self.request_queues[idx].put_nowait(message)
+        except Exception as e:
+            logger.debug(f"Could not send stream control message to process {idx}: {e}")
+
+    def _end_stream(self, idx, request_unique_id):
+        with self._response_lock:
+            self._streams.pop(request_unique_id, None)
+        self._inflight.decrement(idx)
+
+    def inflight_counts(self):
+        """Snapshot of in-flight request counts per process."""
+        return self._inflight.snapshot()
+
     def call_all(
         self,
         method_name,
@@ -200,7 +470,11 @@ class ProcessPool:
 
             results = []
             for future in futures:
-                results.append(future.result())
+                result = future.result()
+                if isinstance(result, ProcessStream):
+                    # SPMD results are gathered across ranks, so generators are drained into lists
+                    result = result.collect(serialization)
+                results.append(result)
 
         return results
 
@@ -213,8 +487,20 @@ class ProcessPool:
                     break
 
                 request_id = response.get("request_unique_id")
+                stream_state = response.get("stream")
                 with self._response_lock:
-                    if request_id in self._response_events:
+                    if stream_state == "start" and request_id in self._response_events:
+                        event, _ = self._response_events[request_id]
+                        chunks = queue.Queue()
+                        self._streams[request_id] = chunks
+                        self._response_events[request_id] = (event, _StreamStart(chunks))
+                        event.set()
+                    elif stream_state in ("item", "end", "error"):
+                        chunks = self._streams.get(request_id)
+                        if chunks is not None:
+                            chunks.put((stream_state, response.get("result")))
+                    elif request_id in self._response_events:
+                        self._record_batch_sizes(response.get("batch_sizes"))
                         event, _ = self._response_events[request_id]
                         self._response_events[request_id] = (event, response["result"])
                         event.set()
@@ -226,6 +512,18 @@ class ProcessPool:
                     logger.debug(f"Response router error: {e}")
                 continue
 
+    @staticmethod
+    def _record_batch_sizes(batch_sizes):
+        """Export micro-batch sizes reported by a subprocess (see batching.py)."""
+        if not batch_sizes:
+            return
+        metrics_pusher = get_metrics_pusher()
+        if metrics_pusher is None:
+            return
+        for name, sizes in batch_sizes.items():
+            for size in sizes:
+                metrics_pusher.record_batch(name, size)
+
     def _clear_queues(self):
         """Clear all pending items from queues."""
         for q in self.request_queues:
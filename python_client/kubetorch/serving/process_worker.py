@@ -1,30 +1,64 @@
 import multiprocessing
 import os
+import threading
 from bdb import BdbQuit
 from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
-from kubetorch.serving.http_server import execute_callable, load_callable, logger, package_exception
+from kubetorch.serving.batching import drain_batch_sizes
+from kubetorch.serving.http_server import (
+    execute_callable,
+    is_stream_result,
+    iter_stream_chunks,
+    load_callable,
+    logger,
+    package_exception,
+    patch_sys_path,
+    save_cached_state,
+)
 from kubetorch.serving.log_capture import create_subprocess_log_capture
+from kubetorch.serving.process_pool import STREAM_WINDOW
+from kubetorch.serving.reduction import reduce_serialized, REDUCTIONS
+from kubetorch.serving.shm_transport import (
+    from_shared_memory,
+    maybe_to_shared_memory,
+    RESULT_SEGMENT,
+    SharedMemoryHandle,
+)
 from kubetorch.serving.utils import clear_debugging_sessions, request_id_ctx_var
 
 
 class ProcessWorker(multiprocessing.Process):
     """Base class for distributed processes that run callables in subprocesses."""
 
-    def __init__(self, local_rank, request_queue, response_queue, max_threads=4, log_queue=None, **kwargs):
+    def __init__(
+        self,
+        local_rank,
+        request_queue,
+        response_queue,
+        max_threads=4,
+        log_pipe=None,
+        cached_state_path=None,
+        **kwargs,
+    ):
         super().__init__()
         # We don't need the cache miss / reload here because these processes are destroyed and recreated
         # with each .to call.
         os.environ["LOCAL_RANK"] = str(local_rank)
+        self.local_rank = local_rank
         self._request_queue = request_queue
         self._response_queue = response_queue
         self._max_threads = max_threads
         self._executor = None
-        self._log_queue = log_queue  # Queue for sending logs back to main process
+        self._log_pipe = log_pipe  # Pipe for sending logs back to main process
         self._log_capture = None
+        # __kt_cached_state__ saved by the process this one replaces, restored when the callable is loaded
+        self._cached_state_path = cached_state_path
         # Store any additional framework-specific settings
         self._settings = kwargs
+        # Flow control for streamed (generator) results, keyed by request_unique_id
+        self._stream_credits = {}
+        self._cancelled_streams = set()
 
     def framework_cleanup(self):
         """Override this method to provide framework-specific cleanup for reloads.
@@ -115,6 +149,10 @@ class ProcessWorker(multiprocessing.Process):
                 if self._log_capture:
                     self._log_capture.ensure_handler()
 
+                # Large binary payloads arrive as a shared memory handle instead of inline bytes
+                if isinstance(params, dict) and isinstance(params.get("data"), SharedMemoryHandle):
+                    params = {**params, "data": from_shared_memory(params["data"])}
+
                 result = execute_callable(
                     callable_obj=callable_obj,
                     cls_or_fn_name=os.environ["KT_CLS_OR_FN_NAME"],
@@ -123,11 +161,17 @@ class ProcessWorker(multiprocessing.Process):
                     serialization=serialization,
                 )
 
+                if is_stream_result(result):
+                    self._stream_result(request_unique_id, result, serialization)
+                    request_id_ctx_var.reset(token)
+                    return
+
                 # Reset the request ID after the call is complete
                 request_id_ctx_var.reset(token)
 
                 # Send response back with the unique ID
-                self._response_queue.put({"request_unique_id": request_unique_id, "result": result})
+                result = maybe_to_shared_memory(result, request_unique_id, RESULT_SEGMENT)
+                self._put_response(request_unique_id, result)
 
             except Exception as e:
                 # Reset the request ID even if there was an error
@@ -139,12 +183,7 @@ class ProcessWorker(multiprocessing.Process):
                 except Exception as f:
                     packaged_exception = f
 
-                self._response_queue.put(
-                    {
-                        "request_unique_id": request_unique_id,
-                        "result": packaged_exception,
-                    }
-                )
+                self._put_response(request_unique_id, packaged_exception)
 
         except Exception as e:
             # Last resort error handling
@@ -156,11 +195,90 @@ class ProcessWorker(multiprocessing.Process):
                 }
             )
 
+    def _put_response(self, request_unique_id, result):
+        message = {"request_unique_id": request_unique_id, "result": result}
+        # Piggyback micro-batch sizes on responses so the main process can export them as metrics
+        batch_sizes = drain_batch_sizes()
+        if batch_sizes:
+            message["batch_sizes"] = batch_sizes
+        self._response_queue.put(message)
+
+    def _stream_result(self, request_unique_id, result, serialization):
+        """Send a generator's items back one at a time, staying at most STREAM_WINDOW items ahead of the consumer."""
+        credits = threading.Semaphore(STREAM_WINDOW)
+        self._stream_credits[request_unique_id] = credits
+        self._response_queue.put({"request_unique_id": request_unique_id, "stream": "start"})
+
+        chunks = iter_stream_chunks(result, serialization)
+        try:
+            for chunk in chunks:
+                credits.acquire()
+                if request_unique_id in self._cancelled_streams:
+                    return
+                self._response_queue.put({"request_unique_id": request_unique_id, "stream": "item", "result": chunk})
+            self._response_queue.put({"request_unique_id": request_unique_id, "stream": "end"})
+        except Exception as e:
+            try:
+                packaged_exception = package_exception(e)
+            except Exception as f:
+                packaged_exception = f
+            self._response_queue.put(
+                {"request_unique_id": request_unique_id, "stream": "error", "result": packaged_exception}
+            )
+        finally:
+            chunks.close()
+            self._stream_credits.pop(request_unique_id, None)
+            self._cancelled_streams.discard(request_unique_id)
+
+    def _handle_stream_control(self, message):
+        """Apply a credit or cancel message for an in-progress stream."""
+        request_unique_id = message.get("stream_credit") or message.get("stream_cancel")
+        credits = self._stream_credits.get(request_unique_id)
+        if credits is None:
+            return
+        if "stream_cancel" in message:
+            self._cancelled_streams.add(request_unique_id)
+            credits.release()
+        else:
+            for _ in range(message.get("n", 1)):
+                credits.release()
+
+    def _save_cached_state(self, request_unique_id):
+        """Save the callable's ``__kt_cached_state__`` for the process replacing this one on a redeploy."""
+        try:
+            path = save_cached_state()
+        except Exception as e:
+            logger.warning(f"Failed to save cached state, the next process will initialize from scratch: {e}")
+            path = None
+        self._response_queue.put({"request_unique_id": request_unique_id, "result": path})
+
+    def _reduce(self, request):
+        """Reduce an SPMD call's results for the supervisor, which doesn't unpickle results or run user code."""
+        request_unique_id = request["request_unique_id"]
+        reduce = request["reduce"]
+        try:
+            if reduce["reduce"] not in REDUCTIONS:
+                # Reduce callables live in the user's code
+                patch_sys_path()
+            result = reduce_serialized(**reduce)
+            result = maybe_to_shared_memory(result, request_unique_id, RESULT_SEGMENT)
+        except Exception as e:
+            try:
+                result = package_exception(e)
+            except Exception as f:
+                result = f
+        self._put_response(request_unique_id, result)
+
     def run(self):
         """Main process loop with thread pool for concurrent request handling."""
-        # Set up subprocess log capture to push logs to main process via queue
-        # Uses LogCapture in queue mode - same capture logic, different emit target
-        self._log_capture = create_subprocess_log_capture(self._log_queue)
+        if self._cached_state_path:
+            os.environ["KT_CACHED_STATE_PATH"] = self._cached_state_path
+        # Bounds micro-batch sizes (see batching.py), since batches form from concurrently running requests
+        os.environ["KT_MAX_THREADS_PER_PROC"] = str(self._max_threads)
+
+        # Set up subprocess log capture to send logs to main process via pipe
+        # Uses LogCapture in pipe mode - same capture logic, different emit target
+        self._log_capture = create_subprocess_log_capture(self._log_pipe)
 
         # Create thread pool for handling requests
         self._executor = ThreadPoolExecutor(max_workers=self._max_threads)
@@ -175,6 +293,20 @@ class ProcessWorker(multiprocessing.Process):
                     if request == "SHUTDOWN":
                         break
 
+                    # Stream flow control is handled inline so it's never queued behind user code
+                    if "stream_credit" in request or "stream_cancel" in request:
+                        self._handle_stream_control(request)
+                        continue
+
+                    if "save_cached_state" in request:
+                        self._save_cached_state(request["save_cached_state"])
+                        continue
+
+                    if "reduce" in request:
+                        if self._executor:
+                            self._executor.submit(self._reduce, request)
+                        continue
+
                     # Submit request to thread pool for concurrent handling
                     # Check executor exists in case we're shutting down
                     if self._executor:
@@ -0,0 +1,142 @@
+"""Tree reduction of SPMD call results.
+
+By default an SPMD call returns one result per rank, and every intermediate tree node forwards its subtree's
+results upward as a list, so the coordinator ends up holding (and the client deserializing) all of them. Passing
+``kt_reduce=`` to the call reduces results at every level of the tree instead:
+
+- Each node lifts its local processes' results into partial results, combines them with the partials returned by
+  its children, and returns a single partial to its parent.
+- The coordinator finalizes the combined partial into the call's result.
+
+Reducing unpickles results and may run a user-defined callable, so each node reduces in one of its ProcessWorker
+subprocesses (see ``ProcessPool.reduce``) rather than in the server process.
+
+Built-in reductions:
+
+- ``"sum"``: adds results with ``+`` (numbers, arrays, tensors), and dicts key by key.
+- ``"mean"``: the mean of ``"sum"``, carried up the tree as a ``{"sum", "count"}`` partial.
+- ``"concat"``: joins list results into one list (other results are collected into a list).
+
+A callable reduces a list of results to one result and must be associative, since it's applied at every level. It's
+sent as an import path, so it has to be importable on the pods (not defined in ``__main__``).
+"""
+
+import importlib
+from functools import reduce as _fold
+from typing import Callable, List, Union
+
+from kubetorch.serving.utils import pack_pickle_frame, unpack_pickle_frame
+
+
+def _add(a, b):
+    if isinstance(a, dict) and isinstance(b, dict):
+        return {key: _add(a[key], b[key]) if key in a and key in b else a.get(key, b.get(key)) for key in {**a, **b}}
+    return a + b
+
+
+def _divide(value, count):
+    if isinstance(value, dict):
+        return {key: _divide(item, count) for key, item in value.items()}
+    return value / count
+
+
+class Reduction:
+    """A reduction as three steps: lift a rank's result into a partial, combine partials, finalize the root's."""
+
+    def lift(self, result):
+        return result
+
+    def combine(self, partials: List):
+        raise NotImplementedError
+
+    def finalize(self, partial):
+        return partial
+
+
+class SumReduction(Reduction):
+    def combine(self, partials):
+        return _fold(_add, partials)
+
+
+class MeanReduction(Reduction):
+    def lift(self, result):
+        return {"sum": result, "count": 1}
+
+    def combine(self, partials):
+        return {
+            "sum": _fold(_add, [partial["sum"] for partial in partials]),
+            "count": sum(partial["count"] for partial in partials),
+        }
+
+    def finalize(self, partial):
+        return _divide(partial["sum"], partial["count"])
+
+
+class ConcatReduction(Reduction):
+    def lift(self, result):
+        return list(result) if isinstance(result, (list, tuple)) else [result]
+
+    def combine(self, partials):
+        return [item for partial in partials for item in partial]
+
+
+class CallableReduction(Reduction):
+    def __init__(self, fn: Callable):
+        self.fn = fn
+
+    def combine(self, partials):
+        return self.fn(partials)
+
+
+REDUCTIONS = {"sum": SumReduction, "mean": MeanReduction, "concat": ConcatReduction}
+
+
+def reduce_arg(reduce: Union[str, Callable, None]):
+    """Client side: validate a ``kt_reduce=`` call argument and turn a callable into its import path."""
+    if reduce is None or (isinstance(reduce, str) and (reduce in REDUCTIONS or ":" in reduce)):
+        return reduce
+    if callable(reduce):
+        if reduce.__module__ == "__main__" or "<locals>" in reduce.__qualname__:
+            raise ValueError(
+                "A kt_reduce callable must be importable on the pods, i.e. defined at the top level of a module "
+                "(not in __main__ or inside a function)"
+            )
+        return f"{reduce.__module__}:{reduce.__qualname__}"
+    raise ValueError(f"Invalid kt_reduce {reduce!r}. Use one of {sorted(REDUCTIONS)}, or a callable.")
+
+
+def get_reduction(reduce: str) -> Reduction:
+    """Server side: resolve a ``reduce`` param (built-in name or ``module:qualname``) into a Reduction."""
+    if reduce in REDUCTIONS:
+        return REDUCTIONS[reduce]()
+    module_name, _, qualname = reduce.partition(":")
+    fn = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        fn = getattr(fn, attr)
+    return CallableReduction(fn)
+
+
+def reduce_results(reduction: Reduction, local_results: List, child_partials: List, is_root: bool):
+    """Combine this node's local results with its children's partials. Returns the final result on the root."""
+    partials = [reduction.lift(result) for result in local_results] + list(child_partials)
+    if not partials:
+        raise ValueError("No results to reduce")
+    partial = reduction.combine(partials)
+    return reduction.finalize(partial) if is_root else partial
+
+
+def reduce_serialized(reduce: str, local_results: List, child_partials: List, serialization: str, is_root: bool):
+    """Like :func:`reduce_results`, for results as they came back from the processes and children (pickle frames
+    when ``serialization`` is pickle). Returns the result in the same form."""
+    binary = serialization == "pickle"
+
+    def load(result):
+        return unpack_pickle_frame(result) if binary and isinstance(result, bytes) else result
+
+    result = reduce_results(
+        get_reduction(reduce),
+        [load(r) for r in local_results],
+        [load(r) for r in child_partials],
+        is_root=is_root,
+    )
+    return pack_pickle_frame(result) if binary else result
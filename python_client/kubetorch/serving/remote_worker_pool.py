@@ -5,6 +5,8 @@ import threading
 import uuid
 
 from kubetorch.serving.http_server import logger
+from kubetorch.serving.sharding import check_all_workers_selected
+from kubetorch.serving.utils import BINARY_CONTENT_TYPE, is_binary_call, pack_call_body, unpack_result_frames
 
 
 class RemoteWorkerPool:
@@ -72,6 +74,15 @@ class RemoteWorkerPool:
 
         logger.debug("Stopped RemoteWorkerPool process and router thread")
 
+    def invalidate_health(self, worker_ips=None):
+        """Drop cached health state so the next call re-checks these workers (all workers if None).
+
+        Called by DistributedSupervisor when DNS membership changes.
+        """
+        if not self.process or not self.process.is_alive():
+            return
+        self.request_queue.put(("INVALIDATE_HEALTH", list(worker_ips) if worker_ips is not None else None))
+
     def call_workers(
         self,
         worker_ips,
@@ -80,8 +91,13 @@ class RemoteWorkerPool:
         params,
         request_headers,
         workers_arg="all",
+        worker_params=None,
     ):
-        """Call remote workers and return responses."""
+        """Call remote workers and return responses.
+
+        ``worker_params`` optionally maps a worker IP to the params to send it instead of ``params`` (e.g. only
+        the argument shards for that worker's subtree).
+        """
         if not self.process or not self.process.is_alive():
             raise RuntimeError("RemoteWorkerPool not running")
 
@@ -97,6 +113,7 @@ class RemoteWorkerPool:
             "params": params,
             "request_headers": request_headers,
             "workers_arg": workers_arg,
+            "worker_params": worker_params,
         }
 
         # Register event for this request
@@ -170,6 +187,9 @@ class RemoteWorkerPool:
         Architecture:
         - Runs in a separate process with its own event loop
         - Maintains a single shared httpx.AsyncClient for connection pooling
+        - Caches which workers passed a health check, so repeat calls skip the /health sweep. A worker is
+          dropped from the cache when a call to it fails to connect, or when the parent sends INVALIDATE_HEALTH
+          after a DNS membership change
         - Processes requests from queue concurrently (multiple requests in flight)
         - Each request involves parallel async HTTP calls to multiple workers
 
@@ -184,6 +204,9 @@ class RemoteWorkerPool:
 
         import httpx
 
+        # Workers known to be healthy, shared by all requests handled by this process
+        healthy_ips = set()
+
         async def wait_for_worker_health(client, worker_ip, workers_arg, quorum_timeout):
             """Wait for a worker to become healthy within timeout."""
             port = os.environ["KT_SERVER_PORT"]
@@ -231,12 +254,30 @@ class RemoteWorkerPool:
 
             logger.debug(f"Async worker: Making POST to {call_url}")
 
+            # Binary pickle calls are forwarded as raw bytes, as received from the client
+            if is_binary_call(params):
+                request_kwargs = {
+                    "content": pack_call_body(params),
+                    "headers": {**request_headers, "Content-Type": BINARY_CONTENT_TYPE},
+                }
+            else:
+                request_kwargs = {"json": params, "headers": request_headers}
+
             # Retry logic for transient failures
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    resp = await client.post(call_url, json=params, headers=request_headers)
-                    result = resp.json()
+                    try:
+                        resp = await client.post(call_url, **request_kwargs)
+                    except httpx.RequestError:
+                        # Connection-level failure, so re-check health before the next call to this worker
+                        healthy_ips.discard(worker_ip)
+                        raise
+                    if resp.headers.get("Content-Type", "").startswith(BINARY_CONTENT_TYPE):
+                        # Keep the per-rank pickled frames opaque; they're re-packed for the caller
+                        result = unpack_result_frames(resp.content)
+                    else:
+                        result = resp.json()
                     break  # Success, exit retry loop
                 except httpx.ReadError as e:
                     # Check if this is due to server shutdown (connection reset)
@@ -282,24 +323,30 @@ class RemoteWorkerPool:
             params = data["params"]
             request_headers = data["request_headers"]
             workers_arg = data["workers_arg"]
+            worker_params = data.get("worker_params") or {}
 
             # With tree topology limiting fanout, we don't need to batch health checks
-            # Each node only calls its direct children in the tree
-            logger.info(f"Waiting for {len(worker_ips)} workers to become ready (timeout={quorum_timeout}s)")
-            health_tasks = [wait_for_worker_health(client, ip, workers_arg, quorum_timeout) for ip in worker_ips]
-            health_results = await asyncio.gather(*health_tasks)
+            # Each node only calls its direct children in the tree. Workers that already passed a health check
+            # are called directly.
+            unchecked_ips = [ip for ip in worker_ips if ip not in healthy_ips]
+            health_results = []
+            if unchecked_ips:
+                logger.info(f"Waiting for {len(unchecked_ips)} workers to become ready (timeout={quorum_timeout}s)")
+                health_tasks = [wait_for_worker_health(client, ip, workers_arg, quorum_timeout) for ip in unchecked_ips]
+                health_results = await asyncio.gather(*health_tasks)
 
             # Process results
-            healthy_workers = []
-            unhealthy_workers = []
-            for worker_ip, is_healthy in health_results:
-                if is_healthy:
-                    healthy_workers.append(worker_ip)
-                else:
-                    unhealthy_workers.append(worker_ip)
+            newly_healthy = {worker_ip for worker_ip, is_healthy in health_results if is_healthy}
+            healthy_ips.update(newly_healthy)
+            unhealthy_workers = [ip for ip in unchecked_ips if ip not in newly_healthy]
+            skipped = set(unhealthy_workers)
+            healthy_workers = [ip for ip in worker_ips if ip not in skipped]
 
             if unhealthy_workers:
-                if workers_arg == "ready":
+                if workers_arg == "ready" and worker_params:
+                    # A sharded call can't skip workers, whose argument slices would be dropped
+                    check_all_workers_selected(worker_ips, healthy_workers, workers_arg)
+                elif workers_arg == "ready":
                     # For "ready" mode, just skip unhealthy workers
                     logger.info(f"Skipping {len(unhealthy_workers)} workers that didn't respond (ready mode)")
                 else:
@@ -324,7 +371,7 @@ class RemoteWorkerPool:
                     worker_ip,
                     cls_or_fn_name,
                     method_name,
-                    params,
+                    worker_params.get(worker_ip, params),
                     request_headers,
                     workers_arg,
                 )
@@ -447,6 +494,12 @@ class RemoteWorkerPool:
                                     task.cancel()
                             break
 
+                        elif cmd == "INVALIDATE_HEALTH":
+                            if request_data is None:
+                                healthy_ips.clear()
+                            else:
+                                healthy_ips.difference_update(request_data)
+
                         elif cmd == "CALL":
                             # Create a task to handle this request concurrently
                             task = asyncio.create_task(process_call(request_data))
@@ -0,0 +1,192 @@
+"""Per-rank argument sharding for SPMD calls.
+
+Wrapping a call argument in :func:`shard` splits it across the ranks of a distributed call instead of sending the
+whole value to every process. The flow through the SPMD tree:
+
+- The client pulls sharded values out of ``args``/``kwargs`` (leaving ``None`` placeholders) and sends them next to
+  the call: as ``shard_values`` for json, or as a second pickle frame after the call frame for pickle. The
+  ``shards`` param records which positions and keyword names were sharded.
+- The coordinator splits each value into ``world_size`` contiguous slices (:func:`split_shards`), one per global rank
+  (``node_rank * procs_per_node + local_rank``), and records the ranks it holds in ``shard_ranks``. Every worker
+  must take part, so a sharded call that selects only some workers (``workers=``, including ``"ready"`` when a
+  worker doesn't respond) fails instead of silently dropping the slices of the ranks left out
+  (:func:`check_all_workers_selected`).
+- Each node forwards to a child only the slices for ranks in the child's subtree (:func:`select_shard_ranks`) and
+  hands each local process its own slice (:func:`rank_params`).
+- ``execute_callable`` puts the slice back into the call's arguments (:func:`take_rank_shard`).
+
+Pickled slices stay opaque frames everywhere except the coordinator, which unpickles the sharded values once to
+split them. A sharded call to a non-distributed service receives the whole value.
+"""
+
+from typing import Dict, List, Optional
+
+from kubetorch.serving.utils import pack_pickle_frame, pack_result_list, unpack_pickle_frame, unpack_result_frames
+
+SHARDS_KEY = "shards"
+
+
+class Shard:
+    """Marks a call argument to be split across the ranks of an SPMD call. Created by :func:`shard`."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return f"Shard({self.value!r})"
+
+
+def shard(value):
+    """Split a call argument across the ranks of a distributed (SPMD) call.
+
+    Each rank receives a contiguous slice of ``value`` (``value[start:end]``) rather than the whole thing, so the
+    value must support ``len()`` and slicing along its first dimension (lists, tuples, NumPy arrays, tensors).
+    Slices are as even as possible; with more ranks than items, the trailing ranks receive empty slices.
+
+    Args:
+        value: The list or array to split.
+
+    Example:
+
+    .. code-block:: python
+
+        import kubetorch as kt
+
+        # 4 pods with 2 processes each: every process gets 1/8 of the prompts
+        results = remote_fn(kt.distributed.shard(prompts), max_tokens=128)
+    """
+    return Shard(value)
+
+
+def extract_shards(body: dict) -> Optional[Dict[str, List]]:
+    """Pull :class:`Shard` values out of a call body, leaving ``None`` placeholders.
+
+    Records the sharded positions under ``body["shards"]`` and returns the values as
+    ``{"args": [...], "kwargs": [...]}`` in the same order, or None if nothing is sharded.
+    """
+    args = list(body.get("args") or [])
+    kwargs = body.get("kwargs") or {}
+    spec = {
+        "args": [i for i, arg in enumerate(args) if isinstance(arg, Shard)],
+        "kwargs": [name for name, value in kwargs.items() if isinstance(value, Shard)],
+    }
+    if not spec["args"] and not spec["kwargs"]:
+        return None
+
+    values = {"args": [args[i].value for i in spec["args"]], "kwargs": [kwargs[name].value for name in spec["kwargs"]]}
+    for i in spec["args"]:
+        args[i] = None
+    for name in spec["kwargs"]:
+        kwargs[name] = None
+    body["args"] = args
+    body["kwargs"] = kwargs
+    body[SHARDS_KEY] = spec
+    return values
+
+
+def is_sharded(params) -> bool:
+    return isinstance(params, dict) and SHARDS_KEY in params
+
+
+def _split(value, world_size: int) -> list:
+    base, extra = divmod(len(value), world_size)
+    slices, start = [], 0
+    for rank in range(world_size):
+        end = start + base + (1 if rank < extra else 0)
+        slices.append(value[start:end])
+        start = end
+    return slices
+
+
+def split_shards(params: dict, world_size: int, procs_per_node: int) -> dict:
+    """Split the sharded values of a call into one slice per global rank. Run once, on the coordinator."""
+    if "shard_ranks" in params:
+        return params
+
+    params = dict(params)
+    binary = isinstance(params.get("data"), (bytes, bytearray))
+    if binary:
+        call_frame, values_frame = unpack_result_frames(params["data"])
+        values = unpack_pickle_frame(values_frame)
+    else:
+        values = params.pop("shard_values")
+
+    arg_slices = [_split(value, world_size) for value in values["args"]]
+    kwarg_slices = [_split(value, world_size) for value in values["kwargs"]]
+    per_rank = [
+        {"args": [s[rank] for s in arg_slices], "kwargs": [s[rank] for s in kwarg_slices]} for rank in range(world_size)
+    ]
+
+    params["shard_ranks"] = list(range(world_size))
+    params["shard_procs"] = procs_per_node
+    if binary:
+        params["data"] = pack_result_list([call_frame] + [pack_pickle_frame(values) for values in per_rank])
+    else:
+        params["shard_values"] = per_rank
+    return params
+
+
+def check_all_workers_selected(worker_ips, selected_ips, workers_arg):
+    """Raise if a sharded call would skip some workers, whose slices would otherwise be dropped."""
+    missing = [ip for ip in worker_ips if ip not in set(selected_ips)]
+    if missing:
+        raise ValueError(
+            f"Sharded arguments are split across all {len(worker_ips)} workers, but workers={workers_arg!r} leaves "
+            f"out {len(missing)} of them ({', '.join(missing[:5])}), so their slices would be dropped"
+        )
+
+
+def select_shard_ranks(params: dict, ranks) -> dict:
+    """Copy of split call params holding only the slices for ``ranks`` (e.g. a child's subtree)."""
+    wanted = set(ranks)
+    keep = [i for i, rank in enumerate(params["shard_ranks"]) if rank in wanted]
+
+    params = dict(params)
+    params["shard_ranks"] = [params["shard_ranks"][i] for i in keep]
+    if isinstance(params.get("data"), (bytes, bytearray)):
+        frames = unpack_result_frames(params["data"])
+        params["data"] = pack_result_list([frames[0]] + [frames[i + 1] for i in keep])
+    else:
+        params["shard_values"] = [params["shard_values"][i] for i in keep]
+    return params
+
+
+def node_ranks(node_rank: int, procs_per_node: int) -> range:
+    """Global ranks of the processes on one node."""
+    return range(node_rank * procs_per_node, (node_rank + 1) * procs_per_node)
+
+
+def rank_params(params: dict, rank: int) -> dict:
+    """Params for the local process with the given global rank."""
+    if rank not in params["shard_ranks"]:
+        raise ValueError(f"No shard for rank {rank} in this call (holding ranks {params['shard_ranks']})")
+    return select_shard_ranks(params, [rank])
+
+
+def take_rank_shard(params: dict, binary: bool) -> dict:
+    """Unpack a sharded call's ``args``/``kwargs`` with this process's slice (or the whole value, if unsplit)."""
+    spec = params.pop(SHARDS_KEY)
+    if "shard_ranks" in params and len(params["shard_ranks"]) != 1:
+        raise ValueError(f"Expected the shard for a single rank, got ranks {params['shard_ranks']}")
+    params.pop("shard_ranks", None)
+    params.pop("shard_procs", None)
+
+    if binary:
+        call_frame, values_frame = unpack_result_frames(params.pop("data"))
+        call = unpack_pickle_frame(call_frame)
+        values = unpack_pickle_frame(values_frame)
+    else:
+        call = {"args": params.get("args", []), "kwargs": params.get("kwargs", {})}
+        values = params.pop("shard_values")
+        if isinstance(values, list):
+            values = values[0]
+
+    args = list(call.get("args") or [])
+    kwargs = dict(call.get("kwargs") or {})
+    for i, value in zip(spec["args"], values["args"]):
+        args[i] = value
+    for name, value in zip(spec["kwargs"], values["kwargs"]):
+        kwargs[name] = value
+    return {"args": args, "kwargs": kwargs}
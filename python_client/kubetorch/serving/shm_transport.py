@@ -0,0 +1,101 @@
+"""Shared-memory handoff of large payloads between the HTTP server and ProcessWorker subprocesses.
+
+``ProcessPool`` talks to its subprocesses over ``multiprocessing.Queue``, which pickles every item and pushes it
+through a pipe. For binary pickle calls the argument payload (``params["data"]``) and the pickled result are raw
+``bytes`` that can be large (tensors, arrays), so above ``KT_SHM_THRESHOLD_BYTES`` they're written once into a
+``multiprocessing.shared_memory`` segment and only a small :class:`SharedMemoryHandle` travels on the queue.
+
+Segment names are derived from the pool's ``request_unique_id``, so whoever owns the request can always release
+its segments, even if the other side died before reading them:
+
+- The sender creates the segment, writes the payload, and closes its mapping.
+- The receiver copies the payload out, closes, and unlinks the segment.
+- ``ProcessPool.call`` calls :func:`release_request_segments` once the request is done, as a safety net.
+"""
+
+import os
+from multiprocessing import shared_memory
+
+DEFAULT_SHM_THRESHOLD_BYTES = 1024 * 1024
+
+PARAMS_SEGMENT = "params"
+RESULT_SEGMENT = "result"
+
+
+class SharedMemoryHandle:
+    """Picklable reference to a payload stored in a shared memory segment."""
+
+    __slots__ = ("name", "size")
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+
+    def __repr__(self):
+        return f"SharedMemoryHandle(name={self.name!r}, size={self.size})"
+
+
+def shm_threshold_bytes() -> int:
+    """Minimum payload size sent through shared memory. Zero or negative disables the shared memory path."""
+    return int(os.getenv("KT_SHM_THRESHOLD_BYTES", DEFAULT_SHM_THRESHOLD_BYTES))
+
+
+def segment_name(request_unique_id: str, kind: str) -> str:
+    # POSIX shm names are limited in length on some platforms, so keep them short
+    return f"kt_{request_unique_id.replace('-', '')[:24]}_{kind[0]}"
+
+
+def maybe_to_shared_memory(payload, request_unique_id: str, kind: str):
+    """Move a bytes payload into shared memory if it's above the threshold.
+
+    Returns a :class:`SharedMemoryHandle` on success, or the payload unchanged if it's not bytes, is below the
+    threshold, or the segment can't be created (e.g. ``/dev/shm`` is full), in which case the caller falls back
+    to sending it over the queue.
+    """
+    threshold = shm_threshold_bytes()
+    if not isinstance(payload, (bytes, bytearray)) or threshold <= 0 or len(payload) < threshold:
+        return payload
+
+    name = segment_name(request_unique_id, kind)
+    try:
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(payload))
+    except OSError:
+        return payload
+
+    try:
+        shm.buf[: len(payload)] = payload
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return SharedMemoryHandle(name, len(payload))
+
+
+def from_shared_memory(value):
+    """Read the payload behind a :class:`SharedMemoryHandle` and unlink its segment. Other values pass through."""
+    if not isinstance(value, SharedMemoryHandle):
+        return value
+
+    shm = shared_memory.SharedMemory(name=value.name)
+    try:
+        return bytes(shm.buf[: value.size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def release_request_segments(request_unique_id: str, kinds=(PARAMS_SEGMENT, RESULT_SEGMENT)):
+    """Unlink any segments still held for a request (e.g. the receiver failed before reading them)."""
+    for kind in kinds:
+        _unlink_if_exists(segment_name(request_unique_id, kind))
+
+
+def _unlink_if_exists(name: str) -> bool:
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    shm.unlink()
+    return True
@@ -4,13 +4,20 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 
-import httpx
 from starlette.responses import JSONResponse
 
 from kubetorch.serving.distributed_supervisor import DistributedSupervisor
 from kubetorch.serving.http_server import logger
 from kubetorch.serving.process_worker import ProcessWorker
 from kubetorch.serving.remote_worker_pool import RemoteWorkerPool
+from kubetorch.serving.sharding import (
+    check_all_workers_selected,
+    is_sharded,
+    node_ranks,
+    rank_params,
+    select_shard_ranks,
+    split_shards,
+)
 
 
 class SPMDDistributedSupervisor(DistributedSupervisor):
@@ -99,6 +106,17 @@ class SPMDDistributedSupervisor(DistributedSupervisor):
             )
         return children
 
+    def _subtree_ips(self, worker_ips: list, root_ip: str, tree_mode: bool) -> list:
+        """IPs of a child node and everything it calls in turn (just the child in flat topology)."""
+        if not tree_mode:
+            return [root_ip]
+        subtree, frontier = [], [root_ip]
+        while frontier:
+            ip = frontier.pop()
+            subtree.append(ip)
+            frontier.extend(self.get_tree_children(sorted_ips=worker_ips, my_ip=ip, fanout=self.tree_fanout))
+        return subtree
+
     def call(
         self,
         request,
@@ -253,18 +271,27 @@ class SPMDDistributedSupervisor(DistributedSupervisor):
                 # Check if current pod should participate in local processing
                 if this_pod_ip not in target_ips:
                     call_local_procs = False
+                selected_ips = target_ips
 
             elif workers_arg == "any":
                 # Only call one worker (this one)
                 subcall_ips = []
+                selected_ips = [this_pod_ip]
             elif workers_arg == "ready":
-                # Filter below in call_worker to only those that respond to /health
-                pass
+                # Filtered by RemoteWorkerPool to only those that respond to /health
+                selected_ips = worker_ips
             elif isinstance(workers_arg, str) and workers_arg:
                 # Filter the subcall_ips to only those matching the workers_arg string
                 subcall_ips = [ip for ip in subcall_ips if workers_arg in ip]
+                selected_ips = [ip for ip in worker_ips if workers_arg in ip]
+            else:
+                selected_ips = worker_ips
             logger.debug(f"Subcall IPs after filtering: {subcall_ips}")
 
+            if is_sharded(params) and not distributed_subcall:
+                # Shards are split over every worker, so a call on a subset would lose the others' slices
+                check_all_workers_selected(worker_ips, selected_ips, workers_arg)
+
         # "restart_procs" is passed through as a regular kwarg, not a special extracted one like pdb or serialization
         # because it only applies to distributed calls, not regular ones.
         if params.get("restart_procs", False):
@@ -281,68 +308,32 @@ class SPMDDistributedSupervisor(DistributedSupervisor):
             # For now, assume we're the first worker if not found
             node_rank = 0
 
-        # Call the workers using RemoteWorkerPool for async operations
-        def call_worker(worker_ip):
-            # Keep this function for backward compatibility but it won't be used
-            # when RemoteWorkerPool is available
-            with httpx.Client(timeout=None) as client:
-                port = os.environ["KT_SERVER_PORT"]
-                worker_url = f"http://{worker_ip}:{port}"
-                # First check that the worker is alive, replicas don't finish setup at exactly the same moment
-                # Use quorum_timeout to control how long to wait for workers
-                for i in range(int(self.quorum_timeout)):
-                    try:
-                        resp = client.get(f"{worker_url}/health")
-                        if resp.status_code == 200:
-                            break
-                    except httpx.RequestError:
-                        if workers_arg == "ready":
-                            logger.debug(f"Worker {worker_ip} not ready, skipping as per 'ready' workers argument")
-                            return None
-                        time.sleep(1)
-                else:
-                    # Timeout reached without successful health check
-                    logger.warning(f"Worker {worker_ip} failed to respond after {self.quorum_timeout}s timeout")
-                    if workers_arg != "ready":
-                        raise TimeoutError(
-                            f"Worker {worker_ip} did not become ready within {self.quorum_timeout} seconds. "
-                            "This may indicate the pod is still starting or there's a resource constraint. "
-                            "Consider increasing quorum_timeout in .distribute() call."
-                        )
-
-                call_url = (
-                    f"{worker_url}/{cls_or_fn_name}/{method_name}?distributed_subcall=true"
-                    if method_name is not None
-                    else f"{worker_url}/{cls_or_fn_name}?distributed_subcall=true"
-                )
-
-                # Clean headers to avoid potential Content-Length issues
-                clean_headers = {}
-                if request.headers:
-                    for key, value in request.headers.items():
-                        # Skip headers that could interfere with httpx's automatic handling
-                        if key.lower() not in [
-                            "content-length",
-                            "transfer-encoding",
-                            "connection",
-                        ]:
-                            clean_headers[key] = value
-
-                try:
-                    logger.debug(f"Making distributed call to {worker_url}")
-                    resp = client.post(
-                        url=call_url,
-                        json=params,
-                        headers=clean_headers,  # Includes deployed_as_of and request_id
-                    )
-                    return resp
-                except (httpx.RequestError, httpx.HTTPError) as e:
-                    logger.error(f"Failed to call worker {worker_url}: {e}")
-                    raise
-
         # Prepare per-process parameters
         num_procs = len(self.process_pool)
-        params_list = [params] * num_procs
+        worker_params = None
+        if is_sharded(params):
+            # Args wrapped in kt.distributed.shard(): each process and child subtree only gets its own slices
+            if not distributed_subcall:
+                params = split_shards(params, world_size=len(worker_ips) * num_procs, procs_per_node=num_procs)
+            procs_per_node = params["shard_procs"]
+            if procs_per_node != num_procs:
+                raise RuntimeError(
+                    f"Sharded call was split for {procs_per_node} processes per pod, but this pod has {num_procs}"
+                )
+            params_list = [rank_params(params, rank) for rank in node_ranks(node_rank, num_procs)]
+            worker_params = {
+                ip: select_shard_ranks(
+                    params,
+                    [
+                        rank
+                        for subtree_ip in self._subtree_ips(worker_ips, ip, tree_mode)
+                        for rank in node_ranks(worker_ips.index(subtree_ip), procs_per_node)
+                    ],
+                )
+                for ip in subcall_ips
+            }
+        else:
+            params_list = [params] * num_procs
         distributed_env_vars_list = []
         debug_ports = []
 
@@ -396,6 +387,7 @@ class SPMDDistributedSupervisor(DistributedSupervisor):
                         for key, value in request.headers.items():
                             if key.lower() not in [
                                 "content-length",
+                                "content-type",
                                 "transfer-encoding",
                                 "connection",
                             ]:
@@ -413,6 +405,7 @@ class SPMDDistributedSupervisor(DistributedSupervisor):
                         params=params,
                         request_headers=clean_headers,
                         workers_arg=workers_arg,
+                        worker_params=worker_params,
                     )
                     logger.warning(
                         f"RemoteWorkerPool returned {len(results) if results else 0} results from {len(subcall_ips)} workers"
@@ -594,5 +587,18 @@ class SPMDDistributedSupervisor(DistributedSupervisor):
             # This is primarily to handle exceptions while packaging an exception, which will cause the server to hang.
             if isinstance(response, Exception):
                 raise response
+
+        if params.get("reduce"):
+            # Only this subtree's reduced result travels upward (see reduction.py)
+            return self._reduce_responses(
+                params["reduce"], local_responses, worker_responses, serialization, is_root=not distributed_subcall
+            )
         logger.debug(f"Returning {len(responses)} responses from execute_call")
         return responses
+
+    def _reduce_responses(self, reduce: str, local_responses, worker_responses, serialization, is_root):
+        result = self.process_pool.reduce(reduce, local_responses, worker_responses, serialization, is_root=is_root)
+        if isinstance(result, JSONResponse):
+            return result
+        # Subcalls return a one-element list so the parent collects it like any other subtree result
+        return result if is_root else [result]
@@ -8,6 +8,7 @@ import os
 import pickle
 import re
 import socket
+import struct
 import subprocess
 import sys
 import time
@@ -30,6 +31,19 @@ RSYNC_PORT = 873
 
 DEFAULT_ALLOWED_SERIALIZATION = "json"
 
+# Binary wire format for pickle serialization (see pack_pickle_frame / pack_call_body below)
+BINARY_CONTENT_TYPE = "application/x-kt-pickle"
+_PICKLE_FRAME_MAGIC = b"KTP5"
+_CALL_BODY_MAGIC = b"KTPC"
+_RESULT_LIST_MAGIC = b"KTPL"
+
+# Streaming (generator) responses: NDJSON for json serialization, length-prefixed pickle frames for pickle
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+PICKLE_STREAM_CONTENT_TYPE = "application/x-kt-pickle-stream"
+STREAM_ERROR_KEY = "__kt_stream_error__"
+_STREAM_RECORD_HEADER = struct.Struct("<BQ")
+_STREAM_ITEM, _STREAM_ERROR = 0, 1
+
 MAGIC_CALL_KWARGS = ["workers", "restart_procs"]
 
 LOG_CONFIG = {
@@ -764,6 +778,182 @@ def wait_for_app_start(port, health_check: str, process: subprocess.Popen, timeo
         raise TimeoutError(f"Failed to detect open port {port} for app {url} within {timeout} seconds")
 
 
+def pack_pickle_frame(obj) -> bytes:
+    """Pickle an object with protocol 5, keeping large buffers (e.g. NumPy arrays) out-of-band.
+
+    Layout: ``magic | num_buffers (u32) | main_len (u64) | buffer_lens (u64 each) | main | buffers``.
+    Out-of-band buffers are copied once into the frame instead of being re-encoded inside the pickle stream.
+    """
+    buffers = []
+    main = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = []
+    for buf in buffers:
+        try:
+            raws.append(buf.raw())
+        except BufferError:
+            # Non-contiguous buffer, fall back to a contiguous copy
+            raws.append(memoryview(buf).tobytes())
+    lengths = [len(main)] + [memoryview(r).nbytes for r in raws]
+    header = struct.pack(f"<4sI{len(lengths)}Q", _PICKLE_FRAME_MAGIC, len(raws), *lengths)
+    return b"".join([header, main, *raws])
+
+
+def unpack_pickle_frame(data):
+    """Inverse of :func:`pack_pickle_frame`. Out-of-band buffers are handed to pickle as views into ``data``."""
+    view = memoryview(data)
+    magic, num_buffers = struct.unpack_from("<4sI", view, 0)
+    if magic != _PICKLE_FRAME_MAGIC:
+        raise ValueError("Payload is not a kubetorch pickle frame")
+    if num_buffers and view.readonly:
+        # Copy once so unpickled arrays are writable, matching in-band pickle semantics
+        view = memoryview(bytearray(view))
+    lengths = struct.unpack_from(f"<{num_buffers + 1}Q", view, 8)
+    offset = 8 + 8 * (num_buffers + 1)
+    main = view[offset : offset + lengths[0]]
+    offset += lengths[0]
+    buffers = []
+    for length in lengths[1:]:
+        buffers.append(view[offset : offset + length])
+        offset += length
+    return pickle.loads(main, buffers=buffers)
+
+
+def pack_call_body(params: dict) -> bytes:
+    """Frame a call body for the binary transport.
+
+    Everything except the pickled ``data`` frame (e.g. "workers", "debugger", "distributed_env_vars") travels
+    as a small JSON header, so the server and intermediate tree nodes can read call settings and forward the
+    payload without unpickling it.
+    """
+    meta = {k: v for k, v in params.items() if k != "data"}
+    meta_bytes = json.dumps(meta).encode("utf-8")
+    return b"".join([struct.pack("<4sI", _CALL_BODY_MAGIC, len(meta_bytes)), meta_bytes, params.get("data") or b""])
+
+
+def unpack_call_body(body) -> dict:
+    """Inverse of :func:`pack_call_body`. Returns the params dict with ``data`` as the raw pickle frame."""
+    view = memoryview(body)
+    magic, meta_len = struct.unpack_from("<4sI", view, 0)
+    if magic != _CALL_BODY_MAGIC:
+        raise ValueError("Payload is not a kubetorch binary call body")
+    params = json.loads(bytes(view[8 : 8 + meta_len]))
+    params["data"] = bytes(view[8 + meta_len :])
+    return params
+
+
+def is_binary_call(params) -> bool:
+    """Whether a call's params arrived over the binary transport (pickle frame not base64-wrapped)."""
+    return isinstance(params, dict) and isinstance(params.get("data"), (bytes, bytearray))
+
+
+def pack_result_list(frames: list) -> bytes:
+    """Concatenate already-pickled result frames (e.g. one per SPMD rank) into a single response body."""
+    header = struct.pack(f"<4sI{len(frames)}Q", _RESULT_LIST_MAGIC, len(frames), *[len(f) for f in frames])
+    return b"".join([header, *frames])
+
+
+def unpack_result_frames(data) -> list:
+    """Split a binary response body into its raw pickle frames without unpickling them.
+
+    A single-result body is returned as a one-element list.
+    """
+    view = memoryview(data)
+    magic, count = struct.unpack_from("<4sI", view, 0)
+    if magic == _PICKLE_FRAME_MAGIC:
+        return [bytes(view)]
+    if magic != _RESULT_LIST_MAGIC:
+        raise ValueError("Payload is not a kubetorch binary response")
+    lengths = struct.unpack_from(f"<{count}Q", view, 8)
+    offset = 8 + 8 * count
+    frames = []
+    for length in lengths:
+        frames.append(bytes(view[offset : offset + length]))
+        offset += length
+    return frames
+
+
+def decode_binary_response(data):
+    """Unpickle a binary response body, returning a list for multi-result (SPMD) responses."""
+    if bytes(data[:4]) == _RESULT_LIST_MAGIC:
+        return [unpack_pickle_frame(frame) for frame in unpack_result_frames(data)]
+    return unpack_pickle_frame(data)
+
+
+def stream_content_type(serialization: str) -> str:
+    return PICKLE_STREAM_CONTENT_TYPE if serialization == "pickle" else NDJSON_CONTENT_TYPE
+
+
+def is_stream_content_type(content_type: str) -> bool:
+    return content_type.startswith((NDJSON_CONTENT_TYPE, PICKLE_STREAM_CONTENT_TYPE))
+
+
+def encode_stream_item(chunk, serialization: str) -> bytes:
+    """Frame one serialized stream item (a JSON string, or a pickle frame) for the wire."""
+    if serialization == "pickle":
+        return _STREAM_RECORD_HEADER.pack(_STREAM_ITEM, len(chunk)) + chunk
+    return chunk.encode("utf-8") + b"\n"
+
+
+def encode_stream_error(error: dict, serialization: str) -> bytes:
+    """Frame a packaged exception raised mid-stream, after the 200 status has already been sent."""
+    if serialization == "pickle":
+        payload = json.dumps(error).encode("utf-8")
+        return _STREAM_RECORD_HEADER.pack(_STREAM_ERROR, len(payload)) + payload
+    return json.dumps({STREAM_ERROR_KEY: error}).encode("utf-8") + b"\n"
+
+
+class StreamDecoder:
+    """Incremental decoder for streamed responses.
+
+    Feed it raw bytes as they arrive; :meth:`feed` returns the complete records decoded so far, as
+    ``(is_error, value)`` tuples where ``value`` is either a deserialized item or a packaged error dict.
+    """
+
+    def __init__(self, content_type: str):
+        self.pickle = content_type.startswith(PICKLE_STREAM_CONTENT_TYPE)
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes):
+        self._buffer += data
+        return self._decode_pickle() if self.pickle else self._decode_ndjson()
+
+    def finish(self):
+        if self._buffer.strip():
+            raise ValueError("Stream ended with an incomplete record")
+
+    def _decode_ndjson(self):
+        records = []
+        *lines, rest = self._buffer.split(b"\n")
+        self._buffer = bytearray(rest)
+        for line in lines:
+            if not line.strip():
+                continue
+            value = json.loads(line)
+            if isinstance(value, dict) and STREAM_ERROR_KEY in value:
+                records.append((True, value[STREAM_ERROR_KEY]))
+            else:
+                records.append((False, value))
+        return records
+
+    def _decode_pickle(self):
+        records = []
+        offset = 0
+        header_size = _STREAM_RECORD_HEADER.size
+        while len(self._buffer) - offset >= header_size:
+            kind, length = _STREAM_RECORD_HEADER.unpack_from(self._buffer, offset)
+            end = offset + header_size + length
+            if len(self._buffer) < end:
+                break
+            payload = bytes(self._buffer[offset + header_size : end])
+            if kind == _STREAM_ERROR:
+                records.append((True, json.loads(payload)))
+            else:
+                records.append((False, unpack_pickle_frame(payload)))
+            offset = end
+        del self._buffer[:offset]
+        return records
+
+
 def _serialize_body(body: dict, serialization: str):
     if body is None:
         return {}
@@ -777,17 +967,53 @@ def _serialize_body(body: dict, serialization: str):
         if kwarg in body.get("kwargs", {}):
             body[kwarg] = body["kwargs"].pop(kwarg)
 
+    # Namespaced so a user function's own ``reduce`` argument (e.g. a loss's) passes through untouched
+    if "kt_reduce" in body.get("kwargs", {}):
+        from kubetorch.serving.reduction import reduce_arg
+
+        body["reduce"] = reduce_arg(body["kwargs"].pop("kt_reduce"))
+
+    if "batch" in body:
+        # Batched (map) call: each call is serialized on its own so the server can fan them out without unpickling
+        calls = [{"args": call["args"], "kwargs": call["kwargs"]} for call in body["batch"]]
+        if serialization == "pickle":
+            body["batch"] = len(calls)
+            body["data"] = pack_result_list([pack_pickle_frame(call) for call in calls])
+            return pack_call_body(body)
+        body["batch"] = calls
+        return body
+
+    from kubetorch.serving.sharding import extract_shards
+
+    # Values wrapped in kt.distributed.shard() travel next to the call so the coordinator can split them by rank
+    shard_values = extract_shards(body)
+
     if serialization == "pickle":
+        # Binary transport: the pickle frame is sent as the raw request body (no base64/JSON wrapping)
         args_data = {"args": body.pop("args"), "kwargs": body.pop("kwargs")}
-        pickled_args = pickle.dumps(args_data or {})
-        encoded_args = base64.b64encode(pickled_args).decode("utf-8")
-        body["data"] = encoded_args
-        return body
+        body["data"] = pack_pickle_frame(args_data)
+        if shard_values is not None:
+            body["data"] = pack_result_list([body["data"], pack_pickle_frame(shard_values)])
+        return pack_call_body(body)
+    if shard_values is not None:
+        body["shard_values"] = shard_values
     return body or {}
 
 
+def split_batch_params(params: dict) -> list:
+    """Split the params of a batched (map) call into the params of each individual call, in order."""
+    common = {k: v for k, v in params.items() if k not in ("batch", "data")}
+    if is_binary_call(params):
+        return [{**common, "data": frame} for frame in unpack_result_frames(params["data"])]
+    return [{**common, **call} for call in params["batch"]]
+
+
 def _deserialize_response(response, serialization: str):
     if serialization == "pickle":
+        if response.headers.get("Content-Type", "").startswith(BINARY_CONTENT_TYPE):
+            return decode_binary_response(response.content)
+
+        # Legacy JSON-wrapped (base64) pickle responses
         response_data = response.json()
         if isinstance(response_data, list):
             # If this is a response from an spmd call, it's a list of serialized dicts
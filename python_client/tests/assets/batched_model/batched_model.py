@@ -0,0 +1,23 @@
+import threading
+
+import kubetorch as kt
+
+
+class Doubler:
+    def __init__(self):
+        self.batch_sizes = []
+        self._lock = threading.Lock()
+
+    @kt.batched(max_batch_size=8, max_wait_ms=200)
+    def double(self, inputs):
+        with self._lock:
+            self.batch_sizes.append(len(inputs))
+        return [x * 2 for x in inputs]
+
+    @kt.batched(max_batch_size=4, max_wait_ms=0)
+    def mismatched(self, inputs):
+        return inputs[:-1]
+
+    def largest_batch(self):
+        with self._lock:
+            return max(self.batch_sizes, default=0)
@@ -0,0 +1,10 @@
+import asyncio
+
+
+class BenchEcho:
+    def echo(self, payload):
+        return payload
+
+    async def aecho(self, payload):
+        await asyncio.sleep(0)
+        return payload
@@ -0,0 +1,19 @@
+import os
+
+
+class CachedModel:
+    __kt_cached_state__ = ["weights"]
+
+    def __init__(self):
+        # On a redeploy, weights saved by the previous process are already set
+        self.restored = hasattr(self, "weights")
+        if not self.restored:
+            self.weights = {"loaded_by": os.getpid(), "values": bytearray(2 * 1024 * 1024)}
+
+    def info(self):
+        return {
+            "restored": self.restored,
+            "loaded_by": self.weights["loaded_by"],
+            "pid": os.getpid(),
+            "size": len(self.weights["values"]),
+        }
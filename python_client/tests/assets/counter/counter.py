@@ -0,0 +1,14 @@
+import asyncio
+
+
+class Counter:
+    def count(self, n, fail_at=None):
+        for i in range(n):
+            if i == fail_at:
+                raise ValueError(f"Failed at {i}")
+            yield i
+
+    async def acount(self, n):
+        for i in range(n):
+            await asyncio.sleep(0)
+            yield i
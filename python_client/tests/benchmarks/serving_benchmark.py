@@ -0,0 +1,355 @@
+"""Local benchmark suite for the serving call path.
+
+Starts ``serving/http_server.py`` in-process with no Kubernetes and no controller: the module metadata the controller
+would push (``KT_CLS_OR_FN_NAME``, ``KT_MODULE_NAME``, ...) is set from ``tests/assets/bench_echo/metadata.dockerfile``,
+and requests go through a Starlette ``TestClient``. Each case measures calls/sec and p50/p99 latency for one
+combination of:
+
+- path: a full HTTP call (``run_callable`` -> supervisor -> subprocess -> ``execute_callable``), or a call straight
+  into the supervisor's ``ProcessPool`` (request queue -> worker -> response router), which leaves out HTTP and FastAPI
+- serialization: json or pickle (binary transport)
+- method: a sync or an async user method
+- payload size, ``num_processes`` and the number of concurrent callers
+
+Run from ``python_client``::
+
+    python -m tests.benchmarks.serving_benchmark --output serving-bench.json
+    python -m tests.benchmarks.serving_benchmark --output new.json --baseline serving-bench.json
+
+With ``--baseline``, cases whose calls/sec dropped or p99 latency rose by more than ``--max-regression`` (default 20%)
+are reported and the exit code is 1.
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Set these BEFORE importing http_server, as it reads them at import time
+os.environ.setdefault("KT_LOG_STREAMING_ENABLED", "false")
+os.environ.setdefault("KT_METRICS_ENABLED", "false")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from kubetorch.serving import http_server  # noqa: E402
+from kubetorch.serving.http_server import app  # noqa: E402
+from kubetorch.serving.utils import (  # noqa: E402
+    _serialize_body,
+    BINARY_CONTENT_TYPE,
+    decode_binary_response,
+    unpack_call_body,
+)
+from starlette.responses import JSONResponse  # noqa: E402
+
+from tests.utils import _update_metadata_env_vars  # noqa: E402
+
+SCHEMA_VERSION = 1
+ASSETS_DIR = Path(__file__).parent.parent / "assets" / "bench_echo"
+CLASS_NAME = "BenchEcho"
+METHODS = {"sync": "echo", "async": "aecho"}
+
+DEFAULT_PATHS = ["http", "process_pool"]
+DEFAULT_SERIALIZATIONS = ["json", "pickle"]
+DEFAULT_METHOD_KINDS = ["sync", "async"]
+DEFAULT_PAYLOAD_SIZES = [64, 16 * 1024, 1024 * 1024]
+DEFAULT_NUM_PROCESSES = [1, 2]
+DEFAULT_CONCURRENCY = [1, 8]
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of ``values`` (``q`` in [0, 100])."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _reset_http_server_state():
+    if http_server.SUPERVISOR:
+        http_server.SUPERVISOR.cleanup()
+    http_server.SUPERVISOR = None
+    http_server._CACHED_CALLABLES.clear()
+    http_server._LAST_DEPLOYED = 0
+    http_server._CACHED_IMAGE.clear()
+
+
+@contextlib.contextmanager
+def _server_env(num_processes):
+    """Environment of a pod running the bench_echo service, restored on exit."""
+    saved = dict(os.environ)
+    os.environ.update(
+        {
+            "KT_DIRECTORY": str(ASSETS_DIR),
+            "POD_NAMESPACE": "kubetorch",
+            "POD_NAME": "kubetorch-bench",
+            "POD_IP": "localhost",
+            "LOCAL_IPS": "localhost",
+            "KT_SERVICE_NAME": "bench-echo",
+            "KT_ALLOWED_SERIALIZATION": "json,pickle",
+        }
+    )
+    _update_metadata_env_vars(ASSETS_DIR, set=True)
+    os.environ["KT_DISTRIBUTED_CONFIG"] = json.dumps({"distribution_type": "local", "num_processes": num_processes})
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+def _http_caller(client, method_name, serialization, payload):
+    """Build a function making one HTTP call; it returns the deserialized result."""
+    url = f"/{CLASS_NAME}/{method_name}"
+    if serialization == "pickle":
+        headers = {"Content-Type": BINARY_CONTENT_TYPE, "X-Serialization": "pickle"}
+
+        def call():
+            body = _serialize_body({"args": [payload], "kwargs": {}}, "pickle")
+            response = client.post(url, content=body, headers=headers)
+            response.raise_for_status()
+            return decode_binary_response(response.content)
+
+    else:
+
+        def call():
+            response = client.post(url, json={"args": [payload], "kwargs": {}})
+            response.raise_for_status()
+            return response.json()
+
+    return call
+
+
+def _process_pool_caller(method_name, serialization, payload):
+    """Build a function making one call directly through the supervisor's ProcessPool."""
+    pool = http_server.SUPERVISOR.process_pool
+    call_kwargs = dict(
+        method_name=method_name,
+        deployed_as_of=None,
+        request_id="bench",
+        distributed_env_vars={},
+        debug_port=None,
+        debug_mode=None,
+        serialization=serialization,
+    )
+
+    def call():
+        # Params are built per call like run_callable does, since the worker consumes them
+        if serialization == "pickle":
+            params = unpack_call_body(_serialize_body({"args": [payload], "kwargs": {}}, "pickle"))
+        else:
+            params = {"args": [payload], "kwargs": {}}
+        result = pool.dispatch(params=params, **call_kwargs)
+        if isinstance(result, (Exception, JSONResponse)):
+            raise RuntimeError(f"Call failed in subprocess: {result}")
+        return decode_binary_response(result) if serialization == "pickle" else result
+
+    return call
+
+
+def _run_case(call, calls, concurrency):
+    """Make ``calls`` calls spread over ``concurrency`` threads, returning (latencies in seconds, errors, wall time)."""
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    remaining = iter(range(calls))
+
+    def worker():
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            start = time.perf_counter()
+            try:
+                call()
+            except Exception as e:
+                with lock:
+                    errors.append(repr(e))
+                continue
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors, time.perf_counter() - start
+
+
+def _case_name(path, serialization, method_kind, payload_bytes, num_processes, concurrency):
+    return f"{path}/{serialization}/{method_kind}/{payload_bytes}B/procs={num_processes}/concurrency={concurrency}"
+
+
+def run_benchmarks(
+    paths=DEFAULT_PATHS,
+    serializations=DEFAULT_SERIALIZATIONS,
+    method_kinds=DEFAULT_METHOD_KINDS,
+    payload_sizes=DEFAULT_PAYLOAD_SIZES,
+    num_processes_list=DEFAULT_NUM_PROCESSES,
+    concurrency_list=DEFAULT_CONCURRENCY,
+    calls=200,
+    warmup=20,
+    log=print,
+):
+    """Run every combination of the given settings and return the results document."""
+    results = []
+    for num_processes in num_processes_list:
+        _reset_http_server_state()
+        with _server_env(num_processes), TestClient(app, raise_server_exceptions=False) as client:
+            for path, serialization, method_kind, payload_bytes in itertools.product(
+                paths, serializations, method_kinds, payload_sizes
+            ):
+                payload = "x" * payload_bytes
+                if path == "http":
+                    call = _http_caller(client, METHODS[method_kind], serialization, payload)
+                else:
+                    call = _process_pool_caller(METHODS[method_kind], serialization, payload)
+
+                # Check the round trip first, so a broken path fails loudly rather than being timed as errors
+                if call() != payload:
+                    raise RuntimeError(f"{path}/{serialization}/{method_kind} did not echo its payload")
+                _run_case(call, warmup, max(concurrency_list))
+
+                for concurrency in concurrency_list:
+                    latencies, errors, wall = _run_case(call, calls, concurrency)
+                    entry = {
+                        "name": _case_name(path, serialization, method_kind, payload_bytes, num_processes, concurrency),
+                        "path": path,
+                        "serialization": serialization,
+                        "method": method_kind,
+                        "payload_bytes": payload_bytes,
+                        "num_processes": num_processes,
+                        "concurrency": concurrency,
+                        "calls": calls,
+                        "errors": len(errors),
+                        "calls_per_sec": len(latencies) / wall,
+                        "latency_ms": {
+                            "p50": percentile(latencies, 50) * 1000 if latencies else None,
+                            "p99": percentile(latencies, 99) * 1000 if latencies else None,
+                            "mean": sum(latencies) / len(latencies) * 1000 if latencies else None,
+                        },
+                    }
+                    if errors:
+                        entry["first_error"] = errors[0]
+                    results.append(entry)
+                    log(
+                        f"{entry['name']}: {entry['calls_per_sec']:.0f} calls/s, "
+                        f"p50 {entry['latency_ms']['p50'] or 0:.2f}ms, "
+                        f"p99 {entry['latency_ms']['p99'] or 0:.2f}ms, {len(errors)} errors"
+                    )
+        _reset_http_server_state()
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": _environment(),
+        "settings": {"calls": calls, "warmup": warmup},
+        "results": results,
+    }
+
+
+def _environment():
+    try:
+        from importlib.metadata import version
+
+        kubetorch_version = version("kubetorch")
+    except Exception:
+        kubetorch_version = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except Exception:
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "kubetorch_version": kubetorch_version,
+        "git_commit": commit,
+    }
+
+
+def compare_results(current, baseline, max_regression=0.2):
+    """List the cases in ``current`` that regressed against ``baseline`` by more than ``max_regression``.
+
+    A case regresses if its calls/sec dropped, or its p99 latency rose, by more than that fraction, or if it has
+    errors the baseline didn't. Cases missing from either document are skipped.
+    """
+    baseline_cases = {entry["name"]: entry for entry in baseline["results"]}
+    regressions = []
+    for entry in current["results"]:
+        base = baseline_cases.get(entry["name"])
+        if base is None:
+            continue
+        if entry["errors"] > base["errors"]:
+            regressions.append(f"{entry['name']}: {entry['errors']} errors (baseline {base['errors']})")
+        if base["calls_per_sec"] and entry["calls_per_sec"] < base["calls_per_sec"] * (1 - max_regression):
+            regressions.append(
+                f"{entry['name']}: {entry['calls_per_sec']:.0f} calls/s (baseline {base['calls_per_sec']:.0f})"
+            )
+        p99, base_p99 = entry["latency_ms"]["p99"], base["latency_ms"]["p99"]
+        if p99 is not None and base_p99 and p99 > base_p99 * (1 + max_regression):
+            regressions.append(f"{entry['name']}: p99 {p99:.2f}ms (baseline {base_p99:.2f}ms)")
+    return regressions
+
+
+def _int_list(value):
+    return [int(v) for v in value.split(",")]
+
+
+def _str_list(value):
+    return value.split(",")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", required=True, help="Path of the JSON results file to write")
+    parser.add_argument("--baseline", help="Results file to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed fractional regression")
+    parser.add_argument("--paths", type=_str_list, default=DEFAULT_PATHS)
+    parser.add_argument("--serializations", type=_str_list, default=DEFAULT_SERIALIZATIONS)
+    parser.add_argument("--methods", type=_str_list, default=DEFAULT_METHOD_KINDS)
+    parser.add_argument("--payload-sizes", type=_int_list, default=DEFAULT_PAYLOAD_SIZES)
+    parser.add_argument("--num-processes", type=_int_list, default=DEFAULT_NUM_PROCESSES)
+    parser.add_argument("--concurrency", type=_int_list, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--calls", type=int, default=200, help="Calls per case")
+    parser.add_argument("--warmup", type=int, default=20, help="Warmup calls per case")
+    args = parser.parse_args(argv)
+
+    # The service's module paths in metadata.dockerfile are relative to python_client
+    os.chdir(Path(__file__).parent.parent.parent)
+    document = run_benchmarks(
+        paths=args.paths,
+        serializations=args.serializations,
+        method_kinds=args.methods,
+        payload_sizes=args.payload_sizes,
+        num_processes_list=args.num_processes,
+        concurrency_list=args.concurrency,
+        calls=args.calls,
+        warmup=args.warmup,
+    )
+    Path(args.output).write_text(json.dumps(document, indent=2))
+    print(f"Wrote {len(document['results'])} results to {args.output}")
+
+    if args.baseline:
+        regressions = compare_results(document, json.loads(Path(args.baseline).read_text()), args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
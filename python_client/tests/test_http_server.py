@@ -4,6 +4,8 @@ import os
 os.environ["KT_LOG_STREAMING_ENABLED"] = "false"
 os.environ["KT_METRICS_ENABLED"] = "false"
 
+import json
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -86,6 +88,14 @@ def setup_test_env(request, reset_state_per_class):
     _update_metadata_env_vars(assets_dir, set=False)
 
 
+@pytest.fixture(scope="class")
+def allow_pickle_serialization():
+    """Allow pickle calls. Must be set before the server starts so the subprocesses inherit it."""
+    os.environ["KT_ALLOWED_SERIALIZATION"] = "json,pickle"
+    yield
+    os.environ.pop("KT_ALLOWED_SERIALIZATION", None)
+
+
 @pytest.fixture(scope="class")
 def http_client(setup_test_env):
     """Create a test client scoped to each test class.
@@ -255,6 +265,104 @@ class TestReloadBehavior:
         assert callable_name in http_server._CACHED_CALLABLES
 
 
+@pytest.mark.parametrize("setup_test_env", load_test_assets(["cached_model"]), indirect=True)
+class TestCachedStateReload:
+    """Test that attributes listed in __kt_cached_state__ survive a redeploy's process restart."""
+
+    def _info(self, http_client, deployed_as_of):
+        response = http_client.post(
+            "/CachedModel/info", json={"args": []}, headers={"X-Deployed-As-Of": deployed_as_of}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    @pytest.mark.level("unit")
+    def test_state_restored_in_new_process(self, http_client, setup_test_env):
+        first = self._info(http_client, datetime.now(timezone.utc).isoformat())
+        assert not first["restored"]
+
+        second = self._info(http_client, datetime.now(timezone.utc).isoformat())
+        assert second["pid"] != first["pid"]
+        assert second["restored"]
+        assert second["loaded_by"] == first["pid"]
+        assert second["size"] == first["size"]
+
+    @pytest.mark.level("unit")
+    def test_state_dropped_when_init_args_change(self, http_client, setup_test_env, monkeypatch):
+        self._info(http_client, datetime.now(timezone.utc).isoformat())
+
+        monkeypatch.setenv("KT_INIT_ARGS", "{}")
+        info = self._info(http_client, datetime.now(timezone.utc).isoformat())
+        assert not info["restored"]
+        assert info["loaded_by"] == info["pid"]
+
+    @pytest.mark.level("unit")
+    def test_save_checks_free_space_first(self, setup_test_env, monkeypatch):
+        import errno
+        import shutil
+        from collections import namedtuple
+
+        import numpy as np
+
+        class Model:
+            __kt_cached_state__ = ["weights", "shared"]
+
+        model = Model()
+        model.weights = {"a": np.zeros(1000, dtype=np.float32), "b": [bytearray(500)]}
+        model.shared = model.weights["a"]  # Counted once
+        assert http_server._estimated_nbytes({"weights": model.weights, "shared": model.shared}) == 4500
+
+        monkeypatch.setenv("KT_CLS_OR_FN_NAME", "Model")
+        monkeypatch.setitem(http_server._CACHED_CALLABLES, "Model", model)
+        usage = namedtuple("usage", "total used free")
+        monkeypatch.setattr(shutil, "disk_usage", lambda path: usage(4000, 0, 4000))
+        with pytest.raises(OSError) as exc_info:
+            http_server.save_cached_state()
+        assert exc_info.value.errno == errno.ENOSPC
+
+    @pytest.mark.level("unit")
+    def test_pool_keeps_processes_in_local_rank_order(self, setup_test_env):
+        from kubetorch.serving.process_pool import ProcessPool
+
+        class FakeProcess:
+            def __init__(self, local_rank, request_queue, cached_state_path=None, **kwargs):
+                self.local_rank = local_rank
+                self.request_queue = request_queue
+                self.cached_state_path = cached_state_path
+
+            def start(self):
+                # Higher ranks finish starting first
+                time.sleep(0.05 * (3 - self.local_rank))
+
+            def is_alive(self):
+                return True
+
+        pool = ProcessPool(
+            process_class=FakeProcess, num_processes=4, cached_state_paths={rank: f"/state/{rank}" for rank in range(4)}
+        )
+        pool.start()
+        try:
+            assert [process.local_rank for process in pool.processes] == [0, 1, 2, 3]
+            assert [process.cached_state_path for process in pool.processes] == [f"/state/{r}" for r in range(4)]
+            assert all(process.request_queue is q for process, q in zip(pool.processes, pool.request_queues))
+
+            # Each process answers on the shared response queue with a path naming its own rank
+            def answer(rank):
+                request = pool.request_queues[rank].get(timeout=5)
+                pool.response_queue.put({"request_unique_id": request["save_cached_state"], "result": f"/saved/{rank}"})
+
+            threads = [threading.Thread(target=answer, args=(rank,)) for rank in range(4)]
+            for thread in threads:
+                thread.start()
+            assert pool.save_cached_state(timeout=5) == {rank: f"/saved/{rank}" for rank in range(4)}
+            for thread in threads:
+                thread.join()
+        finally:
+            pool._running = False
+            pool.response_queue.put("STOP_ROUTER")
+            pool._router_thread.join(timeout=5)
+
+
 # ============ Distributed Execution Tests ============
 # These tests run distributed supervisors with local processes only (no remote workers).
 # This tests single-pod distributed scenarios (e.g., 1 pod with 4 GPUs = 4 local processes).
@@ -410,3 +518,1025 @@ class TestErrorHandling:
                 assert "pod_name" in error_json
                 break  # Just test one error case per method
             break  # Just test first method
+
+
+# ============ Dispatch Policy Tests ============
+
+
+class TestDispatchPolicy:
+    """Test routing of local calls across ProcessPool subprocesses."""
+
+    @pytest.mark.level("unit")
+    def test_least_outstanding_picks_idle_process(self):
+        from kubetorch.serving.dispatch_policy import get_dispatch_policy, InflightCounter
+
+        counter = InflightCounter(3)
+        policy = get_dispatch_policy("least_outstanding")
+
+        # Three concurrent calls should spread across all three processes
+        assert sorted(counter.acquire(policy) for _ in range(3)) == [0, 1, 2]
+        assert counter.snapshot() == [1, 1, 1]
+
+        counter.decrement(1)
+        assert counter.acquire(policy) == 1
+
+    @pytest.mark.level("unit")
+    def test_round_robin_cycles(self):
+        from kubetorch.serving.dispatch_policy import get_dispatch_policy
+
+        policy = get_dispatch_policy("round_robin")
+        assert [policy.select([5, 0, 0]) for _ in range(4)] == [0, 1, 2, 0]
+
+    @pytest.mark.level("unit")
+    def test_sticky_routes_same_key_to_same_process(self):
+        from kubetorch.serving.dispatch_policy import get_dispatch_policy
+
+        policy = get_dispatch_policy("sticky")
+        first = policy.select([0, 0, 0, 0], dispatch_key="session-a")
+        assert all(policy.select([9, 9, 9, 9], dispatch_key="session-a") == first for _ in range(5))
+
+    @pytest.mark.level("unit")
+    def test_unknown_policy_raises(self):
+        from kubetorch.serving.dispatch_policy import get_dispatch_policy
+
+        with pytest.raises(ValueError, match="Unknown dispatch policy"):
+            get_dispatch_policy("random")
+
+    @pytest.mark.level("unit")
+    def test_failed_dispatch_releases_inflight_count(self):
+        from kubetorch.serving.process_pool import ProcessPool
+        from kubetorch.serving.process_worker import ProcessWorker
+
+        pool = ProcessPool(process_class=ProcessWorker, num_processes=2)
+        # Fails before the call is sent (bad arguments), after the policy already counted it as in flight
+        with pytest.raises(TypeError):
+            pool.dispatch(params={}, unexpected=True)
+        assert pool.inflight_counts() == [0, 0]
+
+
+@pytest.fixture(scope="class")
+def sticky_dispatch_env(setup_test_env):
+    """Run a local supervisor with two subprocesses, configured for sticky dispatch through the env var."""
+    os.environ["KT_DISPATCH_POLICY"] = "sticky"
+    os.environ["KT_DISTRIBUTED_CONFIG"] = json.dumps({"distribution_type": "local", "num_processes": 2})
+    yield
+    os.environ.pop("KT_DISPATCH_POLICY", None)
+
+
+@pytest.mark.parametrize("setup_test_env", load_test_assets(["summer"]), indirect=True)
+@pytest.mark.usefixtures("sticky_dispatch_env")
+class TestDispatchPolicyConfig:
+    """Test setting the dispatch policy for a running server."""
+
+    @pytest.mark.level("unit")
+    def test_env_var_sets_policy_end_to_end(self, http_client, monkeypatch):
+        pool = http_server.SUPERVISOR.process_pool
+        assert len(pool) == 2 and pool.dispatch_policy.name == "sticky"
+
+        routed = []
+        call = pool.call
+
+        def record_call(idx, **kwargs):
+            routed.append((kwargs["params"]["args"][0], idx))
+            return call(idx=idx, **kwargs)
+
+        monkeypatch.setattr(pool, "call", record_call)
+        for key in ["session-a", "session-b"]:
+            for i in range(4):
+                response = http_client.post("/summer", json={"args": [i, 1]}, headers={"X-Dispatch-Key": key})
+                assert response.status_code == 200
+                assert response.json() == i + 1
+
+        # Every call with the same key landed on the same subprocess
+        assert len(set(idx for _, idx in routed[:4])) == 1 and len(set(idx for _, idx in routed[4:])) == 1
+        assert pool.inflight_counts() == [0, 0]
+
+
+# ============ Binary Pickle Transport Tests ============
+
+
+@pytest.mark.parametrize("setup_test_env", load_test_assets(["summer"]), indirect=True)
+@pytest.mark.usefixtures("allow_pickle_serialization")
+class TestBinaryPickleTransport:
+    """Test pickle calls sent as raw pickle-5 frames rather than base64-in-JSON."""
+
+    @pytest.mark.level("unit")
+    def test_pickle_frame_roundtrip_out_of_band(self, setup_test_env):
+        import numpy as np
+
+        from kubetorch.serving.utils import pack_pickle_frame, unpack_pickle_frame
+
+        arr = np.arange(1000, dtype=np.float32)
+        restored = unpack_pickle_frame(pack_pickle_frame({"args": [arr], "kwargs": {"scale": 2}}))
+        assert np.array_equal(restored["args"][0], arr)
+        assert restored["kwargs"] == {"scale": 2}
+        # Out-of-band buffers must come back writable
+        restored["args"][0][0] = 1.0
+
+    @pytest.mark.level("unit")
+    def test_binary_call(self, http_client, setup_test_env):
+        from kubetorch.serving.utils import _serialize_body, BINARY_CONTENT_TYPE, decode_binary_response
+
+        body = _serialize_body({"args": [1, 2], "kwargs": {}}, "pickle")
+        assert isinstance(body, bytes)
+
+        response = http_client.post(
+            "/summer",
+            content=body,
+            headers={"Content-Type": BINARY_CONTENT_TYPE, "X-Serialization": "pickle"},
+        )
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith(BINARY_CONTENT_TYPE)
+        assert decode_binary_response(response.content) == 3
+
+    @pytest.mark.level("unit")
+    def test_legacy_base64_call(self, http_client, setup_test_env):
+        import base64
+        import pickle
+
+        data = base64.b64encode(pickle.dumps({"args": [1, 2], "kwargs": {}})).decode("utf-8")
+        response = http_client.post("/summer", json={"data": data}, headers={"X-Serialization": "pickle"})
+        assert response.status_code == 200
+        assert pickle.loads(base64.b64decode(response.json()["data"])) == 3
+
+    @pytest.mark.level("unit")
+    def test_large_payload_through_shared_memory(self, http_client, setup_test_env):
+        from kubetorch.serving.shm_transport import DEFAULT_SHM_THRESHOLD_BYTES
+        from kubetorch.serving.utils import _serialize_body, BINARY_CONTENT_TYPE, decode_binary_response
+
+        # Both the argument and the result are above the shared memory threshold
+        a, b = b"a" * (2 * DEFAULT_SHM_THRESHOLD_BYTES), b"b" * 16
+        response = http_client.post(
+            "/summer",
+            content=_serialize_body({"args": [a, b], "kwargs": {}}, "pickle"),
+            headers={"Content-Type": BINARY_CONTENT_TYPE, "X-Serialization": "pickle"},
+        )
+        assert response.status_code == 200
+        assert decode_binary_response(response.content) == a + b
+
+    @pytest.mark.level("unit")
+    def test_shared_memory_segments_released(self, setup_test_env):
+        import uuid
+
+        from kubetorch.serving.shm_transport import (
+            from_shared_memory,
+            maybe_to_shared_memory,
+            release_request_segments,
+            segment_name,
+            SharedMemoryHandle,
+        )
+
+        request_unique_id = str(uuid.uuid4())
+        payload = b"x" * (2 * 1024 * 1024)
+
+        handle = maybe_to_shared_memory(payload, request_unique_id, "params")
+        assert isinstance(handle, SharedMemoryHandle)
+        assert from_shared_memory(handle) == payload
+        # Reading unlinks the segment
+        with pytest.raises(FileNotFoundError):
+            from_shared_memory(handle)
+
+        # Small payloads stay inline
+        assert maybe_to_shared_memory(b"small", request_unique_id, "params") == b"small"
+
+        # Unread segments are released by request id
+        maybe_to_shared_memory(payload, request_unique_id, "result")
+        release_request_segments(request_unique_id)
+        with pytest.raises(FileNotFoundError):
+            from_shared_memory(SharedMemoryHandle(segment_name(request_unique_id, "result"), len(payload)))
+
+
+# ============ Streaming Response Tests ============
+
+
+@pytest.mark.parametrize("setup_test_env", load_test_assets(["counter"]), indirect=True)
+@pytest.mark.usefixtures("allow_pickle_serialization")
+class TestStreamingResponses:
+    """Test generator callables streaming their items back as they're produced."""
+
+    @staticmethod
+    def _decode(response):
+        from kubetorch.serving.utils import StreamDecoder
+
+        decoder = StreamDecoder(response.headers["Content-Type"])
+        # Feed in small pieces to exercise records split across reads
+        records = []
+        for i in range(0, len(response.content), 7):
+            records.extend(decoder.feed(response.content[i : i + 7]))
+        decoder.finish()
+        return records
+
+    @pytest.mark.level("unit")
+    def test_generator_streams_ndjson(self, http_client, setup_test_env):
+        from kubetorch.serving.utils import NDJSON_CONTENT_TYPE
+
+        # More items than the stream window, so flow-control credits have to flow back
+        response = http_client.post("/Counter/count", json={"args": [50]})
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith(NDJSON_CONTENT_TYPE)
+        assert self._decode(response) == [(False, i) for i in range(50)]
+
+    @pytest.mark.level("unit")
+    def test_async_generator_streams(self, http_client, setup_test_env):
+        response = http_client.post("/Counter/acount", json={"args": [5]})
+        assert response.status_code == 200
+        assert self._decode(response) == [(False, i) for i in range(5)]
+
+    @pytest.mark.level("unit")
+    def test_pickle_stream(self, http_client, setup_test_env):
+        from kubetorch.serving.utils import _serialize_body, BINARY_CONTENT_TYPE, PICKLE_STREAM_CONTENT_TYPE
+
+        response = http_client.post(
+            "/Counter/count",
+            content=_serialize_body({"args": [20], "kwargs": {}}, "pickle"),
+            headers={"Content-Type": BINARY_CONTENT_TYPE, "X-Serialization": "pickle"},
+        )
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith(PICKLE_STREAM_CONTENT_TYPE)
+        assert self._decode(response) == [(False, i) for i in range(20)]
+
+    @pytest.mark.level("unit")
+    def test_error_mid_stream(self, http_client, setup_test_env):
+        response = http_client.post("/Counter/count", json={"args": [5], "kwargs": {"fail_at": 2}})
+        # Status was already sent with the first items; the error arrives as the final record
+        assert response.status_code == 200
+        records = self._decode(response)
+        assert records[:2] == [(False, 0), (False, 1)]
+        is_error, error = records[2]
+        assert is_error and error["error_type"] == "ValueError"
+        assert http_server.SUPERVISOR.process_pool.inflight_counts() == [0]
+
+
+# ============ Batched Call Tests ============
+
+
+@pytest.mark.parametrize("setup_test_env", load_test_assets(["summer"]), indirect=True)
+@pytest.mark.usefixtures("allow_pickle_serialization")
+class TestBatchedCalls:
+    """Test batched (map) calls fanned out across the ProcessPool."""
+
+    @pytest.mark.level("unit")
+    def test_json_batch_results_in_order(self, http_client, setup_test_env):
+        from kubetorch.serving.utils import _serialize_body
+
+        body = _serialize_body({"batch": [{"args": [i, i], "kwargs": {}} for i in range(20)]}, "json")
+        response = http_client.post("/summer", json=body)
+        assert response.status_code == 200
+        assert response.json() == [2 * i for i in range(20)]
+
+    @pytest.mark.level("unit")
+    def test_pickle_batch_results_in_order(self, http_client, setup_test_env):
+        from kubetorch.serving.utils import _serialize_body, BINARY_CONTENT_TYPE, decode_binary_response
+
+        body = _serialize_body({"batch": [{"args": [i, 1], "kwargs": {}} for i in range(10)]}, "pickle")
+        response = http_client.post(
+            "/summer",
+            content=body,
+            headers={"Content-Type": BINARY_CONTENT_TYPE, "X-Serialization": "pickle"},
+        )
+        assert response.status_code == 200
+        assert decode_binary_response(response.content) == [i + 1 for i in range(10)]
+
+    @pytest.mark.level("unit")
+    def test_batch_fails_on_first_error(self, http_client, setup_test_env):
+        body = {"batch": [{"args": [1, 2], "kwargs": {}}, {"args": ["a", 2], "kwargs": {}}]}
+        response = http_client.post("/summer", json=body)
+        assert response.status_code == 422
+        assert response.json()["error_type"] == "TypeError"
+
+    @pytest.mark.level("unit")
+    def test_failed_batch_cancels_pending_and_waits_for_running_calls(self, setup_test_env):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from kubetorch.serving.execution_supervisor import ExecutionSupervisor
+
+        finished = []
+
+        def call(i):
+            time.sleep(0.2)
+            finished.append(i)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = [executor.submit(call, i) for i in range(3)]
+            time.sleep(0.05)
+            ExecutionSupervisor._drain_batch(futures)
+            # The running call finished before the drain returned, and the queued ones never ran
+            assert finished == [0]
+            assert futures[1].cancelled() and futures[2].cancelled()
+
+    @pytest.mark.level("unit")
+    def test_batch_raises_first_error_when_later_calls_also_fail(self, setup_test_env):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from kubetorch.serving.execution_supervisor import ExecutionSupervisor
+
+        def call(i):
+            time.sleep(0.1 * i)
+            raise ValueError(f"call {i} failed")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(call, i) for i in range(3)]
+            with pytest.raises(ValueError, match="call 0 failed"):
+                try:
+                    futures[0].result()
+                finally:
+                    ExecutionSupervisor._drain_batch(futures[1:])
+
+
+# ============ Micro-Batching Tests ============
+
+
+class TestMicroBatcher:
+    """Test collecting concurrent calls into batches."""
+
+    @pytest.mark.level("unit")
+    def test_concurrent_calls_share_a_batch(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from kubetorch.serving.batching import MicroBatcher
+
+        batch_sizes = []
+
+        def double(inputs):
+            batch_sizes.append(len(inputs))
+            return [x * 2 for x in inputs]
+
+        batcher = MicroBatcher("double", max_batch_size=4, max_wait_ms=500)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda x: batcher.submit(double, x), range(8)))
+
+        assert results == [2 * i for i in range(8)]
+        # A full batch runs without waiting out max_wait_ms
+        assert batch_sizes == [4, 4]
+
+    @pytest.mark.level("unit")
+    def test_batch_size_clamped_to_worker_threads(self, monkeypatch):
+        from kubetorch.serving import batching
+
+        monkeypatch.setenv("KT_MAX_THREADS_PER_PROC", "10")
+        monkeypatch.setattr(batching, "_batchers", {})
+        config = {"max_batch_size": 32, "max_wait_ms": 10.0}
+        batcher = batching.get_batcher("predict", config)
+        assert batcher.max_batch_size == 10
+        # The same requested config reuses the batcher rather than rebuilding it
+        assert batching.get_batcher("predict", dict(config)) is batcher
+        assert batching.get_batcher("small", {"max_batch_size": 4, "max_wait_ms": 10.0}).max_batch_size == 4
+
+    @pytest.mark.level("unit")
+    def test_batch_error_raised_for_every_call(self):
+        from kubetorch.serving.batching import MicroBatcher
+
+        def fail(inputs):
+            raise RuntimeError("boom")
+
+        batcher = MicroBatcher("fail", max_batch_size=2, max_wait_ms=0)
+        with pytest.raises(RuntimeError, match="boom"):
+            batcher.submit(fail, 1)
+
+    @pytest.mark.level("unit")
+    def test_invalid_config_rejected(self):
+        import kubetorch as kt
+
+        with pytest.raises(ValueError):
+            kt.batched(max_batch_size=0)
+
+
+@pytest.mark.parametrize("setup_test_env", load_test_assets(["batched_model"]), indirect=True)
+class TestBatchedMethods:
+    """Test methods decorated with kt.batched served over HTTP."""
+
+    @pytest.mark.level("unit")
+    def test_concurrent_requests_are_batched(self, http_client, setup_test_env):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def call(x):
+            return http_client.post("/Doubler/double", json={"args": [x]}).json()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(call, range(8)))
+
+        assert results == [2 * i for i in range(8)]
+        assert http_client.post("/Doubler/largest_batch", json={}).json() > 1
+
+    @pytest.mark.level("unit")
+    def test_result_count_mismatch_is_an_error(self, http_client, setup_test_env):
+        response = http_client.post("/Doubler/mismatched", json={"args": [1]})
+        assert response.status_code == 400
+        assert response.json()["error_type"] == "ValueError"
+
+    @pytest.mark.level("unit")
+    def test_multiple_args_rejected(self, http_client, setup_test_env):
+        response = http_client.post("/Doubler/double", json={"args": [1, 2]})
+        assert response.status_code == 422
+        assert response.json()["error_type"] == "TypeError"
+
+
+# ============ Remote Worker Pool Tests ============
+
+
+class TestRemoteWorkerPool:
+    """Test fan-out calls from RemoteWorkerPool to worker pods."""
+
+    @pytest.fixture
+    def fake_worker(self, monkeypatch):
+        """A stand-in worker pod that answers /health and calls, counting health checks."""
+        import json
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        health_checks = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                health_checks.append(self.path)
+                self._reply({"status": "healthy"})
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self._reply("ok")
+
+            def _reply(self, body):
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        monkeypatch.setenv("KT_SERVER_PORT", str(server.server_address[1]))
+        yield health_checks
+        server.shutdown()
+
+    @pytest.mark.level("unit")
+    def test_health_checked_once_until_invalidated(self, fake_worker):
+        from kubetorch.serving.remote_worker_pool import RemoteWorkerPool
+
+        pool = RemoteWorkerPool(quorum_timeout=5)
+        pool.start(max_workers=10)
+        try:
+
+            def call():
+                return pool.call_workers(["127.0.0.1"], "summer", None, {"args": [1, 2]}, {})
+
+            assert call() == ["ok"]
+            assert call() == ["ok"]
+            assert len(fake_worker) == 1
+
+            pool.invalidate_health(["127.0.0.1"])
+            assert call() == ["ok"]
+            assert len(fake_worker) == 2
+        finally:
+            pool.stop()
+
+    @pytest.mark.level("unit")
+    def test_ready_mode_does_not_skip_workers_of_sharded_call(self, fake_worker):
+        from kubetorch.serving.remote_worker_pool import RemoteWorkerPool
+
+        pool = RemoteWorkerPool(quorum_timeout=5)
+        pool.start(max_workers=10)
+        try:
+            # Nothing listens on 127.0.0.2, so it fails its health check
+            worker_ips = ["127.0.0.1", "127.0.0.2"]
+            params = {"args": [None], "shards": {"args": [0], "kwargs": []}}
+            assert pool.call_workers(worker_ips, "summer", None, params, {}, workers_arg="ready") == ["ok"]
+
+            worker_params = {ip: {**params, "shard_ranks": [rank]} for rank, ip in enumerate(worker_ips)}
+            with pytest.raises(ValueError, match="leaves out 1 of them"):
+                pool.call_workers(
+                    worker_ips, "summer", None, params, {}, workers_arg="ready", worker_params=worker_params
+                )
+        finally:
+            pool.stop()
+
+
+# ============ Argument Sharding Tests ============
+
+
+class TestSharding:
+    """Test splitting kt.distributed.shard() args by global rank through the SPMD tree."""
+
+    @staticmethod
+    def _call_body(serialization):
+        import kubetorch as kt
+        from kubetorch.serving.utils import _serialize_body, unpack_call_body
+
+        body = _serialize_body(
+            {"args": [kt.distributed.shard(list(range(10))), "scale"], "kwargs": {"y": kt.distributed.shard("abcd")}},
+            serialization,
+        )
+        return unpack_call_body(body) if serialization == "pickle" else body
+
+    @pytest.mark.level("unit")
+    @pytest.mark.parametrize("serialization", ["json", "pickle"])
+    def test_each_rank_gets_its_slice(self, serialization):
+        from kubetorch.serving.sharding import (
+            node_ranks,
+            rank_params,
+            select_shard_ranks,
+            split_shards,
+            take_rank_shard,
+        )
+
+        # 2 pods x 2 processes: the coordinator forwards pod 1 only ranks 2 and 3
+        params = split_shards(self._call_body(serialization), world_size=4, procs_per_node=2)
+        forwarded = select_shard_ranks(params, node_ranks(1, 2))
+        assert forwarded["shard_ranks"] == [2, 3]
+
+        binary = serialization == "pickle"
+        calls = [take_rank_shard(rank_params(params, rank), binary) for rank in node_ranks(0, 2)]
+        calls += [take_rank_shard(rank_params(forwarded, rank), binary) for rank in node_ranks(1, 2)]
+        assert [call["args"] for call in calls] == [
+            [[0, 1, 2], "scale"],
+            [[3, 4, 5], "scale"],
+            [[6, 7], "scale"],
+            [[8, 9], "scale"],
+        ]
+        assert [call["kwargs"]["y"] for call in calls] == ["a", "b", "c", "d"]
+
+    @pytest.mark.level("unit")
+    def test_missing_rank_rejected(self):
+        from kubetorch.serving.sharding import rank_params, select_shard_ranks, split_shards
+
+        params = select_shard_ranks(split_shards(self._call_body("json"), 4, 2), [0, 1])
+        with pytest.raises(ValueError):
+            rank_params(params, 2)
+
+    @pytest.mark.level("unit")
+    def test_sharded_call_on_subset_of_workers_rejected(self):
+        from kubetorch.serving.sharding import check_all_workers_selected
+
+        worker_ips = ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+        check_all_workers_selected(worker_ips, set(worker_ips), "ready")
+        with pytest.raises(ValueError, match="leaves out 1 of them"):
+            check_all_workers_selected(worker_ips, ["10.0.0.1", "10.0.0.3"], [0, 2])
+
+
+@pytest.mark.parametrize("setup_test_env", load_test_assets(["summer"]), indirect=True)
+class TestShardedLocalCall:
+    """A sharded call to a non-distributed service receives the whole value."""
+
+    @pytest.mark.level("unit")
+    def test_unsplit_shard_passed_whole(self, http_client, setup_test_env):
+        import kubetorch as kt
+        from kubetorch.serving.utils import _serialize_body
+
+        body = _serialize_body({"args": [kt.distributed.shard([1, 2]), [3]], "kwargs": {}}, "json")
+        response = http_client.post("/summer", json=body)
+        assert response.status_code == 200
+        assert response.json() == [1, 2, 3]
+
+
+# ============ Tree Reduction Tests ============
+
+
+def _max_of(results):
+    """Module-level so it can be sent as a kt_reduce import path."""
+    return max(results)
+
+
+@pytest.fixture(scope="class")
+def reduce_pool():
+    from kubetorch.serving.process_pool import ProcessPool
+    from kubetorch.serving.process_worker import ProcessWorker
+
+    # Pods resolve reduce callables from the user's code, which the subprocess finds through KT_FILE_PATH
+    file_path = os.environ.get("KT_FILE_PATH")
+    os.environ["KT_FILE_PATH"] = str(Path(__file__).parent)
+    pool = ProcessPool(process_class=ProcessWorker, num_processes=1)
+    pool.start()
+    yield pool
+    pool.stop()
+    if file_path is None:
+        os.environ.pop("KT_FILE_PATH", None)
+    else:
+        os.environ["KT_FILE_PATH"] = file_path
+
+
+class TestTreeReduction:
+    """Test reducing SPMD results at each level of the tree."""
+
+    @pytest.fixture(autouse=True)
+    def _supervisor(self, reduce_pool):
+        from kubetorch.serving.spmd.spmd_supervisor import SPMDDistributedSupervisor
+
+        self.supervisor = SPMDDistributedSupervisor.__new__(SPMDDistributedSupervisor)
+        self.supervisor.process_pool = reduce_pool
+
+    def _reduce_tree(self, reduce, rank_results, serialization="json"):
+        """Reduce through a root with 2 local ranks and one child node with 2 local ranks."""
+        from kubetorch.serving.utils import pack_pickle_frame
+
+        if serialization == "pickle":
+            rank_results = [pack_pickle_frame(result) for result in rank_results]
+        reduce_responses = self.supervisor._reduce_responses
+        child = reduce_responses(reduce, rank_results[2:], [], serialization, is_root=False)
+        assert len(child) == 1
+        return reduce_responses(reduce, rank_results[:2], child, serialization, is_root=True)
+
+    @pytest.mark.level("unit")
+    def test_sum_and_mean_of_metric_dicts(self):
+        results = [{"loss": float(i), "steps": 10} for i in range(4)]
+        assert self._reduce_tree("sum", results) == {"loss": 6.0, "steps": 40}
+        assert self._reduce_tree("mean", results) == {"loss": 1.5, "steps": 10.0}
+
+    @pytest.mark.level("unit")
+    def test_concat_pickle(self):
+        from kubetorch.serving.utils import unpack_pickle_frame
+
+        result = self._reduce_tree("concat", [[0, 1], [2], [3], [4, 5]], serialization="pickle")
+        assert unpack_pickle_frame(result) == [0, 1, 2, 3, 4, 5]
+
+    @pytest.mark.level("unit")
+    def test_callable_sent_as_import_path(self):
+        from kubetorch.serving.reduction import reduce_arg
+
+        reduce = reduce_arg(_max_of)
+        assert reduce == f"{__name__}:_max_of"
+        assert self._reduce_tree(reduce, [3, 9, 1, 4]) == 9
+
+        with pytest.raises(ValueError):
+            reduce_arg(lambda results: results[0])
+        with pytest.raises(ValueError):
+            reduce_arg("median")
+
+    @pytest.mark.level("unit")
+    def test_reduction_error_is_packaged(self):
+        from starlette.responses import JSONResponse
+
+        result = self.supervisor._reduce_responses("sum", [1, "a"], [], "json", is_root=True)
+        assert isinstance(result, JSONResponse)
+        assert json.loads(result.body)["error_type"] == "TypeError"
+
+    @pytest.mark.level("unit")
+    def test_user_reduce_kwarg_passes_through(self):
+        from kubetorch.serving.utils import _serialize_body
+
+        body = _serialize_body({"args": [], "kwargs": {"reduce": "mean", "kt_reduce": "sum"}}, "json")
+        assert body["kwargs"] == {"reduce": "mean"}
+        assert body["reduce"] == "sum"
+
+
+# ============ Log Shipping Tests ============
+
+
+@pytest.fixture
+def log_capture_factory():
+    """Build unstarted LogCaptures whose pushes go to an in-memory fake log store."""
+    import httpx
+
+    from kubetorch.serving.log_capture import LogCapture
+
+    captures = []
+
+    def make(handler, **kwargs):
+        capture = LogCapture(log_store_url="http://log-store", **kwargs)
+        capture._session = httpx.Client(transport=httpx.MockTransport(handler))
+        captures.append(capture)
+        return capture
+
+    yield make
+    for capture in captures:
+        capture._session.close()
+
+
+class TestLogShipping:
+    """Test the bounded, batched log shipping pipeline in LogCapture."""
+
+    @pytest.mark.level("unit")
+    def test_push_is_gzipped(self, log_capture_factory):
+        import gzip
+
+        import httpx
+
+        pushes = []
+
+        def handler(request):
+            assert request.headers["Content-Encoding"] == "gzip"
+            pushes.append(json.loads(gzip.decompress(request.content)))
+            return httpx.Response(204)
+
+        capture = log_capture_factory(handler, labels={"service": "test"})
+        capture.add_log("hello", request_id="abc")
+        capture.add_log("world", request_id="abc")
+        capture.flush()
+
+        assert len(pushes) == 1
+        (stream,) = pushes[0]["streams"]
+        assert stream["stream"] == {"service": "test", "level": "INFO", "request_id": "abc"}
+        assert [json.loads(value[1])["message"] for value in stream["values"]] == ["hello", "world"]
+        assert capture.stats() == {"queued": 0, "pushed": 2, "dropped_overflow": 0, "dropped_push_failed": 0}
+
+    @pytest.mark.level("unit")
+    @pytest.mark.parametrize("policy,kept", [("drop_oldest", ["2", "3"]), ("drop_newest", ["0", "1"])])
+    def test_buffer_is_bounded(self, log_capture_factory, policy, kept):
+        import gzip
+
+        import httpx
+
+        pushes = []
+
+        def handler(request):
+            pushes.append(json.loads(gzip.decompress(request.content)))
+            return httpx.Response(204)
+
+        capture = log_capture_factory(handler, max_buffered_lines=2, overflow_policy=policy)
+        for i in range(4):
+            capture.add_log(str(i))
+        assert capture.stats()["queued"] == 2
+        assert capture.stats()["dropped_overflow"] == 2
+
+        capture.flush()
+        (stream,) = pushes[0]["streams"]
+        assert [json.loads(value[1])["message"] for value in stream["values"]] == kept
+
+    @pytest.mark.level("unit")
+    def test_push_retried_with_backoff(self, log_capture_factory):
+        import httpx
+
+        responses = [httpx.Response(503), httpx.Response(429), httpx.Response(204)]
+        capture = log_capture_factory(lambda request: responses.pop(0), retry_backoff=0.01)
+        capture.add_log("eventually")
+        capture.flush()
+        assert not responses
+        assert capture.stats()["pushed"] == 1
+
+    @pytest.mark.level("unit")
+    def test_rejected_batch_dropped_without_retry(self, log_capture_factory):
+        import httpx
+
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(400, text="entry out of order")
+
+        capture = log_capture_factory(handler, retry_backoff=0.01)
+        capture.add_log("rejected")
+        capture.flush()
+        assert len(attempts) == 1
+        assert capture.stats()["dropped_push_failed"] == 1
+
+    @pytest.mark.level("unit")
+    def test_subprocess_logs_sent_in_batches(self, log_capture_factory):
+        import gzip
+
+        import httpx
+
+        from kubetorch.serving.log_capture import LogCapture
+
+        pushes = []
+
+        def handler(request):
+            pushes.append(json.loads(gzip.decompress(request.content)))
+            return httpx.Response(204)
+
+        main = log_capture_factory(handler, labels={"service": "test"})
+        worker = LogCapture(output_pipe=main.new_subprocess_pipe())
+        for i in range(5):
+            worker.add_log(f"line {i}", request_id="abc", extra_labels={"rank": "0"})
+        worker.flush()
+
+        # The main process keeps the subprocess's timestamps and adds its own labels
+        main._subprocess_collector_thread = threading.Thread(target=main._collect_subprocess_logs, daemon=True)
+        main._subprocess_collector_thread.start()
+        deadline = time.time() + 5
+        while main.stats()["queued"] < 5 and time.time() < deadline:
+            time.sleep(0.01)
+        main._stop_event.set()
+        batch = list(main._buffer)
+        main.flush()
+
+        (stream,) = pushes[0]["streams"]
+        assert stream["stream"] == {"service": "test", "rank": "0", "level": "INFO", "request_id": "abc"}
+        assert [json.loads(value[1])["message"] for value in stream["values"]] == [f"line {i}" for i in range(5)]
+        assert [value[0] for value in stream["values"]] == [str(entry["timestamp"]) for entry in batch]
+
+    @pytest.mark.level("unit")
+    def test_subprocess_killed_mid_write_drops_only_its_pipe(self, log_capture_factory):
+        import httpx
+
+        from kubetorch.serving.log_capture import LogCapture
+
+        main = log_capture_factory(lambda request: httpx.Response(204))
+        main._subprocess_collector_thread = threading.Thread(target=main._collect_subprocess_logs, daemon=True)
+        main._subprocess_collector_thread.start()
+        killed = main.new_subprocess_pipe()
+        survivor = LogCapture(output_pipe=main.new_subprocess_pipe())
+
+        # A message header promising more bytes than were written before the writer went away
+        os.write(killed.fileno(), (1000).to_bytes(4, "big") + b"partial")
+        killed.close()
+
+        deadline = time.time() + 5
+        while len(main._subprocess_pipes) > 1 and time.time() < deadline:
+            time.sleep(0.01)
+        assert len(main._subprocess_pipes) == 1
+
+        survivor.add_log("still collected")
+        survivor.flush()
+        while main.stats()["queued"] < 1 and time.time() < deadline:
+            time.sleep(0.01)
+        main._stop_event.set()
+        assert [entry["message"] for entry in main._buffer] == ["still collected"]
+
+    @pytest.mark.level("unit")
+    def test_batch_size_triggers_flush(self, log_capture_factory):
+        import httpx
+
+        capture = log_capture_factory(lambda request: httpx.Response(204), batch_size=3)
+        capture.add_log("a")
+        capture.add_log("b")
+        assert not capture._flush_requested.is_set()
+        capture.add_log("c")
+        assert capture._flush_requested.is_set()
+
+
+# ============ Client Log Tail Tests ============
+
+
+class TestServiceLogTail:
+    """Test that concurrent calls share one Loki tail per service, each receiving only its own request's lines."""
+
+    @pytest.mark.level("unit")
+    def test_shared_tail_demultiplexes_by_request_id(self):
+        import asyncio
+
+        import websockets
+
+        from kubetorch.serving.http_client import ServiceLogTail
+
+        def message(*request_ids):
+            return json.dumps(
+                {
+                    "streams": [
+                        {"stream": {"service": "svc", "request_id": rid}, "values": [[str(time.time_ns()), rid]]}
+                        for rid in request_ids
+                    ]
+                }
+            )
+
+        async def run():
+            paths = []
+            outgoing = asyncio.Queue()
+
+            async def loki(websocket):
+                async def forward():
+                    while True:
+                        await websocket.send(await outgoing.get())
+
+                paths.append(websocket.request.path)
+                sender = asyncio.create_task(forward())
+                await websocket.wait_closed()
+                sender.cancel()
+
+            async with websockets.serve(loki, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                tail = ServiceLogTail("127.0.0.1", port, "default", "svc", idle_timeout=0.2)
+
+                sub_a = tail.subscribe("a")
+                while not paths:
+                    await asyncio.sleep(0.01)
+                # "b" logs before it subscribes, and "c" never does
+                await outgoing.put(message("a", "b", "c"))
+                assert (await sub_a.get(timeout=5))[1][0][1] == "a"
+
+                sub_b = tail.subscribe("b")
+                assert (await sub_b.get(timeout=5))[1][0][1] == "b"
+
+                await outgoing.put(message("b", "a"))
+                assert (await sub_a.get(timeout=5))[1][0][1] == "a"
+                assert (await sub_b.get(timeout=5))[1][0][1] == "b"
+                with pytest.raises(asyncio.TimeoutError):
+                    await sub_a.get(timeout=0.1)
+
+                # One tail on the service's labels, not one per request
+                assert tail.connections == 1
+                assert "request_id" not in paths[0]
+
+                sub_a.close()
+                assert tail.running
+                sub_b.close()
+                deadline = time.time() + 5
+                while tail.running and time.time() < deadline:
+                    await asyncio.sleep(0.05)
+                assert not tail.running
+
+        asyncio.run(run())
+
+
+class TestServiceMetricsPoller:
+    """Test that concurrent calls share one Prometheus poll per round, with the pod list cached."""
+
+    @pytest.mark.level("unit")
+    def test_poll_fans_out_to_all_calls(self):
+        import asyncio
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import parse_qs, urlparse
+
+        from kubetorch.serving.http_client import ServiceMetricsPoller
+
+        queries = []
+
+        class Prometheus(BaseHTTPRequestHandler):
+            def do_GET(self):
+                queries.append(parse_qs(urlparse(self.path).query)["query"][0])
+                result = [
+                    {"metric": {"pod": "svc-0", "kt_metric": "CPU"}, "value": [0, "0.5"]},
+                    {"metric": {"pod": "svc-0", "kt_metric": "Mem"}, "value": [0, "128"]},
+                ]
+                body = json.dumps({"status": "success", "data": {"result": result}}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        class Compute:
+            namespace = "default"
+            service_name = "svc"
+            listings = 0
+
+            def pod_names(self):
+                Compute.listings += 1
+                return ["svc-0"]
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Prometheus)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        prom_url = f"http://127.0.0.1:{server.server_address[1]}/prometheus/api/v1/query"
+
+        async def run():
+            poller = ServiceMetricsPoller(Compute(), prom_url, scope="pod")
+            subscriptions = [poller.subscribe(interval=1) for _ in range(8)]
+            for _ in range(2):
+                for subscription in subscriptions:
+                    assert await subscription.get(timeout=10) == {"svc-0": {"CPU": 0.5, "Mem": 128.0}}
+
+            # One batched query per round for all eight calls, and one pod listing
+            assert poller.polls == len(queries) <= 3
+            assert "kt_metric" in queries[0] and " or " in queries[0]
+            assert Compute.listings == 1
+
+            for subscription in subscriptions:
+                subscription.close()
+            deadline = time.time() + 5
+            while poller.running and time.time() < deadline:
+                await asyncio.sleep(0.05)
+            assert not poller.running
+
+        try:
+            asyncio.run(run())
+        finally:
+            server.shutdown()
+
+    @pytest.mark.level("unit")
+    def test_poll_gap_grows_with_calls_in_flight(self):
+        from kubetorch.serving.http_client import ServiceMetricsPoller
+
+        poller = ServiceMetricsPoller(compute=None, prom_url="", scope="resource")
+        poller._subscriptions = set(range(8))
+        assert poller._min_poll_gap() == 0.5
+        poller._subscriptions = set(range(320))
+        assert poller._min_poll_gap() == 20
+        poller._subscriptions = set(range(10000))
+        assert poller._min_poll_gap() == ServiceMetricsPoller.MAX_POLL_INTERVAL
+
+
+# ============ Benchmark Harness Tests ============
+
+
+class TestServingBenchmark:
+    """Smoke test the local serving benchmark, so the harness keeps working as the call path changes."""
+
+    @pytest.mark.level("unit")
+    def test_benchmark_writes_results(self, reset_state_per_class):
+        from tests.benchmarks.serving_benchmark import compare_results, run_benchmarks
+
+        document = run_benchmarks(
+            payload_sizes=[64],
+            num_processes_list=[1],
+            concurrency_list=[2],
+            calls=10,
+            warmup=2,
+            log=lambda line: None,
+        )
+        # paths x serializations x methods
+        assert len(document["results"]) == 8
+        for entry in document["results"]:
+            assert entry["errors"] == 0
+            assert entry["calls_per_sec"] > 0
+            assert entry["latency_ms"]["p50"] <= entry["latency_ms"]["p99"]
+
+        assert compare_results(document, document) == []
+        slower = json.loads(json.dumps(document))
+        slower["results"][0]["calls_per_sec"] /= 2
+        assert compare_results(slower, document) == [
+            f"{slower['results'][0]['name']}: {slower['results'][0]['calls_per_sec']:.0f} calls/s "
+            f"(baseline {document['results'][0]['calls_per_sec']:.0f})"
+        ]
@@ -0,0 +1,177 @@
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from kubetorch.provisioning.port_forward_broker import (
+    is_broker_running,
+    PortForwardBroker,
+    request_port_forward,
+    send_request,
+)
+
+# Stands in for `kubectl port-forward svc/<name> <local>:<remote> ...` by listening on the local port
+FAKE_KUBECTL = """#!/usr/bin/env python3
+import socket
+import sys
+
+local_port = int(sys.argv[3].split(":")[0])
+server = socket.socket()
+server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+server.bind(("127.0.0.1", local_port))
+server.listen()
+while True:
+    server.accept()[0].close()
+"""
+
+
+def _wait_for(condition, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.fixture
+def fake_kubectl(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    kubectl = bin_dir / "kubectl"
+    kubectl.write_text(FAKE_KUBECTL)
+    kubectl.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("KUBECONFIG", str(tmp_path / "kubeconfig"))
+    return tmp_path
+
+
+@pytest.fixture
+def broker(fake_kubectl):
+    socket_path = fake_kubectl / "broker.sock"
+    broker = PortForwardBroker(socket_path=socket_path, idle_timeout=60)
+    thread = threading.Thread(target=broker.serve, daemon=True)
+    thread.start()
+    assert _wait_for(lambda: is_broker_running(socket_path))
+
+    yield broker
+
+    send_request({"action": "shutdown"}, socket_path)
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+
+
+@pytest.mark.level("unit")
+def test_broker_shares_port_forwards(broker):
+    socket_path = broker.socket_path
+    port = request_port_forward("svc", "default", 80, socket_path=socket_path)
+    assert request_port_forward("svc", "default", 80, socket_path=socket_path) == port
+    assert len(broker.port_forwards) == 1
+
+    other_port = request_port_forward("svc", "default", 81, socket_path=socket_path)
+    assert other_port != port
+
+    listed = send_request({"action": "list"}, socket_path)["port_forwards"]
+    assert sorted((pf["remote_port"], pf["port"], pf["alive"]) for pf in listed) == [
+        (80, port, True),
+        (81, other_port, True),
+    ]
+
+
+@pytest.mark.level("unit")
+def test_kubectl_runs_with_client_env(broker, monkeypatch):
+    # The broker's own credentials (here, the test process's) must not reach another client's kubectl
+    monkeypatch.setenv("AWS_PROFILE", "broker")
+    port = request_port_forward("svc", "default", 80, socket_path=broker.socket_path)
+
+    request = {
+        "action": "ensure",
+        "service_name": "svc",
+        "namespace": "default",
+        "remote_port": 80,
+        "kubeconfig": os.environ["KUBECONFIG"],
+        "env": {"PATH": os.environ["PATH"], "GOOGLE_APPLICATION_CREDENTIALS": "/other/key.json"},
+    }
+    other = send_request(request, broker.socket_path)
+    assert other["status"] == "ok"
+    assert other["port"] != port
+    assert len(broker.port_forwards) == 2
+
+    def kubectl_env(local_port):
+        (pf,) = [pf for pf in broker.port_forwards.values() if pf.port == local_port]
+        with open(f"/proc/{pf.process.pid}/environ", "rb") as f:
+            return dict(item.decode().split("=", 1) for item in f.read().split(b"\0") if item)
+
+    assert kubectl_env(port)["AWS_PROFILE"] == "broker"
+    env = kubectl_env(other["port"])
+    assert "AWS_PROFILE" not in env
+    assert env["GOOGLE_APPLICATION_CREDENTIALS"] == "/other/key.json"
+
+
+@pytest.mark.level("unit")
+def test_broker_restarts_exited_port_forward(broker):
+    port = request_port_forward("svc", "default", 80, socket_path=broker.socket_path)
+    (pf,) = broker.port_forwards.values()
+    process = pf.process
+
+    os.kill(process.pid, signal.SIGKILL)
+    assert _wait_for(lambda: pf.process is not process and pf.alive())
+    # Restarted on the same local port, so clients holding it keep working
+    assert pf.port == port
+    assert request_port_forward("svc", "default", 80, socket_path=broker.socket_path) == port
+
+
+@pytest.mark.level("unit")
+def test_single_broker_per_socket(broker):
+    # A second broker on the same socket exits right away rather than replacing the running one
+    second = PortForwardBroker(socket_path=broker.socket_path)
+    second.serve()
+    assert is_broker_running(broker.socket_path)
+
+
+@pytest.mark.level("unit")
+def test_broker_started_on_demand(fake_kubectl):
+    socket_path = fake_kubectl / "broker.sock"
+    assert not is_broker_running(socket_path)
+    try:
+        port = request_port_forward("svc", "default", 80, socket_path=socket_path)
+        assert is_broker_running(socket_path)
+        assert request_port_forward("svc", "default", 80, socket_path=socket_path) == port
+    finally:
+        send_request({"action": "shutdown"}, socket_path)
+    assert _wait_for(lambda: not socket_path.exists())
+
+
+@pytest.mark.level("unit")
+def test_cached_port_dropped_when_broker_restarts(fake_kubectl, monkeypatch):
+    from kubetorch import globals
+
+    socket_path = fake_kubectl / "broker.sock"
+    monkeypatch.setenv("KT_PORT_FORWARD_BROKER_SOCKET", str(socket_path))
+
+    def start_broker():
+        thread = threading.Thread(target=PortForwardBroker(socket_path=socket_path, idle_timeout=60).serve, daemon=True)
+        thread.start()
+        assert _wait_for(lambda: is_broker_running(socket_path))
+        return thread
+
+    thread = start_broker()
+    try:
+        handle = globals._brokered_pf("svc", "default", 80, health_endpoint=None, previous=None)
+        assert handle.is_alive()
+
+        send_request({"action": "shutdown"}, socket_path)
+        thread.join(timeout=10)
+        # Without a broker the port is gone, and a new broker may hand out another one
+        assert not handle.is_alive()
+        thread = start_broker()
+        assert not handle.is_alive()
+
+        renewed = globals._brokered_pf("svc", "default", 80, health_endpoint=None, previous=handle)
+        assert renewed.is_alive()
+    finally:
+        send_request({"action": "shutdown"}, socket_path)
+        thread.join(timeout=10)
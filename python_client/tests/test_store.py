@@ -12,6 +12,7 @@ These tests verify:
 - Metadata server integration
 """
 
+import subprocess
 import tempfile
 from pathlib import Path
 
@@ -552,3 +553,853 @@ async def test_store_file_renaming(store_helper):
 
         assert (download_dir / "new_name.txt").exists(), "File should be renamed"
         assert not (download_dir / "original_name.txt").exists(), "Original name should not exist"
+
+
+# ==================== Metadata Client ====================
+
+
+@pytest.fixture
+def fake_metadata_server():
+    """A stand-in metadata server answering source lookups, recording the client port of each request."""
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import unquote
+
+    client_ports = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            client_ports.append(self.client_address[1])
+            key = unquote(self.path.split("/api/v1/keys/")[1].split("/source")[0])
+            body = {"found": False} if key.startswith("missing") else {"ip": f"10.0.0.{len(key)}"}
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", client_ports
+    server.shutdown()
+
+
+def _metadata_client(url):
+    from kubetorch.data_store.metadata_client import MetadataClient
+
+    client = MetadataClient(namespace="default")
+    client._base_url = url
+    return client
+
+
+@pytest.mark.level("unit")
+def test_metadata_client_reuses_connection(fake_metadata_server):
+    url, client_ports = fake_metadata_server
+    client = _metadata_client(url)
+
+    for key in ["a", "bb", "ccc"]:
+        assert client.get_source_ip(key) == f"10.0.0.{len(key)}"
+    assert len(set(client_ports)) == 1
+    client.close()
+
+
+@pytest.mark.level("unit")
+def test_metadata_client_bulk_lookups(fake_metadata_server):
+    import asyncio
+
+    url, client_ports = fake_metadata_server
+    client = _metadata_client(url)
+    keys = [f"svc/key-{i}" for i in range(20)] + ["missing/key"]
+    expected = {key: None if key.startswith("missing") else f"10.0.0.{len(key)}" for key in keys}
+
+    assert client.get_source_ips(keys) == expected
+
+    async def lookup_twice():
+        assert await client.get_source_ips_async(keys) == expected
+        session, ports = client.async_session, set(client_ports)
+        assert await client.get_source_ips_async(keys) == expected
+        # The second lookup ran over the first one's client and connections
+        assert client.async_session is session
+        assert set(client_ports) == ports
+        await client.aclose()
+
+    asyncio.run(lookup_twice())
+
+
+@pytest.mark.level("unit")
+def test_multi_key_get_resolves_sources_in_batches(monkeypatch):
+    from kubetorch.data_store import data_store_client
+    from kubetorch.data_store.data_store_client import _SourceResolver, DataStoreClient
+
+    class FakeMetadataClient:
+        def __init__(self):
+            self.batches = []
+            self.completed = []
+
+        def get_source_ips(self, keys, external=False):
+            self.batches.append(list(keys))
+            return {key: f"10.0.0.{key[-1]}" for key in keys}
+
+        def has_store_pods(self, keys):
+            return {key: True for key in keys}
+
+        def complete_request(self, key, ip):
+            self.completed.append((key, ip))
+
+    monkeypatch.setattr(data_store_client, "is_running_in_kubernetes", lambda: True)
+    client = DataStoreClient(namespace="default")
+    client.metadata_client = FakeMetadataClient()
+    keys = [f"svc/key-{i}" for i in range(10)]
+    resolver = _SourceResolver(client, keys, batch_size=4, verbose=False)
+
+    # Keys 3 and 7 are never downloaded (e.g. pod cache hits)
+    for key in keys[:3] + keys[4:7] + keys[8:]:
+        source_info, has_store_backup = resolver.resolve(key)
+        assert source_info.ip == f"10.0.0.{key[-1]}" and has_store_backup
+    assert client.metadata_client.batches == [keys[0:4], keys[4:8], keys[8:]]
+
+    # Their lookups counted as transfers in flight on the peer, so they're released
+    resolver.release_unused()
+    assert client.metadata_client.completed == [("svc/key-3", "10.0.0.3"), ("svc/key-7", "10.0.0.7")]
+
+
+# ==================== Multi-key Transfers ====================
+
+
+@pytest.mark.level("unit")
+def test_multi_key_get_runs_keys_concurrently(monkeypatch):
+    import threading
+    import time
+
+    from kubetorch.data_store.data_store_client import DataStoreClient
+
+    client = DataStoreClient(namespace="default")
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def fake_get_single(key, **kwargs):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+
+    monkeypatch.setattr(client, "_get_single", fake_get_single)
+    client.get(key=[f"svc/key-{i}" for i in range(12)], dest="/tmp", max_workers=4)
+    assert peak[0] == 4
+
+
+@pytest.mark.level("unit")
+def test_multi_key_get_reports_all_failures(monkeypatch):
+    from kubetorch.data_store.data_store_client import DataStoreClient, DataStoreError
+
+    client = DataStoreClient(namespace="default")
+    attempted = []
+
+    def fake_get_single(key, **kwargs):
+        attempted.append(key)
+        if key.startswith("missing"):
+            raise ValueError(f"Key '{key}' not found")
+
+    monkeypatch.setattr(client, "_get_single", fake_get_single)
+    keys = ["svc/a", "missing/b", "svc/c", "missing/d"]
+    with pytest.raises(DataStoreError) as exc_info:
+        client.get(key=keys, dest="/tmp")
+
+    assert sorted(attempted) == sorted(keys)
+    assert "2 of 4 keys" in str(exc_info.value)
+    assert "missing/b" in str(exc_info.value) and "missing/d" in str(exc_info.value)
+
+    # A single key keeps its original error
+    with pytest.raises(ValueError):
+        client.get(key="missing/e", dest="/tmp")
+
+
+# ==================== Code Sync Manifests ====================
+
+
+class _RecordingStoreClient:
+    """Stands in for DataStoreClient in sync_to_store, recording puts instead of running rsync.
+
+    Sync manifests uploaded to the store are kept, so clients sharing ``manifests`` act like machines syncing to the
+    same store.
+    """
+
+    def __init__(self, store_has_key=True, manifests=None):
+        from types import SimpleNamespace
+
+        self.namespace = "default"
+        self.metadata_client = SimpleNamespace(has_store_pod=lambda key: store_has_key)
+        self.manifests = {} if manifests is None else manifests
+        self.puts = []
+        self.gets = []
+
+    def put(self, key, src, contents=False, files_from=None):
+        from kubetorch.data_store.sync_manifest import STORE_MANIFEST_NAME, STORE_MANIFEST_PREFIX
+
+        if key.startswith(STORE_MANIFEST_PREFIX):
+            self.manifests[key] = (Path(src) / STORE_MANIFEST_NAME).read_text()
+            return
+        listed = Path(files_from).read_text().split() if files_from else None
+        self.puts.append({"src": src, "contents": contents, "files": listed})
+
+    def get(self, key, dest, contents=False):
+        from kubetorch.data_store.data_store_client import DataStoreError
+        from kubetorch.data_store.sync_manifest import STORE_MANIFEST_NAME
+
+        self.gets.append(key)
+        if key not in self.manifests:
+            raise DataStoreError(f"Key '{key}' not found")
+        (Path(dest) / STORE_MANIFEST_NAME).write_text(self.manifests[key])
+
+
+@pytest.mark.level("unit")
+def test_sync_manifest_skips_unchanged_tree(tmp_path, monkeypatch):
+    from kubetorch.data_store import sync_manifest
+
+    monkeypatch.setattr(sync_manifest, "SYNC_MANIFEST_DIR", tmp_path / "manifests")
+    project = tmp_path / "project"
+    (project / "pkg" / "__pycache__").mkdir(parents=True)
+    (project / "pkg" / "model.py").write_text("x = 1\n")
+    (project / "pkg" / "__pycache__" / "model.cpython-311.pyc").write_bytes(b"\0")
+    (project / ".gitignore").write_text("data/\n*.log\n")
+    (project / "train.log").write_text("ignored\n")
+    monkeypatch.chdir(project)
+
+    client = _RecordingStoreClient()
+    sync_manifest.sync_to_store(client, key="/svc", sources=[str(project)], service_name="svc")
+    # First sync has no manifest to compare with, so everything goes
+    assert client.puts == [{"src": [str(project)], "contents": False, "files": None}]
+    assert list(client.manifests) == ["/.kt_sync_manifests/svc"]
+
+    manifest = sync_manifest.SyncManifest.load(sync_manifest.SyncManifest.path_for("default", "svc"))
+    assert sorted(manifest.files) == ["project/.gitignore", "project/pkg/model.py"]
+
+    # An unchanged tree is checked against the local manifest only, without fetching the store's
+    gets = len(client.gets)
+    sync_manifest.sync_to_store(client, key="/svc", sources=[str(project)], service_name="svc")
+    assert len(client.puts) == 1
+    assert len(client.gets) == gets
+
+    (project / "pkg" / "model.py").write_text("x = 2\n")
+    (project / "pkg" / "new.py").write_text("y = 1\n")
+    sync_manifest.sync_to_store(client, key="/svc", sources=[str(project)], service_name="svc")
+    assert client.puts[-1] == {
+        "src": str(tmp_path),
+        "contents": True,
+        "files": ["project/pkg/model.py", "project/pkg/new.py"],
+    }
+
+    # A store that lost the data gets a full sync again
+    empty_store = _RecordingStoreClient(store_has_key=False, manifests=client.manifests)
+    sync_manifest.sync_to_store(empty_store, key="/svc", sources=[str(project)], service_name="svc")
+    assert empty_store.puts == [{"src": [str(project)], "contents": False, "files": None}]
+
+
+@pytest.mark.level("unit")
+def test_sync_manifest_sees_syncs_from_other_machines(tmp_path, monkeypatch):
+    from kubetorch.data_store import sync_manifest
+
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "model.py").write_text("x = 1\n")
+    monkeypatch.chdir(project)
+
+    def sync_from(machine, client):
+        # Each machine has its own local manifest cache
+        monkeypatch.setattr(sync_manifest, "SYNC_MANIFEST_DIR", tmp_path / machine)
+        sync_manifest.sync_to_store(client, key="/svc", sources=[str(project)], service_name="svc")
+
+    laptop = _RecordingStoreClient()
+    sync_from("laptop", laptop)
+
+    # CI deploys different code to the same service
+    (project / "model.py").write_text("x = 2\n")
+    ci = _RecordingStoreClient(manifests=laptop.manifests)
+    sync_from("ci", ci)
+    assert len(ci.puts) == 1
+
+    # Back on the laptop, model.py matches the laptop's own last sync but not the store, so it's sent again with
+    # the laptop's new change
+    (project / "model.py").write_text("x = 1\n")
+    (project / "utils.py").write_text("y = 1\n")
+    sync_from("laptop", laptop)
+    assert laptop.puts[-1] == {
+        "src": str(tmp_path),
+        "contents": True,
+        "files": ["project/model.py", "project/utils.py"],
+    }
+
+
+@pytest.mark.level("unit")
+def test_sync_manifest_survives_symlink_loops(tmp_path, monkeypatch):
+    from kubetorch.data_store import sync_manifest
+
+    project = tmp_path / "project"
+    (project / "pkg").mkdir(parents=True)
+    (project / "pkg" / "model.py").write_text("x = 1\n")
+    (project / "pkg" / "loop").symlink_to(project)
+    (project / "shared").symlink_to(project / "pkg")
+    monkeypatch.chdir(project)
+
+    manifest = sync_manifest.SyncManifest.build([project])
+    # Links elsewhere are followed like rsync -L; the link back up to the project isn't
+    assert sorted(manifest.files) == ["project/pkg/model.py", "project/shared/model.py"]
+
+
+# ==================== WebSocket Tunnel ====================
+
+
+@pytest.fixture
+def echo_websocket_server():
+    """A websocket server echoing binary frames back, standing in for the data store's rsync bridge."""
+    import asyncio
+    import threading
+
+    from websockets.asyncio.server import serve
+
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    state = {}
+
+    async def echo(ws):
+        async for message in ws:
+            await ws.send(message)
+
+    async def main():
+        state["stop"] = asyncio.Event()
+        async with serve(echo, "127.0.0.1", 0, max_size=None) as server:
+            state["port"] = server.sockets[0].getsockname()[1]
+            started.set()
+            await state["stop"].wait()
+
+    thread = threading.Thread(target=loop.run_until_complete, args=(main(),), daemon=True)
+    thread.start()
+    started.wait(timeout=5)
+    yield f"ws://127.0.0.1:{state['port']}/rsync/default/"
+    loop.call_soon_threadsafe(state["stop"].set)
+    thread.join(timeout=5)
+
+
+@pytest.mark.level("unit")
+def test_websocket_tunnel_concurrent_streams(echo_websocket_server):
+    import os
+    import socket
+    from concurrent.futures import ThreadPoolExecutor
+
+    from kubetorch.data_store.websocket_tunnel import WebSocketRsyncTunnel
+
+    def round_trip(tunnel_port):
+        payload = os.urandom(3 * 1024 * 1024)
+        received = bytearray()
+        with socket.create_connection(("127.0.0.1", tunnel_port)) as sock:
+            sock.sendall(payload)
+            while len(received) < len(payload):
+                chunk = sock.recv(1024 * 1024)
+                if not chunk:
+                    break
+                received.extend(chunk)
+        return bytes(received) == payload
+
+    with WebSocketRsyncTunnel(32000, echo_websocket_server) as tunnel:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert all(executor.map(round_trip, [tunnel.local_port] * 4))
+
+
+@pytest.mark.level("unit")
+def test_websocket_tunnel_relays_response_after_half_close(echo_websocket_server, monkeypatch):
+    import os
+    import socket
+
+    from kubetorch.data_store import websocket_tunnel
+
+    monkeypatch.setattr(websocket_tunnel, "HALF_CLOSE_TIMEOUT", 1)
+    payload = os.urandom(3 * 1024 * 1024)
+    received = bytearray()
+    with websocket_tunnel.WebSocketRsyncTunnel(32000, echo_websocket_server) as tunnel:
+        with socket.create_connection(("127.0.0.1", tunnel.local_port)) as sock:
+            sock.sendall(payload)
+            # Done sending, but still waiting for the response
+            sock.shutdown(socket.SHUT_WR)
+            while chunk := sock.recv(1024 * 1024):
+                received.extend(chunk)
+    assert bytes(received) == payload
+
+
+@pytest.mark.level("unit")
+def test_websocket_tunnel_stops_with_open_connections(echo_websocket_server, caplog):
+    import logging
+    import socket
+    import time
+
+    from kubetorch.data_store.websocket_tunnel import WebSocketRsyncTunnel
+
+    with caplog.at_level(logging.ERROR, logger="asyncio"):
+        with WebSocketRsyncTunnel(32000, echo_websocket_server) as tunnel:
+            sock = socket.create_connection(("127.0.0.1", tunnel.local_port))
+            sock.sendall(b"ping")
+            assert sock.recv(4) == b"ping"
+        # Stopping closes the open connection instead of leaving it hanging
+        sock.settimeout(5)
+        assert sock.recv(4) == b""
+        sock.close()
+        deadline = time.time() + 5
+        while not tunnel._loop.is_closed() and time.time() < deadline:
+            time.sleep(0.05)
+
+    assert tunnel._loop.is_closed()
+    assert not [record for record in caplog.records if record.name == "asyncio"]
+
+
+# ==================== Striped Rsync ====================
+
+
+@pytest.mark.level("unit")
+def test_partition_files_balances_sizes():
+    from kubetorch.data_store.rsync_client import partition_files
+
+    files = [("big", 100), ("a", 40), ("b", 35), ("c", 30), ("d", 20), ("e", 5)]
+    buckets = partition_files(files, stripes=2)
+    totals = sorted(total for total, _ in buckets)
+    assert totals[1] - totals[0] <= 10
+    assert sorted(path for _, paths in buckets for path in paths) == sorted(path for path, _ in files)
+    # Never more stripes than files
+    assert len(partition_files(files[:2], stripes=8)) == 2
+
+
+def _list_only_output(entries):
+    """Fake ``rsync --list-only`` output for (permissions, size, path) entries."""
+    return "".join(f"{perms} {size:>14,} 2026/01/01 00:00:00 {path}\n" for perms, size, path in entries)
+
+
+@pytest.mark.level("unit")
+def test_striped_upload_splits_file_list(tmp_path, monkeypatch):
+    from kubetorch.data_store import rsync_client as rsync_module
+
+    dataset = tmp_path / "dataset"
+    dataset.mkdir()
+    # rsync isn't run here: listing is faked, as rsync would list dataset with the default excludes applied
+    listing = [("drwxr-xr-x", 4096, "."), ("drwxr-xr-x", 4096, "dataset"), ("drwxr-xr-x", 4096, "dataset/shards")]
+    listing += [("-rw-r--r--", (i + 1) * 1000, f"dataset/shards/part-{i}.bin") for i in range(6)]
+    listing += [("drwxr-xr-x", 4096, "dataset/empty"), ("lrwxrwxrwx", 12, "dataset/latest -> shards/part-5.bin")]
+
+    list_cmds = []
+
+    def fake_list(cmd, **kwargs):
+        list_cmds.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=_list_only_output(listing), stderr="")
+
+    runs = []
+
+    def fake_run(self, rsync_cmd, create_target_dir=True):
+        files_from = rsync_cmd.split("--files-from='")[1].split("'")[0]
+        runs.append(Path(files_from).read_text().split())
+        assert f" {dataset.parent}/ " in rsync_cmd
+
+    monkeypatch.setattr(rsync_module, "is_running_in_kubernetes", lambda: True)
+    monkeypatch.setattr(rsync_module.subprocess, "run", fake_list)
+    monkeypatch.setattr(rsync_module.RsyncClient, "run_rsync_command", fake_run)
+
+    client = rsync_module.RsyncClient(namespace="default", service_name="store")
+    client.upload(source=str(dataset), dest="datasets/train", stripes=3)
+
+    # Listed with the same filters as the upload itself, so excluded paths never reach a stripe
+    assert "--list-only" in list_cmds[0] and "--exclude=.git" in list_cmds[0]
+    assert f"{dataset.parent}/" in list_cmds[0] and not any(arg.startswith("rsync://") for arg in list_cmds[0])
+
+    # Regular files are striped; the symlink and empty directory go in one more rsync afterwards
+    assert len(runs) == 4
+    assert sorted(path for paths in runs[:3] for path in paths) == [f"dataset/shards/part-{i}.bin" for i in range(6)]
+    assert runs[3] == ["dataset/latest", "dataset/empty"]
+
+
+@pytest.mark.level("unit")
+def test_striped_download_does_not_create_remote_dir(tmp_path, monkeypatch):
+    from kubetorch.data_store import rsync_client as rsync_module
+
+    runs = []
+
+    def fake_run(self, rsync_cmd, create_target_dir=True):
+        runs.append(create_target_dir)
+
+    listing = ([(f"part-{i}.bin", 1000) for i in range(4)], ["latest"])
+    monkeypatch.setattr(rsync_module, "is_running_in_kubernetes", lambda: True)
+    monkeypatch.setattr(rsync_module.RsyncClient, "run_rsync_command", fake_run)
+    monkeypatch.setattr(rsync_module.RsyncClient, "_list_files", staticmethod(lambda rsync_cmd: listing))
+
+    client = rsync_module.RsyncClient(namespace="default", service_name="store")
+    client.download(source="rsync://store:873/data/default/datasets/train/", dest=str(tmp_path), stripes=2)
+
+    # Same as an unstriped download: the destination is local, so there's no remote dir to create
+    assert runs == [False, False, False]
+
+
+# ==================== Pod Data Cache ====================
+
+
+@pytest.mark.level("unit")
+def test_pod_cache_serves_repeat_gets(tmp_path):
+    from kubetorch.data_store.pod_cache import PodDataCache
+
+    cache = PodDataCache(str(tmp_path / "cache"), max_bytes=10**9, ttl=60)
+    fetches = []
+
+    def fetch(cache_dest):
+        fetches.append(cache_dest)
+        (Path(cache_dest) / "model").mkdir(exist_ok=True)
+        (Path(cache_dest) / "model" / "weights.bin").write_bytes(b"w" * 1000)
+
+    for worker in range(3):
+        cache.get("models/llm|False|", str(tmp_path / f"worker-{worker}") + "/", fetch)
+        assert (tmp_path / f"worker-{worker}" / "model" / "weights.bin").read_bytes() == b"w" * 1000
+    assert len(fetches) == 1
+
+    cache.get("models/llm|False|", str(tmp_path / "worker-0") + "/", fetch, refresh=True)
+    assert len(fetches) == 2
+
+
+@pytest.mark.level("unit")
+def test_pod_cache_hits_clone_concurrently(tmp_path, monkeypatch):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from kubetorch.data_store import pod_cache
+
+    cache = pod_cache.PodDataCache(str(tmp_path / "cache"), max_bytes=10**9, ttl=60)
+    fetches = []
+
+    def fetch(cache_dest):
+        fetches.append(cache_dest)
+        (Path(cache_dest) / "weights.bin").write_bytes(b"w" * 1000)
+
+    cache.get("models/llm", str(tmp_path / "warm") + "/", fetch)
+
+    # Each clone waits for the other, which only works if neither holds the entry exclusively
+    both_cloning = threading.Barrier(2, timeout=5)
+    clone_tree = pod_cache._clone_tree
+
+    def clone_together(src, dst):
+        both_cloning.wait()
+        clone_tree(src, dst)
+
+    monkeypatch.setattr(pod_cache, "_clone_tree", clone_together)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dests = [str(tmp_path / f"worker-{i}") + "/" for i in range(2)]
+        list(executor.map(lambda dest: cache.get("models/llm", dest, fetch), dests))
+
+    assert len(fetches) == 1
+    assert all((Path(dest) / "weights.bin").read_bytes() == b"w" * 1000 for dest in dests)
+
+
+@pytest.mark.level("unit")
+def test_pod_cache_dest_writes_do_not_reach_cache(tmp_path):
+    from kubetorch.data_store.pod_cache import PodDataCache
+
+    cache = PodDataCache(str(tmp_path / "cache"), max_bytes=10**9, ttl=60)
+
+    def fetch(cache_dest):
+        (Path(cache_dest) / "config.json").write_text("{}")
+
+    cache.get("configs", str(tmp_path / "worker-0") + "/", fetch)
+    with open(tmp_path / "worker-0" / "config.json", "r+") as f:
+        f.write("[]")
+
+    cache.get("configs", str(tmp_path / "worker-1") + "/", fetch)
+    assert (tmp_path / "worker-1" / "config.json").read_text() == "{}"
+
+
+@pytest.mark.level("unit")
+def test_pod_cache_evicts_least_recently_used(tmp_path):
+    from kubetorch.data_store.pod_cache import PodDataCache
+
+    cache = PodDataCache(str(tmp_path / "cache"), max_bytes=2500, ttl=60)
+
+    def fetcher(name):
+        def fetch(cache_dest):
+            (Path(cache_dest) / name).write_bytes(b"x" * 1000)
+
+        return fetch
+
+    for name in ["a", "b", "c"]:
+        cache.get(name, str(tmp_path / "dest") + "/", fetcher(name))
+    # Touch "a" so "b" is the least recently used
+    cache.get("a", str(tmp_path / "dest") + "/", fetcher("a"))
+    cache.get("d", str(tmp_path / "dest") + "/", fetcher("d"))
+
+    cached = {meta["key"] for meta in (cache._read_meta(p.with_suffix("")) for p in cache.root.glob("*.json"))}
+    assert cached == {"a", "d"}
+
+
+# ==================== Object Store ====================
+
+
+@pytest.mark.level("unit")
+def test_dump_object_fails_fast_without_space(tmp_path, monkeypatch):
+    import errno
+    import shutil
+    from collections import namedtuple
+
+    import numpy as np
+
+    from kubetorch.data_store.pod_data_server import _dump_object
+
+    usage = namedtuple("usage", "total used free")
+    monkeypatch.setattr(shutil, "disk_usage", lambda path: usage(1000, 0, 1000))
+    with pytest.raises(OSError) as exc_info:
+        _dump_object(np.zeros(1000, dtype=np.float32), directory=str(tmp_path))
+    assert exc_info.value.errno == errno.ENOSPC
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.level("unit")
+def test_object_round_trip_maps_out_of_band_buffers(tmp_path):
+    import numpy as np
+
+    from kubetorch.data_store.pod_data_server import _dump_object, _load_object
+
+    embeddings = np.arange(100_000, dtype=np.float32).reshape(1000, 100)
+    path = _dump_object({"ids": list(range(3)), "embeddings": embeddings}, directory=str(tmp_path))
+    # The array is written beside the pickle stream, not inside it
+    assert Path(path).stat().st_size < embeddings.nbytes + 4096
+
+    loaded = _load_object(path)
+    assert loaded["ids"] == [0, 1, 2]
+    np.testing.assert_array_equal(loaded["embeddings"], embeddings)
+    # Backed by the copy-on-write mapping, and writable without touching the file
+    assert not loaded["embeddings"].flags.owndata
+    loaded["embeddings"][0, 0] = -1
+    np.testing.assert_array_equal(_load_object(path)["embeddings"], embeddings)
+
+
+@pytest.mark.level("unit")
+def test_pod_data_server_serves_objects_to_local_and_remote_readers(tmp_path, monkeypatch):
+    import socket
+    import threading
+
+    import numpy as np
+
+    from kubetorch.data_store import pod_data_server as pds
+
+    monkeypatch.setattr(pds, "OBJECT_STORE_DIR", str(tmp_path))
+    source = pds.PodDataServer(socket_path=str(tmp_path / "source.sock"))
+    reader = pds.PodDataServer(socket_path=str(tmp_path / "reader.sock"))
+    monkeypatch.setattr(source, "_mds_publish_gpu", lambda keys: True)
+
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+    monkeypatch.setattr(
+        reader,
+        "_mds_get_gpu_source",
+        lambda key: {key: {"found": True, "ip": "127.0.0.1", "gpu_server_port": port}},
+    )
+
+    def serve_one():
+        conn, addr = listener.accept()
+        source._handle_remote_client(conn, addr)
+
+    weights = np.random.rand(256, 256)
+    path = pds._dump_object({"step": 7, "weights": weights}, directory=str(tmp_path))
+    assert source._handle_put_object({"key": "ckpt", "path": path})["status"] == "ok"
+
+    # Same pod: a link to the server's file
+    local = source._handle_get_object({"key": "ckpt"})
+    assert local["source"] == "local"
+    np.testing.assert_array_equal(pds._load_object(local["path"])["weights"], weights)
+
+    # Other pod: streamed from the source server over TCP
+    server_thread = threading.Thread(target=serve_one, daemon=True)
+    server_thread.start()
+    remote = reader._handle_get_object({"key": "ckpt", "timeout": 10})
+    server_thread.join(timeout=10)
+    listener.close()
+    assert remote["source"] == "127.0.0.1"
+    fetched = pds._load_object(remote["path"])
+    assert fetched["step"] == 7
+    np.testing.assert_array_equal(fetched["weights"], weights)
+
+    # Putting the key again replaces the server's file without breaking existing readers
+    new_path = pds._dump_object({"step": 8}, directory=str(tmp_path))
+    source._handle_put_object({"key": "ckpt", "path": new_path})
+    assert not Path(path).exists()
+    assert pds._load_object(local["path"])["step"] == 7
+
+
+# ==================== CPU Tensor Transfer ====================
+
+
+@pytest.mark.level("unit")
+@pytest.mark.parametrize("pack", [False, True])
+def test_cpu_tensors_round_trip_into_destination(tmp_path, pack):
+    import numpy as np
+
+    from kubetorch.data_store.cpu_transfer import _deserialize_into, _flatten_tensors, _serialize_tensors
+    from kubetorch.data_store.pod_data_server import _dump_object, _load_object
+
+    state_dict = {
+        "encoder": {"weight": np.random.rand(64, 32).astype(np.float32), "bias": np.arange(3, dtype=np.int64)},
+        "scale": np.float16(0.5) * np.ones((2, 2), dtype=np.float16),
+    }
+    path = _dump_object(_serialize_tensors(_flatten_tensors(state_dict), pack=pack), directory=str(tmp_path))
+
+    dest = {
+        "encoder": {"weight": np.zeros((64, 32), dtype=np.float32), "bias": np.zeros(3, dtype=np.int64)},
+        "scale": np.zeros((2, 2), dtype=np.float16),
+    }
+    _deserialize_into(_load_object(path), _flatten_tensors(dest), "model")
+    np.testing.assert_array_equal(dest["encoder"]["weight"], state_dict["encoder"]["weight"])
+    np.testing.assert_array_equal(dest["encoder"]["bias"], state_dict["encoder"]["bias"])
+    np.testing.assert_array_equal(dest["scale"], state_dict["scale"])
+
+    wrong_shape = {**dest, "scale": np.zeros((3, 2), dtype=np.float16)}
+    with pytest.raises(ValueError, match="scale"):
+        _deserialize_into(_load_object(path), _flatten_tensors(wrong_shape), "model")
+
+
+@pytest.mark.level("unit")
+def test_cpu_broadcast_getters_fetch_from_their_parent(tmp_path, monkeypatch):
+    import socket
+    import threading
+
+    import numpy as np
+
+    from kubetorch.data_store import pod_data_server as pds
+    from kubetorch.data_store.cpu_transfer import _deserialize_into, _flatten_tensors, _serialize_tensors
+
+    monkeypatch.setattr(pds, "OBJECT_STORE_DIR", str(tmp_path))
+
+    def serve(server):
+        listener = socket.create_server(("127.0.0.1", 0))
+
+        def accept_loop():
+            while True:
+                try:
+                    conn, addr = listener.accept()
+                except OSError:
+                    return
+                threading.Thread(target=server._handle_remote_client, args=(conn, addr), daemon=True).start()
+
+        threading.Thread(target=accept_loop, daemon=True).start()
+        return listener
+
+    source, parent, child = (pds.PodDataServer(socket_path=str(tmp_path / f"{n}.sock")) for n in range(3))
+    source_listener, parent_listener = serve(source), serve(parent)
+    monkeypatch.setattr(source, "_mds_publish_gpu", lambda keys: True)
+    source_info = {"found": True, "ip": "127.0.0.1", "gpu_server_port": source_listener.getsockname()[1]}
+    monkeypatch.setattr(parent, "_mds_get_gpu_source", lambda key: {key: source_info})
+
+    weights = {"w": np.random.rand(128, 128)}
+    path = pds._dump_object(_serialize_tensors(_flatten_tensors(weights)), directory=str(tmp_path))
+    source._handle_put_object({"key": "weights", "path": path})
+
+    # The child asks its parent before the parent has the data, so the parent's server holds the request
+    child_result = {}
+    child_get = threading.Thread(
+        target=lambda: child_result.update(
+            child._handle_get_object(
+                {
+                    "key": "weights",
+                    "group_id": "eval",
+                    "parent_ip": "127.0.0.1",
+                    "parent_port": parent_listener.getsockname()[1],
+                    "timeout": 10,
+                }
+            )
+        )
+    )
+    child_get.start()
+    parent_result = parent._handle_get_object({"key": "weights", "group_id": "eval", "timeout": 10})
+    child_get.join(timeout=15)
+    source_listener.close()
+    parent_listener.close()
+
+    assert parent_result["source"] == "127.0.0.1"
+    assert child_result["status"] == "ok"
+    dest = {"w": np.zeros((128, 128))}
+    _deserialize_into(pds._load_object(child_result["path"]), _flatten_tensors(dest), "weights")
+    np.testing.assert_array_equal(dest["w"], weights["w"])
+
+
+# ==================== Pod Data Server Protocol ====================
+
+
+@pytest.fixture
+def local_pod_data_server(tmp_path):
+    """A PodDataServer answering local clients on a temporary Unix socket, counting the connections it accepts."""
+    import socket
+    import threading
+
+    from kubetorch.data_store.pod_data_server import PodDataServer
+
+    socket_path = str(tmp_path / "pds.sock")
+    server = PodDataServer(socket_path=socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(16)
+    connections = []
+
+    def accept_loop():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            connections.append(conn)
+            threading.Thread(target=server._handle_local_client, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+    yield socket_path, connections
+    listener.close()
+
+
+@pytest.mark.level("unit")
+def test_pod_data_server_client_pipelines_over_one_connection(local_pod_data_server):
+    from kubetorch.data_store.pod_data_server import PodDataServerClient
+
+    socket_path, connections = local_pod_data_server
+    client = PodDataServerClient(socket_path)
+
+    messages = [{"command": "ping"}, {"command": "list_keys"}, {"command": "no_such_command"}] * 300
+    responses = client._send_messages(messages)
+    assert len(responses) == len(messages)
+    assert all(r["status"] == "ok" and "pid" in r for r in responses[0::3])
+    assert all(r["status"] == "ok" and r["keys"] == [] for r in responses[1::3])
+    assert all("Unknown command" in r["error"] for r in responses[2::3])
+    assert client.ping()["status"] == "ok"
+    assert len(connections) == 1
+
+    # A connection the server dropped (e.g. after a restart) is replaced transparently
+    connections[0].close()
+    assert client.ping()["status"] == "ok"
+    assert len(connections) == 2
+    client.close()
+
+
+@pytest.mark.level("unit")
+def test_pod_data_server_client_pipeline_larger_than_socket_buffers(local_pod_data_server):
+    from kubetorch.data_store.pod_data_server import PodDataServerClient
+
+    socket_path, _ = local_pod_data_server
+    client = PodDataServerClient(socket_path)
+
+    # Each error response echoes its command, so responses pile up as fast as requests
+    messages = [{"command": f"no_such_command_{i}_" + "x" * 64 * 1024} for i in range(200)]
+    responses = client._send_messages(messages, timeout=5)
+    assert [r["error"] for r in responses] == [f"Unknown command: {m['command']}" for m in messages]
+    client.close()
+
+
+@pytest.mark.level("unit")
+def test_pod_data_server_client_msgpack_encoding(local_pod_data_server):
+    pytest.importorskip("msgpack")
+    from kubetorch.data_store.pod_data_server import PodDataServerClient
+
+    socket_path, _ = local_pod_data_server
+    client = PodDataServerClient(socket_path, encoding="msgpack")
+    assert [r["status"] for r in client._send_messages([{"command": "ping"}] * 10)] == ["ok"] * 10